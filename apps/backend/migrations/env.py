@@ -13,6 +13,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # Import all SQLModel models
 from src.user.model import User
 from src.job_applications.model import JobApplication
+from src.job_applications.search import SEARCH_INDEXES, SEARCH_VECTOR_COLUMN
 
 # Import other models here...
 
@@ -55,6 +56,11 @@ def include_object(object, name, type_, reflected, compare_to):
         name.startswith(f"{table}_") for table in IGNORED_TABLES
     ):
         return False
+    # Search objects are created by migration only, not declared on the model
+    if type_ == "column" and name == SEARCH_VECTOR_COLUMN:
+        return False
+    if type_ == "index" and name in SEARCH_INDEXES:
+        return False
     return True
 
 
@@ -0,0 +1,61 @@
+"""add company_research_cache table
+
+Revision ID: c7e2a9d4f5b1
+Revises: b2c9f4d1e3a7
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c7e2a9d4f5b1"
+down_revision: Union[str, None] = "b2c9f4d1e3a7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "company_research_cache",
+        sa.Column("cache_key", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("company_key", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("category_key", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("company_name", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("category_name", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("results", sa.JSON(), nullable=True),
+        sa.Column("content_hash", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("source_job_application_id", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column("hit_count", sa.Integer(), nullable=False),
+        sa.Column("refreshed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_hit_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("cache_key"),
+        schema="app",
+    )
+    op.create_index(
+        op.f("ix_app_company_research_cache_company_key"),
+        "company_research_cache",
+        ["company_key"],
+        unique=False,
+        schema="app",
+    )
+    op.create_index(
+        op.f("ix_app_company_research_cache_expires_at"),
+        "company_research_cache",
+        ["expires_at"],
+        unique=False,
+        schema="app",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_app_company_research_cache_expires_at"), table_name="company_research_cache", schema="app")
+    op.drop_index(op.f("ix_app_company_research_cache_company_key"), table_name="company_research_cache", schema="app")
+    op.drop_table("company_research_cache", schema="app")
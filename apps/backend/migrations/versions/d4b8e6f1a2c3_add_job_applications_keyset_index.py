@@ -0,0 +1,33 @@
+"""add job_applications keyset pagination index
+
+Revision ID: d4b8e6f1a2c3
+Revises: c7e2a9d4f5b1
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4b8e6f1a2c3"
+down_revision: Union[str, None] = "c7e2a9d4f5b1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_app_job_applications_user_id_created_at_id",
+        "job_applications",
+        ["user_id", "created_at", "id"],
+        unique=False,
+        schema="app",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_app_job_applications_user_id_created_at_id", table_name="job_applications", schema="app")
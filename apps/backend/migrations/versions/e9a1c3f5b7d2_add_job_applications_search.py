@@ -0,0 +1,67 @@
+"""add job_applications full-text and trigram search
+
+Revision ID: e9a1c3f5b7d2
+Revises: d4b8e6f1a2c3
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e9a1c3f5b7d2"
+down_revision: Union[str, None] = "d4b8e6f1a2c3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Generated column, kept up to date by Postgres on every write
+    op.execute(
+        """
+        ALTER TABLE app.job_applications
+        ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(job_title, '')), 'A')
+            || setweight(to_tsvector('english', coalesce(company_name, '')), 'A')
+            || setweight(to_tsvector('english', coalesce(job_description, '')), 'B')
+        ) STORED
+        """
+    )
+    op.create_index(
+        "ix_app_job_applications_search_vector",
+        "job_applications",
+        ["search_vector"],
+        unique=False,
+        schema="app",
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_app_job_applications_job_title_trgm",
+        "job_applications",
+        ["job_title"],
+        unique=False,
+        schema="app",
+        postgresql_using="gin",
+        postgresql_ops={"job_title": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_app_job_applications_company_name_trgm",
+        "job_applications",
+        ["company_name"],
+        unique=False,
+        schema="app",
+        postgresql_using="gin",
+        postgresql_ops={"company_name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_app_job_applications_company_name_trgm", table_name="job_applications", schema="app")
+    op.drop_index("ix_app_job_applications_job_title_trgm", table_name="job_applications", schema="app")
+    op.drop_index("ix_app_job_applications_search_vector", table_name="job_applications", schema="app")
+    op.drop_column("job_applications", "search_vector", schema="app")
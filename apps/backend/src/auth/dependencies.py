@@ -12,8 +12,8 @@ from jwt import PyJWKError
 
 from src.auth.jwt_handler import JWTHandler
 from src.auth.service import AuthService
-from src.user.dependencies import get_user_service
-from src.user.service import UserService
+from src.user.dependencies import get_async_user_service, get_user_service
+from src.user.service import AsyncUserService, UserService
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +31,7 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    user_service: UserService = Depends(get_user_service),
+    user_service: AsyncUserService = Depends(get_async_user_service),
 ):
     """Get the current authenticated user from JWT token.
 
@@ -39,8 +39,8 @@ async def get_current_user(
     ----------
     token : str
         JWT token from the Authorization header.
-    user_service : UserService
-        User service dependency for database operations.
+    user_service : AsyncUserService
+        Async user service dependency for database operations.
 
     Returns:
     -------
@@ -68,7 +68,7 @@ async def get_current_user(
         logger.error("Error in get_current_user: ", e)
         raise credentials_exception
 
-    user = user_service.get_user_by_email(email)
+    user = await user_service.get_user_by_email(email)
     if user is None:
         raise credentials_exception
     return user
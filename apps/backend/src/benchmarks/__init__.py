@@ -0,0 +1 @@
+"""Replay benchmarks of the resume generation pipeline (see src.benchmarks.pipeline)."""
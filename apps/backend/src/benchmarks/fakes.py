@@ -0,0 +1,378 @@
+"""Deterministic stand-ins for the LLM and web providers used by the pipeline.
+
+This module provides:
+- BenchmarkScenario: knobs for provider latency and the shape of the workload
+- ProviderCalls: counters of the fake provider calls
+- FakeChatModel: chat model answering structured-output and tool-calling
+  requests with schema-valid payloads, after a configurable delay
+- make_fake_tavily_tool: replacement for tools.tavily_tool
+- FakeFirecrawlClient: replacement for the AsyncFirecrawlClient
+- fake_value: builds JSON data that validates against a type annotation
+
+Responses only depend on the scenario and the prompt, so two runs of the same
+scenario perform the same calls in the same order.
+"""
+
+import asyncio
+import datetime
+import enum
+import itertools
+import re
+import threading
+import time
+import types
+import typing
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass, field
+from typing import Any
+from uuid import uuid4
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.tools import BaseTool, tool
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from pydantic import BaseModel, EmailStr, PrivateAttr
+
+_FILLER_WORDS = (
+    "team product customers platform engineering growth culture mission values "
+    "remote hiring roadmap data reliability python cloud security design quality"
+).split()
+
+
+@dataclass
+class BenchmarkScenario:
+    """Workload and latency profile of a benchmark run.
+
+    Attributes:
+        llm_latency: Seconds each LLM call takes
+        search_latency: Seconds each Tavily search takes
+        scrape_latency: Seconds each Firecrawl scrape takes
+        research_categories: Number of categories in the research plan
+        research_rounds: Tool rounds each research executor runs before finishing
+        resume_grades: Grades returned by successive resume evaluations
+        cover_letter_grades: Grades returned by successive cover letter evaluations
+        page_words: Words in each scraped page
+        text_words: Words in each generated free-text field
+    """
+
+    llm_latency: float = 0.0
+    search_latency: float = 0.0
+    scrape_latency: float = 0.0
+    research_categories: int = 4
+    research_rounds: int = 2
+    resume_grades: Sequence[int] = (75, 92)
+    cover_letter_grades: Sequence[int] = (75, 92)
+    page_words: int = 3000
+    text_words: int = 40
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the scenario as JSON-serializable data."""
+        data = asdict(self)
+        data["resume_grades"] = list(self.resume_grades)
+        data["cover_letter_grades"] = list(self.cover_letter_grades)
+        return data
+
+
+@dataclass
+class ProviderCalls:
+    """Number of calls made to each fake provider."""
+
+    llm: int = 0
+    search: int = 0
+    scrape: int = 0
+    _lock: Any = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, provider: str) -> None:
+        """Count one call to a provider."""
+        with self._lock:
+            setattr(self, provider, getattr(self, provider) + 1)
+
+    def to_dict(self) -> dict[str, int]:
+        """Return the counters as a dict."""
+        return {"llm": self.llm, "search": self.search, "scrape": self.scrape}
+
+
+def _text(words: int, label: str = "") -> str:
+    filler = itertools.islice(itertools.cycle(_FILLER_WORDS), max(words, 1))
+    return " ".join(([label] if label else []) + list(filler))
+
+
+def _slug(value: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "", value.lower()) or "company"
+
+
+def fake_value(
+    annotation: Any, field_name: str = "", *, text_words: int = 12, company: str = ""
+) -> Any:
+    """Build JSON data that validates against a type annotation.
+
+    Args:
+        annotation: A type annotation, typically a pydantic model class
+        field_name: Name of the field being filled, used to pick realistic
+            values for emails and URLs
+        text_words: Words in generated strings
+        company: Company name used in generated URLs
+
+    Returns:
+        Data accepted by pydantic validation of the annotation
+    """
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    lowered = field_name.lower()
+
+    if origin is typing.Annotated:
+        return fake_value(args[0], field_name, text_words=text_words, company=company)
+    if origin in (typing.Union, types.UnionType):
+        choice = next((arg for arg in args if arg is not type(None)), str)
+        return fake_value(choice, field_name, text_words=text_words, company=company)
+    if origin is typing.Literal:
+        return args[0]
+    if origin in (list, set, tuple, Sequence):
+        item = args[0] if args else str
+        return [
+            fake_value(item, field_name, text_words=text_words, company=company)
+            for _ in range(2)
+        ]
+    if origin is dict:
+        value_type = args[1] if len(args) == 2 else str
+        return {
+            f"{field_name or 'item'}_{index}": fake_value(
+                value_type, field_name, text_words=text_words, company=company
+            )
+            for index in range(2)
+        }
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return {
+                name: fake_value(
+                    info.annotation, name, text_words=text_words, company=company
+                )
+                for name, info in annotation.model_fields.items()
+            }
+        if issubclass(annotation, enum.Enum):
+            return next(iter(annotation)).value
+        if issubclass(annotation, bool):
+            return True
+        if issubclass(annotation, int):
+            return 1
+        if issubclass(annotation, float):
+            return 1.0
+        if issubclass(annotation, datetime.datetime):
+            return "2025-01-01T00:00:00+00:00"
+        if issubclass(annotation, datetime.date):
+            return "2025-01-01"
+    if annotation is EmailStr or "email" in lowered:
+        return "candidate@example.com"
+    if any(marker in lowered for marker in ("url", "website", "page", "link")):
+        return f"https://{_slug(company)}.com/{_slug(field_name)}"
+    return _text(text_words, field_name.replace("_", " "))
+
+
+class FakeChatModel(BaseChatModel):
+    """Chat model returning deterministic, schema-valid answers.
+
+    Structured output requests get a payload built from the requested schema.
+    The company discovery and research executor loops get one search round
+    per scenario round, then their done tool. Plain prompts (page
+    summaries) get free text.
+    """
+
+    scenario: BenchmarkScenario
+    provider_calls: ProviderCalls
+
+    _schemas: dict[str, type] = PrivateAttr(default_factory=dict)
+    _grade_calls: dict[str, int] = PrivateAttr(default_factory=dict)
+    _lock: Any = PrivateAttr(default_factory=threading.Lock)
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    @property
+    def _llm_type(self) -> str:
+        return "benchmark-fake"
+
+    def bind_tools(self, tools: Sequence[Any], *, tool_choice: Any = None, **kwargs):
+        """Bind tools the way provider chat models do, remembering their schemas."""
+        formatted = []
+        for bound_tool in tools:
+            if isinstance(bound_tool, type):
+                self._schemas[bound_tool.__name__] = bound_tool
+            formatted.append(convert_to_openai_tool(bound_tool))
+        return self.bind(tools=formatted, tool_choice=tool_choice, **kwargs)
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        time.sleep(self.scenario.llm_latency)
+        return self._respond(messages, kwargs)
+
+    async def _agenerate(
+        self, messages, stop=None, run_manager=None, **kwargs
+    ) -> ChatResult:
+        await asyncio.sleep(self.scenario.llm_latency)
+        return self._respond(messages, kwargs)
+
+    def _respond(self, messages: list[BaseMessage], kwargs: dict) -> ChatResult:
+        self.provider_calls.add("llm")
+        tools = [tool_["function"]["name"] for tool_ in kwargs.get("tools") or []]
+        prompt = "\n".join(str(message.content) for message in messages)
+        if kwargs.get("tool_choice") == "any" and len(tools) == 1:
+            message = self._tool_call(tools[0], self._structured(tools[0], prompt))
+        elif "CompanyDiscoveryDoneTool" in tools:
+            message = self._discovery_step(messages, prompt)
+        elif "ResearchDoneTool" in tools:
+            message = self._research_step(messages, prompt)
+        else:
+            message = AIMessage(content=_text(self.scenario.text_words * 3, "Summary"))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    @staticmethod
+    def _tool_call(name: str, args: dict[str, Any]) -> AIMessage:
+        return AIMessage(
+            content="",
+            tool_calls=[{"name": name, "args": args, "id": f"call_{uuid4().hex[:12]}"}],
+        )
+
+    def _next_grade(self, schema_name: str, grades: Sequence[int]) -> int:
+        with self._lock:
+            index = self._grade_calls.get(schema_name, 0)
+            self._grade_calls[schema_name] = index + 1
+        return grades[min(index, len(grades) - 1)] if grades else 100
+
+    def _structured(self, schema_name: str, prompt: str) -> dict[str, Any]:
+        company = _extract(r"COMPANY: ([^\n]+)", prompt) or "Benchmark"
+        if schema_name == "ResearchPlan":
+            return {
+                "target_role": "Benchmark role",
+                "research_categories": [
+                    {
+                        "category_name": f"Benchmark category {index + 1}",
+                        "description": _text(self.scenario.text_words),
+                        "priority": 1 + index % 5,
+                        "data_points": ["company culture", "tech stack"],
+                    }
+                    for index in range(self.scenario.research_categories)
+                ],
+                "rationale": _text(self.scenario.text_words),
+            }
+        data = fake_value(
+            self._schemas[schema_name],
+            text_words=self.scenario.text_words,
+            company=company,
+        )
+        if schema_name == "GeneratedResumeEvaluation":
+            data["grade"] = self._next_grade(schema_name, self.scenario.resume_grades)
+        elif schema_name == "GeneratedCoverLetterEvaluation":
+            data["grade"] = self._next_grade(
+                schema_name, self.scenario.cover_letter_grades
+            )
+        return data
+
+    def _discovery_step(self, messages: list[BaseMessage], prompt: str) -> AIMessage:
+        company = _extract(r"COMPANY: ([^\n]+)", prompt) or "Benchmark"
+        if not any(isinstance(message, ToolMessage) for message in messages):
+            return self._tool_call("company_discovery_tool", {"company_name": company})
+        return self._tool_call(
+            "CompanyDiscoveryDoneTool",
+            {
+                "discovery_results": fake_value(
+                    self._schemas["CompanyDiscoveryDoneTool"]
+                    .model_fields["discovery_results"]
+                    .annotation,
+                    text_words=self.scenario.text_words,
+                    company=company,
+                )
+            },
+        )
+
+    def _research_step(self, messages: list[BaseMessage], prompt: str) -> AIMessage:
+        company = _extract(r"COMPANY: ([^\n]+)", prompt) or "Benchmark"
+        category = _extract(r"category_name: ([^\n]+)", prompt) or "general"
+        rounds = sum(
+            1
+            for message in messages
+            if isinstance(message, AIMessage) and message.tool_calls
+        )
+        if rounds >= self.scenario.research_rounds:
+            return self._tool_call(
+                "ResearchDoneTool",
+                {"results": {category: _text(self.scenario.text_words * 2, category)}},
+            )
+        message = self._tool_call(
+            "tavily_tool", {"query": f"{company} {category} {rounds}"}
+        )
+        message.tool_calls.append(
+            {
+                "name": "scraping_tool",
+                "args": {
+                    "url": f"https://{_slug(company)}.com/{_slug(category)}/{rounds}",
+                    "data_to_extract": ["company culture", "tech stack"],
+                },
+                "id": f"call_{uuid4().hex[:12]}",
+            }
+        )
+        return message
+
+
+def _extract(pattern: str, text: str) -> str | None:
+    match = re.search(pattern, text)
+    return match.group(1).strip() if match else None
+
+
+def make_fake_tavily_tool(
+    scenario: BenchmarkScenario, provider_calls: ProviderCalls
+) -> BaseTool:
+    """Build a tool named like tools.tavily_tool returning canned search results."""
+
+    @tool("tavily_tool")
+    async def fake_tavily_tool(query: str) -> dict:
+        """Search the web and return the top results for a query."""
+        provider_calls.add("search")
+        await asyncio.sleep(scenario.search_latency)
+        domain = _slug(query.split()[0].strip('"'))
+        return {
+            "query": query,
+            "results": [
+                {
+                    "url": f"https://{domain}.com/result-{index}",
+                    "title": f"{query} result {index}",
+                    "content": _text(scenario.text_words * 2, query),
+                    "score": 1 - index / 10,
+                }
+                for index in range(5)
+            ],
+        }
+
+    return fake_tavily_tool
+
+
+class FakeFirecrawlClient:
+    """Stand-in for AsyncFirecrawlClient returning a synthetic page."""
+
+    def __init__(self, scenario: BenchmarkScenario, provider_calls: ProviderCalls):
+        """Initialize the client for a scenario."""
+        self.scenario = scenario
+        self.provider_calls = provider_calls
+
+    async def scrape_markdown(self, url: str, timeout: float | None = None) -> str:
+        """Return a page with navigation, boilerplate and several sections."""
+        self.provider_calls.add("scrape")
+        await asyncio.sleep(self.scenario.scrape_latency)
+        section_words = max(self.scenario.page_words // 6, 1)
+        sections = "\n\n".join(
+            f"## {title}\n\n{_text(section_words, title)}"
+            for title in (
+                "About us",
+                "Company culture",
+                "Our values",
+                "Tech stack",
+                "Press",
+                "Open positions",
+            )
+        )
+        return (
+            "[Home](/) | [About](/about) | [Careers](/careers)\n\n"
+            "We use cookies to improve your experience. Accept all\n\n"
+            f"# {url}\n\n{sections}\n\n© 2025 All rights reserved."
+        )
+
+    async def aclose(self) -> None:
+        """Nothing to close."""
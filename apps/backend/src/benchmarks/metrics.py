@@ -0,0 +1,230 @@
+"""Measurements collected while the pipeline runs under the benchmark harness.
+
+This module provides:
+- NodeMetricsCallback: LangChain callback timing every graph node and counting
+  the LLM calls and estimated prompt tokens each node makes
+- DatabaseRoundTrips: counts the statements and commits sent through the
+  application's SQLAlchemy engines
+- MemoryTracker: peak memory of a run
+
+Nodes of subgraphs are reported with their full path, for example
+"company_profiler/research_executor/run_research_tools", so a node running
+inside another node is counted in both.
+"""
+
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import BaseMessage
+from sqlalchemy import event
+
+from src.core.token_utils import estimate_message_tokens
+
+
+def node_path(metadata: dict[str, Any] | None) -> str | None:
+    """Return the node path of a run from its LangGraph metadata.
+
+    Args:
+        metadata: Callback metadata; LangGraph sets langgraph_checkpoint_ns to
+            "parent_node:task_id|node:task_id" for runs inside a node
+
+    Returns:
+        The path of node names joined with "/", or None outside of a node
+    """
+    namespace = (metadata or {}).get("langgraph_checkpoint_ns")
+    if not namespace:
+        return None
+    return "/".join(part.split(":", 1)[0] for part in namespace.split("|"))
+
+
+@dataclass
+class NodeStats:
+    """Timings and LLM usage of one graph node."""
+
+    runs: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    llm_calls: int = 0
+    prompt_tokens: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the stats as JSON-serializable data."""
+        return {
+            "runs": self.runs,
+            "total_seconds": round(self.total_seconds, 4),
+            "max_seconds": round(self.max_seconds, 4),
+            "llm_calls": self.llm_calls,
+            "prompt_tokens": self.prompt_tokens,
+        }
+
+
+class NodeMetricsCallback(BaseCallbackHandler):
+    """Callback recording per-node wall time and LLM usage."""
+
+    # Timings are taken in the calling task rather than in an executor thread
+    run_inline = True
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.nodes: dict[str, NodeStats] = defaultdict(NodeStats)
+        self.llm_calls = 0
+        self.prompt_tokens = 0
+        self._started: dict[UUID, tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def on_chain_start(
+        self,
+        serialized: dict[str, Any] | None,
+        inputs: Any,
+        *,
+        run_id: UUID,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Start timing a run when it is a graph node."""
+        metadata = metadata or {}
+        # Routing functions and the node's inner runnables share the node's
+        # metadata; only the node run itself carries the node's name
+        if kwargs.get("name") != metadata.get("langgraph_node"):
+            return
+        path = node_path(metadata)
+        if path is not None:
+            with self._lock:
+                self._started[run_id] = (path, time.perf_counter())
+
+    def _finish(self, run_id: UUID) -> None:
+        with self._lock:
+            started = self._started.pop(run_id, None)
+            if started is None:
+                return
+            path, start = started
+            elapsed = time.perf_counter() - start
+            stats = self.nodes[path]
+            stats.runs += 1
+            stats.total_seconds += elapsed
+            stats.max_seconds = max(stats.max_seconds, elapsed)
+
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        """Stop timing a node run."""
+        self._finish(run_id)
+
+    def on_chain_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        """Stop timing a node run that raised."""
+        self._finish(run_id)
+
+    def on_chat_model_start(
+        self,
+        serialized: dict[str, Any] | None,
+        messages: list[list[BaseMessage]],
+        *,
+        run_id: UUID,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Count an LLM call and its estimated prompt tokens."""
+        tokens = sum(estimate_message_tokens(prompt) for prompt in messages)
+        path = node_path(metadata) or "(outside graph)"
+        with self._lock:
+            self.llm_calls += 1
+            self.prompt_tokens += tokens
+            self.nodes[path].llm_calls += 1
+            self.nodes[path].prompt_tokens += tokens
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the collected statistics, nodes sorted by path."""
+        with self._lock:
+            return {
+                "llm_calls": self.llm_calls,
+                "prompt_tokens": self.prompt_tokens,
+                "nodes": {
+                    path: self.nodes[path].to_dict() for path in sorted(self.nodes)
+                },
+            }
+
+
+class DatabaseRoundTrips:
+    """Counts statements and commits sent through SQLAlchemy engines.
+
+    Use as a context manager around the measured code. The LangGraph Postgres
+    checkpointer uses its own psycopg pool and is not counted.
+    """
+
+    def __init__(self, *engines: Any) -> None:
+        """Initialize the counter for sync engines (use async_engine.sync_engine)."""
+        self.engines = engines
+        self.statements = 0
+        self.commits = 0
+        self._lock = threading.Lock()
+
+    def _on_statement(self, *args: Any, **kwargs: Any) -> None:
+        with self._lock:
+            self.statements += 1
+
+    def _on_commit(self, *args: Any, **kwargs: Any) -> None:
+        with self._lock:
+            self.commits += 1
+
+    def __enter__(self) -> "DatabaseRoundTrips":
+        """Start listening to the engines."""
+        for engine in self.engines:
+            event.listen(engine, "before_cursor_execute", self._on_statement)
+            event.listen(engine, "commit", self._on_commit)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Stop listening to the engines."""
+        for engine in self.engines:
+            event.remove(engine, "before_cursor_execute", self._on_statement)
+            event.remove(engine, "commit", self._on_commit)
+
+    def to_dict(self) -> dict[str, int]:
+        """Return the counters."""
+        return {"statements": self.statements, "commits": self.commits}
+
+
+@dataclass
+class MemoryTracker:
+    """Peak memory of the measured code.
+
+    The process peak RSS is always reported; it never decreases, so only the
+    first run of a process reflects that run alone. With trace enabled,
+    tracemalloc reports the peak of Python allocations during the run, at the
+    cost of slowing it down.
+    """
+
+    trace: bool = False
+    traced_peak_mb: float | None = field(default=None, init=False)
+
+    def __enter__(self) -> "MemoryTracker":
+        """Start tracing allocations when enabled."""
+        if self.trace:
+            tracemalloc.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Stop tracing and record the traced peak."""
+        if self.trace:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self.traced_peak_mb = round(peak / 2**20, 2)
+
+    @staticmethod
+    def max_rss_mb() -> float:
+        """Return the peak resident set size of the process in MiB."""
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Kilobytes on Linux, bytes on macOS
+        return round(max_rss / (2**20 if sys.platform == "darwin" else 2**10), 2)
+
+    def to_dict(self) -> dict[str, float | None]:
+        """Return the memory figures."""
+        return {"max_rss_mb": self.max_rss_mb(), "traced_peak_mb": self.traced_peak_mb}
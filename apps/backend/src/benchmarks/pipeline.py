@@ -0,0 +1,421 @@
+"""Replay benchmark of the resume generation pipeline.
+
+Runs the graph built by MainGraphAgent end to end with the LLM, Tavily and
+Firecrawl replaced by the deterministic fakes of src.benchmarks.fakes, and
+reports per run:
+
+- wall time, in total and per graph node
+- LLM calls and estimated prompt tokens, in total and per node
+- fake Tavily and Firecrawl calls
+- statements and commits sent to the application database
+- peak memory
+
+Everything else is the production code path: the graph, the event sink and the
+database writes of the nodes. A throwaway user and job application are created
+in the database given by DATABASE_URL (migrations applied) and deleted after
+each run. Checkpoints go to an InMemorySaver, or with --checkpointer postgres
+to the same database.
+
+Usage:
+    uv run python -m src.benchmarks.pipeline --runs 3 --llm-latency 0.05 \
+        --output report.json
+    uv run python -m src.benchmarks.pipeline --baseline report.json
+
+With --baseline, the run fails (exit status 1) when a counter exceeds the
+baseline by more than --tolerance, or the median wall time by more than
+--time-tolerance, so CI can catch regressions. The Pipeline Benchmark workflow
+compares every change against src/benchmarks/baseline.json; regenerate it with
+--output when a change is expected to move the counters.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+from unittest import mock
+from uuid import uuid4
+
+from sqlalchemy import delete
+
+from src.benchmarks.fakes import (
+    BenchmarkScenario,
+    FakeChatModel,
+    FakeFirecrawlClient,
+    ProviderCalls,
+    fake_value,
+    make_fake_tavily_tool,
+)
+from src.benchmarks.metrics import (
+    DatabaseRoundTrips,
+    MemoryTracker,
+    NodeMetricsCallback,
+)
+from src.core import cache
+from src.core.rate_limit_handlers import (
+    InMemoryTokenBucketStore,
+    TokenBucketRateLimiter,
+)
+
+logger = logging.getLogger(__name__)
+
+# Counters compared against a baseline with --tolerance
+COUNTER_KEYS = ("llm_calls", "prompt_tokens", "db_statements", "db_commits")
+
+
+def _unlimited_rate_limiter(*args: Any, **kwargs: Any) -> TokenBucketRateLimiter:
+    # Fakes have no quota, and waiting on real limits would hide pipeline costs
+    return TokenBucketRateLimiter(
+        "benchmark", 1_000_000.0, store=InMemoryTokenBucketStore()
+    )
+
+
+@contextlib.contextmanager
+def fake_providers(
+    scenario: BenchmarkScenario, provider_calls: ProviderCalls, model: FakeChatModel
+) -> Iterator[None]:
+    """Route the pipeline's provider calls to the fakes.
+
+    Also disables the provider rate limits and gives the run an empty in-memory
+    response cache, so every run makes the same calls.
+    """
+    from src.job_applications import tools
+    from src.job_applications.agents.company_profiler_agents import (
+        company_discovery_agent,
+        research_executor_agent,
+    )
+
+    fake_tavily = make_fake_tavily_tool(scenario, provider_calls)
+    fake_firecrawl = FakeFirecrawlClient(scenario, provider_calls)
+    previous_cache = cache._response_cache
+    with contextlib.ExitStack() as stack:
+        for module in (tools, company_discovery_agent, research_executor_agent):
+            stack.enter_context(mock.patch.object(module, "tavily_tool", fake_tavily))
+        stack.enter_context(
+            mock.patch.object(tools, "get_firecrawl_client", lambda: fake_firecrawl)
+        )
+        stack.enter_context(
+            mock.patch.object(tools, "_get_summarizer_model", lambda: model)
+        )
+        stack.enter_context(
+            mock.patch.object(tools, "get_rate_limiter", _unlimited_rate_limiter)
+        )
+        cache.set_response_cache(cache.InMemoryResponseCache())
+        try:
+            yield
+        finally:
+            cache.set_response_cache(previous_cache)
+
+
+@contextlib.asynccontextmanager
+async def _checkpointer(kind: str) -> AsyncIterator[Any]:
+    if kind == "memory":
+        from langgraph.checkpoint.memory import InMemorySaver
+
+        yield InMemorySaver()
+        return
+    from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+
+    async with AsyncPostgresSaver.from_conn_string(
+        os.environ["DATABASE_URL"]
+    ) as checkpointer:
+        await checkpointer.setup()
+        yield checkpointer
+
+
+@contextlib.asynccontextmanager
+async def _throwaway_job_application(
+    scenario: BenchmarkScenario,
+) -> AsyncIterator[Any]:
+    from src.configs.database_config import get_async_session_context
+    from src.core.types import Resume
+    from src.job_applications.model import CompanyResearchCache, JobApplication
+    from src.user.model import User
+
+    suffix = uuid4().hex[:8]
+    # A new company per run, so the company research cache never hits
+    company = f"Benchmark Labs {suffix}"
+    resume = fake_value(Resume, text_words=scenario.text_words, company=company)
+    user = User(
+        name="Benchmark",
+        email=f"benchmark-{suffix}@example.com",
+        initial_resume=resume,
+    )
+    job_application = JobApplication(
+        job_title="Senior Backend Engineer",
+        company_name=company,
+        job_description=fake_value(str, "job description", text_words=400),
+        original_resume_snapshot={"resume": resume},
+        user_id=user.id,
+        generated_cover_letter=None,
+        background_task_id=None,
+        resume_generation_status="pending",
+    )
+    async with get_async_session_context() as session:
+        session.add(user)
+        await session.flush()
+        session.add(job_application)
+        await session.commit()
+    try:
+        yield job_application
+    finally:
+        async with get_async_session_context() as session:
+            await session.execute(
+                delete(CompanyResearchCache).where(
+                    CompanyResearchCache.company_name == company
+                )
+            )
+            # Job applications and their events are deleted by cascade
+            await session.execute(delete(User).where(User.id == user.id))
+            await session.commit()
+
+
+async def run_pipeline_once(
+    scenario: BenchmarkScenario,
+    *,
+    checkpointer: str = "memory",
+    trace_memory: bool = False,
+) -> dict[str, Any]:
+    """Run the pipeline once against the fakes and return its measurements.
+
+    Args:
+        scenario: Latency and workload of the fake providers
+        checkpointer: "memory" for an InMemorySaver, "postgres" for the
+            Postgres checkpointer on DATABASE_URL
+        trace_memory: Trace Python allocations to report the run's own peak
+
+    Returns:
+        The measurements of the run
+    """
+    from src.configs.database_config import async_engine, engine
+    from src.job_applications.agents.main_graph import MainGraphAgent, MainGraphState
+    from src.job_applications.services.event_sink import aflush_event_sink
+
+    provider_calls = ProviderCalls()
+    model = FakeChatModel(scenario=scenario, provider_calls=provider_calls)
+    callback = NodeMetricsCallback()
+    round_trips = DatabaseRoundTrips(engine, async_engine.sync_engine)
+    memory = MemoryTracker(trace=trace_memory)
+
+    async with (
+        _throwaway_job_application(scenario) as job_application,
+        _checkpointer(checkpointer) as saver,
+    ):
+        graph = MainGraphAgent(
+            model=model, rate_limiter=_unlimited_rate_limiter()
+        ).build_graph(checkpointer=saver)
+        input_state = MainGraphState(
+            job_application_id=job_application.id,
+            job_role=job_application.job_title,
+            job_description=job_application.job_description,
+            company=job_application.company_name,
+            original_resume_snapshot=job_application.original_resume_snapshot["resume"],
+        )
+        with fake_providers(scenario, provider_calls, model), round_trips, memory:
+            start = time.perf_counter()
+            try:
+                await graph.ainvoke(
+                    input_state,
+                    config={
+                        "configurable": {"thread_id": job_application.id},
+                        "callbacks": [callback],
+                    },
+                )
+            finally:
+                await aflush_event_sink()
+            wall_seconds = time.perf_counter() - start
+
+    node_metrics = callback.to_dict()
+    return {
+        "wall_seconds": round(wall_seconds, 4),
+        "llm_calls": node_metrics["llm_calls"],
+        "prompt_tokens": node_metrics["prompt_tokens"],
+        "provider_calls": provider_calls.to_dict(),
+        "db_statements": round_trips.statements,
+        "db_commits": round_trips.commits,
+        "memory": memory.to_dict(),
+        "nodes": node_metrics["nodes"],
+    }
+
+
+def summarize(runs: list[dict[str, Any]]) -> dict[str, Any]:
+    """Summarize runs with medians, so one slow run does not skew the result."""
+    wall_times = [run["wall_seconds"] for run in runs]
+    summary: dict[str, Any] = {
+        "wall_seconds": {
+            "median": round(statistics.median(wall_times), 4),
+            "min": min(wall_times),
+            "max": max(wall_times),
+        },
+        "max_rss_mb": max(run["memory"]["max_rss_mb"] for run in runs),
+        "node_median_seconds": {
+            path: round(
+                statistics.median(
+                    run["nodes"][path]["total_seconds"]
+                    for run in runs
+                    if path in run["nodes"]
+                ),
+                4,
+            )
+            for path in sorted({path for run in runs for path in run["nodes"]})
+        },
+    }
+    for key in COUNTER_KEYS:
+        summary[key] = statistics.median(run[key] for run in runs)
+    return summary
+
+
+def compare_with_baseline(
+    summary: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerance: float = 0.1,
+    time_tolerance: float = 0.5,
+) -> list[str]:
+    """List the regressions of a summary against a baseline summary.
+
+    Args:
+        summary: Summary of the current runs
+        baseline: Summary of the baseline runs
+        tolerance: Allowed relative increase of the counters
+        time_tolerance: Allowed relative increase of the median wall time
+
+    Returns:
+        One message per regression; empty when there is none
+    """
+    regressions = []
+    limits = [(key, summary[key], baseline.get(key), tolerance) for key in COUNTER_KEYS]
+    limits.append(
+        (
+            "wall_seconds.median",
+            summary["wall_seconds"]["median"],
+            (baseline.get("wall_seconds") or {}).get("median"),
+            time_tolerance,
+        )
+    )
+    for name, current, reference, allowed in limits:
+        if reference is None:
+            continue
+        if current > reference * (1 + allowed):
+            regressions.append(
+                f"{name}: {current} exceeds baseline {reference} "
+                f"by more than {allowed:.0%}"
+            )
+    return regressions
+
+
+async def run_benchmark(
+    scenario: BenchmarkScenario,
+    runs: int = 1,
+    *,
+    checkpointer: str = "memory",
+    trace_memory: bool = False,
+) -> dict[str, Any]:
+    """Run the pipeline several times and return the report of all runs."""
+    from src.configs.database_config import dispose_async_engine
+
+    try:
+        results = [
+            await run_pipeline_once(
+                scenario, checkpointer=checkpointer, trace_memory=trace_memory
+            )
+            for _ in range(runs)
+        ]
+    finally:
+        await dispose_async_engine()
+    return {
+        "scenario": scenario.to_dict(),
+        "checkpointer": checkpointer,
+        "summary": summarize(results),
+        "runs": results,
+    }
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    defaults = BenchmarkScenario()
+    parser = argparse.ArgumentParser(
+        description="Replay the resume pipeline against fake providers."
+    )
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument(
+        "--checkpointer", choices=("memory", "postgres"), default="memory"
+    )
+    parser.add_argument("--llm-latency", type=float, default=defaults.llm_latency)
+    parser.add_argument("--search-latency", type=float, default=defaults.search_latency)
+    parser.add_argument("--scrape-latency", type=float, default=defaults.scrape_latency)
+    parser.add_argument("--categories", type=int, default=defaults.research_categories)
+    parser.add_argument("--research-rounds", type=int, default=defaults.research_rounds)
+    parser.add_argument(
+        "--resume-grades",
+        type=int,
+        nargs="+",
+        default=list(defaults.resume_grades),
+        help="grades of successive resume evaluations",
+    )
+    parser.add_argument(
+        "--cover-letter-grades",
+        type=int,
+        nargs="+",
+        default=list(defaults.cover_letter_grades),
+        help="grades of successive cover letter evaluations",
+    )
+    parser.add_argument("--page-words", type=int, default=defaults.page_words)
+    parser.add_argument("--trace-memory", action="store_true")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    parser.add_argument("--time-tolerance", type=float, default=0.5)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark from the command line; returns the exit status."""
+    args = _parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    scenario = BenchmarkScenario(
+        llm_latency=args.llm_latency,
+        search_latency=args.search_latency,
+        scrape_latency=args.scrape_latency,
+        research_categories=args.categories,
+        research_rounds=args.research_rounds,
+        resume_grades=tuple(args.resume_grades),
+        cover_letter_grades=tuple(args.cover_letter_grades),
+        page_words=args.page_words,
+    )
+    report = asyncio.run(
+        run_benchmark(
+            scenario,
+            args.runs,
+            checkpointer=args.checkpointer,
+            trace_memory=args.trace_memory,
+        )
+    )
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    print(json.dumps(report["summary"], indent=2))
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_with_baseline(
+            report["summary"],
+            baseline["summary"],
+            args.tolerance,
+            args.time_tolerance,
+        )
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
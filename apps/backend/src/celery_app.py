@@ -4,6 +4,7 @@ This module sets up the Celery distributed task queue with:
 - Broker configuration (Redis)
 - Result backend configuration (PostgreSQL)
 - Task routing and concurrency settings
+- Periodic tasks run by Celery beat
 - Task failure handlers and logging
 """
 
@@ -14,8 +15,11 @@ import os
 from celery import Celery
 from celery.signals import (
     task_failure,
+    worker_init,
 )
 
+from src.job_applications.pipeline_runtime import PIPELINE_MAX_IN_FLIGHT
+
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +92,16 @@ task_routes = {
     "src.job_applications.generate_resume_job.*": {"queue": "generate_resume"},
 }
 
+# Periodic tasks, sent by a `celery -A src.celery_app beat` process
+beat_schedule = {
+    "purge-expired-company-research": {
+        "task": "src.job_applications.generate_resume_job.purge_expired_company_research",
+        "schedule": float(
+            os.environ.get("COMPANY_RESEARCH_PURGE_INTERVAL_SECONDS", 6 * 60 * 60)
+        ),
+    },
+}
+
 
 def _to_int(env_name: str, default: int) -> int:
     val = os.environ.get(env_name, None)
@@ -100,6 +114,22 @@ def _to_int(env_name: str, default: int) -> int:
         return default
 
 
+# Pipelines are I/O bound and share one event loop per process (see
+# PipelineRuntime), so threads rather than prefork processes by default
+worker_pool = os.environ.get("CELERY_POOL", "threads")
+
+# Time limits and child recycling are only enforced by the prefork pool; the
+# threads pool ignores them, so they are only set when they take effect
+prefork_settings = {}
+if worker_pool == "prefork":
+    prefork_settings = dict(
+        task_time_limit=60 * 60 * 24,  # 24 hours timeout for tasks
+        # Recycle workers to avoid gradual memory growth from async libs
+        worker_max_tasks_per_child=_to_int("CELERY_MAX_TASKS_PER_CHILD", 100),
+        # Child processes open the pipeline runtime (DB pool, compiled graph) on boot
+        worker_proc_alive_timeout=_to_int("CELERY_PROC_ALIVE_TIMEOUT", 30),
+    )
+
 # Optional configuration
 app.conf.update(
     task_serializer="json",
@@ -108,7 +138,6 @@ app.conf.update(
     timezone="UTC",
     enable_utc=True,
     task_track_started=True,
-    task_time_limit=60 * 60 * 24,  # 24 hours timeout for tasks
     worker_hijack_root_logger=False,
     # Fix upcoming deprecation warning
     broker_connection_retry_on_startup=True,
@@ -118,11 +147,16 @@ app.conf.update(
     result_extended=False,
     # Add task routing
     # Concurrency & lifecycle
-    worker_concurrency=_to_int("CELERY_CONCURRENCY", 1),
+    worker_pool=worker_pool,
+    # A thread blocks on each pipeline while at most PIPELINE_MAX_IN_FLIGHT of
+    # them run on the runtime loop, so fewer threads would leave slots unused
+    worker_concurrency=_to_int(
+        "CELERY_CONCURRENCY",
+        PIPELINE_MAX_IN_FLIGHT if worker_pool == "threads" else 1,
+    ),
     worker_prefetch_multiplier=1,
     task_acks_late=True,
-    # Recycle workers to avoid gradual memory growth from async libs
-    worker_max_tasks_per_child=_to_int("CELERY_MAX_TASKS_PER_CHILD", 100),
+    **prefork_settings,
     # Add result backend settings
     result_backend_transport_options={
         "retry_policy": {
@@ -142,6 +176,7 @@ app.conf.update(
         },
     },
     task_routes=task_routes,
+    beat_schedule=beat_schedule,
 )
 
 
@@ -159,5 +194,13 @@ def on_task_failure(sender=None, task_id=None, exception=None, einfo=None, **kwa
     logger.error("Task failed — task_id=%s exception=%s", task_id, str(exception))
 
 
+@worker_init.connect
+def start_worker_metrics_server(**kwargs):
+    """Serve the pipeline's Prometheus metrics from the worker's main process."""
+    from src.core.instrumentation import start_metrics_server
+
+    start_metrics_server()
+
+
 if __name__ == "__main__":
     app.start()
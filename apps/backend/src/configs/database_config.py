@@ -3,6 +3,7 @@
 This module provides:
 - Database engine configuration with optimized connection pooling
 - Session management utilities (generator and context manager based)
+- An async engine (psycopg 3) with matching async session utilities
 - Database initialization with schema creation
 """
 
@@ -11,9 +12,12 @@ import logging
 import os
 
 from sqlalchemy import inspect
+from sqlalchemy.engine import make_url
 from sqlalchemy.exc import DBAPIError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.schema import CreateSchema
 from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -55,6 +59,33 @@ engine = create_engine(
     },
 )
 
+# Async engine used by the FastAPI routes and the graph nodes. It shares the
+# pool settings above; DB_ASYNC_POOL_SIZE / DB_ASYNC_MAX_OVERFLOW override them.
+ASYNC_DATABASE_URL = make_url(DATABASE_URL).set(drivername="postgresql+psycopg")
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    echo=os.getenv("DB_ECHO", "false").lower() == "true",
+    pool_size=int(os.getenv("DB_ASYNC_POOL_SIZE", str(DEFAULT_POOL_SIZE))),
+    max_overflow=int(os.getenv("DB_ASYNC_MAX_OVERFLOW", str(DEFAULT_MAX_OVERFLOW))),
+    pool_timeout=DEFAULT_POOL_TIMEOUT,
+    pool_recycle=DEFAULT_POOL_RECYCLE,
+    pool_pre_ping=DEFAULT_POOL_PRE_PING,
+    pool_use_lifo=DEFAULT_POOL_USE_LIFO,
+    connect_args={
+        "keepalives": KEEPALIVES,
+        "keepalives_idle": KEEPALIVES_IDLE,
+        "keepalives_interval": KEEPALIVES_INTERVAL,
+        "keepalives_count": KEEPALIVES_COUNT,
+        "connect_timeout": 10,
+        "application_name": "resumind",
+    },
+)
+
+# Objects stay usable after commit: async sessions cannot lazily reload them
+async_session_factory = async_sessionmaker(
+    async_engine, class_=AsyncSession, expire_on_commit=False
+)
+
 
 def get_session():
     """Creates and yields a database session.
@@ -133,6 +164,73 @@ def get_session_context():
         session.close()
 
 
+async def get_async_session():
+    """Creates and yields an async database session.
+
+    To be used as a FastAPI dependency.
+    """
+    session = async_session_factory()
+    try:
+        yield session
+        # Auto-commit at the end of request if not already committed
+        if session.in_transaction():
+            await session.commit()
+    except Exception as e:
+        try:
+            await session.rollback()
+        except Exception as rollback_error:
+            logger.error(f"Error during rollback: {str(rollback_error)}")
+        logger.error(f"Async database session error: {str(e)}")
+        raise
+    finally:
+        try:
+            from src.core.service_registry import ServiceRegistry
+
+            ServiceRegistry.clear_session(session)
+            await session.close()
+        except Exception as close_error:
+            logger.error(f"Error closing async database session: {str(close_error)}")
+
+
+@contextlib.asynccontextmanager
+async def get_async_session_context():
+    """Async context manager for database sessions.
+
+    Async counterpart of get_session_context, for code running on an event loop.
+
+    Example:
+        async with get_async_session_context() as session:
+            # Use session here
+    """
+    session = async_session_factory()
+    try:
+        yield session
+        await session.commit()
+    except Exception as e:
+        await session.rollback()
+        logger.error(f"Async database session error (context manager): {str(e)}")
+        raise
+    finally:
+        try:
+            from src.core.service_registry import ServiceRegistry
+
+            ServiceRegistry.clear_session(session)
+        except Exception as cleanup_error:
+            logger.error(f"Error cleaning up services: {str(cleanup_error)}")
+
+        await session.close()
+
+
+async def dispose_async_engine() -> None:
+    """Close the async engine's pooled connections.
+
+    Pooled async connections are bound to the event loop that opened them, so
+    code running each job in its own short-lived loop must dispose the pool
+    before that loop closes.
+    """
+    await async_engine.dispose()
+
+
 def init_db():
     """Initialize the database by creating schemas and tables."""
     inspector = inspect(engine)
@@ -0,0 +1,299 @@
+"""Response cache for calls to paid external APIs.
+
+This module provides:
+- ResponseCache: interface for caching JSON-serializable responses by namespace and key
+- InMemoryResponseCache: per-process LRU cache, used in tests and as a fallback
+- RedisResponseCache: cache shared by every process using the same Redis server
+- get_response_cache: process-wide cache selected from the environment
+- normalize_query / normalize_url: key helpers so equivalent requests share an entry
+
+Every entry has a TTL, and each namespace holds at most max_entries entries; the
+least recently used ones are evicted first. Hits and misses are counted per
+namespace in the current process (see ResponseCache.stats) and exported as the
+resumind_response_cache_hits / resumind_response_cache_misses Prometheus counters.
+
+Caching is best-effort: when Redis is unreachable the Redis cache serves from
+its in-memory fallback instead of failing the call it wraps.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from logging import getLogger
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from src.core.instrumentation import record_cache_lookup
+
+logger = getLogger(__name__)
+
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "5000"))
+
+# Query parameters that never change the content of a page
+_TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "ref"}
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a search query: case-folded with collapsed whitespace."""
+    return " ".join(query.casefold().split())
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a URL so that equivalent addresses share a cache entry.
+
+    Lowercases the scheme and host, defaults the scheme to https, drops the
+    fragment, tracking parameters and trailing slash, and sorts the query.
+    """
+    url = url.strip()
+    parts = urlsplit(url if "//" in url else f"https://{url}")
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in _TRACKING_PARAMS
+    )
+    return urlunsplit(
+        (
+            (parts.scheme or "https").lower(),
+            parts.netloc.lower(),
+            parts.path.rstrip("/") or "/",
+            urlencode(query),
+            "",
+        )
+    )
+
+
+def _hash_key(key: str) -> str:
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+class ResponseCache(ABC):
+    """Interface for caching responses by namespace and key."""
+
+    def __init__(self) -> None:
+        """Initialize the hit and miss counters."""
+        self._stats: dict[str, dict[str, int]] = {}
+        self._stats_lock = threading.Lock()
+
+    @abstractmethod
+    async def get(self, namespace: str, key: str) -> Any | None:
+        """Return the cached value, or None when missing or expired."""
+
+    @abstractmethod
+    async def set(self, namespace: str, key: str, value: Any, ttl: float) -> None:
+        """Store a JSON-serializable value for ttl seconds."""
+
+    def _count(self, namespace: str, outcome: str) -> None:
+        with self._stats_lock:
+            counters = self._stats.setdefault(namespace, {"hits": 0, "misses": 0})
+            counters[outcome] += 1
+        record_cache_lookup(namespace, hit=outcome == "hits")
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Return the hit and miss counters of each namespace in this process."""
+        with self._stats_lock:
+            return {
+                namespace: dict(counts) for namespace, counts in self._stats.items()
+            }
+
+    async def get_or_set(
+        self,
+        namespace: str,
+        key: str,
+        factory: Callable[[], Awaitable[Any]],
+        ttl: float,
+        should_cache: Callable[[Any], bool] | None = None,
+    ) -> Any:
+        """Return the cached value, computing and storing it on a miss.
+
+        Args:
+            namespace: Cache namespace, e.g. "tavily" or "firecrawl"
+            key: Normalized request key
+            factory: Coroutine function producing the value on a miss
+            ttl: Lifetime of a stored value in seconds
+            should_cache: Predicate deciding whether a computed value is stored
+
+        Returns:
+            The cached or freshly computed value
+        """
+        value = await self.get(namespace, key)
+        if value is not None:
+            self._count(namespace, "hits")
+            return value
+        self._count(namespace, "misses")
+        value = await factory()
+        if value is not None and (should_cache is None or should_cache(value)):
+            await self.set(namespace, key, value, ttl)
+        return value
+
+
+class InMemoryResponseCache(ResponseCache):
+    """LRU cache kept in the current process."""
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES) -> None:
+        """Initialize an empty cache holding at most max_entries per namespace."""
+        super().__init__()
+        self.max_entries = max(1, max_entries)
+        self._entries: dict[str, OrderedDict[str, tuple[float, str]]] = {}
+        self._lock = threading.Lock()
+
+    async def get(self, namespace: str, key: str) -> Any | None:
+        """Return the cached value, or None when missing or expired."""
+        with self._lock:
+            entries = self._entries.get(namespace)
+            entry = entries.get(key) if entries else None
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if expires_at <= time.monotonic():
+                del entries[key]
+                return None
+            entries.move_to_end(key)
+        return json.loads(payload)
+
+    async def set(self, namespace: str, key: str, value: Any, ttl: float) -> None:
+        """Store a JSON-serializable value for ttl seconds."""
+        payload = json.dumps(value, default=str)
+        with self._lock:
+            entries = self._entries.setdefault(namespace, OrderedDict())
+            entries[key] = (time.monotonic() + ttl, payload)
+            entries.move_to_end(key)
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+
+
+class RedisResponseCache(ResponseCache):
+    """Cache shared through Redis by every process using the same server.
+
+    Values live under "<prefix>:<namespace>:<sha256(key)>" with a Redis TTL. A
+    sorted set per namespace records the last access time of each entry and is
+    used to evict the least recently used entries beyond max_entries.
+    """
+
+    def __init__(
+        self,
+        redis_url: str,
+        *,
+        key_prefix: str = "resumind:cache",
+        max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+        fallback: ResponseCache | None = None,
+        retry_after_seconds: float = 30.0,
+    ) -> None:
+        """Initialize the cache for the given Redis URL."""
+        super().__init__()
+        self.redis_url = redis_url
+        self.key_prefix = key_prefix
+        self.max_entries = max(1, max_entries)
+        self.fallback = fallback or InMemoryResponseCache(max_entries)
+        self.retry_after_seconds = retry_after_seconds
+        # redis.asyncio clients are bound to the loop that created them
+        self._clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._unavailable_until = 0.0
+
+    def _get_client(self):
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.get(loop)
+            if client is None:
+                import redis.asyncio as aioredis
+
+                client = aioredis.Redis.from_url(
+                    self.redis_url, socket_connect_timeout=1, socket_timeout=1
+                )
+                self._clients[loop] = client
+            return client
+
+    def _available(self) -> bool:
+        return time.monotonic() >= self._unavailable_until
+
+    def _mark_unavailable(self, error: Exception) -> None:
+        logger.warning(f"Redis response cache unavailable, using in-process: {error}")
+        self._unavailable_until = time.monotonic() + self.retry_after_seconds
+
+    async def get(self, namespace: str, key: str) -> Any | None:
+        """Return the cached value, or None when missing or expired."""
+        if not self._available():
+            return await self.fallback.get(namespace, key)
+        entry_key = _hash_key(key)
+        try:
+            client = self._get_client()
+            payload = await client.get(f"{self.key_prefix}:{namespace}:{entry_key}")
+            if payload is None:
+                return None
+            await client.zadd(
+                f"{self.key_prefix}:{namespace}:lru", {entry_key: time.time()}
+            )
+            return json.loads(payload)
+        except Exception as e:
+            self._mark_unavailable(e)
+            return await self.fallback.get(namespace, key)
+
+    async def set(self, namespace: str, key: str, value: Any, ttl: float) -> None:
+        """Store a JSON-serializable value for ttl seconds."""
+        if not self._available():
+            await self.fallback.set(namespace, key, value, ttl)
+            return
+        entry_key = _hash_key(key)
+        lru_key = f"{self.key_prefix}:{namespace}:lru"
+        try:
+            client = self._get_client()
+            async with client.pipeline(transaction=True) as pipe:
+                pipe.set(
+                    f"{self.key_prefix}:{namespace}:{entry_key}",
+                    json.dumps(value, default=str),
+                    ex=max(1, int(ttl)),
+                )
+                pipe.zadd(lru_key, {entry_key: time.time()})
+                pipe.zcard(lru_key)
+                size = (await pipe.execute())[-1]
+            if size > self.max_entries:
+                evicted = await client.zpopmin(lru_key, size - self.max_entries)
+                if evicted:
+                    await client.delete(
+                        *[
+                            f"{self.key_prefix}:{namespace}:{member.decode()}"
+                            for member, _ in evicted
+                        ]
+                    )
+        except Exception as e:
+            self._mark_unavailable(e)
+            await self.fallback.set(namespace, key, value, ttl)
+
+
+_response_cache: ResponseCache | None = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide response cache.
+
+    Uses Redis when RESPONSE_CACHE_BACKEND is "redis" (the default whenever a
+    REDIS_URL or CELERY_BROKER_URL is configured), an in-process cache when it
+    is "memory".
+    """
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is None:
+            redis_url = os.getenv("REDIS_URL") or os.getenv("CELERY_BROKER_URL")
+            backend = os.getenv(
+                "RESPONSE_CACHE_BACKEND", "redis" if redis_url else "memory"
+            ).lower()
+            if backend == "redis" and redis_url:
+                _response_cache = RedisResponseCache(redis_url)
+            else:
+                _response_cache = InMemoryResponseCache()
+        return _response_cache
+
+
+def set_response_cache(cache: ResponseCache | None) -> None:
+    """Override the process-wide response cache (None resets to the default)."""
+    global _response_cache
+    with _response_cache_lock:
+        _response_cache = cache
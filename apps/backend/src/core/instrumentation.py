@@ -0,0 +1,310 @@
+"""Tracing of pipeline nodes and tool calls, exported as Prometheus metrics.
+
+This module provides:
+- instrument_node: decorator opening a span around a graph node
+- instrument_tool: async context manager opening a span around a tool call
+- LLMUsageCallback: LangChain callback recording the token usage of LLM calls
+- llm_token_usage: prompt and completion tokens reported for an LLM call
+- record_retry / record_rate_limit_wait: called by the rate limit helpers
+- record_cache_lookup: called by the response cache on every lookup
+- current_span_metrics: measurements of the innermost open span, attached to
+  the data of the succeeded and failed events emitted inside it
+- start_metrics_server: Prometheus endpoint of the FastAPI app and the Celery
+  worker, served on an internal port apart from the public API
+
+Spans live in a context variable, so concurrent pipelines on one event loop
+and tool calls gathered inside a node are measured separately. A measurement
+recorded in a tool span is also added to the node span around it.
+
+Configuration:
+- PROMETHEUS_MULTIPROC_DIR: enables prometheus_client multiprocess mode, needed
+  to aggregate metrics of prefork worker processes
+- CELERY_METRICS_PORT: port of the worker's metrics server (default 9540, 0 disables)
+- API_METRICS_PORT: port of the FastAPI app's metrics server (default 9541, 0 disables)
+"""
+
+import contextlib
+import contextvars
+import functools
+import inspect
+import os
+import threading
+import time
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+from logging import getLogger
+from typing import Any
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import ChatGeneration, LLMResult
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    multiprocess,
+    start_http_server,
+)
+
+logger = getLogger(__name__)
+
+CELERY_METRICS_PORT = int(os.getenv("CELERY_METRICS_PORT", "9540"))
+API_METRICS_PORT = int(os.getenv("API_METRICS_PORT", "9541"))
+
+_DURATION_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+
+NODE_DURATION = Histogram(
+    "resumind_pipeline_node_duration_seconds",
+    "Wall time of pipeline graph nodes",
+    ["node", "status"],
+    buckets=_DURATION_BUCKETS,
+)
+TOOL_DURATION = Histogram(
+    "resumind_pipeline_tool_duration_seconds",
+    "Wall time of agent tool calls",
+    ["tool", "status"],
+    buckets=_DURATION_BUCKETS,
+)
+LLM_CALLS = Counter("resumind_llm_calls", "LLM calls made by pipeline nodes", ["node"])
+LLM_TOKENS = Counter(
+    "resumind_llm_tokens",
+    "LLM tokens reported by the provider, by node and kind (prompt or completion)",
+    ["node", "kind"],
+)
+LLM_RETRIES = Counter(
+    "resumind_llm_retries", "Calls retried after a provider rate limit error", ["node"]
+)
+RATE_LIMIT_WAIT = Counter(
+    "resumind_rate_limit_wait_seconds",
+    "Time spent waiting on client-side rate limiters",
+    ["limiter"],
+)
+RESPONSE_CACHE_HITS = Counter(
+    "resumind_response_cache_hits",
+    "External API responses served from the response cache",
+    ["namespace"],
+)
+RESPONSE_CACHE_MISSES = Counter(
+    "resumind_response_cache_misses",
+    "External API calls made because no response was cached",
+    ["namespace"],
+)
+
+
+@dataclass
+class Span:
+    """Measurements of one node run or tool call.
+
+    Attributes:
+        kind: "node" or "tool"
+        name: Node or tool name
+        parent: The span this one was opened in, if any
+        status: "ok" unless the span raised or was marked as failed
+    """
+
+    kind: str
+    name: str
+    parent: "Span | None" = None
+    status: str = "ok"
+    started_at: float = field(default_factory=time.perf_counter)
+    llm_calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    retries: int = 0
+    rate_limit_wait_seconds: float = 0.0
+
+    def lineage(self) -> list["Span"]:
+        """Return this span followed by its ancestors."""
+        spans: list[Span] = []
+        span: Span | None = self
+        while span is not None:
+            spans.append(span)
+            span = span.parent
+        return spans
+
+    @property
+    def node(self) -> str:
+        """Name of the innermost node span, used as the metrics label."""
+        return next(
+            (span.name for span in self.lineage() if span.kind == "node"), "none"
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the measurements taken so far."""
+        return {
+            "duration_ms": round((time.perf_counter() - self.started_at) * 1000),
+            "llm_calls": self.llm_calls,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "retries": self.retries,
+            "rate_limit_wait_ms": round(self.rate_limit_wait_seconds * 1000),
+        }
+
+
+_current_span: contextvars.ContextVar[Span | None] = contextvars.ContextVar(
+    "instrumentation_span", default=None
+)
+# Tool spans of gathered calls update their node span from several tasks
+_span_lock = threading.Lock()
+
+
+def current_span() -> Span | None:
+    """Return the innermost open span of the current context."""
+    return _current_span.get()
+
+
+def current_span_metrics() -> dict[str, Any] | None:
+    """Return the measurements of the innermost open span, or None outside one."""
+    span = _current_span.get()
+    return span.to_dict() if span is not None else None
+
+
+def _add(attribute: str, amount: float) -> None:
+    span = _current_span.get()
+    if span is None:
+        return
+    with _span_lock:
+        for owner in span.lineage():
+            setattr(owner, attribute, getattr(owner, attribute) + amount)
+
+
+def record_llm_call(prompt_tokens: int = 0, completion_tokens: int = 0) -> None:
+    """Record an LLM call and its token usage in the open spans."""
+    span = _current_span.get()
+    node = span.node if span is not None else "none"
+    LLM_CALLS.labels(node=node).inc()
+    LLM_TOKENS.labels(node=node, kind="prompt").inc(prompt_tokens)
+    LLM_TOKENS.labels(node=node, kind="completion").inc(completion_tokens)
+    _add("llm_calls", 1)
+    _add("prompt_tokens", prompt_tokens)
+    _add("completion_tokens", completion_tokens)
+
+
+def record_retry() -> None:
+    """Record a call retried after a rate limit error."""
+    span = _current_span.get()
+    LLM_RETRIES.labels(node=span.node if span is not None else "none").inc()
+    _add("retries", 1)
+
+
+def record_rate_limit_wait(limiter: str, seconds: float) -> None:
+    """Record time spent waiting on a rate limiter."""
+    if seconds <= 0:
+        return
+    RATE_LIMIT_WAIT.labels(limiter=limiter).inc(seconds)
+    _add("rate_limit_wait_seconds", seconds)
+
+
+def record_cache_lookup(namespace: str, hit: bool) -> None:
+    """Record a response cache lookup and whether it was a hit."""
+    counter = RESPONSE_CACHE_HITS if hit else RESPONSE_CACHE_MISSES
+    counter.labels(namespace=namespace).inc()
+
+
+@contextlib.contextmanager
+def _span(kind: str, name: str, histogram: Histogram, label: str):
+    span = Span(kind=kind, name=name, parent=_current_span.get())
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException:
+        span.status = "error"
+        raise
+    finally:
+        _current_span.reset(token)
+        histogram.labels(**{label: name, "status": span.status}).observe(
+            time.perf_counter() - span.started_at
+        )
+
+
+def instrument_node(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorate a graph node so its runs are traced as spans named after it.
+
+    Works with both sync and async nodes.
+
+    Args:
+        name: Node name used in metrics labels, e.g. "resume_generator/evaluator"
+    """
+
+    def decorator(node: Callable[..., Any]) -> Callable[..., Any]:
+        if not inspect.iscoroutinefunction(node):
+
+            @functools.wraps(node)
+            def sync_wrapper(*args, **kwargs):
+                with _span("node", name, NODE_DURATION, "node"):
+                    return node(*args, **kwargs)
+
+            return sync_wrapper
+
+        @functools.wraps(node)
+        async def wrapper(*args, **kwargs):
+            with _span("node", name, NODE_DURATION, "node"):
+                return await node(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextlib.asynccontextmanager
+async def instrument_tool(name: str) -> AsyncIterator[Span]:
+    """Trace a tool call as a span; set the span's status to "error" on handled failures."""
+    with _span("tool", name, TOOL_DURATION, "tool") as span:
+        yield span
+
+
+def llm_token_usage(response: LLMResult) -> tuple[int, int]:
+    """Return the prompt and completion tokens the provider reported for a call."""
+    prompt_tokens = completion_tokens = 0
+    for generations in response.generations:
+        for generation in generations:
+            usage = (
+                generation.message.usage_metadata
+                if isinstance(generation, ChatGeneration)
+                else None
+            )
+            if usage:
+                prompt_tokens += usage.get("input_tokens", 0)
+                completion_tokens += usage.get("output_tokens", 0)
+    if not prompt_tokens and not completion_tokens:
+        token_usage = (response.llm_output or {}).get("token_usage") or {}
+        prompt_tokens = token_usage.get("prompt_tokens", 0)
+        completion_tokens = token_usage.get("completion_tokens", 0)
+    return prompt_tokens, completion_tokens
+
+
+class LLMUsageCallback(BaseCallbackHandler):
+    """Callback recording every LLM call and its token usage in the open spans."""
+
+    # Called in the context of the LLM call, where the spans are visible
+    run_inline = True
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        """Record the usage reported by the provider."""
+        record_llm_call(*llm_token_usage(response))
+
+
+def get_metrics_registry() -> CollectorRegistry:
+    """Return the registry to export: multiprocess-aggregated when configured."""
+    if not os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def start_metrics_server(port: int = CELERY_METRICS_PORT) -> bool:
+    """Serve the metrics over HTTP from a background thread.
+
+    Returns:
+        Whether the server was started
+    """
+    if port <= 0:
+        return False
+    try:
+        start_http_server(port, registry=get_metrics_registry())
+    except OSError as e:
+        logger.error(f"Could not start the metrics server on port {port}: {e}")
+        return False
+    logger.info(f"Serving metrics on port {port}")
+    return True
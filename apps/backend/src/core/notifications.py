@@ -0,0 +1,281 @@
+"""Change notifications used to push live updates to streaming clients.
+
+This module provides:
+- ChangeNotifier: interface for publishing and subscribing to change channels
+- RedisChangeNotifier: Redis pub/sub implementation shared across processes
+- InMemoryChangeNotifier: in-process implementation used in tests and as a fallback
+- get_change_notifier: process-wide notifier selected from the environment
+- job_application_channel / user_channel / live_stream_channel: channel name
+  helpers
+
+Publishing is best-effort: a failed publish is logged and never fails the
+database write that triggered it. Subscribers are expected to re-check the
+database periodically so a lost notification only delays an update.
+"""
+
+import asyncio
+import contextlib
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from logging import getLogger
+from typing import Any
+
+logger = getLogger(__name__)
+
+CHANNEL_PREFIX = "resumind"
+
+
+def job_application_channel(job_application_id: str) -> str:
+    """Return the channel carrying changes for a single job application."""
+    return f"{CHANNEL_PREFIX}:job_application:{job_application_id}"
+
+
+def user_channel(user_id: str) -> str:
+    """Return the channel carrying changes for a single user."""
+    return f"{CHANNEL_PREFIX}:user:{user_id}"
+
+
+def live_stream_channel(user_id: str, stream_id: str) -> str:
+    """Return the channel carrying subscription requests of a user's live stream."""
+    return f"{CHANNEL_PREFIX}:user:{user_id}:live:{stream_id}"
+
+
+@dataclass
+class ChangeNotification:
+    """A notification received on a subscribed channel."""
+
+    channel: str
+    payload: dict[str, Any]
+
+
+class Subscription(ABC):
+    """Handle returned by ChangeNotifier.subscribe to receive notifications."""
+
+    @abstractmethod
+    async def get(self, timeout: float | None = None) -> ChangeNotification | None:
+        """Wait for the next notification, returning None when the timeout elapses."""
+
+    @abstractmethod
+    async def add_channel(self, channel: str) -> None:
+        """Start receiving notifications published on an additional channel."""
+
+    @abstractmethod
+    async def remove_channel(self, channel: str) -> None:
+        """Stop receiving notifications published on a channel."""
+
+    async def drain(self) -> list[ChangeNotification]:
+        """Return every notification already waiting without blocking."""
+        pending = []
+        while True:
+            notification = await self.get(timeout=0)
+            if notification is None:
+                return pending
+            pending.append(notification)
+
+
+class ChangeNotifier(ABC):
+    """Interface for publishing change notifications and subscribing to them."""
+
+    @abstractmethod
+    def publish(self, channel: str, payload: dict[str, Any]) -> None:
+        """Publish a JSON-serializable payload on a channel."""
+
+    @abstractmethod
+    def subscribe(self, *channels: str) -> contextlib.AbstractAsyncContextManager:
+        """Return an async context manager yielding a Subscription to the channels."""
+
+
+class _InMemorySubscription(Subscription):
+    """Subscription backed by an asyncio.Queue on the subscriber's event loop."""
+
+    def __init__(self, notifier: "InMemoryChangeNotifier") -> None:
+        self._notifier = notifier
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue[ChangeNotification] = asyncio.Queue()
+        self.channels: set[str] = set()
+
+    def _deliver(self, notification: ChangeNotification) -> None:
+        """Enqueue a notification from any thread."""
+        if self._loop.is_closed():
+            return
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, notification)
+
+    async def get(self, timeout: float | None = None) -> ChangeNotification | None:
+        """Wait for the next notification, returning None when the timeout elapses."""
+        if timeout is not None and timeout <= 0:
+            try:
+                return self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return None
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout=timeout)
+        except TimeoutError:
+            return None
+
+    async def add_channel(self, channel: str) -> None:
+        """Start receiving notifications published on an additional channel."""
+        self._notifier._register(channel, self)
+
+    async def remove_channel(self, channel: str) -> None:
+        """Stop receiving notifications published on a channel."""
+        self._notifier._unregister(channel, self)
+
+
+class InMemoryChangeNotifier(ChangeNotifier):
+    """In-process notifier; only reaches subscribers living in the same process."""
+
+    def __init__(self) -> None:
+        """Initialize the notifier with no subscribers."""
+        self._subscribers: dict[str, set[_InMemorySubscription]] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, channel: str, subscription: _InMemorySubscription) -> None:
+        with self._lock:
+            self._subscribers.setdefault(channel, set()).add(subscription)
+            subscription.channels.add(channel)
+
+    def _unregister(self, channel: str, subscription: _InMemorySubscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[channel]
+            subscription.channels.discard(channel)
+
+    def publish(self, channel: str, payload: dict[str, Any]) -> None:
+        """Publish a payload to every subscriber of the channel in this process."""
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        notification = ChangeNotification(channel=channel, payload=payload)
+        for subscription in subscribers:
+            try:
+                subscription._deliver(notification)
+            except Exception as e:
+                logger.warning(f"Failed to deliver notification on {channel}: {e}")
+
+    @contextlib.asynccontextmanager
+    async def subscribe(self, *channels: str) -> AsyncIterator[Subscription]:
+        """Subscribe to the channels for the lifetime of the context."""
+        subscription = _InMemorySubscription(self)
+        for channel in channels:
+            self._register(channel, subscription)
+        try:
+            yield subscription
+        finally:
+            for channel in list(subscription.channels):
+                self._unregister(channel, subscription)
+
+
+class _RedisSubscription(Subscription):
+    """Subscription backed by a dedicated Redis pub/sub connection."""
+
+    def __init__(self, pubsub: Any) -> None:
+        self._pubsub = pubsub
+
+    async def get(self, timeout: float | None = None) -> ChangeNotification | None:
+        """Wait for the next notification, returning None when the timeout elapses."""
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + max(timeout, 0)
+        while True:
+            remaining = None if deadline is None else max(deadline - loop.time(), 0)
+            message = await self._pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=remaining
+            )
+            if message is not None and message.get("type") == "message":
+                channel = message["channel"]
+                if isinstance(channel, bytes):
+                    channel = channel.decode()
+                try:
+                    payload = json.loads(message["data"])
+                except (TypeError, ValueError):
+                    payload = {}
+                return ChangeNotification(channel=channel, payload=payload)
+            if deadline is not None and loop.time() >= deadline:
+                return None
+
+    async def add_channel(self, channel: str) -> None:
+        """Start receiving notifications published on an additional channel."""
+        await self._pubsub.subscribe(channel)
+
+    async def remove_channel(self, channel: str) -> None:
+        """Stop receiving notifications published on a channel."""
+        await self._pubsub.unsubscribe(channel)
+
+
+class RedisChangeNotifier(ChangeNotifier):
+    """Notifier backed by Redis pub/sub, shared by the API server and workers."""
+
+    def __init__(self, redis_url: str) -> None:
+        """Initialize the notifier for the given Redis URL."""
+        self.redis_url = redis_url
+        self._client = None
+        self._lock = threading.Lock()
+
+    def _get_client(self):
+        with self._lock:
+            if self._client is None:
+                import redis
+
+                self._client = redis.Redis.from_url(self.redis_url)
+            return self._client
+
+    def publish(self, channel: str, payload: dict[str, Any]) -> None:
+        """Publish a payload on the channel; failures are logged and swallowed."""
+        try:
+            self._get_client().publish(channel, json.dumps(payload, default=str))
+        except Exception as e:
+            logger.warning(f"Failed to publish change notification on {channel}: {e}")
+
+    @contextlib.asynccontextmanager
+    async def subscribe(self, *channels: str) -> AsyncIterator[Subscription]:
+        """Subscribe to the channels for the lifetime of the context."""
+        import redis.asyncio as aioredis
+
+        client = aioredis.Redis.from_url(self.redis_url)
+        pubsub = client.pubsub()
+        try:
+            if channels:
+                await pubsub.subscribe(*channels)
+            yield _RedisSubscription(pubsub)
+        finally:
+            try:
+                await pubsub.aclose()
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing Redis subscription: {e}")
+
+
+_change_notifier: ChangeNotifier | None = None
+_change_notifier_lock = threading.Lock()
+
+
+def get_change_notifier() -> ChangeNotifier:
+    """Return the process-wide change notifier.
+
+    Uses Redis when CHANGE_NOTIFIER_BACKEND is "redis" (the default whenever a
+    REDIS_URL or CELERY_BROKER_URL is configured) and the in-process notifier otherwise.
+    """
+    global _change_notifier
+    with _change_notifier_lock:
+        if _change_notifier is None:
+            redis_url = os.getenv("REDIS_URL") or os.getenv("CELERY_BROKER_URL")
+            backend = os.getenv(
+                "CHANGE_NOTIFIER_BACKEND", "redis" if redis_url else "memory"
+            ).lower()
+            if backend == "redis" and redis_url:
+                _change_notifier = RedisChangeNotifier(redis_url)
+            else:
+                _change_notifier = InMemoryChangeNotifier()
+        return _change_notifier
+
+
+def set_change_notifier(notifier: ChangeNotifier | None) -> None:
+    """Override the process-wide change notifier (None resets to the default)."""
+    global _change_notifier
+    with _change_notifier_lock:
+        _change_notifier = notifier
@@ -2,13 +2,45 @@
 
 This module provides:
 - RateLimiter: async context manager for enforcing rate limits
+- TokenBucketRateLimiter: token bucket limiter with request and tokens-per-minute budgets
+- TokenUsageCallback: LangChain callback charging the actual token usage of calls
+  made inside TokenBucketRateLimiter.limit to its token budget
+- InMemoryTokenBucketStore / RedisTokenBucketStore: bucket state, per process or shared
+- get_rate_limiter: process-wide limiter for a provider and model
 - retry_with_backoff: async function for retrying failed requests with exponential backoff
+
+RateLimiter only spaces the calls made through one instance. The token bucket
+limiters returned by get_rate_limiter keep their state in Redis when it is
+configured, so every agent in every worker process draws from the same budget
+for a given provider and model.
+
+``limit(tokens=n)`` takes the estimated prompt tokens before the call. When a
+TokenUsageCallback is among the run's callbacks, the tokens the provider
+reports beyond that estimate (completion tokens, retries) are taken once the
+call returns, without waiting: the next callers wait for them instead.
 """
 
 import asyncio
+import contextlib
+import contextvars
+import logging
+import os
 import random
+import threading
 import time
-import logging
+import weakref
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from typing import Any
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+from src.core.instrumentation import (
+    llm_token_usage,
+    record_rate_limit_wait,
+    record_retry,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +90,325 @@ class RateLimiter:
         """Exit the async context manager."""
         pass
 
+    def limit(self, tokens: int = 0) -> "RateLimiter":
+        """Return the limiter for use as ``async with limiter.limit(tokens)``.
+
+        Token budgets are not tracked by this limiter; only the call rate is.
+        """
+        return self
+
+
+class TokenBucketStore(ABC):
+    """Interface for storing token bucket state."""
+
+    @abstractmethod
+    async def reserve(
+        self, key: str, cost: float, rate: float, capacity: float
+    ) -> float:
+        """Take tokens from a bucket, returning how long the caller must wait.
+
+        The bucket may go negative: the reservation is granted immediately and
+        the caller waits until the bucket would have refilled, which keeps
+        waiting callers in arrival order.
+
+        Args:
+            key: Bucket identifier
+            cost: Number of tokens to take
+            rate: Refill rate in tokens per second
+            capacity: Maximum number of tokens the bucket holds
+
+        Returns:
+            Seconds to wait before proceeding (0 when tokens were available)
+        """
+
+
+class InMemoryTokenBucketStore(TokenBucketStore):
+    """Bucket state kept in the current process."""
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    async def reserve(
+        self, key: str, cost: float, rate: float, capacity: float
+    ) -> float:
+        """Take tokens from a bucket, returning how long the caller must wait."""
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated_at) * rate) - cost
+            self._buckets[key] = (tokens, now)
+        return -tokens / rate if tokens < 0 else 0.0
+
+
+# Atomic refill-and-reserve; returns the wait as a string since Redis truncates
+# Lua numbers to integers
+_TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil or ts == nil then
+    tokens = capacity
+    ts = now
+end
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate) - cost
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil((capacity - tokens) / rate) + 60)
+if tokens < 0 then
+    return tostring(-tokens / rate)
+end
+return '0'
+"""
+
+
+class RedisTokenBucketStore(TokenBucketStore):
+    """Bucket state shared through Redis by every process using the same server.
+
+    Falls back to an in-memory store while Redis is unreachable, so a Redis
+    outage degrades limits to per-process instead of failing LLM calls.
+    """
+
+    def __init__(
+        self,
+        redis_url: str,
+        *,
+        key_prefix: str = "resumind:ratelimit",
+        fallback: TokenBucketStore | None = None,
+        retry_after_seconds: float = 30.0,
+    ) -> None:
+        """Initialize the store for the given Redis URL."""
+        self.redis_url = redis_url
+        self.key_prefix = key_prefix
+        self.fallback = fallback or InMemoryTokenBucketStore()
+        self.retry_after_seconds = retry_after_seconds
+        # redis.asyncio clients are bound to the loop that created them
+        self._scripts: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._unavailable_until = 0.0
+
+    def _get_script(self):
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            script = self._scripts.get(loop)
+            if script is None:
+                import redis.asyncio as aioredis
+
+                client = aioredis.Redis.from_url(
+                    self.redis_url, socket_connect_timeout=1, socket_timeout=1
+                )
+                script = client.register_script(_TOKEN_BUCKET_SCRIPT)
+                self._scripts[loop] = script
+            return script
+
+    async def reserve(
+        self, key: str, cost: float, rate: float, capacity: float
+    ) -> float:
+        """Take tokens from a bucket, returning how long the caller must wait."""
+        if time.monotonic() >= self._unavailable_until:
+            try:
+                wait = await self._get_script()(
+                    keys=[f"{self.key_prefix}:{key}"], args=[rate, capacity, cost]
+                )
+                return float(wait)
+            except Exception as e:
+                logger.warning(
+                    f"Redis rate limiter unavailable, using in-process limits: {e}"
+                )
+                self._unavailable_until = time.monotonic() + self.retry_after_seconds
+        return await self.fallback.reserve(key, cost, rate, capacity)
+
+
+class _TokenUsage:
+    """Tokens reported by the LLM calls made inside one limit() block."""
+
+    def __init__(self) -> None:
+        self.tokens = 0
+
+
+_token_usage: contextvars.ContextVar[_TokenUsage | None] = contextvars.ContextVar(
+    "rate_limit_token_usage", default=None
+)
+
+
+class TokenUsageCallback(BaseCallbackHandler):
+    """Callback reporting the token usage of LLM calls to the enclosing limit()."""
+
+    # Called in the context of the LLM call, where the limit() block is visible
+    run_inline = True
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        """Add the prompt and completion tokens reported by the provider."""
+        usage = _token_usage.get()
+        if usage is not None:
+            usage.tokens += sum(llm_token_usage(response))
+
+
+class TokenBucketRateLimiter:
+    """Token bucket limiter with a request budget and an optional token budget.
+
+    Usable as ``async with limiter`` to take one request, or as
+    ``async with limiter.limit(tokens=n)`` to also take n tokens from the
+    tokens-per-minute budget.
+
+    Attributes:
+    ----------
+    key : str
+        Bucket identifier, typically "provider:model".
+    requests_per_second : float
+        Sustained request rate.
+    tokens_per_minute : int | None
+        Sustained token rate, or None to only limit requests.
+    burst : float
+        Number of requests that may be made back to back after an idle period.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        requests_per_second: float,
+        tokens_per_minute: int | None = None,
+        *,
+        burst: float | None = None,
+        store: TokenBucketStore | None = None,
+    ) -> None:
+        """Initialize the limiter; the store defaults to the process-wide one."""
+        self.key = key
+        self.requests_per_second = requests_per_second
+        self.tokens_per_minute = tokens_per_minute or None
+        self.burst = burst or max(1.0, requests_per_second)
+        self.store = store or get_token_bucket_store()
+
+    async def acquire(self, tokens: int = 0) -> float:
+        """Wait until one request and the given number of tokens are available.
+
+        Args:
+            tokens: Estimated tokens consumed by the request
+
+        Returns:
+            The number of seconds waited
+        """
+        wait = await self.store.reserve(
+            f"{self.key}:requests", 1, self.requests_per_second, self.burst
+        )
+        if self.tokens_per_minute and tokens > 0:
+            token_wait = await self.store.reserve(
+                f"{self.key}:tokens",
+                tokens,
+                self.tokens_per_minute / 60.0,
+                self.tokens_per_minute,
+            )
+            wait = max(wait, token_wait)
+        if wait > 0:
+            logger.info(f"Rate limit for {self.key} reached, waiting {wait:.2f}s")
+            record_rate_limit_wait(self.key, wait)
+            await asyncio.sleep(wait)
+        return wait
+
+    async def charge(self, tokens: int) -> None:
+        """Take tokens already consumed from the token budget, without waiting.
+
+        Args:
+            tokens: Tokens used beyond what was acquired
+        """
+        if self.tokens_per_minute and tokens > 0:
+            await self.store.reserve(
+                f"{self.key}:tokens",
+                tokens,
+                self.tokens_per_minute / 60.0,
+                self.tokens_per_minute,
+            )
+
+    @contextlib.asynccontextmanager
+    async def limit(self, tokens: int = 0) -> AsyncIterator[None]:
+        """Async context manager taking one request and the given tokens.
+
+        The tokens reported through TokenUsageCallback beyond the given
+        estimate are charged on exit.
+        """
+        await self.acquire(tokens)
+        usage = _TokenUsage()
+        token = _token_usage.set(usage)
+        try:
+            yield
+        finally:
+            _token_usage.reset(token)
+            await self.charge(usage.tokens - tokens)
+
+    async def __aenter__(self):
+        """Take one request from the budget."""
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Exit the async context manager."""
+        pass
+
+
+# Requests per second and tokens per minute (None: unlimited) per provider;
+# override with RATE_LIMIT_<PROVIDER>_RPS and RATE_LIMIT_<PROVIDER>_TPM
+DEFAULT_PROVIDER_LIMITS: dict[str, tuple[float, int | None]] = {
+    "mistral": (1.0, None),
+    "tavily": (2.0, None),
+    "firecrawl": (1.0, None),
+}
+
+_token_bucket_store: TokenBucketStore | None = None
+_rate_limiters: dict[str, TokenBucketRateLimiter] = {}
+_rate_limit_lock = threading.Lock()
+
+
+def get_token_bucket_store() -> TokenBucketStore:
+    """Return the process-wide token bucket store.
+
+    Uses Redis when RATE_LIMIT_BACKEND is "redis" (the default whenever a
+    REDIS_URL or CELERY_BROKER_URL is configured) and in-process state otherwise.
+    """
+    global _token_bucket_store
+    with _rate_limit_lock:
+        if _token_bucket_store is None:
+            redis_url = os.getenv("REDIS_URL") or os.getenv("CELERY_BROKER_URL")
+            backend = os.getenv(
+                "RATE_LIMIT_BACKEND", "redis" if redis_url else "memory"
+            ).lower()
+            if backend == "redis" and redis_url:
+                _token_bucket_store = RedisTokenBucketStore(redis_url)
+            else:
+                _token_bucket_store = InMemoryTokenBucketStore()
+        return _token_bucket_store
+
+
+def get_rate_limiter(provider: str, model: str | None = None) -> TokenBucketRateLimiter:
+    """Return the shared limiter for a provider and, optionally, a model.
+
+    Args:
+        provider: Provider name, e.g. "mistral", "tavily" or "firecrawl"
+        model: Model name, for providers that budget each model separately
+
+    Returns:
+        The limiter shared by every caller in this process; its bucket state is
+        shared across processes when the Redis store is used
+    """
+    key = f"{provider}:{model}" if model else provider
+    with _rate_limit_lock:
+        limiter = _rate_limiters.get(key)
+        if limiter is not None:
+            return limiter
+    default_rps, default_tpm = DEFAULT_PROVIDER_LIMITS.get(provider, (1.0, None))
+    env_prefix = f"RATE_LIMIT_{provider.upper()}"
+    tpm = os.getenv(f"{env_prefix}_TPM")
+    limiter = TokenBucketRateLimiter(
+        key,
+        float(os.getenv(f"{env_prefix}_RPS", default_rps)),
+        int(tpm) if tpm else default_tpm,
+    )
+    with _rate_limit_lock:
+        return _rate_limiters.setdefault(key, limiter)
+
 
 async def retry_with_backoff(fn, max_retries=5, base_delay=1.0):
     """Retry a failed async function with exponential backoff on rate limit errors.
@@ -89,6 +440,7 @@ async def retry_with_backoff(fn, max_retries=5, base_delay=1.0):
         except Exception as e:
             if "429" in str(e) or "rate limit" in str(e).lower():
                 delay = base_delay * (2**attempt) + random.uniform(0, 0.5)
+                record_retry()
                 logger.error(
                     "JUST HIT a rate limit error, waiting before retrying again the request"
                 )
@@ -2,9 +2,9 @@
 
 This module provides the ServiceRegistry class which implements a thread-safe
 registry pattern to maintain singleton instances of various services (UserService,
-JobApplicationService, EventService) scoped to individual database sessions.
+JobApplicationService, EventService, ...) scoped to individual database sessions.
 Services are automatically instantiated on first access and can be cleared when
-a session ends.
+a session ends. The async variants are keyed the same way by their AsyncSession.
 """
 
 import threading
@@ -12,6 +12,7 @@ from logging import getLogger
 from typing import Any
 
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 # Initialize structured logger
 logger = getLogger(__name__)
@@ -29,7 +30,7 @@ class ServiceRegistry:
     _lock = threading.RLock()
 
     @classmethod
-    def clear_session(cls, session: Session):
+    def clear_session(cls, session: Session | AsyncSession):
         """Remove all services associated with a session."""
         with cls._lock:
             session_id = id(session)
@@ -123,3 +124,115 @@ class ServiceRegistry:
             # Store the service instance
             cls._instances[service_type][session_id] = service
             return service
+
+    @classmethod
+    def get_async_user_service(cls, session: AsyncSession):
+        """Get or create an AsyncUserService singleton for this async session."""
+        with cls._lock:
+            session_id = id(session)
+            service_type = "async_user_service"
+
+            # Initialize container if needed
+            if service_type not in cls._instances:
+                cls._instances[service_type] = {}
+
+            # Return existing instance if available
+            if session_id in cls._instances[service_type]:
+                return cls._instances[service_type][session_id]
+
+            from src.user.repository import AsyncUserRepository
+            from src.user.service import AsyncUserService
+
+            user_repository = AsyncUserRepository(session)
+            service = AsyncUserService(user_repository)
+
+            # Store the service instance
+            cls._instances[service_type][session_id] = service
+            return service
+
+    @classmethod
+    def get_async_job_application_service(cls, session: AsyncSession):
+        """Get or create an AsyncJobApplicationService singleton for this async session."""
+        with cls._lock:
+            session_id = id(session)
+            service_type = "async_job_application_service"
+
+            # Initialize container if needed
+            if service_type not in cls._instances:
+                cls._instances[service_type] = {}
+
+            # Return existing instance if available
+            if session_id in cls._instances[service_type]:
+                return cls._instances[service_type][session_id]
+
+            from src.job_applications.repositories.job_application_repository import (
+                AsyncJobApplicationRepository,
+            )
+            from src.job_applications.services.job_application_service import (
+                AsyncJobApplicationService,
+            )
+
+            job_application_repository = AsyncJobApplicationRepository(session)
+            service = AsyncJobApplicationService(job_application_repository)
+
+            # Store the service instance
+            cls._instances[service_type][session_id] = service
+            return service
+
+    @classmethod
+    def get_async_events_service(cls, session: AsyncSession):
+        """Get or create an AsyncEventService singleton for this async session."""
+        with cls._lock:
+            session_id = id(session)
+            service_type = "async_events_service"
+
+            # Initialize container if needed
+            if service_type not in cls._instances:
+                cls._instances[service_type] = {}
+
+            # Return existing instance if available
+            if session_id in cls._instances[service_type]:
+                return cls._instances[service_type][session_id]
+
+            from src.job_applications.repositories.events_repository import (
+                AsyncEventRepository,
+            )
+            from src.job_applications.services.events_service import (
+                AsyncEventService,
+            )
+
+            events_repository = AsyncEventRepository(session)
+            service = AsyncEventService(events_repository)
+
+            # Store the service instance
+            cls._instances[service_type][session_id] = service
+            return service
+
+    @classmethod
+    def get_async_company_research_cache_service(cls, session: AsyncSession):
+        """Get or create an AsyncCompanyResearchCacheService singleton for this async session."""
+        with cls._lock:
+            session_id = id(session)
+            service_type = "async_company_research_cache_service"
+
+            # Initialize container if needed
+            if service_type not in cls._instances:
+                cls._instances[service_type] = {}
+
+            # Return existing instance if available
+            if session_id in cls._instances[service_type]:
+                return cls._instances[service_type][session_id]
+
+            from src.job_applications.repositories.company_research_repository import (
+                AsyncCompanyResearchRepository,
+            )
+            from src.job_applications.services.company_research_cache_service import (
+                AsyncCompanyResearchCacheService,
+            )
+
+            company_research_repository = AsyncCompanyResearchRepository(session)
+            service = AsyncCompanyResearchCacheService(company_research_repository)
+
+            # Store the service instance
+            cls._instances[service_type][session_id] = service
+            return service
@@ -0,0 +1,58 @@
+"""Token count estimates for LLM prompts.
+
+This module provides:
+- estimate_tokens: approximate token count of a piece of text
+- estimate_message_tokens: approximate token count of a list of chat messages
+
+The estimates use a characters-per-token ratio rather than the provider's
+tokenizer. They are meant for budgeting (rate limits, prompt sizing), where a
+cheap and stable approximation is preferable to an exact but slow count.
+"""
+
+import math
+from collections.abc import Iterable
+from typing import Any
+
+# Average characters per token for English prose with Mistral/OpenAI-style BPE
+CHARS_PER_TOKEN = 4
+# Role markers and separators added around every chat message
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def estimate_tokens(text: str | None) -> int:
+    """Estimate the number of tokens in a piece of text.
+
+    Args:
+        text: The text to measure
+
+    Returns:
+        The approximate token count
+    """
+    if not text:
+        return 0
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def estimate_message_tokens(messages: Iterable[Any]) -> int:
+    """Estimate the number of prompt tokens used by a list of chat messages.
+
+    Accepts LangChain messages, (role, content) tuples and plain strings.
+
+    Args:
+        messages: The messages sent to the model
+
+    Returns:
+        The approximate token count
+    """
+    total = 0
+    for message in messages:
+        if isinstance(message, tuple):
+            content = message[-1]
+        elif isinstance(message, str):
+            content = message
+        else:
+            content = getattr(message, "content", "")
+        if not isinstance(content, str):
+            content = str(content)
+        total += estimate_tokens(content) + MESSAGE_OVERHEAD_TOKENS
+    return total
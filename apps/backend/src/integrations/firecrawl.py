@@ -0,0 +1,165 @@
+"""Async Firecrawl client used by the scraping tool.
+
+This module provides:
+- AsyncFirecrawlClient: scrapes pages through the Firecrawl REST API without
+  blocking the event loop
+- FirecrawlError: raised when a scrape fails or returns no content
+- get_firecrawl_client / close_firecrawl_client: process-wide client
+
+The firecrawl-py SDK is synchronous (and its async variant opens a new HTTP
+session per request), so this client talks to the API directly with one pooled
+httpx.AsyncClient per event loop. A semaphore caps the number of scrapes in
+flight per loop and every request has its own timeout.
+
+Configuration:
+- FIRECRAWL_API_KEY / FIRECRAWL_API_URL: credentials and endpoint, as for the SDK
+- FIRECRAWL_MAX_CONCURRENCY: scrapes in flight per event loop (default 4)
+- FIRECRAWL_TIMEOUT_SECONDS: timeout of a single scrape (default 60)
+"""
+
+import asyncio
+import os
+import threading
+import weakref
+from logging import getLogger
+
+import httpx
+
+logger = getLogger(__name__)
+
+FIRECRAWL_API_URL = os.getenv("FIRECRAWL_API_URL", "https://api.firecrawl.dev")
+FIRECRAWL_MAX_CONCURRENCY = int(os.getenv("FIRECRAWL_MAX_CONCURRENCY", "4"))
+FIRECRAWL_TIMEOUT_SECONDS = float(os.getenv("FIRECRAWL_TIMEOUT_SECONDS", "60"))
+
+
+class FirecrawlError(Exception):
+    """Raised when Firecrawl cannot scrape a page."""
+
+
+class AsyncFirecrawlClient:
+    """Non-blocking Firecrawl scraping client with pooled connections.
+
+    httpx clients and asyncio semaphores belong to the loop they are first used
+    on, so both are kept per event loop. In the Celery worker all pipelines run
+    on the PipelineRuntime loop and therefore share a single pool and cap.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        api_url: str = FIRECRAWL_API_URL,
+        *,
+        max_concurrency: int = FIRECRAWL_MAX_CONCURRENCY,
+        timeout: float = FIRECRAWL_TIMEOUT_SECONDS,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """Initialize the client; the API key defaults to FIRECRAWL_API_KEY."""
+        self.api_key = api_key or os.getenv("FIRECRAWL_API_KEY")
+        self.api_url = api_url.rstrip("/")
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = timeout
+        self.transport = transport
+        self._clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def _get_client(self) -> tuple[httpx.AsyncClient, asyncio.Semaphore]:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.get(loop)
+            if client is None or client.is_closed:
+                headers = {"Content-Type": "application/json"}
+                if self.api_key:
+                    headers["Authorization"] = f"Bearer {self.api_key}"
+                client = httpx.AsyncClient(
+                    base_url=self.api_url,
+                    headers=headers,
+                    transport=self.transport,
+                    limits=httpx.Limits(
+                        max_connections=self.max_concurrency,
+                        max_keepalive_connections=self.max_concurrency,
+                    ),
+                )
+                self._clients[loop] = client
+                self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+            return client, self._semaphores[loop]
+
+    async def scrape_markdown(self, url: str, timeout: float | None = None) -> str:
+        """Scrape a page and return its content as markdown.
+
+        Args:
+            url: The page to scrape
+            timeout: Timeout in seconds for this scrape, excluding the time spent
+                waiting for a concurrency slot
+
+        Returns:
+            The page content in markdown
+
+        Raises:
+            FirecrawlError: If the request fails, times out or returns no content
+        """
+        timeout = timeout or self.timeout
+        client, slots = self._get_client()
+        async with slots:
+            try:
+                response = await client.post(
+                    "/v1/scrape",
+                    json={
+                        "url": url,
+                        "formats": ["markdown"],
+                        # Firecrawl's own scrape timeout, in milliseconds
+                        "timeout": int(timeout * 1000),
+                    },
+                    # Leave Firecrawl a few seconds to report its own timeout
+                    timeout=httpx.Timeout(timeout + 5, connect=10),
+                )
+            except httpx.TimeoutException as e:
+                raise FirecrawlError(
+                    f"Scraping {url} timed out after {timeout}s"
+                ) from e
+            except httpx.HTTPError as e:
+                raise FirecrawlError(f"Scraping {url} failed: {e}") from e
+
+        try:
+            payload = response.json()
+        except ValueError:
+            payload = {}
+        if response.status_code != 200 or not payload.get("success"):
+            error = payload.get("error") or response.text[:200]
+            raise FirecrawlError(
+                f"Scraping {url} failed with status {response.status_code}: {error}"
+            )
+        markdown = (payload.get("data") or {}).get("markdown")
+        if not markdown:
+            raise FirecrawlError(f"Scraping {url} returned no content")
+        return markdown
+
+    async def aclose(self) -> None:
+        """Close the connection pool of the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.pop(loop, None)
+            self._semaphores.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+
+_firecrawl_client: AsyncFirecrawlClient | None = None
+_firecrawl_client_lock = threading.Lock()
+
+
+def get_firecrawl_client() -> AsyncFirecrawlClient:
+    """Return the process-wide Firecrawl client."""
+    global _firecrawl_client
+    with _firecrawl_client_lock:
+        if _firecrawl_client is None:
+            _firecrawl_client = AsyncFirecrawlClient()
+        return _firecrawl_client
+
+
+async def close_firecrawl_client() -> None:
+    """Close the process-wide client's connections on the running event loop."""
+    with _firecrawl_client_lock:
+        client = _firecrawl_client
+    if client is not None:
+        await client.aclose()
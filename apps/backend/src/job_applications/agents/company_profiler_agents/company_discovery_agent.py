@@ -7,7 +7,6 @@ and LLM-based reasoning to gather comprehensive company information.
 
 import asyncio
 import logging
-import operator
 from datetime import date
 from typing import Annotated, Any
 
@@ -24,18 +23,27 @@ from langgraph.graph.state import CompiledStateGraph
 from langgraph.types import Command
 from pydantic import BaseModel
 
-from src.configs.database_config import get_session_context
+from src.configs.database_config import get_async_session_context
 from src.core.constants import MODEL_NAME
-from src.core.rate_limit_handlers import RateLimiter, retry_with_backoff
+from src.core.instrumentation import instrument_node, instrument_tool
+from src.core.rate_limit_handlers import get_rate_limiter, retry_with_backoff
 from src.core.service_registry import ServiceRegistry
+from src.core.token_utils import estimate_message_tokens
+from src.job_applications.agents.message_compaction import add_and_compact_messages
 from src.job_applications.prompts.company_profiler import (
     company_discovery_system_prompt,
 )
 from src.job_applications.tools import (
     CompanyDiscoveryDoneTool,
     company_discovery_tool,
+    tavily_search,
     tavily_tool,
 )
+from src.job_applications.services.event_sink import (
+    EventSink,
+    flush_events_on_exit,
+    get_event_sink,
+)
 from src.job_applications.types import (
     DiscoveredCompanyProfile,
     EventStatus,
@@ -65,8 +73,9 @@ class CompanyDiscoveryAgentState(BaseModel):
         Current iteration count in the discovery workflow.
     max_iterations : int
         Maximum number of iterations allowed for discovery.
-    messages : Annotated[list[BaseMessage], operator.add]
-        List of messages in the agent conversation.
+    messages : Annotated[list[BaseMessage], add_and_compact_messages]
+        List of messages in the agent conversation, with older tool outputs
+        compacted to keep the history within the token budget.
     """
 
     job_application_id: str
@@ -76,7 +85,7 @@ class CompanyDiscoveryAgentState(BaseModel):
     company_discovery_results: DiscoveredCompanyProfile = None
     iteration: int = 0
     max_iterations: int = 7
-    messages: Annotated[list[BaseMessage], operator.add]
+    messages: Annotated[list[BaseMessage], add_and_compact_messages]
 
 
 class CompanyDiscoveryAgent:
@@ -91,8 +100,10 @@ class CompanyDiscoveryAgent:
         The language model instance used for reasoning and tool invocation.
     debug : bool
         Flag to enable debug mode for logging.
-    rate_limiter : RateLimiter
+    rate_limiter : TokenBucketRateLimiter
         Rate limiter to control API call frequency.
+    event_sink : EventSink
+        Buffered sink used to emit progress events.
 
     Methods:
     -------
@@ -111,6 +122,7 @@ class CompanyDiscoveryAgent:
         model: ChatMistralAI | None = None,
         debug: bool = False,
         rate_limiter=None,
+        event_sink: EventSink | None = None,
     ):
         """Initialize the CompanyDiscoveryAgent.
 
@@ -120,12 +132,15 @@ class CompanyDiscoveryAgent:
             The language model instance for reasoning. Defaults to ChatMistralAI with MODEL_NAME.
         debug : bool
             Flag to enable debug mode for logging. Defaults to False.
-        rate_limiter : RateLimiter | None
-            Rate limiter to control API call frequency. Defaults to RateLimiter with 1.0 calls per second.
+        rate_limiter : TokenBucketRateLimiter | None
+            Rate limiter to control API call frequency. Defaults to the shared Mistral limiter.
+        event_sink : EventSink | None
+            Buffered sink used to emit progress events. Defaults to the process-wide sink.
         """
         self.model = model or ChatMistralAI(model=MODEL_NAME, max_tokens=8192)
         self.debug = debug
-        self.rate_limiter = rate_limiter or RateLimiter(1.0)
+        self.rate_limiter = rate_limiter or get_rate_limiter("mistral", MODEL_NAME)
+        self.event_sink = event_sink or get_event_sink()
 
     def build_graph(self, checkpointer=InMemorySaver()) -> CompiledStateGraph:
         """Build and compile the company discovery agent's state graph.
@@ -159,6 +174,8 @@ class CompanyDiscoveryAgent:
             logger.error(f"Error building company discovery agent graph: {e}")
             raise e
 
+    @instrument_node("company_discovery/plan_research")
+    @flush_events_on_exit
     async def plan_research(self, state: CompanyDiscoveryAgentState):
         """Plan and execute one company-discovery reasoning iteration.
 
@@ -188,16 +205,15 @@ class CompanyDiscoveryAgent:
             new_messages = []
 
             if state.iteration == 1:
-                with get_session_context() as session:
+                async with get_async_session_context() as session:
                     job_application_service = (
-                        ServiceRegistry.get_job_application_service(session)
+                        ServiceRegistry.get_async_job_application_service(session)
                     )
-                    event_service = ServiceRegistry.get_events_service(session)
-                    job_application_service.update_job_application_status(
+                    await job_application_service.update_job_application_status(
                         state.job_application_id,
                         ResumeGenerationStatus.PROCESSING_COMPANY_PROFILE,
                     )
-                    event_service.emit_pipeline_step(
+                    self.event_sink.emit_pipeline_step(
                         job_application_id=state.job_application_id,
                         step=PipelineStep.COMPANY_DISCOVERY,
                         status=EventStatus.STARTED,
@@ -214,7 +230,9 @@ class CompanyDiscoveryAgent:
                 ]
                 messages_for_invocation.extend(initial_messages)
                 new_messages.extend(initial_messages)
-            async with self.rate_limiter:
+            async with self.rate_limiter.limit(
+                tokens=estimate_message_tokens(messages_for_invocation)
+            ):
                 response = await retry_with_backoff(
                     lambda: model_with_tools.ainvoke(messages_for_invocation)
                 )
@@ -227,21 +245,20 @@ class CompanyDiscoveryAgent:
                     final_results = DiscoveredCompanyProfile.model_validate(
                         tool_args["discovery_results"]
                     )
-                    with get_session_context() as session:
+                    async with get_async_session_context() as session:
                         job_application_service = (
-                            ServiceRegistry.get_job_application_service(session)
+                            ServiceRegistry.get_async_job_application_service(session)
                         )
-                        event_service = ServiceRegistry.get_events_service(session)
-                        job_application_service.update_company_profile_discovery_results(
+                        await job_application_service.update_company_profile_discovery_results(
                             state.job_application_id, final_results
                         )
-                        event_service.emit_pipeline_step(
+                        self.event_sink.emit_pipeline_step(
                             job_application_id=state.job_application_id,
                             step=PipelineStep.COMPANY_DISCOVERY,
                             status=EventStatus.SUCCEEDED,
                             message="Company discovery completed",
                         )
-                        event_service.emit_artifact_generated(
+                        self.event_sink.emit_artifact_generated(
                             job_application_id=state.job_application_id,
                             artifact_type="company_profile",
                             summary="Company discovery results stored",
@@ -270,22 +287,21 @@ class CompanyDiscoveryAgent:
                     update={"messages": new_messages},
                 )
         except Exception as e:
-            with get_session_context() as session:
-                job_application_service = ServiceRegistry.get_job_application_service(
-                    session
+            async with get_async_session_context() as session:
+                job_application_service = (
+                    ServiceRegistry.get_async_job_application_service(session)
                 )
-                event_service = ServiceRegistry.get_events_service(session)
-                job_application_service.update_job_application_status(
+                await job_application_service.update_job_application_status(
                     state.job_application_id, ResumeGenerationStatus.FAILED
                 )
-                event_service.emit_pipeline_step(
+                self.event_sink.emit_pipeline_step(
                     job_application_id=state.job_application_id,
                     step=PipelineStep.COMPANY_DISCOVERY,
                     status=EventStatus.FAILED,
                     message="Company discovery failed",
                     error={"message": str(e)},
                 )
-                event_service.emit_pipeline_failed(
+                self.event_sink.emit_pipeline_failed(
                     job_application_id=state.job_application_id,
                     message="Company discovery failed",
                     error={"message": str(e)},
@@ -293,6 +309,8 @@ class CompanyDiscoveryAgent:
             logger.error(f"Error running the company discovery agent: {str(e)}")
             raise e
 
+    @instrument_node("company_discovery/call_tool")
+    @flush_events_on_exit
     async def call_tool(self, state: CompanyDiscoveryAgentState):
         """Execute all tool calls requested by the latest model response.
 
@@ -317,22 +335,21 @@ class CompanyDiscoveryAgent:
             ]
             return {"messages": tool_responses}
         except Exception as e:
-            with get_session_context() as session:
-                job_application_service = ServiceRegistry.get_job_application_service(
-                    session
+            async with get_async_session_context() as session:
+                job_application_service = (
+                    ServiceRegistry.get_async_job_application_service(session)
                 )
-                event_service = ServiceRegistry.get_events_service(session)
-                job_application_service.update_job_application_status(
+                await job_application_service.update_job_application_status(
                     state.job_application_id, ResumeGenerationStatus.FAILED
                 )
-                event_service.emit_pipeline_step(
+                self.event_sink.emit_pipeline_step(
                     job_application_id=state.job_application_id,
                     step=PipelineStep.COMPANY_DISCOVERY,
                     status=EventStatus.FAILED,
                     message="Company discovery failed",
                     error={"message": str(e)},
                 )
-                event_service.emit_pipeline_failed(
+                self.event_sink.emit_pipeline_failed(
                     job_application_id=state.job_application_id,
                     message="Error while executing discovery tools",
                     error={"message": str(e)},
@@ -354,16 +371,15 @@ class CompanyDiscoveryAgent:
             A success or error tool message suitable for appending to graph
             state.
         """
-        try:
-            tools = [tavily_tool, company_discovery_tool]
-            tool_to_invoke = next(
-                (tool for tool in tools if tool.name == tool_call["name"]), None
-            )
-            if not tool_to_invoke:
-                raise ValueError(f"Tool {tool_call['name']} not found")
-            logger.debug(f"Invoking tool {tool_call['name']}")
-            with get_session_context() as session:
-                event_service = ServiceRegistry.get_events_service(session)
+        async with instrument_tool(tool_call.get("name", "unknown")) as span:
+            try:
+                tools = [tavily_tool, company_discovery_tool]
+                tool_to_invoke = next(
+                    (tool for tool in tools if tool.name == tool_call["name"]), None
+                )
+                if not tool_to_invoke:
+                    raise ValueError(f"Tool {tool_call['name']} not found")
+                logger.debug(f"Invoking tool {tool_call['name']}")
                 args = tool_call.get("args", {}) or {}
                 friendly_message = "Starting tool execution"
                 args_summary = {}
@@ -378,7 +394,7 @@ class CompanyDiscoveryAgent:
                     friendly_message = f"Discovering company details for {company_name}"
                     args_summary = {"company_name": company_name}
 
-                event_service.emit_tool_execution(
+                self.event_sink.emit_tool_execution(
                     job_application_id=job_application_id,
                     tool_name=tool_to_invoke.name,
                     status=EventStatus.STARTED,
@@ -386,27 +402,29 @@ class CompanyDiscoveryAgent:
                     message=friendly_message,
                     data={"args_summary": args_summary} if args_summary else None,
                 )
-            async with self.rate_limiter:
-                result = await retry_with_backoff(
-                    lambda: tool_to_invoke.ainvoke(input=tool_call["args"])
-                )
-            with get_session_context() as session:
-                event_service = ServiceRegistry.get_events_service(session)
-                event_service.emit_tool_execution(
+                # Both discovery tools search through the cached, rate limited tavily_search
+                if tool_to_invoke.name == tavily_tool.name:
+                    result = await retry_with_backoff(
+                        lambda: tavily_search(tool_call["args"])
+                    )
+                else:
+                    result = await retry_with_backoff(
+                        lambda: tool_to_invoke.ainvoke(input=tool_call["args"])
+                    )
+                self.event_sink.emit_tool_execution(
                     job_application_id=job_application_id,
                     tool_name=tool_to_invoke.name,
                     status=EventStatus.SUCCEEDED,
                     step=PipelineStep.COMPANY_DISCOVERY,
                     message="Tool execution completed",
                 )
-            return ToolMessage(
-                content=result, tool_call_id=tool_call["id"], status="success"
-            )
-        except Exception as e:
-            logger.error(f"Error running process tool call {str(e)}")
-            with get_session_context() as session:
-                event_service = ServiceRegistry.get_events_service(session)
-                event_service.emit_tool_execution(
+                return ToolMessage(
+                    content=result, tool_call_id=tool_call["id"], status="success"
+                )
+            except Exception as e:
+                span.status = "error"
+                logger.error(f"Error running process tool call {str(e)}")
+                self.event_sink.emit_tool_execution(
                     job_application_id=job_application_id,
                     tool_name=tool_call.get("name", "unknown"),
                     status=EventStatus.FAILED,
@@ -414,8 +432,8 @@ class CompanyDiscoveryAgent:
                     message="Tool execution failed",
                     error={"message": str(e)},
                 )
-            return ToolMessage(
-                content=f"Error executing tool {tool_call['name']} please try again",
-                tool_call_id=tool_call["id"],
-                status="error",
-            )
+                return ToolMessage(
+                    content=f"Error executing tool {tool_call['name']} please try again",
+                    tool_call_id=tool_call["id"],
+                    status="error",
+                )
@@ -3,7 +3,9 @@
 This module provides the CompanyProfilerAgent class which orchestrates the process
 of discovering company information and executing research plans through a LangGraph
 state machine. It coordinates company discovery, research planning, and research
-execution to build comprehensive company profiles.
+execution to build comprehensive company profiles. Categories researched recently
+for the same company are served from the company research cache instead of being
+handed to the research executor again.
 """
 
 import logging
@@ -23,19 +25,30 @@ from langgraph.graph.state import CompiledStateGraph
 from langgraph.types import Command, Send
 from pydantic import BaseModel
 
-from src.configs.database_config import get_session_context
+from src.configs.database_config import get_async_session_context
 from src.core.constants import MODEL_NAME, STRUCTURED_OUTPUT_MAX_RETRY
-from src.core.rate_limit_handlers import RateLimiter, retry_with_backoff
+from src.core.instrumentation import instrument_node
+from src.core.rate_limit_handlers import get_rate_limiter, retry_with_backoff
 from src.core.service_registry import ServiceRegistry
+from src.core.token_utils import estimate_message_tokens
 from src.job_applications.agents.company_profiler_agents.company_discovery_agent import (
     CompanyDiscoveryAgent,
 )
 from src.job_applications.agents.company_profiler_agents.research_executor_agent import (
     ResearchExecutor,
 )
+from src.job_applications.prompt_rendering import render_model
 from src.job_applications.prompts.company_profiler import (
     research_planner_system_prompt,
 )
+from src.job_applications.services.company_research_cache_service import (
+    normalize_company_key,
+)
+from src.job_applications.services.event_sink import (
+    EventSink,
+    flush_events_on_exit,
+    get_event_sink,
+)
 from src.job_applications.types import (
     DiscoveredCompanyProfile,
     EventStatus,
@@ -133,6 +146,7 @@ class CompanyProfilerAgent:
         model: ChatMistralAI | None = None,
         debug: bool = False,
         rate_limiter=None,
+        event_sink: EventSink | None = None,
     ) -> None:
         """Initialize the CompanyProfilerAgent.
 
@@ -142,23 +156,32 @@ class CompanyProfilerAgent:
             The language model instance for reasoning. Defaults to ChatMistralAI with MODEL_NAME.
         debug : bool
             Flag to enable debug mode for logging. Defaults to False.
-        rate_limiter : RateLimiter | None
-            Rate limiter to control API call frequency. Defaults to RateLimiter with 1.0 calls per second.
+        rate_limiter : TokenBucketRateLimiter | None
+            Rate limiter to control API call frequency. Defaults to the shared Mistral limiter.
+        event_sink : EventSink | None
+            Buffered sink used to emit progress events. Defaults to the process-wide sink.
         """
         self.model = model or ChatMistralAI(model=MODEL_NAME, max_tokens=8192)
         self.debug = debug
-        self.rate_limiter = rate_limiter or RateLimiter(1.0)
+        self.rate_limiter = rate_limiter or get_rate_limiter("mistral", MODEL_NAME)
+        self.event_sink = event_sink or get_event_sink()
 
     def build_graph(self, checkpointer=InMemorySaver()) -> CompiledStateGraph:
         """Build the graph for the Company profiler agent."""
         try:
             builder = StateGraph(CompanyProfilerState)
             company_discovery_agent = CompanyDiscoveryAgent(
-                model=self.model, debug=self.debug, rate_limiter=self.rate_limiter
+                model=self.model,
+                debug=self.debug,
+                rate_limiter=self.rate_limiter,
+                event_sink=self.event_sink,
             )
             company_discovery_graph = company_discovery_agent.build_graph()
             research_executor = ResearchExecutor(
-                model=self.model, debug=self.debug, rate_limiter=self.rate_limiter
+                model=self.model,
+                debug=self.debug,
+                rate_limiter=self.rate_limiter,
+                event_sink=self.event_sink,
             )
             research_executor_graph = research_executor.build_graph()
             builder.add_node("company_discovery", company_discovery_graph)
@@ -176,58 +199,84 @@ class CompanyProfilerAgent:
             )
             raise e
 
+    @instrument_node("company_profiler/research_planner")
+    @flush_events_on_exit
     async def research_planner(
         self, state: CompanyProfilerState, config: RunnableConfig
     ):
         """Plan and execute the research phase for the company profiler agent."""
         try:
-            with get_session_context() as session:
-                event_service = ServiceRegistry.get_events_service(session)
-                event_service.emit_pipeline_step(
-                    job_application_id=state.job_application_id,
-                    step=PipelineStep.RESEARCH_PLANNING,
-                    status=EventStatus.STARTED,
-                    message="Planning research",
-                )
-            async with self.rate_limiter:
+            self.event_sink.emit_pipeline_step(
+                job_application_id=state.job_application_id,
+                step=PipelineStep.RESEARCH_PLANNING,
+                status=EventStatus.STARTED,
+                message="Planning research",
+            )
+            company_key = normalize_company_key(
+                state.company, state.company_discovery_results
+            )
+            cached_categories = await self._list_cached_categories(company_key)
+            cache_hint = (
+                f"""\n\n
+                    ALREADY RESEARCHED CATEGORIES: {", ".join(cached_categories)}
+                    (Reuse these exact category names for any of them that fit the role.)"""
+                if cached_categories
+                else ""
+            )
+            messages = [
+                SystemMessage(content=research_planner_system_prompt),
+                HumanMessage(
+                    content=f"""
+                    Today's date is: {date.today().isoformat()}
+                    COMPANY: {state.company} \n\n 
+                    JOB ROLE: {state.job_role}\n\n 
+                    JOB DESCRIPTION: {state.job_description} \n\n 
+                    COMPANY DISCOVERY RESULTS:\n{render_model(state.company_discovery_results)}{cache_hint}"""
+                ),
+            ]
+            async with self.rate_limiter.limit(
+                tokens=estimate_message_tokens(messages)
+            ):
                 configured_model = self.model.with_structured_output(
                     ResearchPlan
                 ).with_retry(stop_after_attempt=STRUCTURED_OUTPUT_MAX_RETRY)
                 response = await retry_with_backoff(
-                    lambda: configured_model.ainvoke(
-                        [
-                            SystemMessage(content=research_planner_system_prompt),
-                            HumanMessage(
-                                content=f"""
-                                Today's date is: {date.today().isoformat()}
-                                COMPANY: {state.company} \n\n 
-                                JOB ROLE: {state.job_role}\n\n 
-                                JOB DESCRIPTION: {state.job_description} \n\n 
-                                COMPANY DISCOVERY RESULTS: {state.company_discovery_results}"""
-                            ),
-                        ]
-                    )
+                    lambda: configured_model.ainvoke(messages)
                 )
-            with get_session_context() as session:
-                job_application_service = ServiceRegistry.get_job_application_service(
-                    session
+            cached_results = await self._get_cached_results(
+                company_key,
+                [category.category_name for category in response.research_categories],
+            )
+            async with get_async_session_context() as session:
+                job_application_service = (
+                    ServiceRegistry.get_async_job_application_service(session)
                 )
-                job_application_service.update_company_profile_research_plan(
+                await job_application_service.update_company_profile_research_plan(
                     state.job_application_id, response
                 )
-                event_service = ServiceRegistry.get_events_service(session)
-                event_service.emit_pipeline_step(
+                self.event_sink.emit_pipeline_step(
                     job_application_id=state.job_application_id,
                     step=PipelineStep.RESEARCH_PLANNING,
                     status=EventStatus.SUCCEEDED,
                     message="Generated research plan",
                 )
-                event_service.emit_pipeline_step(
+                self.event_sink.emit_pipeline_step(
                     job_application_id=state.job_application_id,
                     step=PipelineStep.RESEARCH,
                     status=EventStatus.STARTED,
                     message="Starting research execution",
                 )
+                for category_name, results in cached_results.items():
+                    await job_application_service.append_company_profile_category_research_results(
+                        state.job_application_id, category_name, results
+                    )
+                    self.event_sink.emit_research_category(
+                        job_application_id=state.job_application_id,
+                        category_name=category_name,
+                        status=EventStatus.SUCCEEDED,
+                        message="Reused recent research for this category",
+                        data={"cached": True},
+                    )
             logger.debug("RESPONSE FROM RESEARCH_PLANNER: ", response=response)
             sends = [
                 Send(
@@ -242,25 +291,28 @@ class CompanyProfilerAgent:
                     },
                 )
                 for category in response.research_categories
+                if category.category_name not in cached_results
             ]
-            return Command(goto=sends, update={"research_plan": response})
+            update = {"research_plan": response, "research_results": cached_results}
+            if not sends:
+                return Command(goto="finalize_research", update=update)
+            return Command(goto=sends, update=update)
         except Exception as e:
-            with get_session_context() as session:
-                job_application_service = ServiceRegistry.get_job_application_service(
-                    session
+            async with get_async_session_context() as session:
+                job_application_service = (
+                    ServiceRegistry.get_async_job_application_service(session)
                 )
-                event_service = ServiceRegistry.get_events_service(session)
-                job_application_service.update_job_application_status(
+                await job_application_service.update_job_application_status(
                     state.job_application_id, ResumeGenerationStatus.FAILED
                 )
-                event_service.emit_pipeline_step(
+                self.event_sink.emit_pipeline_step(
                     job_application_id=state.job_application_id,
                     step=PipelineStep.RESEARCH_PLANNING,
                     status=EventStatus.FAILED,
                     message="Research planning failed",
                     error={"message": str(e)},
                 )
-                event_service.emit_pipeline_failed(
+                self.event_sink.emit_pipeline_failed(
                     job_application_id=state.job_application_id,
                     message="Research planning failed",
                     error={"message": str(e)},
@@ -268,7 +320,46 @@ class CompanyProfilerAgent:
             logger.error(f"Error running the researcher planner: {str(e)}")
             raise e
 
-    def finalize_research(self, state: CompanyProfilerState, config: RunnableConfig):
+    async def _list_cached_categories(self, company_key: str) -> list[str]:
+        """List the category names with fresh cached research for a company.
+
+        Cache errors are logged and treated as an empty cache.
+        """
+        try:
+            async with get_async_session_context() as session:
+                cache_service = (
+                    ServiceRegistry.get_async_company_research_cache_service(session)
+                )
+                entries = await cache_service.list_fresh_entries(company_key)
+            return [entry.category_name for entry in entries]
+        except Exception as e:
+            logger.warning(f"Company research cache lookup failed: {str(e)}")
+            return []
+
+    async def _get_cached_results(
+        self, company_key: str, category_names: list[str]
+    ) -> dict[str, Any]:
+        """Retrieve fresh cached results for the planned categories.
+
+        Cache errors are logged and treated as misses.
+        """
+        try:
+            async with get_async_session_context() as session:
+                cache_service = (
+                    ServiceRegistry.get_async_company_research_cache_service(session)
+                )
+                return await cache_service.get_fresh_results(
+                    company_key, category_names
+                )
+        except Exception as e:
+            logger.warning(f"Company research cache lookup failed: {str(e)}")
+            return {}
+
+    @instrument_node("company_profiler/finalize_research")
+    @flush_events_on_exit
+    async def finalize_research(
+        self, state: CompanyProfilerState, config: RunnableConfig
+    ):
         """Finalize the research phase for the company profiler agent."""
         try:
             total_categories = (
@@ -281,22 +372,21 @@ class CompanyProfilerAgent:
                 # Halt graph execution and mark step as failed via the except block below
                 raise Exception("All research categories have failed.")
 
-            with get_session_context() as session:
-                event_service = ServiceRegistry.get_events_service(session)
-                job_application_service = ServiceRegistry.get_job_application_service(
-                    session
+            async with get_async_session_context() as session:
+                job_application_service = (
+                    ServiceRegistry.get_async_job_application_service(session)
                 )
-                event_service.emit_pipeline_step(
+                self.event_sink.emit_pipeline_step(
                     job_application_id=state.job_application_id,
                     step=PipelineStep.RESEARCH,
                     status=EventStatus.SUCCEEDED,
                     message="Research completed",
                 )
-                job_application_service.update_job_application_status(
+                await job_application_service.update_job_application_status(
                     state.job_application_id,
                     ResumeGenerationStatus.PROCESSING_RESUME_GENERATION,
                 )
-                event_service.emit_pipeline_step(
+                self.event_sink.emit_pipeline_step(
                     job_application_id=state.job_application_id,
                     step=PipelineStep.RESUME_GENERATION,
                     status=EventStatus.STARTED,
@@ -304,16 +394,15 @@ class CompanyProfilerAgent:
                 )
             return state
         except Exception as e:
-            with get_session_context() as session:
-                job_application_service = ServiceRegistry.get_job_application_service(
-                    session
+            async with get_async_session_context() as session:
+                job_application_service = (
+                    ServiceRegistry.get_async_job_application_service(session)
                 )
-                event_service = ServiceRegistry.get_events_service(session)
-                job_application_service.update_job_application_status(
+                await job_application_service.update_job_application_status(
                     state.job_application_id, ResumeGenerationStatus.FAILED
                 )
 
-                event_service.emit_pipeline_step(
+                self.event_sink.emit_pipeline_step(
                     job_application_id=state.job_application_id,
                     step=PipelineStep.RESEARCH,
                     status=EventStatus.FAILED,
@@ -321,7 +410,7 @@ class CompanyProfilerAgent:
                     error={"message": str(e)},
                 )
 
-                event_service.emit_pipeline_failed(
+                self.event_sink.emit_pipeline_failed(
                     job_application_id=state.job_application_id,
                     message="Finalizing research failed",
                     error={"message": str(e)},
@@ -3,6 +3,7 @@
 This module implements the ResearchExecutor agent that conducts research on companies
 by executing web search and scraping tools. It manages the research workflow through
 a state graph, handles tool invocations, and emits events for progress tracking.
+Completed categories are stored in the company research cache for later applications.
 
 Key components:
 - ResearchExecutorState: State model maintaining research progress and results
@@ -11,7 +12,6 @@ Key components:
 
 import asyncio
 import logging
-import operator
 from datetime import date
 from typing import Annotated, Any
 
@@ -28,18 +28,31 @@ from langgraph.graph.state import CompiledStateGraph
 from langgraph.types import Command
 from pydantic import BaseModel
 
-from src.configs.database_config import get_session_context
+from src.configs.database_config import get_async_session_context
 from src.core.constants import MODEL_NAME
-from src.core.rate_limit_handlers import RateLimiter, retry_with_backoff
+from src.core.instrumentation import instrument_node, instrument_tool
+from src.core.rate_limit_handlers import get_rate_limiter, retry_with_backoff
 from src.core.service_registry import ServiceRegistry
+from src.core.token_utils import estimate_message_tokens
+from src.job_applications.agents.message_compaction import add_and_compact_messages
+from src.job_applications.prompt_rendering import render_model
 from src.job_applications.prompts.company_profiler import (
     research_executor_system_prompt,
 )
 from src.job_applications.tools import (
     ResearchDoneTool,
     scraping_tool,
+    tavily_search,
     tavily_tool,
 )
+from src.job_applications.services.company_research_cache_service import (
+    normalize_company_key,
+)
+from src.job_applications.services.event_sink import (
+    EventSink,
+    flush_events_on_exit,
+    get_event_sink,
+)
 from src.job_applications.types import (
     DiscoveredCompanyProfile,
     EventStatus,
@@ -56,7 +69,7 @@ class ResearchExecutorState(BaseModel):
     job_application_id: str
     company: str
     job_role: str
-    messages: Annotated[list[BaseMessage], operator.add]
+    messages: Annotated[list[BaseMessage], add_and_compact_messages]
     research_category: ResearchCategory
     research_results: dict[str, Any] = {}
     iteration: int = 0
@@ -72,11 +85,13 @@ class ResearchExecutor:
         model: ChatMistralAI | None = None,
         debug: bool = False,
         rate_limiter=None,
+        event_sink: EventSink | None = None,
     ) -> None:
         """Initialize the ResearchExecutor agent."""
         self.model = model or ChatMistralAI(model=MODEL_NAME, max_tokens=8192)
         self.debug = debug
-        self.rate_limiter = rate_limiter or RateLimiter(1.0)
+        self.rate_limiter = rate_limiter or get_rate_limiter("mistral", MODEL_NAME)
+        self.event_sink = event_sink or get_event_sink()
 
     def build_graph(self, checkpointer=InMemorySaver()) -> CompiledStateGraph:
         """Build the graph for the Research Executor agent."""
@@ -93,6 +108,8 @@ class ResearchExecutor:
             )
             raise e
 
+    @instrument_node("research_executor/research_executor")
+    @flush_events_on_exit
     async def research_executor(self, state: ResearchExecutorState):
         """Execute the research tasks for the Research Executor agent."""
         try:
@@ -108,15 +125,13 @@ class ResearchExecutor:
             messages_for_invocation = list(state.messages)
             new_messages = []
             if state.iteration == 1:
-                with get_session_context() as session:
-                    event_service = ServiceRegistry.get_events_service(session)
-                    event_service.emit_research_category(
-                        job_application_id=state.job_application_id,
-                        category_name=state.research_category.category_name,
-                        status=EventStatus.STARTED,
-                        iteration=1,
-                        message="Starting research category",
-                    )
+                self.event_sink.emit_research_category(
+                    job_application_id=state.job_application_id,
+                    category_name=state.research_category.category_name,
+                    status=EventStatus.STARTED,
+                    iteration=1,
+                    message="Starting research category",
+                )
                 initial_messages = [
                     SystemMessage(content=research_executor_system_prompt),
                     HumanMessage(
@@ -124,14 +139,16 @@ class ResearchExecutor:
                         Today's date is: {date.today().isoformat()}
                         COMPANY: {state.company} \n\n 
                         JOB ROLE: {state.job_role}\n\n 
-                        SEARCH CATEGORY: {state.research_category}
-                        COMPANY DISCOVERY CONTEXT: {state.company_discovery_results}
+                        SEARCH CATEGORY:\n{render_model(state.research_category)}
+                        COMPANY DISCOVERY CONTEXT:\n{render_model(state.company_discovery_results)}
                        """
                     ),
                 ]
                 messages_for_invocation.extend(initial_messages)
                 new_messages.extend(initial_messages)
-            async with self.rate_limiter:
+            async with self.rate_limiter.limit(
+                tokens=estimate_message_tokens(messages_for_invocation)
+            ):
                 response = await retry_with_backoff(
                     lambda: model_with_tools.ainvoke(messages_for_invocation)
                 )
@@ -152,17 +169,16 @@ class ResearchExecutor:
                             data_payload = {"keys_count": len(final_results)}
                     except Exception:
                         data_payload = None
-                    with get_session_context() as session:
+                    async with get_async_session_context() as session:
                         job_application_service = (
-                            ServiceRegistry.get_job_application_service(session)
+                            ServiceRegistry.get_async_job_application_service(session)
                         )
-                        job_application_service.append_company_profile_category_research_results(
+                        await job_application_service.append_company_profile_category_research_results(
                             state.job_application_id,
                             state.research_category.category_name,
                             final_results,
                         )
-                        event_service = ServiceRegistry.get_events_service(session)
-                        event_service.emit_research_category(
+                        self.event_sink.emit_research_category(
                             job_application_id=state.job_application_id,
                             category_name=state.research_category.category_name,
                             status=EventStatus.SUCCEEDED,
@@ -170,6 +186,7 @@ class ResearchExecutor:
                             message="Finished research category",
                             data=data_payload,
                         )
+                    await self._cache_category_results(state, final_results)
                     return Command(
                         goto=END,
                         update={
@@ -196,16 +213,14 @@ class ResearchExecutor:
                     update={"messages": new_messages},
                 )
         except Exception as e:
-            with get_session_context() as session:
-                event_service = ServiceRegistry.get_events_service(session)
-                event_service.emit_research_category(
-                    job_application_id=state.job_application_id,
-                    category_name=state.research_category.category_name,
-                    status=EventStatus.FAILED,
-                    iteration=state.iteration,
-                    message=f"Research for {state.research_category.category_name} has failed",
-                    error={"message": str(e)},
-                )
+            self.event_sink.emit_research_category(
+                job_application_id=state.job_application_id,
+                category_name=state.research_category.category_name,
+                status=EventStatus.FAILED,
+                iteration=state.iteration,
+                message=f"Research for {state.research_category.category_name} has failed",
+                error={"message": str(e)},
+            )
             logger.error(f"Error running the researcher executor: {str(e)}")
             return Command(
                 goto=END,
@@ -216,6 +231,32 @@ class ResearchExecutor:
                 },
             )
 
+    async def _cache_category_results(
+        self, state: ResearchExecutorState, results: Any
+    ) -> None:
+        """Store the results of a completed category in the company research cache.
+
+        Cache errors are logged and never fail the category.
+        """
+        try:
+            async with get_async_session_context() as session:
+                cache_service = (
+                    ServiceRegistry.get_async_company_research_cache_service(session)
+                )
+                await cache_service.store_category_results(
+                    company_key=normalize_company_key(
+                        state.company, state.company_discovery_results
+                    ),
+                    company_name=state.company,
+                    category_name=state.research_category.category_name,
+                    results=results,
+                    source_job_application_id=state.job_application_id,
+                )
+        except Exception as e:
+            logger.warning(f"Storing research in the company cache failed: {str(e)}")
+
+    @instrument_node("research_executor/run_research_tools")
+    @flush_events_on_exit
     async def run_research_tools(self, state: ResearchExecutorState):
         """Run the research tools for the Research Executor agent."""
         try:
@@ -231,16 +272,14 @@ class ResearchExecutor:
             ]
             return {"messages": tool_responses}
         except Exception as e:
-            with get_session_context() as session:
-                event_service = ServiceRegistry.get_events_service(session)
-                event_service.emit_research_category(
-                    job_application_id=state.job_application_id,
-                    category_name=state.research_category.category_name,
-                    status=EventStatus.FAILED,
-                    iteration=state.iteration,
-                    message=f"Research for {state.research_category.category_name} has failed",
-                    error={"message": str(e)},
-                )
+            self.event_sink.emit_research_category(
+                job_application_id=state.job_application_id,
+                category_name=state.research_category.category_name,
+                status=EventStatus.FAILED,
+                iteration=state.iteration,
+                message=f"Research for {state.research_category.category_name} has failed",
+                error={"message": str(e)},
+            )
             logger.error(f"Error running the researcher tools: {str(e)}")
             raise {"messages": []}
 
@@ -248,15 +287,14 @@ class ResearchExecutor:
         self, tool_call: dict[str, Any], job_application_id: str
     ):
         """Process a tool call safely for the Research Executor agent."""
-        try:
-            tools = [tavily_tool, scraping_tool]
-            tool_to_invoke = next(
-                (tool for tool in tools if tool.name == tool_call["name"]), None
-            )
-            if not tool_to_invoke:
-                raise ValueError(f"Tool {tool_call['name']} not found")
-            with get_session_context() as session:
-                event_service = ServiceRegistry.get_events_service(session)
+        async with instrument_tool(tool_call.get("name", "unknown")) as span:
+            try:
+                tools = [tavily_tool, scraping_tool]
+                tool_to_invoke = next(
+                    (tool for tool in tools if tool.name == tool_call["name"]), None
+                )
+                if not tool_to_invoke:
+                    raise ValueError(f"Tool {tool_call['name']} not found")
                 args = tool_call.get("args", {}) or {}
                 friendly_message = "Starting tool execution"
                 args_summary = {}
@@ -271,7 +309,7 @@ class ResearchExecutor:
                     friendly_message = f"Scraping {url}"
                     args_summary = {"url": url}
 
-                event_service.emit_tool_execution(
+                self.event_sink.emit_tool_execution(
                     job_application_id=job_application_id,
                     tool_name=tool_to_invoke.name,
                     status=EventStatus.STARTED,
@@ -280,36 +318,32 @@ class ResearchExecutor:
                     data={"args_summary": args_summary} if args_summary else None,
                 )
 
-            result = None
-            if tool_to_invoke.name == scraping_tool.name:
-                logger.debug("Invoking tool scraping tool")
-                async with self.rate_limiter:
+                logger.debug(f"Invoking tool {tool_to_invoke.name}")
+                # Searches and scrapes go through the response cache, which applies
+                # the provider rate limit on misses only
+                if tool_to_invoke.name == tavily_tool.name:
+                    result = await retry_with_backoff(
+                        lambda: tavily_search(tool_call["args"])
+                    )
+                else:
                     result = await retry_with_backoff(
                         lambda: tool_to_invoke.ainvoke(input=tool_call["args"])
                     )
-            else:
-                logger.debug("Invoking tool other tool")
-                result = await retry_with_backoff(
-                    lambda: tool_to_invoke.ainvoke(input=tool_call["args"])
-                )
 
-            with get_session_context() as session:
-                event_service = ServiceRegistry.get_events_service(session)
-                event_service.emit_tool_execution(
+                self.event_sink.emit_tool_execution(
                     job_application_id=job_application_id,
                     tool_name=tool_to_invoke.name,
                     status=EventStatus.SUCCEEDED,
                     step=PipelineStep.RESEARCH,
                     message="Tool execution completed",
                 )
-            return ToolMessage(
-                content=result, tool_call_id=tool_call["id"], status="success"
-            )
-        except Exception as e:
-            logger.error(f"Error running process tool call {str(e)}")
-            with get_session_context() as session:
-                event_service = ServiceRegistry.get_events_service(session)
-                event_service.emit_tool_execution(
+                return ToolMessage(
+                    content=result, tool_call_id=tool_call["id"], status="success"
+                )
+            except Exception as e:
+                span.status = "error"
+                logger.error(f"Error running process tool call {str(e)}")
+                self.event_sink.emit_tool_execution(
                     job_application_id=job_application_id,
                     tool_name=tool_call.get("name", "unknown"),
                     status=EventStatus.FAILED,
@@ -317,8 +351,8 @@ class ResearchExecutor:
                     message="Tool execution failed",
                     error={"message": str(e)},
                 )
-            return ToolMessage(
-                content=f"Error executing tool {tool_call['name']} please try again",
-                tool_call_id=tool_call["id"],
-                status="error",
-            )
+                return ToolMessage(
+                    content=f"Error executing tool {tool_call['name']} please try again",
+                    tool_call_id=tool_call["id"],
+                    status="error",
+                )
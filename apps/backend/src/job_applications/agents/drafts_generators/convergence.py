@@ -0,0 +1,117 @@
+"""Convergence policy of the generator/evaluator loops.
+
+Each round of a drafting loop is two structured-output LLM calls resending the
+original resume, the previous draft and the research results. The policy ends
+the loop as soon as another round is unlikely to be worth its cost:
+
+1. The grade reached the threshold
+2. The maximum number of rounds was evaluated
+3. The evaluator requested no substantive change
+4. The grade improved by less than a minimum delta since the previous round
+5. Another round would exceed the token or the time budget of the loop
+
+A round is assumed to cost what the previous rounds cost on average.
+
+Configuration:
+- DRAFT_LOOP_MIN_GRADE_IMPROVEMENT: minimum grade gain between rounds (default 3)
+- DRAFT_LOOP_MIN_CHANGE_CHARS: requested changes shorter than this are ignored
+  (default 20)
+- DRAFT_LOOP_TOKEN_BUDGET: estimated prompt tokens of a loop (default 120000)
+- DRAFT_LOOP_TIME_BUDGET_SECONDS: wall time of a loop (default 300)
+"""
+
+import os
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+from src.job_applications.types import DraftLoopStopReason
+
+DRAFT_LOOP_MIN_GRADE_IMPROVEMENT = int(
+    os.getenv("DRAFT_LOOP_MIN_GRADE_IMPROVEMENT", "3")
+)
+DRAFT_LOOP_MIN_CHANGE_CHARS = int(os.getenv("DRAFT_LOOP_MIN_CHANGE_CHARS", "20"))
+DRAFT_LOOP_TOKEN_BUDGET = int(os.getenv("DRAFT_LOOP_TOKEN_BUDGET", "120000"))
+DRAFT_LOOP_TIME_BUDGET_SECONDS = float(
+    os.getenv("DRAFT_LOOP_TIME_BUDGET_SECONDS", "300")
+)
+
+# Requested changes meaning "nothing to change"
+_NO_CHANGE_MARKERS = {"", "none", "n/a", "na", "no change", "no changes", "-"}
+
+
+def substantive_changes(changes: Mapping[str, str] | Iterable[str]) -> list[str]:
+    """Return the requested changes worth another drafting round.
+
+    Args:
+        changes: The evaluator's requested changes, by field or as a list
+
+    Returns:
+        The changes that are neither empty, "no change" markers nor shorter than
+        DRAFT_LOOP_MIN_CHANGE_CHARS
+    """
+    values = changes.values() if isinstance(changes, Mapping) else changes
+    return [
+        change
+        for change in (str(value).strip() for value in values)
+        if change.lower().rstrip(".") not in _NO_CHANGE_MARKERS
+        and len(change) >= DRAFT_LOOP_MIN_CHANGE_CHARS
+    ]
+
+
+@dataclass(frozen=True)
+class ConvergencePolicy:
+    """Decides after each evaluation whether a drafting loop continues.
+
+    Attributes:
+        grade_threshold: Grade at which a draft is accepted
+        max_rounds: Maximum number of evaluated drafts
+        min_grade_improvement: Minimum grade gain between two rounds
+        token_budget: Estimated prompt tokens the loop may spend, or None
+        time_budget_seconds: Wall time the loop may take, or None
+    """
+
+    grade_threshold: int = 90
+    max_rounds: int = 5
+    min_grade_improvement: int = DRAFT_LOOP_MIN_GRADE_IMPROVEMENT
+    token_budget: int | None = DRAFT_LOOP_TOKEN_BUDGET
+    time_budget_seconds: float | None = DRAFT_LOOP_TIME_BUDGET_SECONDS
+
+    def stop_reason(
+        self,
+        *,
+        grades: list[int],
+        changes: Mapping[str, str] | Iterable[str],
+        tokens_used: int,
+        elapsed_seconds: float,
+    ) -> DraftLoopStopReason | None:
+        """Return why the loop should stop after the latest evaluation, if it should.
+
+        Args:
+            grades: Grades of every evaluated draft, oldest first
+            changes: Changes requested by the latest evaluation
+            tokens_used: Estimated prompt tokens spent by the loop so far
+            elapsed_seconds: Wall time since the loop started
+
+        Returns:
+            The stop reason, or None to run another round
+        """
+        if grades[-1] >= self.grade_threshold:
+            return DraftLoopStopReason.GRADE_THRESHOLD_REACHED
+        if len(grades) >= self.max_rounds:
+            return DraftLoopStopReason.MAX_ROUNDS_REACHED
+        if not substantive_changes(changes):
+            return DraftLoopStopReason.NO_CHANGES_REQUESTED
+        if len(grades) > 1 and grades[-1] - grades[-2] < self.min_grade_improvement:
+            return DraftLoopStopReason.GRADE_PLATEAU
+        rounds = len(grades)
+        if (
+            self.token_budget is not None
+            and tokens_used + tokens_used / rounds > self.token_budget
+        ):
+            return DraftLoopStopReason.TOKEN_BUDGET_EXHAUSTED
+        if (
+            self.time_budget_seconds is not None
+            and elapsed_seconds + elapsed_seconds / rounds > self.time_budget_seconds
+        ):
+            return DraftLoopStopReason.TIME_BUDGET_EXHAUSTED
+        return None
@@ -7,6 +7,9 @@ job descriptions, resumes, and company research results.
 Key components:
 - CoverLetterGeneratorState: State model for the agent workflow
 - CoverLetterGeneratorAgent: Main agent class with generator, evaluator, and finalization nodes
+
+Revision rounds return find/replace edits of the previous draft unless
+DRAFT_REVISION_MODE is "full".
 """
 
 import logging
@@ -14,6 +17,7 @@ from datetime import date
 from typing import Any
 
 from langchain_core.messages import (
+    BaseMessage,
     HumanMessage,
     SystemMessage,
 )
@@ -25,20 +29,35 @@ from langgraph.graph.state import CompiledStateGraph
 from langgraph.types import Command
 from pydantic import BaseModel
 
-from src.configs.database_config import get_session_context
+from src.configs.database_config import get_async_session_context
 from src.core.constants import (
     MODEL_NAME,
     STRUCTURED_OUTPUT_MAX_RETRY,
 )
-from src.core.rate_limit_handlers import RateLimiter, retry_with_backoff
+from src.core.instrumentation import instrument_node
+from src.core.rate_limit_handlers import get_rate_limiter, retry_with_backoff
 from src.core.service_registry import ServiceRegistry
+from src.core.token_utils import estimate_message_tokens
 from src.core.types import Resume
+from src.job_applications.agents.drafts_generators.revisions import (
+    REVISION_MODE,
+    RevisionError,
+    apply_cover_letter_edits,
+)
+from src.job_applications.prompt_rendering import render_model, render_research_results
 from src.job_applications.prompts.cover_letter_generator import (
     cover_letter_evaluator_system_prompt,
     cover_letter_generator_system_prompt,
+    cover_letter_revision_instructions,
+)
+from src.job_applications.services.event_sink import (
+    EventSink,
+    flush_events_on_exit,
+    get_event_sink,
 )
 from src.job_applications.types import (
     CoverLetterResponse,
+    CoverLetterRevisionOutput,
     EventStatus,
     GeneratedCoverLetterEvaluation,
     PipelineStep,
@@ -72,20 +91,36 @@ class CoverLetterGeneratorAgent:
         model: ChatMistralAI | None = None,
         debug: bool = False,
         rate_limiter=None,
+        event_sink: EventSink | None = None,
+        revision_mode: str = REVISION_MODE,
     ) -> None:
         """Initialize the CoverLetterGeneratorAgent."""
         self.model = model or ChatMistralAI(model=MODEL_NAME, max_tokens=8192)
         self.debug = debug
-        self.rate_limiter = RateLimiter(0.5)
+        self.rate_limiter = rate_limiter or get_rate_limiter("mistral", MODEL_NAME)
+        self.event_sink = event_sink or get_event_sink()
+        self.revision_mode = revision_mode
+
+    def build_graph(
+        self, checkpointer=InMemorySaver(), finalize: bool = True
+    ) -> CompiledStateGraph:
+        """Build the graph for the Cover Letter generator agent.
 
-    def build_graph(self, checkpointer=InMemorySaver()) -> CompiledStateGraph:
-        """Build the graph for the Cover Letter generator agent."""
+        Args:
+            checkpointer: Checkpointer of the graph
+            finalize: Whether the graph saves the cover letter and completes the
+                job application; when False the caller finalizes it, e.g. after
+                reconciling the letter with the final resume
+        """
         try:
             builder = StateGraph(CoverLetterGeneratorState)
 
             builder.add_node("generator", self.generator)
             builder.add_node("evaluator", self.evaluator)
-            builder.add_node("finalize_generation", self.finalize_generation)
+            builder.add_node(
+                "finalize_generation",
+                self.finalize_generation if finalize else self._skip_finalization,
+            )
             builder.add_edge(START, "generator")
             builder.add_edge("finalize_generation", END)
             return builder.compile(checkpointer=checkpointer, debug=self.debug)
@@ -95,87 +130,78 @@ class CoverLetterGeneratorAgent:
             )
             raise e
 
+    @instrument_node("cover_letter_generator/generator")
+    @flush_events_on_exit
     async def generator(self, state: CoverLetterGeneratorState, config: RunnableConfig):
         """Node function for generating an enhanced version of the cover letter."""
         try:
-            with get_session_context() as session:
-                events_service = ServiceRegistry.get_events_service(session)
-                events_service.emit_pipeline_step(
-                    job_application_id=state.job_application_id,
-                    step=PipelineStep.COVER_LETTER_DRAFTING,
-                    status=EventStatus.STARTED,
-                    message="Drafting an enhanced version of the cover letter",
-                    data={
-                        "iteration": state.current_evaluation,
-                        "max_iterations": state.max_evaluations,
-                    },
-                )
+            self.event_sink.emit_pipeline_step(
+                job_application_id=state.job_application_id,
+                step=PipelineStep.COVER_LETTER_DRAFTING,
+                status=EventStatus.STARTED,
+                message="Drafting an enhanced version of the cover letter",
+                data={
+                    "iteration": state.current_evaluation,
+                    "max_iterations": state.max_evaluations,
+                },
+            )
 
-            messages = [SystemMessage(content=cover_letter_generator_system_prompt)]
-            if not state.evaluation_results and state.current_evaluation == 0:
-                messages.append(
-                    HumanMessage(
-                        content=f"""ROLE: {state.job_role} \n\n 
-                        CURRENT DATE: {date.today().isoformat()}
-                        JOB DESCRIPTION:{state.job_description} \n\n 
-                        RESUME: {state.generated_resume} \n\n 
-                        COMPANY RESEARCH RESULTS: {state.research_results}"""
-                    ),
-                )
-            else:
-                messages.append(
-                    HumanMessage(
-                        content=f"""TODO: fix the REQUESTED CHANGES in the PREVIOUS GENERATED VERSION of the cover letter
-                                    ROLE: {state.job_role} \n\n
-                                    JOB DESCRIPTION: {state.job_description}
-                                    RESUME:{state.generated_resume}
-                                    PREVIOUS GENERATED VERSION: {state.generated_cover_letter}
-                                    REQUESTED CHANGES: {state.evaluation_results}
-                                    COMPANY RESEARCH RESULTS: {state.research_results}
-                                    """
-                    )
-                )
-            async with self.rate_limiter:
-                configured_model = self.model.with_structured_output(
-                    CoverLetterResponse
-                ).with_retry(stop_after_attempt=STRUCTURED_OUTPUT_MAX_RETRY)
-                response = await retry_with_backoff(
-                    lambda: configured_model.ainvoke(messages)
-                )
-            with get_session_context() as session:
-                event_service = ServiceRegistry.get_events_service(session)
-                event_service.emit_pipeline_step(
-                    job_application_id=state.job_application_id,
-                    step=PipelineStep.COVER_LETTER_DRAFTING,
-                    status=EventStatus.SUCCEEDED,
-                    message="Generated an enhanced version of the cover letter",
-                    data={
-                        "iteration": state.current_evaluation,
-                        "max_iterations": state.max_evaluations,
-                    },
-                )
+            content = None
+            rejected_edits: list[str] = []
+            if (
+                state.evaluation_results
+                and state.generated_cover_letter
+                and self.revision_mode == "patch"
+            ):
+                try:
+                    content, rejected_edits = await self._revise_cover_letter(state)
+                except RevisionError as e:
+                    logger.warning(f"Regenerating the whole cover letter instead: {e}")
+            revision_mode = "patch" if content is not None else "full"
 
-            logger.debug("RESPONSE FROM COVER LETTER GENERATOR: ", response=response)
-            return Command(
-                goto="evaluator", update={"generated_cover_letter": response.content}
+            if content is None:
+                messages = self._full_generation_messages(state)
+                async with self.rate_limiter.limit(
+                    tokens=estimate_message_tokens(messages)
+                ):
+                    configured_model = self.model.with_structured_output(
+                        CoverLetterResponse
+                    ).with_retry(stop_after_attempt=STRUCTURED_OUTPUT_MAX_RETRY)
+                    response = await retry_with_backoff(
+                        lambda: configured_model.ainvoke(messages)
+                    )
+                content = response.content
+            self.event_sink.emit_pipeline_step(
+                job_application_id=state.job_application_id,
+                step=PipelineStep.COVER_LETTER_DRAFTING,
+                status=EventStatus.SUCCEEDED,
+                message="Generated an enhanced version of the cover letter",
+                data={
+                    "iteration": state.current_evaluation,
+                    "max_iterations": state.max_evaluations,
+                    "revision_mode": revision_mode,
+                    "rejected_edits": len(rejected_edits),
+                },
             )
+
+            logger.debug("RESPONSE FROM COVER LETTER GENERATOR: ", content=content)
+            return Command(goto="evaluator", update={"generated_cover_letter": content})
         except Exception as e:
-            with get_session_context() as session:
-                job_application_service = ServiceRegistry.get_job_application_service(
-                    session
+            async with get_async_session_context() as session:
+                job_application_service = (
+                    ServiceRegistry.get_async_job_application_service(session)
                 )
-                event_service = ServiceRegistry.get_events_service(session)
-                job_application_service.update_job_application_status(
+                await job_application_service.update_job_application_status(
                     state.job_application_id, ResumeGenerationStatus.FAILED
                 )
-                event_service.emit_pipeline_step(
+                self.event_sink.emit_pipeline_step(
                     job_application_id=state.job_application_id,
                     step=PipelineStep.COVER_LETTER_GENERATION,
                     status=EventStatus.FAILED,
                     message="Cover letter generation failed",
                     error={"message": str(e)},
                 )
-                event_service.emit_pipeline_failed(
+                self.event_sink.emit_pipeline_failed(
                     job_application_id=state.job_application_id,
                     message="Cover letter generation failed",
                     error={"message": str(e)},
@@ -183,23 +209,97 @@ class CoverLetterGeneratorAgent:
             logger.error(f"Error running the cover letter generator: {str(e)}")
             raise e
 
+    def _full_generation_messages(
+        self, state: CoverLetterGeneratorState
+    ) -> list[BaseMessage]:
+        messages: list[BaseMessage] = [
+            SystemMessage(content=cover_letter_generator_system_prompt)
+        ]
+        if not state.evaluation_results and state.current_evaluation == 0:
+            messages.append(
+                HumanMessage(
+                    content=f"""ROLE: {state.job_role} \n\n 
+                    CURRENT DATE: {date.today().isoformat()}
+                    JOB DESCRIPTION:{state.job_description} \n\n 
+                    RESUME:\n{render_model(state.generated_resume)} \n\n 
+                    COMPANY RESEARCH RESULTS:\n{render_research_results(state.research_results)}"""
+                ),
+            )
+        else:
+            messages.append(
+                HumanMessage(
+                    content=f"""TODO: fix the REQUESTED CHANGES in the PREVIOUS GENERATED VERSION of the cover letter
+                                ROLE: {state.job_role} \n\n
+                                JOB DESCRIPTION: {state.job_description}
+                                RESUME:\n{render_model(state.generated_resume)}
+                                PREVIOUS GENERATED VERSION: {state.generated_cover_letter}
+                                REQUESTED CHANGES:\n{render_model(state.evaluation_results)}
+                                COMPANY RESEARCH RESULTS:\n{render_research_results(state.research_results)}
+                                """
+                )
+            )
+        return messages
+
+    async def _revise_cover_letter(
+        self, state: CoverLetterGeneratorState
+    ) -> tuple[str, list[str]]:
+        """Ask the model for find/replace edits of the previous draft and apply them.
+
+        Returns:
+            The revised cover letter and the rejected edits
+
+        Raises:
+            RevisionError: If the model returned no usable edit
+        """
+        messages: list[BaseMessage] = [
+            SystemMessage(
+                content=cover_letter_generator_system_prompt
+                + cover_letter_revision_instructions
+            ),
+            HumanMessage(
+                content=f"""TODO: fix the REQUESTED CHANGES in the PREVIOUS GENERATED VERSION of the cover letter by returning edits
+                            ROLE: {state.job_role} \n\n
+                            JOB DESCRIPTION: {state.job_description}
+                            RESUME:\n{render_model(state.generated_resume)}
+                            PREVIOUS GENERATED VERSION: {state.generated_cover_letter}
+                            REQUESTED CHANGES:\n{render_model(state.evaluation_results)}
+                            COMPANY RESEARCH RESULTS:\n{render_research_results(state.research_results)}
+                            """
+            ),
+        ]
+        async with self.rate_limiter.limit(tokens=estimate_message_tokens(messages)):
+            configured_model = self.model.with_structured_output(
+                CoverLetterRevisionOutput
+            ).with_retry(stop_after_attempt=STRUCTURED_OUTPUT_MAX_RETRY)
+            response: CoverLetterRevisionOutput = await retry_with_backoff(
+                lambda: configured_model.ainvoke(messages)
+            )
+        if response is None or not response.edits:
+            raise RevisionError("the model returned no edit")
+        content, rejected = apply_cover_letter_edits(
+            state.generated_cover_letter, response.edits
+        )
+        if rejected:
+            logger.info(f"Rejected {len(rejected)} cover letter edits: {rejected}")
+        return content, rejected
+
+    @instrument_node("cover_letter_generator/evaluator")
+    @flush_events_on_exit
     async def evaluator(self, state: CoverLetterGeneratorState, config: RunnableConfig):
         """Node function for evaluating the generated cover letter and suggesting improvements."""
         try:
             if state.current_evaluation >= state.max_evaluations:
                 return Command(goto="finalize_generation")
-            with get_session_context() as session:
-                events_service = ServiceRegistry.get_events_service(session)
-                events_service.emit_pipeline_step(
-                    job_application_id=state.job_application_id,
-                    step=PipelineStep.COVER_LETTER_EVALUATION,
-                    status=EventStatus.STARTED,
-                    message="Evaluating the generated version of the cover letter",
-                    data={
-                        "iteration": state.current_evaluation,
-                        "max_iterations": state.max_evaluations,
-                    },
-                )
+            self.event_sink.emit_pipeline_step(
+                job_application_id=state.job_application_id,
+                step=PipelineStep.COVER_LETTER_EVALUATION,
+                status=EventStatus.STARTED,
+                message="Evaluating the generated version of the cover letter",
+                data={
+                    "iteration": state.current_evaluation,
+                    "max_iterations": state.max_evaluations,
+                },
+            )
 
             messages = [SystemMessage(content=cover_letter_evaluator_system_prompt)]
             if not state.evaluation_results and state.current_evaluation == 0:
@@ -207,9 +307,9 @@ class CoverLetterGeneratorAgent:
                     HumanMessage(
                         content=f"""ROLE: {state.job_role} \n\n 
                         JOB DESCRIPTION:{state.job_description} \n\n 
-                        RESUME: {state.generated_resume} \n\n 
+                        RESUME:\n{render_model(state.generated_resume)} \n\n 
                         GENERATED COVER LETTER: {state.generated_cover_letter} \n\n
-                        COMPANY RESEARCH RESULTS: {state.research_results} \n\n
+                        COMPANY RESEARCH RESULTS:\n{render_research_results(state.research_results)} \n\n
                         """
                     ),
                 )
@@ -220,34 +320,34 @@ class CoverLetterGeneratorAgent:
                                     CURRENT DATE: {date.today().isoformat()}
                                     ROLE: {state.job_role} \n\n
                                     JOB DESCRIPTION: {state.job_description}
-                                    RESUME:{state.generated_resume}
+                                    RESUME:\n{render_model(state.generated_resume)}
                                     GENERATED COVER LETTER: {state.generated_cover_letter}
-                                    PREVIOUS EVALUATION: {state.evaluation_results}
-                                    COMPANY RESEARCH RESULTS: {state.research_results}
+                                    PREVIOUS EVALUATION:\n{render_model(state.evaluation_results)}
+                                    COMPANY RESEARCH RESULTS:\n{render_research_results(state.research_results)}
                                     """
                     )
                 )
-            async with self.rate_limiter:
+            async with self.rate_limiter.limit(
+                tokens=estimate_message_tokens(messages)
+            ):
                 configured_model = self.model.with_structured_output(
                     GeneratedCoverLetterEvaluation
                 ).with_retry(stop_after_attempt=STRUCTURED_OUTPUT_MAX_RETRY)
                 response = await retry_with_backoff(
                     lambda: configured_model.ainvoke(messages)
                 )
-            with get_session_context() as session:
-                event_service = ServiceRegistry.get_events_service(session)
-                event_service.emit_pipeline_step(
-                    job_application_id=state.job_application_id,
-                    step=PipelineStep.COVER_LETTER_EVALUATION,
-                    status=EventStatus.SUCCEEDED,
-                    message="Suggested improvements to enhance the generated cover letter",
-                    data={
-                        "iteration": state.current_evaluation,
-                        "evaluation_summary": response.summary,
-                        "evaluation_grade": response.grade,
-                        "max_iterations": state.max_evaluations,
-                    },
-                )
+            self.event_sink.emit_pipeline_step(
+                job_application_id=state.job_application_id,
+                step=PipelineStep.COVER_LETTER_EVALUATION,
+                status=EventStatus.SUCCEEDED,
+                message="Suggested improvements to enhance the generated cover letter",
+                data={
+                    "iteration": state.current_evaluation,
+                    "evaluation_summary": response.summary,
+                    "evaluation_grade": response.grade,
+                    "max_iterations": state.max_evaluations,
+                },
+            )
             if response.grade < state.evaluation_grade_threshold:
                 return Command(
                     goto="generator",
@@ -259,22 +359,21 @@ class CoverLetterGeneratorAgent:
             else:
                 return Command(goto="finalize_generation")
         except Exception as e:
-            with get_session_context() as session:
-                job_application_service = ServiceRegistry.get_job_application_service(
-                    session
+            async with get_async_session_context() as session:
+                job_application_service = (
+                    ServiceRegistry.get_async_job_application_service(session)
                 )
-                event_service = ServiceRegistry.get_events_service(session)
-                job_application_service.update_job_application_status(
+                await job_application_service.update_job_application_status(
                     state.job_application_id, ResumeGenerationStatus.FAILED
                 )
-                event_service.emit_pipeline_step(
+                self.event_sink.emit_pipeline_step(
                     job_application_id=state.job_application_id,
                     step=PipelineStep.COVER_LETTER_EVALUATION,
                     status=EventStatus.FAILED,
                     message="Cover letter evaluation failed",
                     error={"message": str(e)},
                 )
-                event_service.emit_pipeline_failed(
+                self.event_sink.emit_pipeline_failed(
                     job_application_id=state.job_application_id,
                     message="Cover letter evaluation failed",
                     error={"message": str(e)},
@@ -282,47 +381,50 @@ class CoverLetterGeneratorAgent:
             logger.error(f"Error running the resume evaluator: {str(e)}")
             raise e
 
+    def _skip_finalization(self, state: CoverLetterGeneratorState) -> dict[str, Any]:
+        return {}
+
+    @instrument_node("cover_letter_generator/finalize_generation")
+    @flush_events_on_exit
     async def finalize_generation(
         self, state: CoverLetterGeneratorState, config: RunnableConfig
     ):
         """Node function for finalizing the cover letter generation process."""
         try:
-            with get_session_context() as session:
-                job_application_service = ServiceRegistry.get_job_application_service(
-                    session
+            async with get_async_session_context() as session:
+                job_application_service = (
+                    ServiceRegistry.get_async_job_application_service(session)
                 )
-                events_service = ServiceRegistry.get_events_service(session)
-                job_application_service.save_generated_cover_letter(
+                await job_application_service.save_generated_cover_letter(
                     state.job_application_id, state.generated_cover_letter
                 )
-                events_service.emit_pipeline_step(
+                self.event_sink.emit_pipeline_step(
                     job_application_id=state.job_application_id,
                     step=PipelineStep.COVER_LETTER_GENERATION,
                     status=EventStatus.SUCCEEDED,
                     message="Successfully generated enhanced cover letter",
                 )
-                job_application_service.update_job_application_status(
+                await job_application_service.update_job_application_status(
                     state.job_application_id,
                     ResumeGenerationStatus.COMPLETED,
                 )
 
         except Exception as e:
-            with get_session_context() as session:
-                job_application_service = ServiceRegistry.get_job_application_service(
-                    session
+            async with get_async_session_context() as session:
+                job_application_service = (
+                    ServiceRegistry.get_async_job_application_service(session)
                 )
-                event_service = ServiceRegistry.get_events_service(session)
-                job_application_service.update_job_application_status(
+                await job_application_service.update_job_application_status(
                     state.job_application_id, ResumeGenerationStatus.FAILED
                 )
-                event_service.emit_pipeline_step(
+                self.event_sink.emit_pipeline_step(
                     job_application_id=state.job_application_id,
                     step=PipelineStep.COVER_LETTER_GENERATION,
                     status=EventStatus.FAILED,
                     message="Cover letter finalization failed",
                     error={"message": str(e)},
                 )
-                event_service.emit_pipeline_failed(
+                self.event_sink.emit_pipeline_failed(
                     job_application_id=state.job_application_id,
                     message="Cover letter finalization failed",
                     error={"message": str(e)},
@@ -0,0 +1,88 @@
+"""Overlapping cover letter drafting with resume polishing.
+
+In the overlapped pipeline mode the cover letter is drafted from the first
+resume draft graded at least COVER_LETTER_HANDOFF_GRADE, while the resume loop
+keeps polishing. When the loop ends, the final resume is compared with the
+draft the cover letter was written from; if it changed materially, the cover
+letter gets a reconciliation revision against the final resume.
+
+Configuration:
+- COVER_LETTER_HANDOFF_GRADE: grade of the resume draft handed to the cover
+  letter generator (default 80)
+- RESUME_MATERIAL_CHANGE_RATIO: share of rendered resume lines that must differ
+  for a change to be material (default 0.1)
+"""
+
+import difflib
+import os
+
+from src.core.types import Resume
+from src.job_applications.prompt_rendering import render_model
+from src.job_applications.types import GeneratedCoverLetterEvaluation
+
+COVER_LETTER_HANDOFF_GRADE = int(os.getenv("COVER_LETTER_HANDOFF_GRADE", "80"))
+RESUME_MATERIAL_CHANGE_RATIO = float(os.getenv("RESUME_MATERIAL_CHANGE_RATIO", "0.1"))
+
+
+def resume_change_ratio(before: Resume, after: Resume) -> float:
+    """Return the share of the resume that differs between two drafts.
+
+    Drafts are compared line by line in their prompt rendering, so the ratio
+    reflects the content the cover letter generator sees.
+
+    Args:
+        before: The draft the cover letter was written from
+        after: The final resume
+
+    Returns:
+        0 for identical drafts, up to 1 for drafts with nothing in common
+    """
+    if before is after:
+        return 0.0
+    matcher = difflib.SequenceMatcher(
+        None,
+        render_model(before).splitlines(),
+        render_model(after).splitlines(),
+        autojunk=False,
+    )
+    return 1 - matcher.ratio()
+
+
+def resume_changed_materially(
+    before: Resume,
+    after: Resume,
+    threshold: float = RESUME_MATERIAL_CHANGE_RATIO,
+) -> bool:
+    """Return whether the final resume differs enough to revise the cover letter."""
+    return resume_change_ratio(before, after) > threshold
+
+
+def reconciliation_request(
+    before: Resume, after: Resume, grade: int
+) -> GeneratedCoverLetterEvaluation:
+    """Build the revision request aligning a cover letter with the final resume.
+
+    Args:
+        before: The draft the cover letter was written from
+        after: The final resume
+        grade: Last grade of the cover letter
+
+    Returns:
+        An evaluation whose requested changes name the resume sections that
+        changed since the cover letter was drafted
+    """
+    changed_sections = [
+        name
+        for name in Resume.model_fields
+        if getattr(before, name) != getattr(after, name)
+    ]
+    return GeneratedCoverLetterEvaluation(
+        grade=grade,
+        changes=[
+            "The resume was revised after this cover letter was drafted "
+            f"(changed sections: {', '.join(changed_sections)}). Align every claim, "
+            "title, skill and achievement mentioned in the cover letter with the "
+            "current RESUME, and keep the rest of the letter unchanged."
+        ],
+        summary="The cover letter must be reconciled with the final resume.",
+    )
@@ -6,13 +6,23 @@ specific job applications. It uses a multi-step pipeline:
 - Generator: Creates enhanced resume versions based on job descriptions
 - Evaluator: Assesses generated resumes and suggests improvements
 - Finalize: Saves the final resume and initiates cover letter generation
+
+The loop between generator and evaluator ends according to a ConvergencePolicy;
+the reason it stopped is recorded in the evaluation and generation events, and
+the best graded draft is the one saved.
+
+Revision rounds ask for targeted edits of the previous draft in "patch" mode
+(DRAFT_REVISION_MODE), falling back to a full regeneration when no edit applies.
 """
 
+import dataclasses
 import logging
+import time
 from datetime import date
 from typing import Any
 
 from langchain_core.messages import (
+    BaseMessage,
     HumanMessage,
     SystemMessage,
 )
@@ -24,24 +34,43 @@ from langgraph.graph.state import CompiledStateGraph
 from langgraph.types import Command
 from pydantic import BaseModel
 
-from src.configs.database_config import get_session_context
+from src.configs.database_config import get_async_session_context
 from src.core.constants import (
     MODEL_NAME,
     STRUCTURED_OUTPUT_MAX_RETRY,
 )
-from src.core.rate_limit_handlers import RateLimiter, retry_with_backoff
+from src.core.instrumentation import instrument_node
+from src.core.rate_limit_handlers import get_rate_limiter, retry_with_backoff
 from src.core.service_registry import ServiceRegistry
+from src.core.token_utils import estimate_message_tokens
 from src.core.types import Resume
+from src.job_applications.agents.drafts_generators.convergence import (
+    ConvergencePolicy,
+)
+from src.job_applications.agents.drafts_generators.revisions import (
+    REVISION_MODE,
+    RevisionError,
+    apply_resume_edits,
+)
+from src.job_applications.prompt_rendering import render_model, render_research_results
 from src.job_applications.prompts.resume_generator import (
     resume_evaluator_system_prompt,
     resume_generator_system_prompt,
+    resume_revision_instructions,
+)
+from src.job_applications.services.event_sink import (
+    EventSink,
+    flush_events_on_exit,
+    get_event_sink,
 )
 from src.job_applications.types import (
+    DraftLoopStopReason,
     EventStatus,
     GeneratedResumeEvaluation,
     PipelineStep,
     ResumeGenerationOutput,
     ResumeGenerationStatus,
+    ResumeRevisionOutput,
     ResumeStrategyBrief,
 )
 
@@ -63,6 +92,14 @@ class ResumeGeneratorState(BaseModel):
     strategy_brief: ResumeStrategyBrief | None = None
     evaluation_results: GeneratedResumeEvaluation | None = None
     evaluation_grade_threshold: int = 90
+    # Convergence bookkeeping
+    loop_started_at: float | None = None
+    tokens_used: int = 0
+    grade_history: list[int] = []
+    best_grade: int | None = None
+    best_resume: Resume | None = None
+    best_strategy_brief: ResumeStrategyBrief | None = None
+    stop_reason: str | None = None
 
 
 class ResumeGeneratorAgent:
@@ -73,11 +110,17 @@ class ResumeGeneratorAgent:
         model: ChatMistralAI | None = None,
         debug: bool = False,
         rate_limiter=None,
+        event_sink: EventSink | None = None,
+        convergence_policy: ConvergencePolicy | None = None,
+        revision_mode: str = REVISION_MODE,
     ) -> None:
         """Initialize the ResumeGeneratorAgent."""
         self.model = model or ChatMistralAI(model=MODEL_NAME, max_tokens=8192)
         self.debug = debug
-        self.rate_limiter = RateLimiter(0.5)
+        self.rate_limiter = rate_limiter or get_rate_limiter("mistral", MODEL_NAME)
+        self.event_sink = event_sink or get_event_sink()
+        self.convergence_policy = convergence_policy or ConvergencePolicy()
+        self.revision_mode = revision_mode
 
     def build_graph(self, checkpointer=InMemorySaver()) -> CompiledStateGraph:
         """Build the graph for the Resume generator agent."""
@@ -96,97 +139,97 @@ class ResumeGeneratorAgent:
             )
             raise e
 
+    @instrument_node("resume_generator/generator")
+    @flush_events_on_exit
     async def generator(self, state: ResumeGeneratorState, config: RunnableConfig):
         """Node function for generating an enhanced version of the resume."""
+        started_at = time.time()
         try:
-            with get_session_context() as session:
-                events_service = ServiceRegistry.get_events_service(session)
-                events_service.emit_pipeline_step(
-                    job_application_id=state.job_application_id,
-                    step=PipelineStep.RESUME_DRAFTING,
-                    status=EventStatus.STARTED,
-                    message="Drafting an enhanced version of the resume",
-                    data={
-                        "iteration": state.current_evaluation,
-                        "max_iterations": state.max_evaluations,
-                    },
-                )
+            self.event_sink.emit_pipeline_step(
+                job_application_id=state.job_application_id,
+                step=PipelineStep.RESUME_DRAFTING,
+                status=EventStatus.STARTED,
+                message="Drafting an enhanced version of the resume",
+                data={
+                    "iteration": state.current_evaluation,
+                    "max_iterations": state.max_evaluations,
+                },
+            )
 
-            messages = [SystemMessage(content=resume_generator_system_prompt)]
-            if not state.evaluation_results and state.current_evaluation == 0:
-                messages.append(
-                    HumanMessage(
-                        content=f"""ROLE: {state.job_role} \n\n 
-                        CURRENT DATE: {date.today().isoformat()}
-                        JOB DESCRIPTION:{state.job_description} \n\n 
-                        ORIGINAL RESUME: {state.original_resume_snapshot} \n\n 
-                        COMPANY RESEARCH RESULTS: {state.research_results}"""
-                    ),
-                )
+            revision = None
+            if (
+                state.evaluation_results
+                and state.generated_resume is not None
+                and self.revision_mode == "patch"
+            ):
+                try:
+                    revision = await self._revise_resume(state)
+                except RevisionError as e:
+                    logger.warning(f"Regenerating the whole resume instead: {e}")
+
+            if revision is not None:
+                resume, strategy_brief, messages, rejected_edits = revision
+                revision_mode = "patch"
             else:
-                messages.append(
-                    HumanMessage(
-                        content=f"""TODO: fix the REQUESTED CHANGES in the PREVIOUS GENERATED VERSION of the resume
-                                    ROLE: {state.job_role} \n\n
-                                    JOB DESCRIPTION: {state.job_description}
-                                    ORIGINAL RESUME:{state.original_resume_snapshot}
-                                    PREVIOUS GENERATED VERSION: {state.generated_resume}
-                                    REQUESTED CHANGES: {state.evaluation_results}
-                                    COMPANY RESEARCH RESULTS: {state.research_results}
-                                    """
+                messages = self._full_generation_messages(state)
+                async with self.rate_limiter.limit(
+                    tokens=estimate_message_tokens(messages)
+                ):
+                    configured_model = self.model.with_structured_output(
+                        ResumeGenerationOutput
+                    ).with_retry(stop_after_attempt=STRUCTURED_OUTPUT_MAX_RETRY)
+                    response: ResumeGenerationOutput = await retry_with_backoff(
+                        lambda: configured_model.ainvoke(messages)
                     )
-                )
-            async with self.rate_limiter:
-                configured_model = self.model.with_structured_output(
-                    ResumeGenerationOutput
-                ).with_retry(stop_after_attempt=STRUCTURED_OUTPUT_MAX_RETRY)
-                response: ResumeGenerationOutput = await retry_with_backoff(
-                    lambda: configured_model.ainvoke(messages)
-                )
-            if response is None:
-                raise ValueError(
-                    "Structured output model returned None — the LLM failed to produce "
-                    "a valid ResumeGenerationOutput response."
-                )
-            with get_session_context() as session:
-                event_service = ServiceRegistry.get_events_service(session)
-                event_service.emit_pipeline_step(
-                    job_application_id=state.job_application_id,
-                    step=PipelineStep.RESUME_DRAFTING,
-                    status=EventStatus.SUCCEEDED,
-                    message="Generated an enhanced version of the resume",
-                    data={
-                        "iteration": state.current_evaluation,
-                        "max_iterations": state.max_evaluations,
-                        "strategy_brief": response.strategy_brief.model_dump(),
-                    },
-                )
+                if response is None:
+                    raise ValueError(
+                        "Structured output model returned None — the LLM failed to produce "
+                        "a valid ResumeGenerationOutput response."
+                    )
+                resume, strategy_brief = response.resume, response.strategy_brief
+                rejected_edits = []
+                revision_mode = "full"
+            self.event_sink.emit_pipeline_step(
+                job_application_id=state.job_application_id,
+                step=PipelineStep.RESUME_DRAFTING,
+                status=EventStatus.SUCCEEDED,
+                message="Generated an enhanced version of the resume",
+                data={
+                    "iteration": state.current_evaluation,
+                    "max_iterations": state.max_evaluations,
+                    "strategy_brief": strategy_brief.model_dump(),
+                    "revision_mode": revision_mode,
+                    "rejected_edits": len(rejected_edits),
+                },
+            )
 
-            logger.debug("RESPONSE FROM RESUME GENERATOR: ", response=response)
+            logger.debug("RESPONSE FROM RESUME GENERATOR: ", resume=resume)
             return Command(
                 goto="evaluator",
                 update={
-                    "generated_resume": response.resume,
-                    "strategy_brief": response.strategy_brief,
+                    "generated_resume": resume,
+                    "strategy_brief": strategy_brief,
+                    "loop_started_at": state.loop_started_at or started_at,
+                    "tokens_used": state.tokens_used
+                    + estimate_message_tokens(messages),
                 },
             )
         except Exception as e:
-            with get_session_context() as session:
-                job_application_service = ServiceRegistry.get_job_application_service(
-                    session
+            async with get_async_session_context() as session:
+                job_application_service = (
+                    ServiceRegistry.get_async_job_application_service(session)
                 )
-                event_service = ServiceRegistry.get_events_service(session)
-                job_application_service.update_job_application_status(
+                await job_application_service.update_job_application_status(
                     state.job_application_id, ResumeGenerationStatus.FAILED
                 )
-                event_service.emit_pipeline_step(
+                self.event_sink.emit_pipeline_step(
                     job_application_id=state.job_application_id,
                     step=PipelineStep.RESUME_GENERATION,
                     status=EventStatus.FAILED,
                     message="Resume generation failed",
                     error={"message": str(e)},
                 )
-                event_service.emit_pipeline_failed(
+                self.event_sink.emit_pipeline_failed(
                     job_application_id=state.job_application_id,
                     message="Resume generation failed",
                     error={"message": str(e)},
@@ -194,23 +237,103 @@ class ResumeGeneratorAgent:
             logger.error(f"Error running the resume generator: {str(e)}")
             raise e
 
+    def _full_generation_messages(
+        self, state: ResumeGeneratorState
+    ) -> list[BaseMessage]:
+        messages: list[BaseMessage] = [
+            SystemMessage(content=resume_generator_system_prompt)
+        ]
+        if not state.evaluation_results and state.current_evaluation == 0:
+            messages.append(
+                HumanMessage(
+                    content=f"""ROLE: {state.job_role} \n\n 
+                    CURRENT DATE: {date.today().isoformat()}
+                    JOB DESCRIPTION:{state.job_description} \n\n 
+                    ORIGINAL RESUME:\n{render_model(state.original_resume_snapshot)} \n\n 
+                    COMPANY RESEARCH RESULTS:\n{render_research_results(state.research_results)}"""
+                ),
+            )
+        else:
+            messages.append(
+                HumanMessage(
+                    content=f"""TODO: fix the REQUESTED CHANGES in the PREVIOUS GENERATED VERSION of the resume
+                                ROLE: {state.job_role} \n\n
+                                JOB DESCRIPTION: {state.job_description}
+                                ORIGINAL RESUME:\n{render_model(state.original_resume_snapshot)}
+                                PREVIOUS GENERATED VERSION:\n{render_model(state.generated_resume)}
+                                REQUESTED CHANGES:\n{render_model(state.evaluation_results)}
+                                COMPANY RESEARCH RESULTS:\n{render_research_results(state.research_results)}
+                                """
+                )
+            )
+        return messages
+
+    async def _revise_resume(
+        self, state: ResumeGeneratorState
+    ) -> tuple[Resume, ResumeStrategyBrief, list[BaseMessage], list[str]]:
+        """Ask the model for targeted edits of the previous draft and apply them.
+
+        Returns:
+            The revised resume, its strategy brief, the prompt sent and the
+            rejected edits
+
+        Raises:
+            RevisionError: If the model returned no usable edit
+        """
+        messages: list[BaseMessage] = [
+            SystemMessage(
+                content=resume_generator_system_prompt + resume_revision_instructions
+            ),
+            HumanMessage(
+                content=f"""TODO: fix the REQUESTED CHANGES in the PREVIOUS GENERATED VERSION of the resume by returning edits
+                            ROLE: {state.job_role} \n\n
+                            JOB DESCRIPTION: {state.job_description}
+                            ORIGINAL RESUME:\n{render_model(state.original_resume_snapshot)}
+                            PREVIOUS GENERATED VERSION (JSON): {state.generated_resume.model_dump_json()}
+                            REQUESTED CHANGES:\n{render_model(state.evaluation_results)}
+                            COMPANY RESEARCH RESULTS:\n{render_research_results(state.research_results)}
+                            """
+            ),
+        ]
+        async with self.rate_limiter.limit(tokens=estimate_message_tokens(messages)):
+            configured_model = self.model.with_structured_output(
+                ResumeRevisionOutput
+            ).with_retry(stop_after_attempt=STRUCTURED_OUTPUT_MAX_RETRY)
+            response: ResumeRevisionOutput = await retry_with_backoff(
+                lambda: configured_model.ainvoke(messages)
+            )
+        if response is None or not response.edits:
+            raise RevisionError("the model returned no edit")
+        resume, rejected = apply_resume_edits(state.generated_resume, response.edits)
+        if rejected:
+            logger.info(f"Rejected {len(rejected)} resume edits: {rejected}")
+        strategy_brief = response.strategy_brief or state.strategy_brief
+        if strategy_brief is None:
+            raise RevisionError("no strategy brief to carry over")
+        return resume, strategy_brief, messages, rejected
+
+    @instrument_node("resume_generator/evaluator")
+    @flush_events_on_exit
     async def evaluator(self, state: ResumeGeneratorState, config: RunnableConfig):
         """Node function for evaluating the generated resume."""
         try:
             if state.current_evaluation >= state.max_evaluations:
-                return Command(goto="finalize_generation")
-            with get_session_context() as session:
-                events_service = ServiceRegistry.get_events_service(session)
-                events_service.emit_pipeline_step(
-                    job_application_id=state.job_application_id,
-                    step=PipelineStep.RESUME_EVALUATION,
-                    status=EventStatus.STARTED,
-                    message="Evaluating the generated version of the resume",
-                    data={
-                        "iteration": state.current_evaluation,
-                        "max_iterations": state.max_evaluations,
+                return Command(
+                    goto="finalize_generation",
+                    update={
+                        "stop_reason": DraftLoopStopReason.MAX_ROUNDS_REACHED.value
                     },
                 )
+            self.event_sink.emit_pipeline_step(
+                job_application_id=state.job_application_id,
+                step=PipelineStep.RESUME_EVALUATION,
+                status=EventStatus.STARTED,
+                message="Evaluating the generated version of the resume",
+                data={
+                    "iteration": state.current_evaluation,
+                    "max_iterations": state.max_evaluations,
+                },
+            )
 
             messages = [SystemMessage(content=resume_evaluator_system_prompt)]
             if not state.evaluation_results and state.current_evaluation == 0:
@@ -218,9 +341,9 @@ class ResumeGeneratorAgent:
                     HumanMessage(
                         content=f"""ROLE: {state.job_role} \n\n 
                         JOB DESCRIPTION:{state.job_description} \n\n 
-                        ORIGINAL RESUME: {state.original_resume_snapshot} \n\n 
-                        GENERATED RESUME: {state.generated_resume} \n\n
-                        COMPANY RESEARCH RESULTS: {state.research_results} \n\n
+                        ORIGINAL RESUME:\n{render_model(state.original_resume_snapshot)} \n\n 
+                        GENERATED RESUME:\n{render_model(state.generated_resume)} \n\n
+                        COMPANY RESEARCH RESULTS:\n{render_research_results(state.research_results)} \n\n
                         """
                     ),
                 )
@@ -231,61 +354,86 @@ class ResumeGeneratorAgent:
                                     CURRENT DATE: {date.today().isoformat()}
                                     ROLE: {state.job_role} \n\n
                                     JOB DESCRIPTION: {state.job_description}
-                                    ORIGINAL RESUME:{state.original_resume_snapshot}
-                                    GENERATED VERSION: {state.generated_resume}
-                                    PREVIOUS EVALUATION: {state.evaluation_results}
-                                    COMPANY RESEARCH RESULTS: {state.research_results}
+                                    ORIGINAL RESUME:\n{render_model(state.original_resume_snapshot)}
+                                    GENERATED VERSION:\n{render_model(state.generated_resume)}
+                                    PREVIOUS EVALUATION:\n{render_model(state.evaluation_results)}
+                                    COMPANY RESEARCH RESULTS:\n{render_research_results(state.research_results)}
                                     """
                     )
                 )
-            async with self.rate_limiter:
+            async with self.rate_limiter.limit(
+                tokens=estimate_message_tokens(messages)
+            ):
                 configured_model = self.model.with_structured_output(
                     GeneratedResumeEvaluation
                 ).with_retry(stop_after_attempt=STRUCTURED_OUTPUT_MAX_RETRY)
                 response = await retry_with_backoff(
                     lambda: configured_model.ainvoke(messages)
                 )
-            with get_session_context() as session:
-                event_service = ServiceRegistry.get_events_service(session)
-                event_service.emit_pipeline_step(
-                    job_application_id=state.job_application_id,
-                    step=PipelineStep.RESUME_EVALUATION,
-                    status=EventStatus.SUCCEEDED,
-                    message="Suggested improvements to enhance the generated resume",
-                    data={
-                        "iteration": state.current_evaluation,
-                        "evaluation_summary": response.summary,
-                        "evaluation_grade": response.grade,
-                        "max_iterations": state.max_evaluations,
-                    },
+            grade_history = [*state.grade_history, response.grade]
+            tokens_used = state.tokens_used + estimate_message_tokens(messages)
+            policy = dataclasses.replace(
+                self.convergence_policy,
+                grade_threshold=state.evaluation_grade_threshold,
+                max_rounds=state.max_evaluations,
+            )
+            stop_reason = policy.stop_reason(
+                grades=grade_history,
+                changes=response.changes,
+                tokens_used=tokens_used,
+                elapsed_seconds=time.time() - (state.loop_started_at or time.time()),
+            )
+            update: dict[str, Any] = {
+                "evaluation_results": response,
+                "grade_history": grade_history,
+                "tokens_used": tokens_used,
+            }
+            if state.best_grade is None or response.grade >= state.best_grade:
+                update.update(
+                    best_grade=response.grade,
+                    best_resume=state.generated_resume,
+                    best_strategy_brief=state.strategy_brief,
                 )
-            if response.grade < state.evaluation_grade_threshold:
-                return Command(
-                    goto="generator",
-                    update={
-                        "evaluation_results": response,
-                        "current_evaluation": state.current_evaluation + 1,
-                    },
+            self.event_sink.emit_pipeline_step(
+                job_application_id=state.job_application_id,
+                step=PipelineStep.RESUME_EVALUATION,
+                status=EventStatus.SUCCEEDED,
+                message="Suggested improvements to enhance the generated resume",
+                data={
+                    "iteration": state.current_evaluation,
+                    "evaluation_summary": response.summary,
+                    "evaluation_grade": response.grade,
+                    "max_iterations": state.max_evaluations,
+                    "stop_reason": stop_reason.value if stop_reason else None,
+                },
+            )
+            if stop_reason is None:
+                update["current_evaluation"] = state.current_evaluation + 1
+                return Command(goto="generator", update=update)
+            update["stop_reason"] = stop_reason.value
+            # An earlier draft graded better than the last one
+            if "best_grade" not in update and state.best_resume is not None:
+                update.update(
+                    generated_resume=state.best_resume,
+                    strategy_brief=state.best_strategy_brief,
                 )
-            else:
-                return Command(goto="finalize_generation")
+            return Command(goto="finalize_generation", update=update)
         except Exception as e:
-            with get_session_context() as session:
-                job_application_service = ServiceRegistry.get_job_application_service(
-                    session
+            async with get_async_session_context() as session:
+                job_application_service = (
+                    ServiceRegistry.get_async_job_application_service(session)
                 )
-                event_service = ServiceRegistry.get_events_service(session)
-                job_application_service.update_job_application_status(
+                await job_application_service.update_job_application_status(
                     state.job_application_id, ResumeGenerationStatus.FAILED
                 )
-                event_service.emit_pipeline_step(
+                self.event_sink.emit_pipeline_step(
                     job_application_id=state.job_application_id,
                     step=PipelineStep.RESUME_GENERATION,
                     status=EventStatus.FAILED,
                     message="Resume evaluation failed",
                     error={"message": str(e)},
                 )
-                event_service.emit_pipeline_failed(
+                self.event_sink.emit_pipeline_failed(
                     job_application_id=state.job_application_id,
                     message="Resume evaluation failed",
                     error={"message": str(e)},
@@ -293,34 +441,41 @@ class ResumeGeneratorAgent:
             logger.error(f"Error running the resume evaluator: {str(e)}")
             raise e
 
+    @instrument_node("resume_generator/finalize_generation")
+    @flush_events_on_exit
     async def finalize_generation(
         self, state: ResumeGeneratorState, config: RunnableConfig
     ):
         """Node function for finalizing the resume generation process."""
         try:
-            with get_session_context() as session:
-                job_application_service = ServiceRegistry.get_job_application_service(
-                    session
+            async with get_async_session_context() as session:
+                job_application_service = (
+                    ServiceRegistry.get_async_job_application_service(session)
                 )
-                events_service = ServiceRegistry.get_events_service(session)
-                job_application_service.save_generated_resume(
+                await job_application_service.save_generated_resume(
                     state.job_application_id, state.generated_resume
                 )
                 if state.strategy_brief:
-                    job_application_service.save_resume_strategy_brief(
+                    await job_application_service.save_resume_strategy_brief(
                         state.job_application_id, state.strategy_brief
                     )
-                events_service.emit_pipeline_step(
+                self.event_sink.emit_pipeline_step(
                     job_application_id=state.job_application_id,
                     step=PipelineStep.RESUME_GENERATION,
                     status=EventStatus.SUCCEEDED,
                     message="Successfully generated enhanced resume",
+                    data={
+                        "stop_reason": state.stop_reason,
+                        "rounds": len(state.grade_history),
+                        "grade_history": state.grade_history,
+                        "final_grade": state.best_grade,
+                    },
                 )
-                job_application_service.update_job_application_status(
+                await job_application_service.update_job_application_status(
                     state.job_application_id,
                     ResumeGenerationStatus.PROCESSING_COVER_LETTER,
                 )
-                events_service.emit_pipeline_step(
+                self.event_sink.emit_pipeline_step(
                     job_application_id=state.job_application_id,
                     step=PipelineStep.COVER_LETTER_GENERATION,
                     status=EventStatus.STARTED,
@@ -328,22 +483,21 @@ class ResumeGeneratorAgent:
                 )
 
         except Exception as e:
-            with get_session_context() as session:
-                job_application_service = ServiceRegistry.get_job_application_service(
-                    session
+            async with get_async_session_context() as session:
+                job_application_service = (
+                    ServiceRegistry.get_async_job_application_service(session)
                 )
-                event_service = ServiceRegistry.get_events_service(session)
-                job_application_service.update_job_application_status(
+                await job_application_service.update_job_application_status(
                     state.job_application_id, ResumeGenerationStatus.FAILED
                 )
-                event_service.emit_pipeline_step(
+                self.event_sink.emit_pipeline_step(
                     job_application_id=state.job_application_id,
                     step=PipelineStep.RESUME_GENERATION,
                     status=EventStatus.FAILED,
                     message="Resume finalization failed",
                     error={"message": str(e)},
                 )
-                event_service.emit_pipeline_failed(
+                self.event_sink.emit_pipeline_failed(
                     job_application_id=state.job_application_id,
                     message="Resume finalization failed",
                     error={"message": str(e)},
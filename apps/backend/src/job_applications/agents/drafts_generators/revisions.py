@@ -0,0 +1,187 @@
+"""Patch-based revisions of resume and cover letter drafts.
+
+In patch mode, revision rounds ask the model for targeted edits (see
+ResumeRevisionOutput and CoverLetterRevisionOutput) instead of a complete new
+draft, and the edits are applied here to the previous draft. Output tokens
+then scale with the requested changes rather than with the whole document.
+
+This module provides:
+- apply_resume_edits: apply path-addressed edits to a Resume
+- apply_cover_letter_edits: apply find/replace edits to a cover letter
+- RevisionError: raised when no edit could be applied
+- REVISION_MODE: "patch" (default) or "full", from DRAFT_REVISION_MODE
+
+Edits that cannot be applied (unknown path, excerpt not found, value that does
+not validate) are skipped and reported; the generators fall back to a full
+regeneration when every edit of a revision is rejected.
+"""
+
+import copy
+import json
+import os
+import re
+from typing import Any
+
+from pydantic import ValidationError
+
+from src.core.types import Resume
+from src.job_applications.types import CoverLetterEdit, ResumeEdit
+
+REVISION_MODE = os.getenv("DRAFT_REVISION_MODE", "patch").lower()
+
+_PATH_TOKEN_RE = re.compile(r"([A-Za-z_]\w*)|\[(\d+)\]")
+
+
+class RevisionError(Exception):
+    """Raised when none of the edits of a revision can be applied."""
+
+
+def _parse_path(path: str) -> list[str | int]:
+    tokens: list[str | int] = []
+    position = 0
+    path = path.strip()
+    while position < len(path):
+        if path[position] == ".":
+            position += 1
+            continue
+        match = _PATH_TOKEN_RE.match(path, position)
+        if not match:
+            raise ValueError(f"invalid path {path!r}")
+        field, index = match.groups()
+        tokens.append(field if field is not None else int(index))
+        position = match.end()
+    if not tokens or not isinstance(tokens[0], str):
+        raise ValueError(f"invalid path {path!r}")
+    return tokens
+
+
+def _parse_value(raw: str | None, current: Any) -> Any:
+    # Text fields take the value as is; anything else is sent as JSON
+    if isinstance(current, str):
+        return raw or ""
+    if raw is None:
+        raise ValueError("missing value")
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError:
+        if current is None:
+            return raw
+        raise ValueError(f"value is not valid JSON: {raw[:80]!r}") from None
+
+
+def _removal_order(edit: ResumeEdit) -> list[tuple[bool, str | int]]:
+    try:
+        tokens = _parse_path(edit.path)
+    except ValueError:
+        return []
+    # Tagging indexes keeps names and indexes from being compared with each other
+    return [(isinstance(token, int), token) for token in tokens]
+
+
+def _without_none(value: Any) -> Any:
+    # Optional text fields of the resume models are typed str with a None
+    # default, so a dumped draft only validates again once they are left out
+    if isinstance(value, dict):
+        return {k: _without_none(v) for k, v in value.items() if v is not None}
+    if isinstance(value, list):
+        return [_without_none(item) for item in value]
+    return value
+
+
+def _apply_edit(document: dict[str, Any], edit: ResumeEdit) -> None:
+    tokens = _parse_path(edit.path)
+    parent: Any = document
+    for token in tokens[:-1]:
+        parent = parent[token]
+    last = tokens[-1]
+
+    if edit.operation == "remove":
+        if not isinstance(parent, list) or not isinstance(last, int):
+            raise ValueError("only list items can be removed")
+        del parent[last]
+        return
+    current = parent[last]
+    if edit.operation == "append":
+        if not isinstance(current, list):
+            raise ValueError("values can only be appended to lists")
+        sample = current[0] if current else None
+        current.append(_parse_value(edit.value, sample))
+        return
+    parent[last] = _parse_value(edit.value, current)
+
+
+def apply_resume_edits(
+    resume: Resume, edits: list[ResumeEdit]
+) -> tuple[Resume, list[str]]:
+    """Apply targeted edits to a resume draft.
+
+    Edits are applied in order, except removals, which are applied last from
+    the highest index down, so every index refers to the previous draft.
+
+    Args:
+        resume: The previous draft
+        edits: The edits returned by the model
+
+    Returns:
+        The revised resume and a description of each rejected edit
+
+    Raises:
+        RevisionError: If edits were given but none could be applied
+    """
+    ordered = [edit for edit in edits if edit.operation != "remove"] + sorted(
+        (edit for edit in edits if edit.operation == "remove"),
+        key=_removal_order,
+        reverse=True,
+    )
+    document = resume.model_dump(mode="json")
+    revised = resume
+    rejected: list[str] = []
+    for edit in ordered:
+        candidate = copy.deepcopy(document)
+        try:
+            _apply_edit(candidate, edit)
+            revised = Resume.model_validate(_without_none(candidate))
+        except (KeyError, IndexError, TypeError, ValueError, ValidationError) as e:
+            rejected.append(f"{edit.operation} {edit.path}: {str(e).splitlines()[0]}")
+            continue
+        document = candidate
+    if edits and len(rejected) == len(edits):
+        raise RevisionError(f"No resume edit could be applied: {rejected}")
+    return revised, rejected
+
+
+def apply_cover_letter_edits(
+    cover_letter: str, edits: list[CoverLetterEdit]
+) -> tuple[str, list[str]]:
+    """Apply find/replace edits to a cover letter draft.
+
+    Each excerpt replaces its first occurrence; whitespace differences between
+    the excerpt and the draft are tolerated.
+
+    Args:
+        cover_letter: The previous draft
+        edits: The edits returned by the model
+
+    Returns:
+        The revised cover letter and a description of each rejected edit
+
+    Raises:
+        RevisionError: If edits were given but none could be applied
+    """
+    revised = cover_letter
+    rejected: list[str] = []
+    for edit in edits:
+        excerpt = edit.find.strip()
+        if not excerpt:
+            rejected.append("empty excerpt")
+            continue
+        pattern = re.compile(r"\s+".join(re.escape(word) for word in excerpt.split()))
+        match = pattern.search(revised)
+        if match is None:
+            rejected.append(f"excerpt not found: {excerpt[:80]!r}")
+            continue
+        revised = revised[: match.start()] + edit.replace + revised[match.end() :]
+    if edits and len(rejected) == len(edits):
+        raise RevisionError(f"No cover letter edit could be applied: {rejected}")
+    # Deleted paragraphs leave blank runs behind
+    return re.sub(r"\n{3,}", "\n\n", revised).strip(), rejected
@@ -3,32 +3,60 @@
 This module contains the main graph agent that coordinates the workflow
 for processing job applications, including company profiling, resume generation,
 and cover letter generation.
+
+Two pipeline modes are available (DRAFTS_PIPELINE_MODE):
+- "sequential" (default): the cover letter generator runs once the resume
+  generator has finished
+- "overlapped": the cover letter is drafted from the first accepted resume
+  draft while the resume loop keeps polishing, then reconciled with the final
+  resume if it changed materially (see drafts_generators.overlap). The drafting
+  subgraphs then run inside a single node without checkpoints of their own, so
+  an interrupted run restarts drafting from the beginning.
 """
 
+import asyncio
 import logging
+import os
+from contextlib import aclosing
 from typing import Any
 
+from langchain_core.runnables import RunnableConfig
 from langchain_mistralai import ChatMistralAI
 from langgraph.checkpoint.memory import InMemorySaver
 from langgraph.graph import END, START, StateGraph
 from langgraph.graph.state import CompiledStateGraph
 from pydantic import BaseModel
 
+from src.configs.database_config import get_async_session_context
 from src.core.constants import MODEL_NAME
-from src.core.rate_limit_handlers import RateLimiter
+from src.core.instrumentation import instrument_node
+from src.core.rate_limit_handlers import get_rate_limiter
+from src.core.service_registry import ServiceRegistry
 from src.core.types import Resume
 from src.job_applications.agents.company_profiler_agents.company_profiler import (
     CompanyProfilerAgent,
 )
 from src.job_applications.agents.drafts_generators.cover_letter_generator import (
     CoverLetterGeneratorAgent,
+    CoverLetterGeneratorState,
+)
+from src.job_applications.agents.drafts_generators.overlap import (
+    COVER_LETTER_HANDOFF_GRADE,
+    reconciliation_request,
+    resume_changed_materially,
 )
 from src.job_applications.agents.drafts_generators.resume_generator import (
     ResumeGeneratorAgent,
 )
+from src.job_applications.services.event_sink import EventSink, get_event_sink
+from src.job_applications.types import ResumeGenerationStatus
 
 logger = logging.getLogger(__name__)
 
+PIPELINE_MODE = os.getenv("DRAFTS_PIPELINE_MODE", "sequential").lower()
+# Cover letter revision rounds allowed to reconcile it with the final resume
+RECONCILIATION_ROUNDS = 1
+
 
 class MainGraphState(BaseModel):
     """State model for the main graph agent."""
@@ -50,40 +78,65 @@ class MainGraphAgent:
         model: ChatMistralAI | None = None,
         debug: bool = False,
         rate_limiter=None,
+        event_sink: EventSink | None = None,
+        pipeline_mode: str = PIPELINE_MODE,
     ) -> None:
         """Initialize the MainGraphAgent."""
         self.model = model or ChatMistralAI(model=MODEL_NAME, max_tokens=8192)
         self.debug = debug
-        self.rate_limiter = rate_limiter or RateLimiter(1.0)
+        self.rate_limiter = rate_limiter or get_rate_limiter("mistral", MODEL_NAME)
+        self.event_sink = event_sink or get_event_sink()
+        self.pipeline_mode = pipeline_mode
 
     def build_graph(self, checkpointer=InMemorySaver()) -> CompiledStateGraph:
         """Build the main orchestrator graph for Resumind."""
         try:
             builder = StateGraph(MainGraphState)
             company_profiler = CompanyProfilerAgent(
-                rate_limiter=self.rate_limiter, model=self.model, debug=self.debug
+                rate_limiter=self.rate_limiter,
+                model=self.model,
+                debug=self.debug,
+                event_sink=self.event_sink,
             )
             company_profiler_graph = company_profiler.build_graph(
                 checkpointer=checkpointer
             )
             resume_generator = ResumeGeneratorAgent(
-                model=self.model, debug=self.debug, rate_limiter=self.rate_limiter
+                model=self.model,
+                debug=self.debug,
+                rate_limiter=self.rate_limiter,
+                event_sink=self.event_sink,
             )
-            resume_generator_graph = resume_generator.build_graph(
-                checkpointer=checkpointer
+            cover_letter_generator = CoverLetterGeneratorAgent(
+                model=self.model,
+                debug=self.debug,
+                rate_limiter=self.rate_limiter,
+                event_sink=self.event_sink,
             )
 
-            cover_letter_generator = CoverLetterGeneratorAgent(
-                model=self.model, debug=self.debug
+            builder.add_node("company_profiler", company_profiler_graph)
+            builder.add_edge(START, "company_profiler")
+            if self.pipeline_mode == "overlapped":
+                self.cover_letter_generator = cover_letter_generator
+                self.resume_generator_graph = resume_generator.build_graph(
+                    checkpointer=False
+                )
+                self.cover_letter_generator_graph = cover_letter_generator.build_graph(
+                    checkpointer=False, finalize=False
+                )
+                builder.add_node("overlapped_drafts", self.overlapped_drafts)
+                builder.add_edge("company_profiler", "overlapped_drafts")
+                builder.add_edge("overlapped_drafts", END)
+                return builder.compile(checkpointer=checkpointer, debug=self.debug)
+
+            resume_generator_graph = resume_generator.build_graph(
+                checkpointer=checkpointer
             )
             cover_letter_generator_graph = cover_letter_generator.build_graph(
                 checkpointer=checkpointer
             )
-
-            builder.add_node("company_profiler", company_profiler_graph)
             builder.add_node("resume_generator", resume_generator_graph)
             builder.add_node("cover_letter_generator", cover_letter_generator_graph)
-            builder.add_edge(START, "company_profiler")
             builder.add_edge("company_profiler", "resume_generator")
             builder.add_edge("resume_generator", "cover_letter_generator")
             builder.add_edge("cover_letter_generator", END)
@@ -91,3 +144,122 @@ class MainGraphAgent:
         except Exception as e:
             logger.error("Error building the main graph", error=str(e))
             raise e
+
+    @instrument_node("main_graph/overlapped_drafts")
+    async def overlapped_drafts(self, state: MainGraphState, config: RunnableConfig):
+        """Generate the resume and the cover letter with overlapping loops.
+
+        The cover letter generator starts on the first resume draft graded at
+        least COVER_LETTER_HANDOFF_GRADE, or on the final resume if no draft
+        reaches it. Once both loops are done, the cover letter is revised if the
+        final resume changed materially, then saved. A failed cover letter run
+        stops the resume loop, and any failure marks the job application FAILED.
+        """
+        resume_input = {
+            "job_application_id": state.job_application_id,
+            "original_resume_snapshot": state.original_resume_snapshot,
+            "job_role": state.job_role,
+            "job_description": state.job_description,
+            "company": state.company,
+            "research_results": state.research_results or {},
+        }
+        handoff_resume: Resume | None = None
+        cover_letter_task: asyncio.Task | None = None
+        resume_state: dict[str, Any] = {}
+        try:
+            async with aclosing(
+                self.resume_generator_graph.astream(
+                    resume_input, config, stream_mode="values"
+                )
+            ) as resume_states:
+                async for resume_state in resume_states:
+                    if cover_letter_task is not None and cover_letter_task.done():
+                        # Raises the cover letter failure instead of polishing on
+                        cover_letter_task.result()
+                    grades = resume_state.get("grade_history") or []
+                    if (
+                        cover_letter_task is None
+                        and grades
+                        and grades[-1] >= COVER_LETTER_HANDOFF_GRADE
+                    ):
+                        handoff_resume = resume_state["generated_resume"]
+                        logger.info(
+                            "Drafting the cover letter from a resume graded "
+                            f"{grades[-1]}"
+                        )
+                        cover_letter_task = asyncio.create_task(
+                            self.cover_letter_generator_graph.ainvoke(
+                                self._cover_letter_input(state, handoff_resume),
+                                config,
+                            )
+                        )
+            final_resume: Resume = resume_state["generated_resume"]
+            if cover_letter_task is None:
+                handoff_resume = final_resume
+                cover_letter_state = await self.cover_letter_generator_graph.ainvoke(
+                    self._cover_letter_input(state, final_resume), config
+                )
+            else:
+                cover_letter_state = await cover_letter_task
+
+            if resume_changed_materially(handoff_resume, final_resume):
+                logger.info("Reconciling the cover letter with the final resume")
+                previous_evaluation = cover_letter_state.get("evaluation_results")
+                cover_letter_state = await self.cover_letter_generator_graph.ainvoke(
+                    {
+                        **self._cover_letter_input(state, final_resume),
+                        "generated_cover_letter": cover_letter_state[
+                            "generated_cover_letter"
+                        ],
+                        "evaluation_results": reconciliation_request(
+                            handoff_resume,
+                            final_resume,
+                            grade=previous_evaluation.grade
+                            if previous_evaluation
+                            else 0,
+                        ),
+                        "current_evaluation": 1,
+                        "max_evaluations": 1 + RECONCILIATION_ROUNDS,
+                    },
+                    config,
+                )
+            await self.cover_letter_generator.finalize_generation(
+                CoverLetterGeneratorState.model_validate(cover_letter_state), config
+            )
+        except BaseException as e:
+            if cover_letter_task is not None and not cover_letter_task.done():
+                cover_letter_task.cancel()
+            if isinstance(e, Exception):
+                # The resume finalization may have moved the status past FAILED
+                await self._mark_failed(state.job_application_id, e)
+            raise
+        return {"generated_resume": final_resume}
+
+    async def _mark_failed(self, job_application_id: str, error: Exception):
+        try:
+            async with get_async_session_context() as session:
+                job_application_service = (
+                    ServiceRegistry.get_async_job_application_service(session)
+                )
+                await job_application_service.update_job_application_status(
+                    job_application_id, ResumeGenerationStatus.FAILED
+                )
+            self.event_sink.emit_pipeline_failed(
+                job_application_id=job_application_id,
+                message="Drafting the resume and cover letter failed",
+                error={"message": str(error)},
+            )
+        except Exception as e:
+            logger.error(f"Error marking the job application as failed: {str(e)}")
+
+    def _cover_letter_input(
+        self, state: MainGraphState, resume: Resume
+    ) -> dict[str, Any]:
+        return {
+            "job_application_id": state.job_application_id,
+            "job_role": state.job_role,
+            "job_description": state.job_description,
+            "company": state.company,
+            "research_results": state.research_results or {},
+            "generated_resume": resume,
+        }
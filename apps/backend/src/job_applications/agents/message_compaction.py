@@ -0,0 +1,186 @@
+"""Bounded message history for the tool-calling agent loops.
+
+This module provides:
+- compact_messages: shrink a tool-calling conversation to a token budget
+- add_and_compact_messages: LangGraph reducer appending messages, then compacting
+
+Each loop iteration of the discovery and research agents resends the whole
+conversation, and tool outputs (search results, page summaries) dominate it.
+Compaction keeps the leading system and task messages and the most recent tool
+round intact, and:
+
+1. Replaces older tool outputs with a short excerpt that names the call made
+2. If the history is still over budget, drops the oldest rounds entirely and
+   lists their calls in the task message so the model does not repeat them
+
+A round is an AI message with the tool and feedback messages that follow it,
+so every remaining tool call keeps its tool result.
+
+Configuration:
+- AGENT_HISTORY_TOKEN_BUDGET: estimated tokens of the compacted history (default 16000)
+- COMPACTED_TOOL_OUTPUT_CHARS: characters kept from a compacted tool output (default 500)
+"""
+
+import os
+from typing import Any
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+
+from src.core.token_utils import estimate_message_tokens, estimate_tokens
+
+AGENT_HISTORY_TOKEN_BUDGET = int(os.getenv("AGENT_HISTORY_TOKEN_BUDGET", "16000"))
+COMPACTED_TOOL_OUTPUT_CHARS = int(os.getenv("COMPACTED_TOOL_OUTPUT_CHARS", "500"))
+
+# additional_kwargs markers, so compaction is idempotent across reducer calls
+_COMPACTED_KEY = "compacted"
+_OMITTED_CALLS_KEY = "omitted_tool_calls"
+_ORIGINAL_CONTENT_KEY = "original_content"
+
+
+def _content_text(message: BaseMessage) -> str:
+    content = message.content
+    return content if isinstance(content, str) else str(content)
+
+
+def _describe_call(tool_call: dict[str, Any]) -> str:
+    args = ", ".join(
+        f"{key}={value!r}" for key, value in (tool_call.get("args") or {}).items()
+    )
+    description = f"{tool_call.get('name', 'tool')}({args})"
+    return description if len(description) <= 200 else description[:197] + "..."
+
+
+def _split_rounds(
+    messages: list[BaseMessage],
+) -> tuple[list[BaseMessage], list[list[BaseMessage]]]:
+    preamble: list[BaseMessage] = []
+    rounds: list[list[BaseMessage]] = []
+    for message in messages:
+        if isinstance(message, AIMessage):
+            rounds.append([message])
+        elif rounds:
+            rounds[-1].append(message)
+        else:
+            preamble.append(message)
+    return preamble, rounds
+
+
+def _compact_tool_message(
+    message: ToolMessage, calls: dict[str, dict[str, Any]], max_chars: int
+) -> ToolMessage:
+    if message.additional_kwargs.get(_COMPACTED_KEY):
+        return message
+    text = _content_text(message)
+    if len(text) <= max_chars:
+        return message
+    call = calls.get(message.tool_call_id)
+    description = _describe_call(call) if call else "tool call"
+    return message.model_copy(
+        update={
+            "content": (
+                f"[Earlier output of {description}, compacted from about "
+                f"{estimate_tokens(text)} tokens]\n{text[:max_chars]}..."
+            ),
+            "additional_kwargs": {**message.additional_kwargs, _COMPACTED_KEY: True},
+        }
+    )
+
+
+def _with_omitted_calls(
+    preamble: list[BaseMessage], omitted_calls: list[str]
+) -> list[BaseMessage]:
+    # The note goes on the last task message rather than a new message, so the
+    # message roles keep alternating the way the provider expects
+    for index in range(len(preamble) - 1, -1, -1):
+        message = preamble[index]
+        if not isinstance(message, HumanMessage):
+            continue
+        calls = message.additional_kwargs.get(_OMITTED_CALLS_KEY, []) + omitted_calls
+        original = message.additional_kwargs.get(
+            _ORIGINAL_CONTENT_KEY, _content_text(message)
+        )
+        note = "\n".join(f"- {call}" for call in calls)
+        updated = message.model_copy(
+            update={
+                "content": (
+                    f"{original}\n\nEARLIER STEPS (omitted to save context; "
+                    f"do not repeat these tool calls):\n{note}"
+                ),
+                "additional_kwargs": {
+                    **message.additional_kwargs,
+                    _OMITTED_CALLS_KEY: calls,
+                    _ORIGINAL_CONTENT_KEY: original,
+                },
+            }
+        )
+        return preamble[:index] + [updated] + preamble[index + 1 :]
+    return preamble
+
+
+def compact_messages(
+    messages: list[BaseMessage],
+    token_budget: int = AGENT_HISTORY_TOKEN_BUDGET,
+    keep_recent_rounds: int = 1,
+    max_tool_output_chars: int = COMPACTED_TOOL_OUTPUT_CHARS,
+) -> list[BaseMessage]:
+    """Compact a tool-calling conversation to fit a token budget.
+
+    Args:
+        messages: The conversation, oldest first
+        token_budget: Maximum estimated tokens of the result; the leading
+            messages and the most recent rounds are kept even when they exceed it
+        keep_recent_rounds: Number of most recent rounds left untouched
+        max_tool_output_chars: Characters kept from each compacted tool output
+
+    Returns:
+        A new list of messages; the given messages are not modified
+    """
+    preamble, rounds = _split_rounds(list(messages))
+    if len(rounds) <= keep_recent_rounds:
+        return list(messages)
+
+    older, recent = rounds[:-keep_recent_rounds], rounds[-keep_recent_rounds:]
+    compacted_rounds = []
+    for round_messages in older:
+        calls = {
+            call["id"]: call
+            for call in round_messages[0].tool_calls
+            if call.get("id") is not None
+        }
+        compacted_rounds.append(
+            [
+                _compact_tool_message(message, calls, max_tool_output_chars)
+                if isinstance(message, ToolMessage)
+                else message
+                for message in round_messages
+            ]
+        )
+
+    def flatten(rounds_to_flatten: list[list[BaseMessage]]) -> list[BaseMessage]:
+        return [message for round_ in rounds_to_flatten for message in round_]
+
+    omitted_calls: list[str] = []
+    while (
+        compacted_rounds
+        and estimate_message_tokens(
+            preamble + flatten(compacted_rounds) + flatten(recent)
+        )
+        > token_budget
+    ):
+        dropped = compacted_rounds.pop(0)
+        omitted_calls.extend(_describe_call(call) for call in dropped[0].tool_calls)
+
+    if omitted_calls:
+        preamble = _with_omitted_calls(preamble, omitted_calls)
+    return preamble + flatten(compacted_rounds) + flatten(recent)
+
+
+def add_and_compact_messages(
+    old: list[BaseMessage] | None, new: list[BaseMessage] | None
+) -> list[BaseMessage]:
+    """Append new messages to the history, then compact it.
+
+    Used instead of operator.add so both the prompt and the checkpointed state
+    stay bounded across agent iterations.
+    """
+    return compact_messages((old or []) + (new or []))
@@ -6,12 +6,20 @@ instances with database sessions.
 
 from fastapi import Depends
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.configs.database_config import get_session
+from src.configs.database_config import get_async_session, get_session
 from src.job_applications.repositories.job_application_repository import (
     JobApplicationRepository,
 )
-from src.job_applications.services.job_application_service import JobApplicationService
+from src.job_applications.services.events_service import (
+    AsyncEventService,
+    EventService,
+)
+from src.job_applications.services.job_application_service import (
+    AsyncJobApplicationService,
+    JobApplicationService,
+)
 
 
 def get_job_application_repository(session: Session = Depends(get_session)):
@@ -32,3 +40,37 @@ def get_job_application_service(
     from src.core.service_registry import ServiceRegistry
 
     return ServiceRegistry.get_job_application_service(session)
+
+
+def get_event_service(session: Session = Depends(get_session)) -> EventService:
+    """Dependency to get EventService instance.
+
+    This ensures that the service is created with the current database session.
+    """
+    from src.core.service_registry import ServiceRegistry
+
+    return ServiceRegistry.get_events_service(session)
+
+
+def get_async_job_application_service(
+    session: AsyncSession = Depends(get_async_session),
+) -> AsyncJobApplicationService:
+    """Dependency to get AsyncJobApplicationService instance.
+
+    This ensures that the service is created with the current async database session.
+    """
+    from src.core.service_registry import ServiceRegistry
+
+    return ServiceRegistry.get_async_job_application_service(session)
+
+
+def get_async_event_service(
+    session: AsyncSession = Depends(get_async_session),
+) -> AsyncEventService:
+    """Dependency to get AsyncEventService instance.
+
+    This ensures that the service is created with the current async database session.
+    """
+    from src.core.service_registry import ServiceRegistry
+
+    return ServiceRegistry.get_async_events_service(session)
@@ -0,0 +1,547 @@
+"""Shared change feeds of job applications, multiplexed across stream clients.
+
+Every client watching an application used to reload and re-serialize it on
+each change. ApplicationFeedHub runs one watcher per application instead:
+
+1. The watcher subscribes to the application's change channel, loads the
+   application once, then on each change loads its top-level fields and only
+   the events since its cursor
+2. Each change is serialized once into pre-encoded SSE frames, a snapshot frame
+   and a delta frame, and offered to every subscriber
+3. Subscribers read from bounded queues. A client falling behind has its
+   backlog coalesced: snapshot clients keep only the latest frame, delta
+   clients are resynchronized with a fresh snapshot
+
+Database and serialization cost therefore follows the number of watched
+applications, not the number of connected clients. The watcher stops with its
+last subscriber, or after sending the completion frame of a finished
+application.
+
+A delta client reconnecting with Last-Event-ID replays the frames it missed
+from the watcher's recent frames. If they are no longer there (the watcher was
+restarted, or ran in another process), the events after its cursor are loaded
+from the database and sent as one delta; only a client whose Last-Event-ID
+cannot be decoded receives a snapshot.
+
+This module provides:
+- ApplicationFeedHub: the hub, with subscribe() as its entry point
+- FeedSubscriber: a client's view of a feed
+- get_application_feed_hub / set_application_feed_hub: process-wide hub
+
+Configuration:
+- SSE_CLIENT_QUEUE_SIZE: frames buffered per client (default 32)
+- SSE_REPLAY_FRAMES: recent delta frames kept for reconnecting clients
+  (default 64)
+"""
+
+import asyncio
+import contextlib
+import os
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from logging import getLogger
+from typing import Any, Literal
+
+from src.configs.database_config import get_async_session_context
+from src.core.notifications import (
+    ChangeNotifier,
+    get_change_notifier,
+    job_application_channel,
+)
+from src.core.service_registry import ServiceRegistry
+from src.job_applications.model import Event, JobApplication
+from src.job_applications.streaming import (
+    DELTA_EVENT,
+    SNAPSHOT_EVENT,
+    EventCursor,
+    application_fields,
+    changed_fields,
+    field_fingerprints,
+    format_sse,
+    serialize_event,
+)
+from src.job_applications.types import ResumeGenerationStatus
+
+logger = getLogger(__name__)
+
+SSE_HEARTBEAT_SECONDS = float(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))
+SSE_CLIENT_QUEUE_SIZE = max(2, int(os.getenv("SSE_CLIENT_QUEUE_SIZE", "32")))
+SSE_REPLAY_FRAMES = int(os.getenv("SSE_REPLAY_FRAMES", "64"))
+
+KEEP_ALIVE_FRAME = ": keep-alive\n\n"
+
+FeedMode = Literal["snapshot", "delta"]
+
+_TERMINAL_STATUSES = {
+    ResumeGenerationStatus.FAILED.value,
+    ResumeGenerationStatus.COMPLETED.value,
+}
+# Queued after the last frame of a feed
+_END = None
+
+
+@dataclass(frozen=True)
+class FeedKey:
+    """Identifies a shared feed; clients with the same key share one watcher."""
+
+    application_id: str
+    events_limit: int = 200
+    poll_interval_ms: int = 1000
+
+
+class FeedSubscriber:
+    """A client's view of an application feed.
+
+    Attributes:
+        mode: "snapshot" for full frames, "delta" for a snapshot then deltas
+        completed: Set once the completion frame of the application was queued
+    """
+
+    def __init__(self, mode: FeedMode, queue_size: int = SSE_CLIENT_QUEUE_SIZE):
+        """Initialize the subscriber with an empty queue of queue_size frames."""
+        self.mode = mode
+        self.queue_size = queue_size
+        self.completed = False
+        self.dropped_frames = 0
+        # Bounded by offer(); the closing frames may exceed the bound
+        self._queue: asyncio.Queue[str | None] = asyncio.Queue()
+
+    def offer(self, frame: str, resync: Callable[[], str] | None = None) -> None:
+        """Queue a frame, coalescing the backlog when the client is behind.
+
+        Args:
+            frame: The pre-encoded frame
+            resync: Returns a snapshot of the application including this frame's
+                changes, replacing the backlog of a delta client
+        """
+        if self._queue.qsize() >= self.queue_size:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+                self.dropped_frames += 1
+            if self.mode == "delta" and resync is not None:
+                # The dropped deltas cannot be skipped; the snapshot replaces them
+                self._queue.put_nowait(resync())
+                return
+        self._queue.put_nowait(frame)
+
+    def close(self, final_frame: str) -> None:
+        """Queue the frame ending the feed, after which frames() stops."""
+        self._queue.put_nowait(final_frame)
+        self._queue.put_nowait(_END)
+
+    async def frames(
+        self, heartbeat: float | None = SSE_HEARTBEAT_SECONDS
+    ) -> AsyncIterator[str]:
+        """Yield queued frames, or a keep-alive comment after heartbeat idle seconds.
+
+        A heartbeat of None never sends keep-alives, for callers sending their own.
+        """
+        while True:
+            try:
+                frame = await asyncio.wait_for(self._queue.get(), timeout=heartbeat)
+            except TimeoutError:
+                yield KEEP_ALIVE_FRAME
+                continue
+            if frame is _END:
+                return
+            yield frame
+
+
+class _ApplicationWatcher:
+    """Loads one application on each change and broadcasts the resulting frames."""
+
+    def __init__(self, hub: "ApplicationFeedHub", key: FeedKey) -> None:
+        self.hub = hub
+        self.key = key
+        self.clients = 0
+        self.closed = False
+        self.ready = asyncio.Event()
+        self.subscribers: set[FeedSubscriber] = set()
+
+        self._task: asyncio.Task | None = None
+        self._application_id: str | None = None
+        self._status: str | None = None
+        self._cursor = EventCursor()
+        self._fingerprints: dict[str, str] = {}
+        self._fields: dict[str, Any] = {}
+        self._events: deque[dict[str, Any]] = deque(maxlen=key.events_limit)
+        self._counter = 0
+        self._replay: deque[tuple[str, str]] = deque(maxlen=SSE_REPLAY_FRAMES)
+        # Held while refreshing, so a resuming client sees a stable cursor
+        self._lock = asyncio.Lock()
+        self._join_frames: dict[FeedMode, str] = {}
+        self._final_frames: dict[FeedMode, str] = {}
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        self.closed = True
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+
+    # Frames
+
+    def _snapshot_payload(self) -> dict[str, Any]:
+        return {**self._fields, "events": list(self._events)}
+
+    def _snapshot_id(self) -> str:
+        updated_at = self._fields.get("updated_at") or "0"
+        return f"{updated_at}:{self._counter}"
+
+    def _join_frame(self, mode: FeedMode) -> str:
+        """Snapshot frame opening a new client's feed, cached until the next change."""
+        frame = self._join_frames.get(mode)
+        if frame is None:
+            payload = {
+                **self._snapshot_payload(),
+                "status_changed": True,
+                "previous_status": None,
+            }
+            frame_id = self._cursor.encode() if mode == "delta" else self._snapshot_id()
+            frame = format_sse(frame_id, payload, SNAPSHOT_EVENT)
+            self._join_frames[mode] = frame
+        return frame
+
+    def _delta_resync(self) -> str:
+        return self._join_frame("delta")
+
+    def _broadcast(self, frames: dict[FeedMode, str | None]) -> None:
+        for subscriber in list(self.subscribers):
+            frame = frames.get(subscriber.mode)
+            if frame is not None:
+                subscriber.offer(frame, resync=self._delta_resync)
+
+    def _finish(self, frames: dict[FeedMode, str]) -> None:
+        """Send the frames ending every feed and close the watcher."""
+        self._final_frames = frames
+        self.closed = True
+        for subscriber in list(self.subscribers):
+            self._send_final(subscriber)
+        self.hub._discard(self)
+
+    def _send_final(self, subscriber: FeedSubscriber) -> None:
+        subscriber.completed = self._status in _TERMINAL_STATUSES
+        subscriber.close(self._final_frames[subscriber.mode])
+
+    async def join(self, subscriber: FeedSubscriber, last_event_id: str | None) -> None:
+        """Queue the opening frames of a new subscriber and add it to the feed."""
+        if self._application_id is not None:
+            replayed = None
+            if subscriber.mode == "delta":
+                replayed = self._replay_after(last_event_id)
+                cursor = EventCursor.decode(last_event_id)
+                if replayed is None and cursor is not None:
+                    replayed = await self._resume_from(cursor)
+            if replayed is None:
+                subscriber.offer(self._join_frame(subscriber.mode))
+            else:
+                for frame in replayed:
+                    subscriber.offer(frame, resync=self._delta_resync)
+        if self.closed:
+            self._send_final(subscriber)
+            return
+        self.subscribers.add(subscriber)
+
+    def _replay_after(self, last_event_id: str | None) -> list[str] | None:
+        if not last_event_id:
+            return None
+        if last_event_id == self._cursor.encode():
+            return []
+        frame_ids = [frame_id for frame_id, _ in self._replay]
+        if last_event_id not in frame_ids:
+            return None
+        return [frame for _, frame in self._replay][
+            frame_ids.index(last_event_id) + 1 :
+        ]
+
+    async def _resume_from(self, cursor: EventCursor) -> list[str] | None:
+        """Load what a client at cursor missed up to this watcher's cursor.
+
+        Returns:
+            The delta frame bringing the client up to date (none if it already
+            is), or None if the events could not be loaded
+        """
+        try:
+            async with self._lock:
+                missed: list[Event] = []
+                end = (self._cursor.event_created_at, self._cursor.event_id)
+                position = cursor
+                while self._cursor.event_id is not None:
+                    page = await self.hub.load_events(
+                        self.key.application_id, position, self.key.events_limit
+                    )
+                    missed.extend(e for e in page if (e.created_at, e.id) <= end)
+                    if (
+                        len(page) < self.key.events_limit
+                        or (page[-1].created_at, page[-1].id) >= end
+                    ):
+                        break
+                    position = EventCursor(page[-1].created_at, page[-1].id)
+        except Exception as e:
+            logger.error(
+                f"Error resuming the feed of application {self.key.application_id}: {e}"
+            )
+            return None
+
+        # The client holds the fields as of its cursor; resend them all only if
+        # the application changed since
+        unchanged = cursor.application_updated_at == self._cursor.application_updated_at
+        delta, _ = changed_fields(self._fields, self._fingerprints if unchanged else {})
+        if not missed and not delta:
+            return []
+        status_change: dict[str, Any] = {}
+        if "resume_generation_status" in delta:
+            status_change = {"status_changed": True, "previous_status": None}
+        payload = {
+            "id": self._application_id,
+            "fields": delta,
+            "events": [serialize_event(e) for e in missed],
+            **status_change,
+        }
+        return [format_sse(self._cursor.encode(), payload, DELTA_EVENT)]
+
+    # Loading
+
+    async def _load_initial(self) -> bool:
+        app = await self.hub.load_application(self.key.application_id, True)
+        if app is None:
+            return False
+        self._application_id = app.id
+        events = app.events or []
+        self._events.extend(
+            serialize_event(e) for e in events[-self.key.events_limit :]
+        )
+        self._cursor.advance(events)
+        self._cursor.application_updated_at = app.updated_at
+        self._fields = application_fields(app)
+        self._fingerprints = field_fingerprints(self._fields)
+        self._status = app.resume_generation_status
+        return True
+
+    async def _refresh(self) -> tuple[bool, bool]:
+        """Load the changes since the last refresh and broadcast them.
+
+        Returns:
+            Whether the application still exists and whether more events are
+            waiting beyond the page just fetched
+        """
+        app = await self.hub.load_application(self.key.application_id, False)
+        if app is None:
+            return False, False
+        new_events = await self.hub.load_events(
+            self.key.application_id, self._cursor, self.key.events_limit
+        )
+        more_pending = len(new_events) >= self.key.events_limit
+        fields = application_fields(app)
+        delta, self._fingerprints = changed_fields(fields, self._fingerprints)
+        if not new_events and not delta:
+            return True, more_pending
+
+        serialized = [serialize_event(e) for e in new_events]
+        self._cursor.advance(new_events)
+        self._cursor.application_updated_at = app.updated_at
+        self._fields = fields
+        self._events.extend(serialized)
+        self._join_frames.clear()
+        self._counter += 1
+
+        status_change: dict[str, Any] = {}
+        if app.resume_generation_status != self._status:
+            status_change = {"status_changed": True, "previous_status": self._status}
+            self._status = app.resume_generation_status
+
+        delta_id = self._cursor.encode()
+        delta_frame = format_sse(
+            delta_id,
+            {"id": app.id, "fields": delta, "events": serialized, **status_change},
+            DELTA_EVENT,
+        )
+        self._replay.append((delta_id, delta_frame))
+        snapshot_frame = None
+        if any(subscriber.mode == "snapshot" for subscriber in self.subscribers):
+            snapshot_frame = format_sse(
+                self._snapshot_id(),
+                {**self._snapshot_payload(), **status_change},
+                SNAPSHOT_EVENT,
+            )
+        self._broadcast({"delta": delta_frame, "snapshot": snapshot_frame})
+        return True, more_pending
+
+    def _completion_frames(self) -> dict[FeedMode, str]:
+        ending = {"stream_ending": True, "final_status": self._status}
+        return {
+            "delta": format_sse(
+                self._cursor.encode(),
+                {"id": self._application_id, **ending},
+                DELTA_EVENT,
+            ),
+            "snapshot": format_sse(
+                f"completion-{self._snapshot_id()}",
+                {**self._snapshot_payload(), **ending},
+                SNAPSHOT_EVENT,
+            ),
+        }
+
+    async def _run(self) -> None:
+        gone = format_sse("gone", {"detail": "not_found"})
+        min_frame_interval = max(0.1, self.key.poll_interval_ms / 1000.0)
+        loop = asyncio.get_running_loop()
+        try:
+            # Subscribe before the first read so no change can slip in between
+            async with self.hub.notifier.subscribe(
+                job_application_channel(self.key.application_id)
+            ) as subscription:
+                exists = await self._load_initial()
+                self.ready.set()
+                more_pending = False
+                last_frame_at = loop.time()
+                while exists and not self.closed:
+                    if self._status in _TERMINAL_STATUSES and not more_pending:
+                        self._finish(self._completion_frames())
+                        return
+                    if not more_pending:
+                        notification = await subscription.get(
+                            timeout=SSE_HEARTBEAT_SECONDS
+                        )
+                        if notification is not None:
+                            # Coalesce bursts of notifications into a single frame
+                            since_last_frame = loop.time() - last_frame_at
+                            if since_last_frame < min_frame_interval:
+                                await asyncio.sleep(
+                                    min_frame_interval - since_last_frame
+                                )
+                            await subscription.drain()
+                    # Idle timeouts double as a resync in case a notification was lost
+                    counter = self._counter
+                    async with self._lock:
+                        exists, more_pending = await self._refresh()
+                    if self._counter != counter:
+                        last_frame_at = loop.time()
+                if not exists:
+                    self._finish({"delta": gone, "snapshot": gone})
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(
+                f"Error in the feed of application {self.key.application_id}: {e}"
+            )
+            error = format_sse(
+                "stream-error", {"detail": "stream_error", "message": str(e)}
+            )
+            self._finish({"delta": error, "snapshot": error})
+        finally:
+            self.ready.set()
+
+
+class ApplicationFeedHub:
+    """In-process hub sharing one watcher per application among stream clients.
+
+    All methods must be called from the event loop serving the clients.
+    """
+
+    def __init__(
+        self,
+        notifier: ChangeNotifier | None = None,
+        queue_size: int = SSE_CLIENT_QUEUE_SIZE,
+    ) -> None:
+        """Initialize the hub.
+
+        Args:
+            notifier: Change notifier to watch, the process-wide one by default
+            queue_size: Frames buffered per client before its backlog is coalesced
+        """
+        self.notifier = notifier or get_change_notifier()
+        self.queue_size = queue_size
+        self._watchers: dict[FeedKey, _ApplicationWatcher] = {}
+
+    @property
+    def watched_applications(self) -> int:
+        """Number of applications currently watched."""
+        return len(self._watchers)
+
+    def _discard(self, watcher: _ApplicationWatcher) -> None:
+        if self._watchers.get(watcher.key) is watcher:
+            del self._watchers[watcher.key]
+
+    @contextlib.asynccontextmanager
+    async def subscribe(
+        self,
+        key: FeedKey,
+        mode: FeedMode = "snapshot",
+        last_event_id: str | None = None,
+    ) -> AsyncIterator[FeedSubscriber]:
+        """Subscribe to the feed of an application for the lifetime of the context.
+
+        The first frames are a snapshot of the application, except for a delta
+        client with a valid Last-Event-ID, which resumes from the recent frames
+        or, if they no longer hold it, from the events stored after its cursor.
+
+        Args:
+            key: The feed to join
+            mode: "snapshot" or "delta" frames
+            last_event_id: Last-Event-ID sent by a reconnecting delta client
+
+        Yields:
+            The subscriber whose frames() the client streams
+        """
+        watcher = self._watchers.get(key)
+        if watcher is None or watcher.closed:
+            watcher = _ApplicationWatcher(self, key)
+            self._watchers[key] = watcher
+            watcher.start()
+        watcher.clients += 1
+        subscriber = FeedSubscriber(mode, self.queue_size)
+        try:
+            await watcher.ready.wait()
+            await watcher.join(subscriber, last_event_id)
+            yield subscriber
+        finally:
+            watcher.subscribers.discard(subscriber)
+            watcher.clients -= 1
+            if watcher.clients == 0 and not watcher.closed:
+                watcher.stop()
+                self._discard(watcher)
+
+    async def load_application(
+        self, application_id: str, with_events: bool
+    ) -> JobApplication | None:
+        """Load an application in a short-lived session."""
+        async with get_async_session_context() as session:
+            job_application_service = ServiceRegistry.get_async_job_application_service(
+                session
+            )
+            return await job_application_service.get_job_application(
+                application_id, with_events=with_events
+            )
+
+    async def load_events(
+        self, application_id: str, cursor: EventCursor, limit: int
+    ) -> list[Event]:
+        """Load the events of an application from a cursor in a short-lived session."""
+        async with get_async_session_context() as session:
+            event_service = ServiceRegistry.get_async_events_service(session)
+            return await event_service.list_events(
+                application_id,
+                since=cursor.event_created_at,
+                after_id=cursor.event_id,
+                limit=limit,
+            )
+
+
+_application_feed_hub: ApplicationFeedHub | None = None
+
+
+def get_application_feed_hub() -> ApplicationFeedHub:
+    """Return the process-wide feed hub."""
+    global _application_feed_hub
+    if _application_feed_hub is None:
+        _application_feed_hub = ApplicationFeedHub()
+    return _application_feed_hub
+
+
+def set_application_feed_hub(hub: ApplicationFeedHub | None) -> None:
+    """Override the process-wide feed hub (None resets to the default)."""
+    global _application_feed_hub
+    _application_feed_hub = hub
@@ -2,20 +2,45 @@
 
 This module provides Celery tasks and async functions to orchestrate
 the resume generation workflow for job applications using LangGraph
-and PostgreSQL for checkpointing.
+and PostgreSQL for checkpointing. Each worker process runs the workflow on a
+shared PipelineRuntime, started when the process boots; with the thread pool,
+one process runs several pipelines concurrently on that runtime.
+
+It also provides purge_expired_company_research, run periodically by Celery beat
+(see beat_schedule in src.celery_app) to delete expired company research cache
+entries.
 """
 
-import asyncio
 import logging
-import os
+
+from celery.signals import worker_process_init, worker_process_shutdown, worker_shutdown
+from langgraph.graph.state import CompiledStateGraph
 
 from src.celery_app import app
+from src.job_applications.pipeline_runtime import (
+    get_pipeline_runtime,
+    shutdown_pipeline_runtime,
+)
 
 # Initialize structured logger
 logger = logging.getLogger(__name__)
 
-# Database connection settings
-db_url = os.environ.get("DATABASE_URL")
+
+@worker_process_init.connect
+def start_pipeline_runtime(**kwargs):
+    """Start the pipeline runtime when a prefork worker process boots."""
+    try:
+        get_pipeline_runtime()
+    except Exception as e:
+        # The first task retries the startup
+        logger.error(f"Error starting the pipeline runtime: {str(e)}")
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def stop_pipeline_runtime(**kwargs):
+    """Stop the pipeline runtime when the worker process exits."""
+    shutdown_pipeline_runtime()
 
 
 @app.task(
@@ -25,78 +50,97 @@ db_url = os.environ.get("DATABASE_URL")
 def start_resume_generation(self, job_application_id: str):
     """Given a workflow id, execute the workflow."""
     try:
-        asyncio.run(start_resume_generation_async(job_application_id))
+        runtime = get_pipeline_runtime()
+        runtime.run_pipeline(
+            start_resume_generation_async(job_application_id, runtime.graph)
+        )
         return {"job_application_id": job_application_id}
     except Exception as e:
         logger.error(f"Error starting resume generation: {str(e)}")
         raise e
 
 
+@app.task
+def purge_expired_company_research():
+    """Delete the expired company research cache entries."""
+    try:
+        purged = get_pipeline_runtime().run(purge_expired_company_research_async())
+        logger.info(f"Purged {purged} expired company research cache entries")
+        return {"purged": purged}
+    except Exception as e:
+        logger.error(f"Error purging the company research cache: {str(e)}")
+        raise e
+
+
+async def purge_expired_company_research_async() -> int:
+    """Delete the expired company research cache entries and return their number."""
+    from src.configs.database_config import get_async_session_context
+    from src.core.service_registry import ServiceRegistry
+    from src.user.model import User  # noqa: F401 - must be imported before JobApplication mapper is configured
+
+    async with get_async_session_context() as session:
+        return await ServiceRegistry.get_async_company_research_cache_service(
+            session
+        ).purge_expired()
+
+
 async def start_resume_generation_async(
     job_application_id: str,
+    graph: CompiledStateGraph,
 ):
-    """Given a job application id, start the resume generation."""
+    """Given a job application id, start the resume generation on a compiled graph."""
     import psycopg
     from langchain_core.runnables import RunnableConfig
     from langfuse.langchain import CallbackHandler
-    from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
 
-    from src.configs.database_config import get_session_context
-    from src.core.rate_limit_handlers import RateLimiter
+    from src.configs.database_config import get_async_session_context
+    from src.core.instrumentation import LLMUsageCallback
+    from src.core.rate_limit_handlers import TokenUsageCallback
     from src.core.service_registry import ServiceRegistry
-    from src.job_applications.agents.main_graph import MainGraphAgent, MainGraphState
+    from src.job_applications.agents.main_graph import MainGraphState
+    from src.job_applications.services.event_sink import get_event_sink
     from src.user.model import User  # noqa: F401 - must be imported before JobApplication mapper is configured
 
     try:
-        async with await psycopg.AsyncConnection.connect(db_url) as conn:
-            await conn.set_autocommit(True)
-
-            # Initialize the async checkpointer
-            checkpointer = AsyncPostgresSaver(conn)
-            await checkpointer.setup()
-
-            # Build the execution graph with the async checkpointer
-            executor = MainGraphAgent(rate_limiter=RateLimiter())
-            graph = executor.build_graph(checkpointer)
-            with get_session_context() as session:
-                job_application_service = ServiceRegistry.get_job_application_service(
-                    session
-                )
-                job_application = job_application_service.get_job_application(
-                    job_application_id
-                )
-                job_application_role = job_application.job_title
-                job_application_description = job_application.job_description
-                job_application_company = job_application.company_name
-                original_resume_snapshot = job_application.original_resume_snapshot[
-                    "resume"
-                ]
-
-            input_state = MainGraphState(
-                job_application_id=job_application_id,
-                job_role=job_application_role,
-                job_description=job_application_description,
-                company=job_application_company,
-                original_resume_snapshot=original_resume_snapshot,
+        async with get_async_session_context() as session:
+            job_application_service = ServiceRegistry.get_async_job_application_service(
+                session
             )
-
-            # Execute the workflow
-            configurable = {
-                "thread_id": job_application_id,
-            }
-            config = RunnableConfig(
-                callbacks=[CallbackHandler()], configurable=configurable
+            job_application = await job_application_service.get_job_application(
+                job_application_id
             )
-
+            job_application_role = job_application.job_title
+            job_application_description = job_application.job_description
+            job_application_company = job_application.company_name
+            original_resume_snapshot = job_application.original_resume_snapshot[
+                "resume"
+            ]
+
+        input_state = MainGraphState(
+            job_application_id=job_application_id,
+            job_role=job_application_role,
+            job_description=job_application_description,
+            company=job_application_company,
+            original_resume_snapshot=original_resume_snapshot,
+        )
+
+        # Execute the workflow
+        configurable = {
+            "thread_id": job_application_id,
+        }
+        config = RunnableConfig(
+            callbacks=[CallbackHandler(), LLMUsageCallback(), TokenUsageCallback()],
+            configurable=configurable,
+        )
+
+        try:
             await graph.ainvoke(
                 input=input_state,
                 config=config,
             )
-
-            # Ensure all pending operations complete before closing
-            await asyncio.sleep(0.1)
-
-            await conn.close()
+        finally:
+            # Persist whatever the pipeline buffered, including on failure
+            await get_event_sink().aflush()
 
     except psycopg.Error as db_error:
         logger.error(f"Database error in start_resume_generation_async {str(db_error)}")
@@ -0,0 +1,314 @@
+"""Per-user live updates stream multiplexing every application feed.
+
+A dashboard used to open one SSE connection per application being generated,
+plus one while a resume was being extracted, each authenticating and polling on
+its own. LiveUpdatesStream carries all of them on a single connection:
+
+1. On connect it follows every application of the user that is still being
+   generated, and any application the user creates afterwards
+2. Frames of each application come from its shared ApplicationFeedHub feed and
+   are forwarded as is, their id prefixed with "<application_id>/"
+3. Resume extraction notifications of the user are sent as resume.status frames
+4. Subscribe and unsubscribe requests posted for the stream (see
+   request_subscription_change) add or remove applications while it is open
+
+Requests reach the stream through the change notifier, so the process
+handling the request does not need to be the one serving the stream.
+
+This module provides:
+- LiveUpdatesStream: a user's stream, with frames() as its entry point
+- request_subscription_change: publish a subscribe or unsubscribe request
+
+Configuration:
+- LIVE_STREAM_MAX_APPLICATIONS: applications followed at once by a stream
+  (default 50)
+"""
+
+import asyncio
+import os
+import uuid
+from collections.abc import AsyncIterator
+from logging import getLogger
+from typing import Any, Literal
+
+from src.configs.database_config import get_async_session_context
+from src.core.notifications import (
+    ChangeNotification,
+    ChangeNotifier,
+    live_stream_channel,
+    user_channel,
+)
+from src.core.service_registry import ServiceRegistry
+from src.job_applications.feed_hub import (
+    KEEP_ALIVE_FRAME,
+    SSE_CLIENT_QUEUE_SIZE,
+    SSE_HEARTBEAT_SECONDS,
+    ApplicationFeedHub,
+    FeedKey,
+    FeedMode,
+    get_application_feed_hub,
+)
+from src.job_applications.streaming import format_sse
+
+logger = getLogger(__name__)
+
+LIVE_STREAM_MAX_APPLICATIONS = int(os.getenv("LIVE_STREAM_MAX_APPLICATIONS", "50"))
+
+READY_EVENT = "live.ready"
+ERROR_EVENT = "live.error"
+UNSUBSCRIBED_EVENT = "application.unsubscribed"
+RESUME_STATUS_EVENT = "resume.status"
+
+SubscriptionAction = Literal["subscribe", "unsubscribe"]
+
+
+def request_subscription_change(
+    notifier: ChangeNotifier,
+    user_id: str,
+    stream_id: str,
+    action: SubscriptionAction,
+    application_id: str,
+    mode: FeedMode = "delta",
+    last_event_id: str | None = None,
+) -> None:
+    """Ask a user's open live stream to follow or stop following an application.
+
+    The caller is responsible for checking that the application belongs to
+    the user; streams apply the requests published on their channel as is.
+
+    Args:
+        notifier: Change notifier shared with the stream
+        user_id: Owner of the stream
+        stream_id: Id announced in the stream's live.ready frame
+        action: "subscribe" or "unsubscribe"
+        application_id: The application to follow or drop
+        mode: Frames of the application feed, "delta" by default
+        last_event_id: Last frame id of the application the client received,
+            without the application prefix, to resume a delta feed from
+    """
+    notifier.publish(
+        live_stream_channel(user_id, stream_id),
+        {
+            "action": action,
+            "application_id": application_id,
+            "mode": mode,
+            "last_event_id": last_event_id,
+        },
+    )
+
+
+def _tag_frame(application_id: str, frame: str) -> str:
+    # Feed frames all start with their id line
+    return f"id: {application_id}/{frame[len('id: ') :]}"
+
+
+class LiveUpdatesStream:
+    """A user's live updates, multiplexed on one SSE stream.
+
+    Attributes:
+        user_id: Owner of the stream
+        stream_id: Random id addressing subscription requests to this stream
+    """
+
+    def __init__(
+        self,
+        user_id: str,
+        mode: FeedMode = "delta",
+        hub: ApplicationFeedHub | None = None,
+        max_applications: int = LIVE_STREAM_MAX_APPLICATIONS,
+    ) -> None:
+        """Initialize the stream.
+
+        Args:
+            user_id: Owner of the stream
+            mode: Frames of the applications followed automatically
+            hub: Feed hub to subscribe to, the process-wide one by default
+            max_applications: Applications followed at once
+        """
+        self.user_id = user_id
+        self.stream_id = uuid.uuid4().hex
+        self.mode = mode
+        self.hub = hub or get_application_feed_hub()
+        self.max_applications = max_applications
+        # Bounded so a slow client pushes back on the feeds, which coalesce
+        self._output: asyncio.Queue[str] = asyncio.Queue(maxsize=SSE_CLIENT_QUEUE_SIZE)
+        self._feeds: dict[str, asyncio.Task] = {}
+
+    @property
+    def applications(self) -> list[str]:
+        """IDs of the applications currently followed."""
+        return list(self._feeds)
+
+    async def subscribe(
+        self,
+        application_id: str,
+        mode: FeedMode | None = None,
+        last_event_id: str | None = None,
+    ) -> bool:
+        """Start following an application, unless it is already followed.
+
+        Returns:
+            Whether the application is followed
+        """
+        if application_id in self._feeds:
+            return True
+        if len(self._feeds) >= self.max_applications:
+            await self._output.put(
+                format_sse(
+                    self.stream_id,
+                    {"detail": "too_many_applications", "id": application_id},
+                    ERROR_EVENT,
+                )
+            )
+            return False
+        self._feeds[application_id] = asyncio.create_task(
+            self._forward(application_id, mode or self.mode, last_event_id)
+        )
+        return True
+
+    async def unsubscribe(self, application_id: str) -> bool:
+        """Stop following an application.
+
+        Returns:
+            Whether the application was followed
+        """
+        task = self._feeds.pop(application_id, None)
+        if task is None:
+            return False
+        task.cancel()
+        await self._output.put(
+            format_sse(
+                f"{application_id}/unsubscribed",
+                {"id": application_id, "reason": "requested"},
+                UNSUBSCRIBED_EVENT,
+            )
+        )
+        return True
+
+    async def _forward(
+        self, application_id: str, mode: FeedMode, last_event_id: str | None
+    ) -> None:
+        try:
+            async with self.hub.subscribe(
+                FeedKey(application_id), mode=mode, last_event_id=last_event_id
+            ) as feed:
+                async for frame in feed.frames(heartbeat=None):
+                    await self._output.put(_tag_frame(application_id, frame))
+            reason = "completed" if feed.completed else "closed"
+            await self._output.put(
+                format_sse(
+                    f"{application_id}/unsubscribed",
+                    {"id": application_id, "reason": reason},
+                    UNSUBSCRIBED_EVENT,
+                )
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(
+                f"Error forwarding the feed of application {application_id}: {e}"
+            )
+        finally:
+            if self._feeds.get(application_id) is asyncio.current_task():
+                del self._feeds[application_id]
+
+    async def _handle(self, notification: ChangeNotification) -> None:
+        payload = notification.payload
+        if notification.channel != user_channel(self.user_id):
+            application_id = payload.get("application_id")
+            if not application_id:
+                return
+            if payload.get("action") == "unsubscribe":
+                await self.unsubscribe(application_id)
+            elif payload.get("action") == "subscribe":
+                await self.subscribe(
+                    application_id,
+                    payload.get("mode") or None,
+                    payload.get("last_event_id"),
+                )
+        elif payload.get("type") == "application" and payload.get("application_id"):
+            await self.subscribe(payload["application_id"])
+        elif payload.get("type") == "resume_extraction":
+            await self._send_resume_status(payload)
+
+    async def _send_resume_status(self, payload: dict[str, Any]) -> None:
+        status = payload.get("status")
+        data: dict[str, Any] = {"status": status}
+        if payload.get("detail"):
+            data["detail"] = payload["detail"]
+        if status == "complete":
+            resume = await self.load_resume()
+            if resume is None:
+                # The notification preceded the commit; the next one will follow
+                return
+            data["resume"] = resume
+        await self._output.put(format_sse("resume", data, RESUME_STATUS_EVENT))
+
+    async def _listen(self, subscription) -> None:
+        while True:
+            notification = await subscription.get()
+            if notification is None:
+                continue
+            try:
+                await self._handle(notification)
+            except Exception as e:
+                logger.error(f"Error handling a live stream notification: {e}")
+
+    async def frames(
+        self, heartbeat: float = SSE_HEARTBEAT_SECONDS
+    ) -> AsyncIterator[str]:
+        """Yield the frames of the stream, or a keep-alive after heartbeat idle seconds.
+
+        The first frame is live.ready, announcing the stream id and the
+        applications followed from the start.
+        """
+        # Subscribe before listing the applications so none created meanwhile is missed
+        async with self.hub.notifier.subscribe(
+            user_channel(self.user_id),
+            live_stream_channel(self.user_id, self.stream_id),
+        ) as subscription:
+            active = await self.list_active_applications()
+            for application_id in active[: self.max_applications]:
+                await self.subscribe(application_id)
+            yield format_sse(
+                self.stream_id,
+                {"stream_id": self.stream_id, "applications": self.applications},
+                READY_EVENT,
+            )
+            listener = asyncio.create_task(self._listen(subscription))
+            try:
+                while True:
+                    try:
+                        frame = await asyncio.wait_for(
+                            self._output.get(), timeout=heartbeat
+                        )
+                    except TimeoutError:
+                        yield KEEP_ALIVE_FRAME
+                        continue
+                    yield frame
+            finally:
+                tasks = [listener, *self._feeds.values()]
+                self._feeds.clear()
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def list_active_applications(self) -> list[str]:
+        """List the user's applications still being generated, in a short-lived session."""
+        async with get_async_session_context() as session:
+            job_application_service = ServiceRegistry.get_async_job_application_service(
+                session
+            )
+            return await job_application_service.list_active_job_application_ids(
+                self.user_id
+            )
+
+    async def load_resume(self) -> dict[str, Any] | None:
+        """Load the user's extracted resume in a short-lived session."""
+        async with get_async_session_context() as session:
+            user = await ServiceRegistry.get_async_user_service(session).get_user(
+                self.user_id
+            )
+        if user is None or not isinstance(user.initial_resume, dict):
+            return None
+        return user.initial_resume or None
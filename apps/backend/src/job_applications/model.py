@@ -3,12 +3,14 @@
 This module provides:
 - JobApplication: main model for tracking job applications
 - Event: model for tracking application processing events
+- CompanyResearchCache: research results shared across applications to the same company
 """
 
 from datetime import datetime, UTC
 from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
+from sqlalchemy import DateTime, Index
 from sqlmodel import JSON, Column, Field, Relationship, SQLModel
 
 if TYPE_CHECKING:
@@ -56,15 +58,22 @@ class JobApplication(JobApplicationBase, table=True):
     """Model for job applications with database table configuration."""
 
     __tablename__ = "job_applications"
-    __table_args__ = {
-        "schema": "app",
-    }
+    __table_args__ = (
+        # Serves the keyset pagination of a user's applications, newest first
+        Index(
+            "ix_app_job_applications_user_id_created_at_id",
+            "user_id",
+            "created_at",
+            "id",
+        ),
+        {"schema": "app"},
+    )
     user: "User" = Relationship(back_populates="job_applications")
-    # New: related events (ordered by created_at asc)
+    # New: related events (ordered by created_at then id, asc)
     events: list["Event"] = Relationship(
         back_populates="job_application",
         sa_relationship_kwargs={
-            "order_by": "Event.created_at",
+            "order_by": "[Event.created_at, Event.id]",
             "cascade": "all, delete-orphan",
         },
     )
@@ -122,3 +131,38 @@ class Event(EventBase, table=True):
         """Pydantic configuration for Event model."""
 
         orm_mode = True
+
+
+class CompanyResearchCache(SQLModel, table=True):
+    """Research results for one company and research category, reused across applications.
+
+    Rows are addressed by a hash of the normalized company key (domain or name)
+    and category key, so every application to the same company resolves to the
+    same row. ``content_hash`` identifies the stored results, letting a refresh
+    tell whether the research actually changed.
+    """
+
+    __tablename__ = "company_research_cache"
+    __table_args__ = {
+        "schema": "app",
+    }
+
+    cache_key: str = Field(primary_key=True)
+    company_key: str = Field(index=True)
+    category_key: str
+    company_name: str
+    category_name: str
+    results: Any = Field(default=None, sa_column=Column(JSON))
+    content_hash: str
+    source_job_application_id: str | None = Field(default=None)
+    hit_count: int = Field(default=0)
+    refreshed_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+    )
+    expires_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False, index=True),
+    )
+    last_hit_at: datetime | None = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=True)
+    )
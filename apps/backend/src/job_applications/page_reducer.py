@@ -0,0 +1,225 @@
+"""Reduction of scraped pages before they are summarized by the LLM.
+
+This module provides reduce_page, which turns the raw markdown of a scraped page
+into the few sections relevant to the requested data points:
+
+1. Boilerplate lines (navigation link bars, cookie and newsletter banners,
+   copyright footers, image-only lines) are removed, and lines made only of
+   links, such as job listings or post indexes, are kept as their link text
+2. The page is split into sections at markdown headings, and blocks already
+   seen earlier on the page are dropped
+3. Sections are scored against the data points with BM25 and kept, best first,
+   until the token budget (SCRAPE_TOKEN_BUDGET, default 3000) is spent
+4. Kept sections are returned in page order
+
+Scoring is purely lexical so it works offline and costs no API calls.
+"""
+
+import math
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+
+from src.core.token_utils import CHARS_PER_TOKEN, estimate_tokens
+
+SCRAPE_TOKEN_BUDGET = int(os.getenv("SCRAPE_TOKEN_BUDGET", "3000"))
+
+# BM25 parameters
+_K1 = 1.5
+_B = 0.75
+# Matches in a section heading count this many times
+_HEADING_WEIGHT = 3
+# Smallest leftover budget worth filling with the beginning of a long section
+_MIN_PARTIAL_SECTION_TOKENS = 200
+
+_HEADING_RE = re.compile(r"^#{1,6}\s+\S")
+_LINK_RE = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+_IMAGE_RE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+# Separators of navigation link bars, e.g. "[Home](/) | [About](/about)"
+_LINK_BAR_SEPARATORS = set("|·•")
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_BOILERPLATE_RE = re.compile(
+    r"\b(cookies?|accept all|reject all|privacy policy|terms of (use|service)|"
+    r"all rights reserved|skip to (main )?content|subscribe to our newsletter|"
+    r"sign up for our newsletter|log ?in|sign ?in|back to top)\b|©",
+    re.IGNORECASE,
+)
+_STOPWORDS = {
+    "a",
+    "about",
+    "an",
+    "and",
+    "are",
+    "as",
+    "at",
+    "be",
+    "by",
+    "for",
+    "from",
+    "how",
+    "in",
+    "is",
+    "it",
+    "its",
+    "of",
+    "on",
+    "or",
+    "that",
+    "the",
+    "their",
+    "this",
+    "to",
+    "what",
+    "which",
+    "who",
+    "with",
+}
+
+
+@dataclass
+class _Section:
+    heading: str
+    blocks: list[str] = field(default_factory=list)
+
+    @property
+    def text(self) -> str:
+        return "\n\n".join(([self.heading] if self.heading else []) + self.blocks)
+
+
+def _terms(text: str) -> list[str]:
+    return [
+        word
+        for word in _WORD_RE.findall(_LINK_RE.sub(r"\1", text).lower())
+        if word not in _STOPWORDS and len(word) > 1
+    ]
+
+
+def _is_boilerplate(line: str) -> bool:
+    stripped = line.strip().lstrip("-*+ ").strip()
+    if not stripped:
+        return False
+    # Image-only lines
+    if not _IMAGE_RE.sub("", stripped).strip():
+        return True
+    # Link bars; lone links and link lists are kept, repeated ones are
+    # dropped as duplicate blocks
+    between_links = set(_LINK_RE.sub("", stripped).replace(" ", ""))
+    if between_links and between_links <= _LINK_BAR_SEPARATORS:
+        return True
+    # Short banner and footer lines; long lines merely mentioning these words stay
+    return len(stripped) < 120 and bool(_BOILERPLATE_RE.search(stripped))
+
+
+def _strip_links(line: str) -> str:
+    # Lines made only of links keep their link text
+    if _LINK_RE.search(line) and not _LINK_RE.sub("", line).strip(" -*+"):
+        return _LINK_RE.sub(r"\1", line)
+    return line
+
+
+def _split_sections(markdown: str) -> list[_Section]:
+    sections = [_Section(heading="")]
+    seen_blocks: set[str] = set()
+    for raw_block in re.split(r"\n\s*\n", markdown):
+        lines = [
+            _strip_links(line)
+            for line in raw_block.splitlines()
+            if not _is_boilerplate(line)
+        ]
+        if not lines:
+            continue
+        if _HEADING_RE.match(lines[0].strip()):
+            sections.append(_Section(heading=lines[0].strip()))
+            lines = lines[1:]
+        block = "\n".join(lines).strip()
+        if not block:
+            continue
+        key = " ".join(block.lower().split())
+        if key in seen_blocks:
+            continue
+        seen_blocks.add(key)
+        sections[-1].blocks.append(block)
+    return [section for section in sections if section.blocks]
+
+
+def _score_sections(sections: list[_Section], query_terms: set[str]) -> list[float]:
+    documents = [
+        Counter(_terms(section.text) + _terms(section.heading) * (_HEADING_WEIGHT - 1))
+        for section in sections
+    ]
+    lengths = [sum(document.values()) for document in documents]
+    average_length = (sum(lengths) / len(lengths)) or 1
+    document_frequency = Counter(
+        term for document in documents for term in query_terms if term in document
+    )
+    scores = []
+    for document, length in zip(documents, lengths, strict=True):
+        score = 0.0
+        for term in query_terms:
+            frequency = document.get(term, 0)
+            if not frequency:
+                continue
+            idf = math.log(
+                1
+                + (len(documents) - document_frequency[term] + 0.5)
+                / (document_frequency[term] + 0.5)
+            )
+            score += (
+                idf
+                * frequency
+                * (_K1 + 1)
+                / (frequency + _K1 * (1 - _B + _B * length / average_length))
+            )
+        scores.append(score)
+    return scores
+
+
+def reduce_page(
+    markdown: str | None,
+    data_points: list[str],
+    token_budget: int = SCRAPE_TOKEN_BUDGET,
+) -> str:
+    """Reduce scraped markdown to the sections relevant to the data points.
+
+    Args:
+        markdown: Markdown content of the scraped page
+        data_points: Data points the summary must cover
+        token_budget: Maximum estimated tokens of the reduced page
+
+    Returns:
+        The cleaned page when it fits the budget, otherwise its highest scoring
+        sections in page order. Pages where no section matches a data point
+        are reduced to their leading sections.
+    """
+    if not markdown:
+        return ""
+    sections = _split_sections(markdown)
+    if not sections:
+        return ""
+    cleaned = "\n\n".join(section.text for section in sections)
+    if estimate_tokens(cleaned) <= token_budget:
+        return cleaned
+
+    query_terms = {term for point in data_points for term in _terms(point)}
+    scores = _score_sections(sections, query_terms)
+    ranked = sorted(range(len(sections)), key=lambda index: (-scores[index], index))
+
+    kept: dict[int, str] = {}
+    remaining = token_budget
+    for index in ranked:
+        text = sections[index].text
+        cost = estimate_tokens(text)
+        if cost > remaining:
+            # Keep the beginning of a relevant section too long to fit whole
+            if scores[index] <= 0 and kept:
+                continue
+            if remaining < _MIN_PARTIAL_SECTION_TOKENS and kept:
+                continue
+            text = text[: remaining * CHARS_PER_TOKEN]
+            cost = remaining
+        kept[index] = text
+        remaining -= cost
+        if remaining <= 0:
+            break
+    return "\n\n".join(kept[index] for index in sorted(kept))
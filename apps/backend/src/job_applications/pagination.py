@@ -0,0 +1,80 @@
+"""Keyset pagination of job application listings.
+
+Listings are ordered by (created_at, id), newest first, and search results by
+(rank, created_at, id). Instead of skipping
+OFFSET rows, a page starts right after the last row of the previous page,
+which the client passes back as an opaque cursor. With the
+(user_id, created_at, id) index, every page is an index range scan of `limit`
+rows, however deep it is.
+
+This module provides:
+- PageCursor: position after a row of a listing, encoded as an opaque string
+- InvalidCursorError: raised when a cursor string cannot be decoded
+"""
+
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import datetime
+
+from src.job_applications.model import JobApplication
+from src.job_applications.types import JobApplicationPreview
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor is malformed."""
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """Position after a row of a listing ordered by ([rank,] created_at, id) descending.
+
+    Attributes:
+        created_at: Creation time of the last row
+        id: ID of the last row
+        rank: Search rank of the last row, for search results only
+    """
+
+    created_at: datetime
+    id: str
+    rank: float | None = None
+
+    @classmethod
+    def after(
+        cls,
+        job_application: JobApplication | JobApplicationPreview,
+        rank: float | None = None,
+    ) -> "PageCursor":
+        """Return the cursor of the page following a job application."""
+        return cls(
+            created_at=job_application.created_at, id=job_application.id, rank=rank
+        )
+
+    def encode(self) -> str:
+        """Encode the cursor as an opaque URL-safe string."""
+        parts = [self.created_at.isoformat(), self.id]
+        if self.rank is not None:
+            # repr round-trips the float exactly, as the seek needs
+            parts.append(repr(self.rank))
+        raw = "|".join(parts).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, value: str) -> "PageCursor":
+        """Decode a cursor produced by encode.
+
+        Raises:
+            InvalidCursorError: If the value is not a valid cursor
+        """
+        try:
+            raw = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)).decode()
+            created_at, application_id, *rank = raw.split("|")
+            if len(rank) > 1:
+                raise ValueError("too many cursor parts")
+            return cls(
+                created_at=datetime.fromisoformat(created_at),
+                id=application_id,
+                rank=float(rank[0]) if rank else None,
+            )
+        except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+            raise InvalidCursorError(f"Invalid pagination cursor: {value!r}") from e
@@ -0,0 +1,214 @@
+"""Per-process runtime for the resume generation pipeline.
+
+Celery executes tasks synchronously, so each resume generation used to start a
+new event loop, open its own checkpointer connection, run the checkpointer
+migrations and compile every graph before doing any work. PipelineRuntime does
+that setup once per worker process: it owns a long-lived event loop running on a
+background thread, a connection pool backing the LangGraph Postgres checkpointer
+and the compiled main graph. Tasks submit their coroutines to the runtime loop.
+
+Pipelines spend nearly all their time awaiting the LLM and research APIs, so one
+process runs many of them concurrently on that loop: Celery's thread pool hands
+each task to a thread that blocks on run_pipeline, while at most
+PIPELINE_MAX_IN_FLIGHT pipelines execute at once.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+from langgraph.graph.state import CompiledStateGraph
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+PIPELINE_DB_POOL_MIN_SIZE = int(os.getenv("PIPELINE_DB_POOL_MIN_SIZE", "1"))
+PIPELINE_DB_POOL_MAX_SIZE = int(os.getenv("PIPELINE_DB_POOL_MAX_SIZE", "4"))
+PIPELINE_MAX_IN_FLIGHT = int(os.getenv("PIPELINE_MAX_IN_FLIGHT", "16"))
+
+
+class PipelineRuntime:
+    """Long-lived event loop, checkpointer pool and compiled graph for one process.
+
+    Attributes:
+        conninfo: Postgres connection string used by the checkpointer pool
+        loop: The runtime event loop, or None when the runtime is stopped
+        graph: The compiled main graph, available once the runtime is started
+        max_in_flight: Maximum number of pipelines running concurrently
+    """
+
+    def __init__(
+        self,
+        conninfo: str,
+        *,
+        min_pool_size: int = PIPELINE_DB_POOL_MIN_SIZE,
+        max_pool_size: int = PIPELINE_DB_POOL_MAX_SIZE,
+        max_in_flight: int = PIPELINE_MAX_IN_FLIGHT,
+    ) -> None:
+        """Initialize the runtime without starting it."""
+        self.conninfo = conninfo
+        self.min_pool_size = min_pool_size
+        self.max_pool_size = max(min_pool_size, max_pool_size)
+        self.max_in_flight = max(1, max_in_flight)
+        self.in_flight = 0
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.graph: CompiledStateGraph | None = None
+        self._pool = None
+        self._slots: asyncio.Semaphore | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the runtime loop is running."""
+        return self.loop is not None and self.loop.is_running()
+
+    def start(self) -> None:
+        """Start the runtime loop, open the checkpointer pool and compile the graph."""
+        if self.running:
+            return
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def run_loop() -> None:
+            asyncio.set_event_loop(loop)
+            loop.call_soon(ready.set)
+            try:
+                loop.run_forever()
+            finally:
+                loop.close()
+
+        self._thread = threading.Thread(
+            target=run_loop, name="pipeline-runtime", daemon=True
+        )
+        self._thread.start()
+        ready.wait()
+        self.loop = loop
+        self._slots = asyncio.Semaphore(self.max_in_flight)
+        try:
+            self.run(self._open())
+        except Exception:
+            self.stop()
+            raise
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        """Run a coroutine on the runtime loop and wait for its result.
+
+        Args:
+            coro: The coroutine to run
+            timeout: Maximum number of seconds to wait, or None to wait forever
+
+        Returns:
+            The coroutine's result
+        """
+        if self.loop is None:
+            coro.close()
+            raise RuntimeError("The pipeline runtime is not started")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+    def run_pipeline(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a pipeline on the runtime loop once an in-flight slot is free.
+
+        Args:
+            coro: The pipeline coroutine to run
+
+        Returns:
+            The coroutine's result
+        """
+        return self.run(self._run_in_slot(coro))
+
+    async def _run_in_slot(self, coro: Coroutine[Any, Any, T]) -> T:
+        async with self._slots:
+            self.in_flight += 1
+            try:
+                return await coro
+            finally:
+                self.in_flight -= 1
+
+    def stop(self) -> None:
+        """Flush pending work, close the pools and stop the runtime loop."""
+        loop = self.loop
+        if loop is None:
+            return
+        try:
+            if loop.is_running():
+                self.run(self._close(), timeout=30)
+        except Exception as e:
+            logger.error(f"Error closing the pipeline runtime: {e}")
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            if self._thread is not None:
+                self._thread.join(timeout=10)
+            self.loop = None
+            self.graph = None
+            self._thread = None
+
+    async def _open(self) -> None:
+        from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+        from psycopg.rows import dict_row
+        from psycopg_pool import AsyncConnectionPool
+
+        from src.job_applications.agents.main_graph import MainGraphAgent
+        from src.user.model import User  # noqa: F401 - must be imported before JobApplication mapper is configured
+
+        # Connection settings required by AsyncPostgresSaver when given a pool
+        self._pool = AsyncConnectionPool(
+            self.conninfo,
+            min_size=self.min_pool_size,
+            max_size=self.max_pool_size,
+            open=False,
+            kwargs={
+                "autocommit": True,
+                "prepare_threshold": 0,
+                "row_factory": dict_row,
+            },
+        )
+        await self._pool.open(wait=True)
+
+        checkpointer = AsyncPostgresSaver(self._pool)
+        # Creates or migrates the checkpoint tables, so once per process is enough
+        await checkpointer.setup()
+
+        self.graph = MainGraphAgent().build_graph(checkpointer)
+        logger.info("Pipeline runtime started")
+
+    async def _close(self) -> None:
+        from src.configs.database_config import dispose_async_engine
+        from src.integrations.firecrawl import close_firecrawl_client
+        from src.job_applications.services.event_sink import aflush_event_sink
+
+        await aflush_event_sink()
+        await close_firecrawl_client()
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+        # The async engine's connections were opened on this loop
+        await dispose_async_engine()
+        logger.info("Pipeline runtime stopped")
+
+
+_runtime: PipelineRuntime | None = None
+_runtime_lock = threading.Lock()
+
+
+def get_pipeline_runtime() -> PipelineRuntime:
+    """Return the process-wide pipeline runtime, starting it on first use."""
+    global _runtime
+    with _runtime_lock:
+        if _runtime is None:
+            _runtime = PipelineRuntime(os.environ["DATABASE_URL"])
+        if not _runtime.running:
+            _runtime.start()
+        return _runtime
+
+
+def shutdown_pipeline_runtime() -> None:
+    """Stop the process-wide pipeline runtime, if it was started."""
+    global _runtime
+    with _runtime_lock:
+        runtime, _runtime = _runtime, None
+    if runtime is not None:
+        runtime.stop()
@@ -0,0 +1,166 @@
+"""Compact text rendering of models and research state for LLM prompts.
+
+Interpolating a Pydantic model into an f-string produces its repr: class names,
+quoted field names, None values and "Not provided" placeholders for every empty
+field. This module renders the same data as indented "key: value" lines:
+
+- render_model: any model, e.g. Resume, DiscoveredCompanyProfile, ResearchPlan
+  or an evaluation; memoized per object
+- render_research_results: the research results of the company profiler,
+  memoized by content
+
+Empty values (None, blank strings, placeholders, empty lists and objects) are
+left out, enums are rendered as their values, and lists of short scalars are
+joined on one line. Model fields keep their declaration order and plain dict
+keys are sorted, so the same data always renders to the same text, which keeps
+prompt prefixes stable for provider-side prompt caching.
+
+Rendered models are assumed not to be mutated afterwards; the agents replace
+models in their state rather than changing them in place.
+"""
+
+import functools
+import json
+import weakref
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import BaseModel
+
+_PLACEHOLDERS = {"not provided", "n/a", "none", "null"}
+_INDENT = "  "
+# Lists of scalars shorter than this are joined on a single line
+_INLINE_LIST_MAX_CHARS = 160
+
+_model_renders: dict[int, tuple[weakref.ref, str]] = {}
+
+
+def _is_empty(value: Any) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, str):
+        return not value.strip() or value.strip().lower() in _PLACEHOLDERS
+    if isinstance(value, list | dict):
+        return not value
+    return False
+
+
+def _prune(value: Any, sort_keys: bool) -> Any:
+    """Drop empty values recursively, returning None when nothing is left."""
+    if isinstance(value, dict):
+        keys = sorted(value, key=str) if sort_keys else list(value)
+        pruned = {}
+        for key in keys:
+            item = _prune(value[key], sort_keys)
+            if not _is_empty(item):
+                pruned[key] = item
+        return pruned or None
+    if isinstance(value, list):
+        items = [_prune(item, sort_keys) for item in value]
+        return [item for item in items if not _is_empty(item)] or None
+    if isinstance(value, str):
+        return value.strip()
+    return value
+
+
+def _scalar(value: Any) -> str:
+    if isinstance(value, bool):
+        return "yes" if value else "no"
+    return str(value)
+
+
+def _inline_list(items: list[Any]) -> str | None:
+    if any(isinstance(item, dict | list) for item in items):
+        return None
+    texts = [_scalar(item) for item in items]
+    if any("," in text or "\n" in text for text in texts):
+        return None
+    line = ", ".join(texts)
+    return line if len(line) <= _INLINE_LIST_MAX_CHARS else None
+
+
+def _render_lines(value: Any, depth: int) -> list[str]:
+    prefix = _INDENT * depth
+    if isinstance(value, dict):
+        lines = []
+        for key, item in value.items():
+            if isinstance(item, dict | list):
+                inline = _inline_list(item) if isinstance(item, list) else None
+                if inline is not None:
+                    lines.append(f"{prefix}{key}: {inline}")
+                else:
+                    lines.append(f"{prefix}{key}:")
+                    lines.extend(_render_lines(item, depth + 1))
+            elif "\n" in _scalar(item):
+                lines.append(f"{prefix}{key}:")
+                lines.extend(_render_lines(item, depth + 1))
+            else:
+                lines.append(f"{prefix}{key}: {_scalar(item)}")
+        return lines
+    if isinstance(value, list):
+        lines = []
+        for item in value:
+            item_lines = _render_lines(item, depth + 1)
+            # The first line of the item carries the bullet
+            first = item_lines[0][len(prefix) + len(_INDENT) :]
+            lines.append(f"{prefix}- {first}")
+            lines.extend(item_lines[1:])
+        return lines
+    return [f"{prefix}{line.strip()}" for line in _scalar(value).splitlines()]
+
+
+def _render(value: Any, sort_keys: bool) -> str:
+    pruned = _prune(value, sort_keys)
+    if _is_empty(pruned):
+        return ""
+    return "\n".join(_render_lines(pruned, 0))
+
+
+def _memoized(model: BaseModel, render: Callable[[BaseModel], str]) -> str:
+    key = id(model)
+    entry = _model_renders.get(key)
+    if entry is not None and entry[0]() is model:
+        return entry[1]
+    text = render(model)
+    _model_renders[key] = (
+        weakref.ref(model, lambda _, key=key: _model_renders.pop(key, None)),
+        text,
+    )
+    return text
+
+
+def render_model(model: BaseModel | None) -> str:
+    """Render a model as compact, deterministic prompt text.
+
+    Args:
+        model: The model to render, e.g. a Resume or a DiscoveredCompanyProfile
+
+    Returns:
+        Indented "key: value" lines without empty fields, or an empty string
+    """
+    if model is None:
+        return ""
+    return _memoized(
+        model,
+        lambda model: _render(model.model_dump(mode="json"), sort_keys=False),
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _render_json(canonical_json: str) -> str:
+    return _render(json.loads(canonical_json), sort_keys=True)
+
+
+def render_research_results(results: dict[str, Any] | None) -> str:
+    """Render the research results of the company profiler as prompt text.
+
+    Args:
+        results: Findings by research category
+
+    Returns:
+        Indented "key: value" lines, categories sorted by name, or an empty string
+    """
+    if not results:
+        return ""
+    canonical_json = json.dumps(results, sort_keys=True, default=str)
+    return _render_json(canonical_json)
@@ -11,6 +11,9 @@ and evaluating cover letters in the Resume Synthesizer Team. It includes:
   Cover Letter Evaluator Agent to assess cover letter quality, accuracy, and
   strategic effectiveness.
 
+- cover_letter_revision_instructions: Output format of patch-based revision
+  rounds, where the generator returns find/replace edits instead of a new letter.
+
 Both prompts emphasize maintaining 100% factual accuracy and avoiding fabrication
 of experience, skills, or achievements.
 """
@@ -381,3 +384,15 @@ Generate a `GeneratedCoverLetterEvaluation` object with:
 
 Focus on providing feedback that will meaningfully improve the candidate's competitive positioning while maintaining authentic representation of their background and qualifications.
 """
+
+cover_letter_revision_instructions = """
+### Revision Mode
+
+This is a revision round. Do NOT rewrite the whole cover letter. Return only the edits that
+address the REQUESTED CHANGES in the PREVIOUS GENERATED VERSION:
+- `find` is an exact excerpt of the previous version (a phrase, sentence or paragraph)
+- `replace` is its new text; use an empty string to delete the excerpt
+- Keep each excerpt as short as possible while still being unique in the letter
+- Leave every part that needs no change out of the edits
+The revised letter must still meet every requirement above, including the word limit.
+"""
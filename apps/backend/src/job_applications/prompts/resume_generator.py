@@ -3,6 +3,7 @@
 This module provides specialized prompts for:
 - resume_generator_system_prompt: Instructions for generating optimized resumes
 - resume_evaluator_system_prompt: Framework for evaluating and scoring resumes
+- resume_revision_instructions: Output format of patch-based revision rounds
 """
 
 resume_generator_system_prompt = """
@@ -369,3 +370,20 @@ Your evaluation succeeds when it:
 
 Execute evaluation with analytical rigor, constructive insight, and strategic focus on maximizing candidate success while maintaining complete factual integrity.
 """
+
+resume_revision_instructions = """
+# REVISION MODE
+This is a revision round. Do NOT rewrite the whole resume. Return only the targeted edits
+that address the REQUESTED CHANGES, applied to the PREVIOUS GENERATED VERSION (given as JSON):
+- `path` addresses a value in that JSON: fields separated by dots, list items by [index],
+  e.g. `personal_info.summary`, `work_experiences[1].responsibilities`, `skills`
+- `set` replaces the value at `path`: plain text for text fields, JSON for lists and objects
+  (e.g. the whole `skills` list, or one `projects[0]` object)
+- `append` adds an item (JSON object, or text for lists of text) to the list at `path`
+- `remove` deletes the list item at `path`
+- Indexes always refer to the PREVIOUS GENERATED VERSION
+- Prefer the smallest edit that fully addresses a change: a single field over a whole entry,
+  an entry over a whole section
+- Return a strategy brief only if the revision changes the keywords or narrative
+All factual-integrity rules above still apply to every edited value.
+"""
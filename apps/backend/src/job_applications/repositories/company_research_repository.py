@@ -0,0 +1,124 @@
+"""Repository module for the company research cache.
+
+This module provides the AsyncCompanyResearchRepository class for reading and
+upserting CompanyResearchCache rows. Only an async variant exists because the
+cache is only used by the graph nodes.
+"""
+
+import logging
+from datetime import datetime
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import col, delete, select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.job_applications.model import CompanyResearchCache
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncCompanyResearchRepository:
+    """Async repository for CompanyResearchCache database operations."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize the AsyncCompanyResearchRepository with an async database session."""
+        self.session = session
+
+    async def list_fresh(
+        self, company_key: str, now: datetime
+    ) -> list[CompanyResearchCache]:
+        """List the unexpired cache entries of a company.
+
+        Args:
+            company_key: Normalized company key
+            now: Entries expiring at or before this time are ignored
+
+        Returns:
+            The fresh entries, most recently refreshed first
+        """
+        statement = (
+            select(CompanyResearchCache)
+            .where(CompanyResearchCache.company_key == company_key)
+            .where(CompanyResearchCache.expires_at > now)
+            .order_by(col(CompanyResearchCache.refreshed_at).desc())
+        )
+        results = await self.session.exec(statement)
+        return results.all()
+
+    async def get_fresh_by_keys(
+        self, cache_keys: list[str], now: datetime
+    ) -> list[CompanyResearchCache]:
+        """Retrieve the unexpired entries among the given cache keys.
+
+        Args:
+            cache_keys: Cache keys to look up
+            now: Entries expiring at or before this time are ignored
+
+        Returns:
+            The fresh entries found
+        """
+        if not cache_keys:
+            return []
+        statement = (
+            select(CompanyResearchCache)
+            .where(col(CompanyResearchCache.cache_key).in_(cache_keys))
+            .where(CompanyResearchCache.expires_at > now)
+        )
+        results = await self.session.exec(statement)
+        return results.all()
+
+    async def upsert(self, entry: CompanyResearchCache) -> None:
+        """Insert an entry, or replace the results of the entry with the same key.
+
+        Args:
+            entry: The entry to store
+        """
+        values = entry.model_dump()
+        statement = insert(CompanyResearchCache).values(**values)
+        statement = statement.on_conflict_do_update(
+            index_elements=[CompanyResearchCache.cache_key],
+            set_={
+                "company_name": statement.excluded.company_name,
+                "category_name": statement.excluded.category_name,
+                "results": statement.excluded.results,
+                "content_hash": statement.excluded.content_hash,
+                "source_job_application_id": statement.excluded.source_job_application_id,
+                "refreshed_at": statement.excluded.refreshed_at,
+                "expires_at": statement.excluded.expires_at,
+            },
+        )
+        await self.session.exec(statement)
+        await self.session.commit()
+
+    async def record_hits(self, cache_keys: list[str], now: datetime) -> None:
+        """Increment the hit counters of the given entries.
+
+        Args:
+            cache_keys: Cache keys that were served
+            now: Time of the hit
+        """
+        if not cache_keys:
+            return
+        statement = (
+            update(CompanyResearchCache)
+            .where(col(CompanyResearchCache.cache_key).in_(cache_keys))
+            .values(hit_count=CompanyResearchCache.hit_count + 1, last_hit_at=now)
+        )
+        await self.session.exec(statement)
+        await self.session.commit()
+
+    async def delete_expired(self, now: datetime) -> int:
+        """Delete every expired entry.
+
+        Args:
+            now: Entries expiring at or before this time are deleted
+
+        Returns:
+            The number of entries deleted
+        """
+        statement = delete(CompanyResearchCache).where(
+            CompanyResearchCache.expires_at <= now
+        )
+        result = await self.session.exec(statement)
+        await self.session.commit()
+        return result.rowcount or 0
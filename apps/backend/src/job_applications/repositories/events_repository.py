@@ -1,7 +1,8 @@
 """Repository module for Event model database operations.
 
 This module provides EventRepository class for managing CRUD operations
-on Event entities linked to job applications.
+on Event entities linked to job applications, and its async counterpart
+AsyncEventRepository.
 """
 
 from __future__ import annotations
@@ -9,11 +10,50 @@ from __future__ import annotations
 from datetime import datetime
 
 from sqlalchemy import delete as sa_delete
+from sqlalchemy import tuple_
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.job_applications.model import Event
 
 
+def _filter_events(
+    stmt,
+    *,
+    event_name: str | None = None,
+    step: str | None = None,
+    status: str | None = None,
+    category_name: str | None = None,
+    tool_name: str | None = None,
+    since: datetime | None = None,
+    after_id: str | None = None,
+    until: datetime | None = None,
+):
+    """Apply the optional list_events filters to an Event select statement.
+
+    ``since`` alone keeps the events created at or after it. With ``after_id``,
+    only the events strictly after the (since, after_id) event are kept, the id
+    breaking ties between events created at the same instant.
+    """
+    if event_name:
+        stmt = stmt.where(Event.event_name == event_name)
+    if step:
+        stmt = stmt.where(Event.step == step)
+    if status:
+        stmt = stmt.where(Event.status == status)
+    if category_name:
+        stmt = stmt.where(Event.category_name == category_name)
+    if tool_name:
+        stmt = stmt.where(Event.tool_name == tool_name)
+    if since and after_id:
+        stmt = stmt.where(tuple_(Event.created_at, Event.id) > tuple_(since, after_id))
+    elif since:
+        stmt = stmt.where(Event.created_at >= since)
+    if until:
+        stmt = stmt.where(Event.created_at <= until)
+    return stmt
+
+
 class EventRepository:
     """Repository for handling Event model database operations.
 
@@ -31,12 +71,20 @@ class EventRepository:
         self.session.commit()
         return self.get_by_id(event.id)
 
-    def create_many(self, events: list[Event]) -> list[Event]:
-        """Create multiple events in the database."""
+    def create_many(self, events: list[Event], *, refresh: bool = True) -> list[Event]:
+        """Create multiple events in the database.
+
+        Args:
+            events: The events to insert in a single transaction
+            refresh: If False, skip re-fetching the created rows and return the
+                given (expired) instances, saving one SELECT per event.
+        """
         if not events:
             return []
         self.session.add_all(events)
         self.session.commit()
+        if not refresh:
+            return events
         # Refresh created entities (ids are set via default_factory so they exist already)
         return [self.get_by_id(e.id) for e in events if e.id is not None]  # defensive
 
@@ -57,6 +105,7 @@ class EventRepository:
         category_name: str | None = None,
         tool_name: str | None = None,
         since: datetime | None = None,
+        after_id: str | None = None,
         until: datetime | None = None,
         limit: int = 200,
         offset: int = 0,
@@ -64,28 +113,26 @@ class EventRepository:
     ) -> list[Event]:
         """Fetch events for a job application with optional filters.
 
-        Ordered by created_at (asc by default).
+        Ordered by created_at then id (asc by default).
         """
-        stmt = select(Event).where(Event.job_application_id == job_application_id)
-
-        if event_name:
-            stmt = stmt.where(Event.event_name == event_name)
-        if step:
-            stmt = stmt.where(Event.step == step)
-        if status:
-            stmt = stmt.where(Event.status == status)
-        if category_name:
-            stmt = stmt.where(Event.category_name == category_name)
-        if tool_name:
-            stmt = stmt.where(Event.tool_name == tool_name)
-        if since:
-            stmt = stmt.where(Event.created_at >= since)
-        if until:
-            stmt = stmt.where(Event.created_at <= until)
-
+        stmt = _filter_events(
+            select(Event).where(Event.job_application_id == job_application_id),
+            event_name=event_name,
+            step=step,
+            status=status,
+            category_name=category_name,
+            tool_name=tool_name,
+            since=since,
+            after_id=after_id,
+            until=until,
+        )
         stmt = (
             stmt.order_by(
-                Event.created_at.asc() if ascending else Event.created_at.desc()
+                *(
+                    (Event.created_at.asc(), Event.id.asc())
+                    if ascending
+                    else (Event.created_at.desc(), Event.id.desc())
+                )
             )
             .limit(limit)
             .offset(offset)
@@ -120,3 +167,114 @@ class EventRepository:
         # result.rowcount can be None on some dialects; commit regardless
         self.session.commit()
         return int(result.rowcount or 0)
+
+
+class AsyncEventRepository:
+    """Async repository for Event model database operations.
+
+    Mirrors EventRepository on an AsyncSession.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initialize the AsyncEventRepository with an async database session."""
+        self.session = session
+
+    async def create(self, event: Event) -> Event:
+        """Create a new event in the database."""
+        self.session.add(event)
+        await self.session.commit()
+        return await self.get_by_id(event.id)
+
+    async def create_many(
+        self, events: list[Event], *, refresh: bool = True
+    ) -> list[Event]:
+        """Create multiple events in the database.
+
+        Args:
+            events: The events to insert in a single transaction
+            refresh: If False, skip re-fetching the created rows.
+        """
+        if not events:
+            return []
+        self.session.add_all(events)
+        await self.session.commit()
+        if not refresh:
+            return events
+        return [await self.get_by_id(e.id) for e in events if e.id is not None]
+
+    async def get_by_id(self, event_id: str) -> Event | None:
+        """Fetch an event by its ID."""
+        res = await self.session.exec(select(Event).where(Event.id == event_id))
+        return res.first()
+
+    async def list_events(
+        self,
+        job_application_id: str,
+        *,
+        event_name: str | None = None,
+        step: str | None = None,
+        status: str | None = None,
+        category_name: str | None = None,
+        tool_name: str | None = None,
+        since: datetime | None = None,
+        after_id: str | None = None,
+        until: datetime | None = None,
+        limit: int = 200,
+        offset: int = 0,
+        ascending: bool = True,
+    ) -> list[Event]:
+        """Fetch events for a job application with optional filters.
+
+        Ordered by created_at then id (asc by default).
+        """
+        stmt = _filter_events(
+            select(Event).where(Event.job_application_id == job_application_id),
+            event_name=event_name,
+            step=step,
+            status=status,
+            category_name=category_name,
+            tool_name=tool_name,
+            since=since,
+            after_id=after_id,
+            until=until,
+        )
+        stmt = (
+            stmt.order_by(
+                *(
+                    (Event.created_at.asc(), Event.id.asc())
+                    if ascending
+                    else (Event.created_at.desc(), Event.id.desc())
+                )
+            )
+            .limit(limit)
+            .offset(offset)
+        )
+        res = await self.session.exec(stmt)
+        return res.all()
+
+    async def get_latest_by_step(
+        self, job_application_id: str, step: str
+    ) -> Event | None:
+        """Fetch the latest event for a job application and step."""
+        stmt = (
+            select(Event)
+            .where(
+                Event.job_application_id == job_application_id,
+                Event.step == step,
+            )
+            .order_by(Event.created_at.desc())
+            .limit(1)
+        )
+        res = await self.session.exec(stmt)
+        return res.first()
+
+    async def delete_by_job_application(self, job_application_id: str) -> int:
+        """Delete all events linked to a job application.
+
+        Returns number of rows deleted.
+        """
+        result = await self.session.execute(
+            sa_delete(Event).where(Event.job_application_id == job_application_id)
+        )
+        await self.session.commit()
+        return int(result.rowcount or 0)
@@ -1,17 +1,79 @@
 """Repository module for job application database operations.
 
 This module provides the JobApplicationRepository class for handling CRUD operations
-and queries on JobApplication objects in the database.
+and queries on JobApplication objects in the database, and its async counterpart
+AsyncJobApplicationRepository.
 """
 
 import logging
+from datetime import UTC, datetime
+from typing import Any
 
-from sqlmodel import Session, desc, func, select
+from sqlalchemy import JSON, case, cast, literal, tuple_, update
+from sqlalchemy.dialects.postgresql import JSONB, array
+from sqlalchemy.orm import selectinload
+from sqlmodel import Session, col, desc, func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.job_applications.model import JobApplication
+from src.job_applications.pagination import PageCursor
+from src.job_applications.search import SearchHit, search_condition, search_rank
+from src.job_applications.types import JobApplicationPreview, ResumeGenerationStatus
 
 logger = logging.getLogger(__name__)
 
+# Listings select these columns only, leaving the large JSON documents behind
+_PREVIEW_FIELDS = tuple(JobApplicationPreview.model_fields)
+_PREVIEW_COLUMNS = tuple(getattr(JobApplication, name) for name in _PREVIEW_FIELDS)
+
+
+def _to_preview(values) -> JobApplicationPreview:
+    return JobApplicationPreview(**dict(zip(_PREVIEW_FIELDS, values)))
+
+
+def _to_hit(row) -> SearchHit:
+    return SearchHit(_to_preview(row[:-1]), row[-1])
+
+
+def _count_statement(condition):
+    return select(func.count(JobApplication.id)).where(condition)
+
+
+def _page_statement(condition, offset: int, limit: int, cursor: PageCursor | None):
+    statement = select(*_PREVIEW_COLUMNS).where(condition)
+    if cursor is not None:
+        # Row comparison, so the (user_id, created_at, id) index bounds the scan
+        statement = statement.where(
+            tuple_(JobApplication.created_at, JobApplication.id)
+            < tuple_(cursor.created_at, cursor.id)
+        )
+    else:
+        statement = statement.offset(offset)
+    return statement.order_by(
+        desc(JobApplication.created_at), desc(JobApplication.id)
+    ).limit(limit)
+
+
+def _search_filter(user_id: str, term: str):
+    return search_condition(term) & (JobApplication.user_id == user_id)
+
+
+def _search_statement(
+    condition, term: str, offset: int, limit: int, cursor: PageCursor | None
+):
+    rank = search_rank(term)
+    statement = select(*_PREVIEW_COLUMNS, rank.label("rank")).where(condition)
+    if cursor is not None and cursor.rank is not None:
+        statement = statement.where(
+            tuple_(rank, JobApplication.created_at, JobApplication.id)
+            < tuple_(cursor.rank, cursor.created_at, cursor.id)
+        )
+    else:
+        statement = statement.offset(offset)
+    return statement.order_by(
+        rank.desc(), desc(JobApplication.created_at), desc(JobApplication.id)
+    ).limit(limit)
+
 
 class JobApplicationRepository:
     """Repository for handling User model database operations.
@@ -93,84 +155,85 @@ class JobApplicationRepository:
         return results.all()
 
     def list_paginated(
-        self, user_id: str, offset: int = 0, limit: int = 30
-    ) -> tuple[list[JobApplication], int]:
-        """List job applications with pagination.
+        self,
+        user_id: str,
+        offset: int = 0,
+        limit: int = 30,
+        *,
+        cursor: PageCursor | None = None,
+        with_total: bool = True,
+    ) -> tuple[list[JobApplicationPreview], int | None]:
+        """List previews of job applications with pagination, newest first.
+
+        Runs the same keyset statement as AsyncJobApplicationRepository.list_paginated.
 
         Args:
             user_id: The ID of the user to list job applications for.
             offset (int, optional): The number of job applications to skip. Defaults to 0.
             limit (int, optional): The maximum number of job applications to return. Defaults to 30.
+            cursor: Start after this position instead of skipping offset rows.
+            with_total: Whether to count all of the user's job applications.
 
         Returns:
-            Tuple[List[JobApplication], int]: A tuple containing the list of matching apps and the total count
+            Tuple[List[JobApplicationPreview], int | None]: A tuple containing the previews of the matching apps and the total count, None unless with_total
         """
         try:
-            # Get total count efficiently using func.count()
-            count_statement = select(func.count(JobApplication.id)).where(
-                JobApplication.user_id == user_id
+            condition = JobApplication.user_id == user_id
+            total = (
+                self.session.exec(_count_statement(condition)).one()
+                if with_total
+                else None
             )
-            total = self.session.exec(count_statement).one()
-
-            # Get paginated results
-            statement = (
-                select(JobApplication)
-                .where(JobApplication.user_id == user_id)
-                .offset(offset)
-                .limit(limit)
-                .order_by(desc(JobApplication.created_at))
+            result = self.session.exec(
+                _page_statement(condition, offset, limit, cursor)
             )
-            result = self.session.exec(statement)
-            return result.all(), total
+            return [_to_preview(row) for row in result.all()], total
         except Exception as e:
             logger.error(f"Error listing paginated job applications: {e}")
             raise e
 
     def search_job_applications(
-        self, user_id: str, search_term: str, offset: int = 0, limit: int = 30
-    ) -> tuple[list[JobApplication], int]:
-        """List job applications with names or descriptions that match a pattern using LIKE search.
+        self,
+        user_id: str,
+        search_term: str,
+        offset: int = 0,
+        limit: int = 30,
+        *,
+        cursor: PageCursor | None = None,
+        with_total: bool = True,
+    ) -> tuple[list[SearchHit], int | None]:
+        """Search job applications by title, company and description, best match first.
+
+        Runs the same full-text statement as
+        AsyncJobApplicationRepository.search_job_applications.
 
         Args:
             user_id: The ID of the user to list job applications for.
             search_term (str): The search term to match against name or description
             offset (int, optional): The number of job applications to skip. Defaults to 0.
             limit (int, optional): The maximum number of job applications to return. Defaults to 30.
+            cursor: Start after this ranked position instead of skipping offset rows.
+            with_total: Whether to count all matching job applications.
 
         Returns:
-            Tuple[List[JobApplication], int]: A tuple containing the list of matching job applications and the total count
+            Tuple[List[SearchHit], int | None]: A tuple containing the previews of the matching job applications with their rank and the total count, None unless with_total
         """
+        term = (search_term or "").strip()
+        if not term:
+            return [], 0 if with_total else None
         try:
-            # Create the LIKE pattern (case-insensitive)
-            like_pattern = f"%{search_term}%"
-
-            # Create OR condition for name and description
-            search_condition = (
-                (JobApplication.job_title.ilike(like_pattern))
-                | (JobApplication.job_description.ilike(like_pattern))
-                | (JobApplication.company_name.ilike(like_pattern))
-            ) & (JobApplication.user_id == user_id)
-
-            # Get total count efficiently using func.count()
-            count_statement = select(func.count(JobApplication.id)).where(
-                search_condition
+            condition = _search_filter(user_id, term)
+            total = (
+                self.session.exec(_count_statement(condition)).one()
+                if with_total
+                else None
             )
-            total = self.session.exec(count_statement).one()
-
-            # Get paginated results
-            statement = (
-                select(JobApplication)
-                .where(search_condition)
-                .offset(offset)
-                .limit(limit)
-                .order_by(desc(JobApplication.created_at))
+            result = self.session.exec(
+                _search_statement(condition, term, offset, limit, cursor)
             )
-            result = self.session.exec(statement)
-            return result.all(), total
+            return [_to_hit(row) for row in result.all()], total
         except Exception as e:
-            logger.error(
-                f"Error searching job applications by name or description like '{search_term}': {e}"
-            )
+            logger.error(f"Error searching job applications for '{search_term}': {e}")
             raise e
 
     def update(self, job_application: JobApplication) -> JobApplication:
@@ -182,6 +245,7 @@ class JobApplicationRepository:
         Returns:
             The updated job application
         """
+        job_application.updated_at = datetime.now(UTC)
         self.session.add(job_application)
         self.session.commit()
         updated_application = self.get_by_id(job_application.id)
@@ -202,3 +266,265 @@ class JobApplicationRepository:
             self.session.commit()
             return True
         return False
+
+
+class AsyncJobApplicationRepository:
+    """Async repository for JobApplication database operations.
+
+    Mirrors JobApplicationRepository on an AsyncSession. Relationships cannot be
+    lazy-loaded on an async session, so events are only available when
+    requested with ``with_events=True``.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initialize the AsyncJobApplicationRepository with an async database session."""
+        self.session = session
+
+    async def create(self, job_application: JobApplication) -> JobApplication:
+        """Create a new job application in the database.
+
+        Args:
+            job_application: The job application object to be created
+
+        Returns:
+            The created job application with updated fields
+        """
+        self.session.add(job_application)
+        await self.session.commit()
+        return await self.get_by_id(job_application.id)
+
+    async def get_by_id(
+        self,
+        job_application_id: str,
+        *,
+        refresh: bool = False,
+        with_events: bool = False,
+    ) -> JobApplication | None:
+        """Retrieve a job application by its ID.
+
+        Args:
+            job_application_id: The ID of the application to retrieve
+            refresh: If True, refresh the object from the database to get the latest state.
+            with_events: If True, eagerly load the related events.
+
+        Returns:
+            The job application if found, None otherwise
+        """
+        statement = select(JobApplication).where(
+            JobApplication.id == job_application_id
+        )
+        if with_events:
+            statement = statement.options(selectinload(JobApplication.events))
+        if refresh:
+            statement = statement.execution_options(populate_existing=True)
+        results = await self.session.exec(statement)
+        return results.first()
+
+    async def get_by_id_and_user(
+        self, job_application_id: str, user_id: str, *, refresh: bool = False
+    ) -> JobApplication | None:
+        """Retrieve a job application by its ID and user id.
+
+        Args:
+            job_application_id: The ID of the application to retrieve
+            user_id: The ID of the user to whom the job application belong
+            refresh: If True, refresh the object from the database to get the latest state.
+
+        Returns:
+            The job application if found, None otherwise
+        """
+        statement = (
+            select(JobApplication)
+            .where(JobApplication.id == job_application_id)
+            .where(JobApplication.user_id == user_id)
+        )
+        if refresh:
+            statement = statement.execution_options(populate_existing=True)
+        results = await self.session.exec(statement)
+        return results.first()
+
+    async def get_all(self, user_id: str) -> list[JobApplication]:
+        """Retrieve all job applications of a user.
+
+        Returns:
+            A list of the user's job applications
+        """
+        statement = select(JobApplication).where(JobApplication.user_id == user_id)
+        results = await self.session.exec(statement)
+        return results.all()
+
+    async def list_active_ids(self, user_id: str) -> list[str]:
+        """List the IDs of a user's job applications still being generated.
+
+        Args:
+            user_id: The ID of the user to list job applications for.
+
+        Returns:
+            The IDs of the applications that are neither completed nor failed
+        """
+        statement = (
+            select(JobApplication.id)
+            .where(JobApplication.user_id == user_id)
+            .where(
+                col(JobApplication.resume_generation_status).not_in(
+                    [
+                        ResumeGenerationStatus.COMPLETED.value,
+                        ResumeGenerationStatus.FAILED.value,
+                    ]
+                )
+            )
+            .order_by(desc(JobApplication.created_at))
+        )
+        results = await self.session.exec(statement)
+        return list(results.all())
+
+    async def list_paginated(
+        self,
+        user_id: str,
+        offset: int = 0,
+        limit: int = 30,
+        *,
+        cursor: PageCursor | None = None,
+        with_total: bool = True,
+    ) -> tuple[list[JobApplicationPreview], int | None]:
+        """List previews of job applications with pagination, newest first.
+
+        Only the preview columns are selected.
+
+        Args:
+            user_id: The ID of the user to list job applications for.
+            offset (int, optional): The number of job applications to skip. Defaults to 0.
+            limit (int, optional): The maximum number of job applications to return. Defaults to 30.
+            cursor: Start after this position instead of skipping offset rows.
+            with_total: Whether to count all of the user's job applications.
+
+        Returns:
+            Tuple[List[JobApplicationPreview], int | None]: A tuple containing the previews of the matching apps and the total count, None unless with_total
+        """
+        try:
+            condition = JobApplication.user_id == user_id
+            total = await self._count(condition) if with_total else None
+            result = await self.session.exec(
+                _page_statement(condition, offset, limit, cursor)
+            )
+            return [_to_preview(row) for row in result.all()], total
+        except Exception as e:
+            logger.error(f"Error listing paginated job applications: {e}")
+            raise e
+
+    async def search_job_applications(
+        self,
+        user_id: str,
+        search_term: str,
+        offset: int = 0,
+        limit: int = 30,
+        *,
+        cursor: PageCursor | None = None,
+        with_total: bool = True,
+    ) -> tuple[list[SearchHit], int | None]:
+        """Search job applications by title, company and description, best match first.
+
+        Uses the full-text and trigram indexes of the search module: words
+        match as prefixes, and titles and companies tolerate typos. Only the
+        preview columns are selected.
+
+        Args:
+            user_id: The ID of the user to list job applications for.
+            search_term (str): The search term to match against name or description
+            offset (int, optional): The number of job applications to skip. Defaults to 0.
+            limit (int, optional): The maximum number of job applications to return. Defaults to 30.
+            cursor: Start after this ranked position instead of skipping offset rows.
+            with_total: Whether to count all matching job applications.
+
+        Returns:
+            Tuple[List[SearchHit], int | None]: A tuple containing the previews of the matching job applications with their rank and the total count, None unless with_total
+        """
+        term = (search_term or "").strip()
+        if not term:
+            return [], 0 if with_total else None
+        try:
+            condition = _search_filter(user_id, term)
+            total = await self._count(condition) if with_total else None
+            result = await self.session.exec(
+                _search_statement(condition, term, offset, limit, cursor)
+            )
+            return [_to_hit(row) for row in result.all()], total
+        except Exception as e:
+            logger.error(f"Error searching job applications for '{search_term}': {e}")
+            raise e
+
+    async def _count(self, condition) -> int:
+        return (await self.session.exec(_count_statement(condition))).one()
+
+    async def set_company_profile_entry(
+        self, job_application_id: str, key: str, value: Any, *, merge: bool = False
+    ) -> bool:
+        """Set one entry of a job application's company profile in a single UPDATE.
+
+        The new profile is computed by the database from the stored one, so
+        concurrent writers of different entries, or of different keys of a
+        merged entry, never overwrite each other.
+
+        Args:
+            job_application_id: The ID of the job application to update
+            key: The top-level key of the company profile
+            value: The JSON value to store under the key
+            merge: Merge value, a dict, into the object stored under the key
+                instead of replacing it
+
+        Returns:
+            True if the job application was updated, False if it does not exist
+        """
+        empty = cast(literal("{}"), JSONB)
+        stored = cast(JobApplication.company_profile, JSONB)
+        profile = case((func.jsonb_typeof(stored) == "object", stored), else_=empty)
+        new_value = literal(value, JSONB)
+        if merge:
+            current = profile.op("->")(key)
+            new_value = case(
+                (func.jsonb_typeof(current) == "object", current), else_=empty
+            ).op("||")(new_value)
+        statement = (
+            update(JobApplication)
+            .where(JobApplication.id == job_application_id)
+            .values(
+                company_profile=cast(
+                    func.jsonb_set(profile, array([key]), new_value), JSON
+                ),
+                updated_at=datetime.now(UTC),
+            )
+        )
+        result = await self.session.execute(statement)
+        await self.session.commit()
+        return result.rowcount > 0
+
+    async def update(self, job_application: JobApplication) -> JobApplication:
+        """Update an existing job application.
+
+        Args:
+            job_application: The job application object with updated fields. Must have a valid ID.
+
+        Returns:
+            The updated job application
+        """
+        job_application.updated_at = datetime.now(UTC)
+        self.session.add(job_application)
+        await self.session.commit()
+        return await self.get_by_id(job_application.id)
+
+    async def delete(self, job_application_id: str) -> bool:
+        """Delete a job application by its ID.
+
+        Args:
+            job_application_id: The ID of the job application to delete
+
+        Returns:
+            True if the job application was deleted, False otherwise
+        """
+        # Events must be loaded for the delete-orphan cascade to run without lazy loads
+        job_application = await self.get_by_id(job_application_id, with_events=True)
+        if job_application:
+            await self.session.delete(job_application)
+            await self.session.commit()
+            return True
+        return False
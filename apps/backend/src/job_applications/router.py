@@ -10,14 +10,14 @@ This module provides API endpoints for managing job applications and resume gene
 """
 
 import asyncio
-import json
 import os
 from logging import getLogger
-from typing import Any
+from typing import Literal
 
 from fastapi import (
     APIRouter,
     Depends,
+    Header,
     HTTPException,
     Query,
     Request,
@@ -26,19 +26,27 @@ from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from src.auth.dependencies import get_current_user
+from src.configs.database_config import get_async_session_context
+from src.core.service_registry import ServiceRegistry
 from src.core.types import Resume
-from src.job_applications.dependencies import get_job_application_service
+from src.job_applications.dependencies import get_async_job_application_service
+from src.job_applications.feed_hub import (
+    SSE_HEARTBEAT_SECONDS,
+    FeedKey,
+    get_application_feed_hub,
+)
 from src.job_applications.generate_resume_job import start_resume_generation
 from src.job_applications.model import JobApplication
-from src.job_applications.services.job_application_service import JobApplicationService
+from src.job_applications.pagination import InvalidCursorError, PageCursor
+from src.job_applications.services.job_application_service import (
+    AsyncJobApplicationService,
+)
 from src.job_applications.types import (
     CreateJobApplicationRequest,
     JobApplicationPreview,
     ResumeGenerationStatus,
 )
-from src.user.dependencies import get_user_service
 from src.user.model import User
-from src.user.service import UserService
 
 logger = getLogger(__name__)
 UPLOAD_DIR = os.path.join(os.path.dirname(__file__), "../../uploads")
@@ -53,16 +61,47 @@ class PaginatedJobApplicationsResponse(BaseModel):
     """Response model for paginated job applications list."""
 
     items: list[JobApplicationPreview]
-    total: int
+    total: int | None
     has_next: bool
+    next_cursor: str | None = None
+
+
+def _decode_cursor(cursor: str | None) -> PageCursor | None:
+    if cursor is None:
+        return None
+    try:
+        return PageCursor.decode(cursor)
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+
+def _paginated_response(
+    previews: list[JobApplicationPreview],
+    limit: int,
+    total: int | None,
+    ranks: list[float] | None = None,
+) -> PaginatedJobApplicationsResponse:
+    # Pages are fetched with one extra row, telling whether another page follows
+    page = previews[:limit]
+    has_next = len(previews) > limit
+    next_cursor = None
+    if has_next:
+        rank = ranks[limit - 1] if ranks is not None else None
+        next_cursor = PageCursor.after(page[-1], rank).encode()
+    return PaginatedJobApplicationsResponse(
+        items=page,
+        total=total,
+        has_next=has_next,
+        next_cursor=next_cursor,
+    )
 
 
 @job_application_router.post("/start-generation")
-def start_application_resume_generation(
+async def start_application_resume_generation(
     application_data: CreateJobApplicationRequest,
     current_user: User = Depends(get_current_user),
-    job_application_service: JobApplicationService = Depends(
-        get_job_application_service
+    job_application_service: AsyncJobApplicationService = Depends(
+        get_async_job_application_service
     ),
 ):
     """Create a new job application and start the resume generation process.
@@ -71,7 +110,7 @@ def start_application_resume_generation(
     resume generation workflow via a Celery task.
     """
     try:
-        job_application = job_application_service.create_job_application(
+        job_application = await job_application_service.create_job_application(
             JobApplication(
                 job_description=application_data.job_description,
                 job_title=application_data.job_role,
@@ -81,12 +120,13 @@ def start_application_resume_generation(
             )
         )
 
-        resume_generation_job = start_resume_generation.delay(
-            job_application_id=job_application.id
+        # Publishing to the broker is blocking I/O; keep it off the event loop
+        resume_generation_job = await asyncio.to_thread(
+            start_resume_generation.delay, job_application_id=job_application.id
         )
         job_application.resume_generation_status = ResumeGenerationStatus.STARTED.value
         job_application.background_task_id = resume_generation_job.id
-        updated_application = job_application_service.update_job_application(
+        updated_application = await job_application_service.update_job_application(
             job_application
         )
         return updated_application
@@ -106,28 +146,29 @@ def start_application_resume_generation(
 async def list_job_applications(
     offset: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
+    include_total: bool | None = Query(
+        None, description="Count all applications; by default only on the first page"
+    ),
     user: User = Depends(get_current_user),
-    job_application_service: JobApplicationService = Depends(
-        get_job_application_service
+    job_application_service: AsyncJobApplicationService = Depends(
+        get_async_job_application_service
     ),
 ):
-    """Get a paginated list of job applications for the current user.
+    """Get a paginated list of job applications for the current user, newest first.
 
-    Supports pagination via offset and limit query parameters.
+    Pages are requested with the next_cursor of the previous page, which keeps
+    their cost constant however deep they are; offset is still accepted for
+    the first page and older clients. The total is only counted on the first
+    page unless include_total says otherwise.
     """
+    page_cursor = _decode_cursor(cursor)
+    with_total = include_total if include_total is not None else page_cursor is None
     try:
-        job_applications, total = job_application_service.list_paginated(
-            user.id, offset, limit
-        )
-        job_applications_previews = [
-            JobApplicationPreview(**job_application.model_dump())
-            for job_application in job_applications
-        ]
-        has_next = (offset + limit) < total
-        logger.debug("PAGINATED APPLICATIONS", job_applications_previews)
-        return PaginatedJobApplicationsResponse(
-            items=job_applications_previews, total=total, has_next=has_next
+        previews, total = await job_application_service.list_paginated(
+            user.id, offset, limit + 1, cursor=page_cursor, with_total=with_total
         )
+        return _paginated_response(previews, limit, total)
     except Exception as e:
         logger.error(f"Error listing job applications: {e}")
         return PaginatedJobApplicationsResponse(items=[], total=0, has_next=False)
@@ -138,27 +179,41 @@ async def search_job_applications(
     search_term: str = Query(None, description="Search term"),
     offset: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
+    include_total: bool | None = Query(
+        None, description="Count all matches; by default only on the first page"
+    ),
     user: User = Depends(get_current_user),
-    job_application_service: JobApplicationService = Depends(
-        get_job_application_service
+    job_application_service: AsyncJobApplicationService = Depends(
+        get_async_job_application_service
     ),
 ):
     """Search for job applications with comprehensive filtering support.
 
     Supports filtering by:
-    - search_term: matches app name or description
+    - search_term: matches the title, company or description; words match as
+      prefixes and titles and companies tolerate typos
+
+    Results are ranked, best match first, and paginated like /list.
     """
+    page_cursor = _decode_cursor(cursor)
+    if page_cursor is not None and page_cursor.rank is None:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+    with_total = include_total if include_total is not None else page_cursor is None
     try:
-        job_applications, total = job_application_service.search_job_applications(
-            search_term=search_term, offset=offset, limit=limit, user_id=user.id
+        hits, total = await job_application_service.search_job_applications(
+            search_term=search_term,
+            offset=offset,
+            limit=limit + 1,
+            user_id=user.id,
+            cursor=page_cursor,
+            with_total=with_total,
         )
-        job_applications_previews = [
-            JobApplicationPreview(**job_application.model_dump())
-            for job_application in job_applications
-        ]
-        has_next = (offset + limit) < total
-        return PaginatedJobApplicationsResponse(
-            items=job_applications_previews, total=total, has_next=has_next
+        return _paginated_response(
+            [hit.preview for hit in hits],
+            limit,
+            total,
+            ranks=[hit.rank for hit in hits],
         )
     except Exception as e:
         logger.error(f"Error searching job applications: {e}")
@@ -170,24 +225,42 @@ async def application_snapshot_sse(
     application_id: str,
     token: str,
     request: Request,
-    user_service: UserService = Depends(get_user_service),
-    job_application_service: JobApplicationService = Depends(
-        get_job_application_service
-    ),
     poll_interval_ms: int = 1000,
     events_limit: int = 200,
+    mode: Literal["snapshot", "delta"] = "snapshot",
+    last_event_id: str | None = Header(None, alias="Last-Event-ID"),
 ):
-    """SSE stream of the full JobApplication snapshot (including related events).
-
-    Sends a new frame on every poll to ensure real-time updates.
+    """SSE stream of the JobApplication (including related events).
+
+    Sends a new frame whenever the application or its events change, as signalled
+    through the change notifier. Notifications arriving within poll_interval_ms of
+    each other are coalesced into one frame, and an idle stream re-checks the
+    database every SSE_HEARTBEAT_SECONDS in case a notification was lost.
+
+    In the default "snapshot" mode every frame carries the full application. In
+    "delta" mode the full snapshot is sent once, followed by application.delta
+    frames holding only new events and the top-level fields that changed. Delta
+    frame ids are resumable cursors: a reconnecting client sending Last-Event-ID
+    only receives what it missed instead of a new snapshot.
+
+    Clients watching the same application share one feed of the
+    ApplicationFeedHub, which loads and serializes each change once; a client
+    too slow to keep up has its backlog coalesced.
     """
     try:
-        current_user = await get_current_user(token, user_service)
+        async with get_async_session_context() as session:
+            current_user = await get_current_user(
+                token, ServiceRegistry.get_async_user_service(session)
+            )
     except Exception:
         raise HTTPException(status_code=401, detail="Invalid token")
 
     # Authorization: ensure the job application belongs to the current user
-    app_obj = job_application_service.get_job_application(application_id)
+    async with get_async_session_context() as session:
+        job_application_service = ServiceRegistry.get_async_job_application_service(
+            session
+        )
+        app_obj = await job_application_service.get_job_application(application_id)
     if not app_obj:
         raise HTTPException(status_code=404, detail="Job application not found")
     if app_obj.user_id != current_user.id:
@@ -195,113 +268,24 @@ async def application_snapshot_sse(
             status_code=403, detail="Not authorized for this application"
         )
 
-    def _serialize_event(ev) -> dict[str, Any]:
-        return {
-            "id": ev.id,
-            "job_application_id": ev.job_application_id,
-            "event_name": ev.event_name,
-            "status": ev.status,
-            "step": ev.step,
-            "category_name": ev.category_name,
-            "tool_name": ev.tool_name,
-            "iteration": ev.iteration,
-            "message": ev.message,
-            "data": ev.data,
-            "error": ev.error,
-            "created_at": ev.created_at.isoformat() if ev.created_at else None,
-        }
-
-    def _serialize_job_application(app: JobApplication) -> dict[str, Any]:
-        # Sort events ascending; apply limit to the most recent ones to keep payload reasonable
-        evs = app.events or []
-        if events_limit and len(evs) > events_limit:
-            evs = evs[-events_limit:]
-
-        return {
-            "id": app.id,
-            "job_title": app.job_title,
-            "company_name": app.company_name,
-            "job_description": app.job_description,
-            "background_task_id": app.background_task_id,
-            "resume_generation_status": (
-                app.resume_generation_status if app.resume_generation_status else None
-            ),
-            "company_profile": app.company_profile,
-            "generated_resume": app.generated_resume,
-            "resume_strategy_brief": app.resume_strategy_brief,
-            "original_resume_snapshot": app.original_resume_snapshot,
-            "generated_cover_letter": app.generated_cover_letter,
-            "created_at": app.created_at.isoformat() if app.created_at else None,
-            "updated_at": app.updated_at.isoformat() if app.updated_at else None,
-            "events": [_serialize_event(e) for e in evs],
-        }
-
-    def _format_sse(evt_id: str, payload: dict[str, Any]) -> str:
-        return f"id: {evt_id}\nevent: application.snapshot\ndata: {json.dumps(payload, default=str)}\n\n"
+    feed_key = FeedKey(
+        application_id, events_limit=events_limit, poll_interval_ms=poll_interval_ms
+    )
 
     async def event_generator():
-        counter = 0
-        last_status = None
-
-        while True:
-            if await request.is_disconnected():
-                logger.info(f"Client disconnected for application {application_id}")
-                break
-
-            try:
-                app = job_application_service.get_job_application(
-                    application_id, refresh=True
-                )
-
-                if not app:
-                    yield _format_sse("gone", {"detail": "not_found"})
-                    break
-
-                current_status = app.resume_generation_status
-                status_changed = current_status != last_status
-                last_status = current_status
-
-                # Always send the current state
-                payload = _serialize_job_application(app)
-                event_id = (
-                    f"{app.updated_at.isoformat() if app.updated_at else '0'}:{counter}"
-                )
-
-                # Add status change indicator
-                if status_changed:
-                    payload["status_changed"] = True
-                    payload["previous_status"] = last_status
-
-                yield _format_sse(event_id, payload)
-                counter += 1
-
-                # Handle terminal states
-                if current_status in [
-                    ResumeGenerationStatus.FAILED.value,
-                    ResumeGenerationStatus.COMPLETED.value,
-                ]:
-                    # Send completion event and close after a delay
-                    completion_payload = {
-                        **payload,
-                        "stream_ending": True,
-                        "final_status": current_status,
-                    }
-                    yield _format_sse(f"completion-{event_id}", completion_payload)
-
-                    # Give client time to process the final event
-                    await asyncio.sleep(1.0)
-                    break
-
-                await asyncio.sleep(max(0.1, poll_interval_ms / 1000.0))
-
-            except Exception as e:
-                logger.error(
-                    f"Error in SSE stream for application {application_id}: {e}"
-                )
-                yield _format_sse(
-                    "stream-error", {"detail": "stream_error", "message": str(e)}
-                )
-                break
+        async with get_application_feed_hub().subscribe(
+            feed_key,
+            mode=mode,
+            last_event_id=last_event_id if mode == "delta" else None,
+        ) as feed:
+            async for frame in feed.frames(heartbeat=SSE_HEARTBEAT_SECONDS):
+                if await request.is_disconnected():
+                    logger.info(f"Client disconnected for application {application_id}")
+                    return
+                yield frame
+            if feed.completed:
+                # Give client time to process the final event
+                await asyncio.sleep(1.0)
 
     from os import getenv
 
@@ -321,13 +305,13 @@ async def application_snapshot_sse(
 @job_application_router.get("/stats")
 async def get_resume_creation_stats(
     current_user: User = Depends(get_current_user),
-    job_application_service: JobApplicationService = Depends(
-        get_job_application_service
+    job_application_service: AsyncJobApplicationService = Depends(
+        get_async_job_application_service
     ),
 ):
     """Get statistics for resume creation for the current user."""
     try:
-        stats = job_application_service.get_stats(current_user.id)
+        stats = await job_application_service.get_stats(current_user.id)
         return stats
     except Exception as e:
         logger.error(
@@ -347,13 +331,13 @@ async def update_generated_resume(
     application_id: str,
     request: UpdateResumeRequest,
     current_user: User = Depends(get_current_user),
-    job_application_service: JobApplicationService = Depends(
-        get_job_application_service
+    job_application_service: AsyncJobApplicationService = Depends(
+        get_async_job_application_service
     ),
 ):
     """Update the generated resume for a job application."""
     try:
-        job_application = job_application_service.get_user_job_application(
+        job_application = await job_application_service.get_user_job_application(
             application_id, current_user.id, refresh=True
         )
         if not job_application:
@@ -365,7 +349,7 @@ async def update_generated_resume(
                 status_code=400,
                 detail="Cannot update job application resume because it isn't generated yet",
             )
-        updated_job_application = job_application_service.save_generated_resume(
+        updated_job_application = await job_application_service.save_generated_resume(
             application_id, request.resume
         )
         return updated_job_application
@@ -387,13 +371,13 @@ async def update_generated_cover_letter(
     application_id: str,
     cover_letter: UpdateCoverLetterRequest,
     current_user: User = Depends(get_current_user),
-    job_application_service: JobApplicationService = Depends(
-        get_job_application_service
+    job_application_service: AsyncJobApplicationService = Depends(
+        get_async_job_application_service
     ),
 ):
     """Update the generated cover letter for a job application."""
     try:
-        job_application = job_application_service.get_user_job_application(
+        job_application = await job_application_service.get_user_job_application(
             application_id, current_user.id, refresh=True
         )
         if not job_application:
@@ -405,8 +389,10 @@ async def update_generated_cover_letter(
                 status_code=400,
                 detail="Cannot update job application cover letter because it isn't generated yet",
             )
-        updated_job_application = job_application_service.save_generated_cover_letter(
-            application_id, cover_letter.cover_letter_content
+        updated_job_application = (
+            await job_application_service.save_generated_cover_letter(
+                application_id, cover_letter.cover_letter_content
+            )
         )
         return updated_job_application
     except Exception as e:
@@ -420,13 +406,13 @@ async def update_generated_cover_letter(
 async def delete_job_application(
     application_id: str,
     current_user: User = Depends(get_current_user),
-    job_application_service: JobApplicationService = Depends(
-        get_job_application_service
+    job_application_service: AsyncJobApplicationService = Depends(
+        get_async_job_application_service
     ),
 ):
     """Delete a job application."""
     try:
-        job_application = job_application_service.get_user_job_application(
+        job_application = await job_application_service.get_user_job_application(
             application_id, current_user.id, refresh=True
         )
         if not job_application:
@@ -434,7 +420,7 @@ async def delete_job_application(
                 status_code=404, detail="No job application found for the given user"
             )
 
-        return job_application_service.delete_job_application(application_id)
+        return await job_application_service.delete_job_application(application_id)
     except Exception as e:
         logger.error(f"ERROR in job_application router delete_job_application {str(e)}")
         return HTTPException(status_code=500, detail="Internal Server error")
@@ -444,13 +430,13 @@ async def delete_job_application(
 async def get_job_application(
     application_id: str,
     current_user: User = Depends(get_current_user),
-    job_application_service: JobApplicationService = Depends(
-        get_job_application_service
+    job_application_service: AsyncJobApplicationService = Depends(
+        get_async_job_application_service
     ),
 ):
     """Get a job application by ID."""
     try:
-        job_application = job_application_service.get_user_job_application(
+        job_application = await job_application_service.get_user_job_application(
             application_id, current_user.id, refresh=True
         )
         if not job_application:
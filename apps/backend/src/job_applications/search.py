@@ -0,0 +1,103 @@
+"""Full-text and trigram search over job applications.
+
+Searching used to run ILIKE '%term%' over the title, the company and the whole
+job description, which no index can serve. The search now relies on database
+objects maintained by the add_job_applications_search migration:
+
+- search_vector: a generated tsvector column over the title and company
+  (weight A) and the job description (weight B), with a GIN index
+- GIN trigram indexes on job_title and company_name (pg_trgm)
+
+A term matches an application when its words, each as a prefix, all appear in
+search_vector, or when it is similar to words of the title or the company
+(word_similarity, tolerating typos). Results are ranked by ts_rank_cd plus the
+best trigram similarity.
+
+The column and indexes are not declared on the model, so loading applications
+never fetches the vector; migrations/env.py keeps autogenerate from dropping
+them.
+
+This module provides:
+- SearchHit: the preview of a matching application and its rank
+- SEARCH_VECTOR_COLUMN / SEARCH_INDEXES: names of the search objects
+- prefix_tsquery: the tsquery text of a search term
+- search_condition / search_rank: SQL expressions used by the repository
+"""
+
+import re
+from typing import NamedTuple
+
+from sqlalchemy import ColumnElement, Float, cast, column, false, func, literal
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from src.job_applications.model import JobApplication
+from src.job_applications.types import JobApplicationPreview
+
+SEARCH_CONFIG = "english"
+SEARCH_VECTOR_COLUMN = "search_vector"
+SEARCH_INDEXES = {
+    "ix_app_job_applications_search_vector",
+    "ix_app_job_applications_job_title_trgm",
+    "ix_app_job_applications_company_name_trgm",
+}
+
+_WORD_RE = re.compile(r"\w+")
+
+_search_vector = column(SEARCH_VECTOR_COLUMN, TSVECTOR)
+
+
+class SearchHit(NamedTuple):
+    """Preview of a job application matching a search, with its rank."""
+
+    preview: JobApplicationPreview
+    rank: float
+
+
+def prefix_tsquery(term: str) -> str | None:
+    """Return a tsquery matching every word of the term as a prefix.
+
+    Only word characters are kept, so the result is always valid tsquery
+    syntax. Returns None when the term has no words.
+    """
+    words = _WORD_RE.findall(term.lower())
+    return " & ".join(f"{word}:*" for word in words) or None
+
+
+def _similar(term: str, field) -> ColumnElement[bool]:
+    # term <% field: word_similarity above the threshold, served by the trigram index
+    return literal(term).op("<%")(field)
+
+
+def search_condition(term: str) -> ColumnElement[bool]:
+    """Return the condition matching the applications found by a search term."""
+    tsquery = prefix_tsquery(term)
+    text_match = (
+        _search_vector.op("@@")(func.to_tsquery(SEARCH_CONFIG, tsquery))
+        if tsquery
+        else false()
+    )
+    return (
+        text_match
+        | _similar(term, JobApplication.job_title)
+        | _similar(term, JobApplication.company_name)
+    )
+
+
+def search_rank(term: str) -> ColumnElement[float]:
+    """Return the rank of an application for a search term, higher is better.
+
+    The rank is cast to double precision: the real computed by Postgres would
+    otherwise be compared with the double bound from a page cursor, and rows
+    tied with a page's last row would be skipped.
+    """
+    rank = func.greatest(
+        func.word_similarity(term, JobApplication.job_title),
+        func.word_similarity(term, JobApplication.company_name),
+    )
+    tsquery = prefix_tsquery(term)
+    if tsquery:
+        rank = (
+            func.ts_rank_cd(_search_vector, func.to_tsquery(SEARCH_CONFIG, tsquery))
+            + rank
+        )
+    return cast(rank, Float(53))
@@ -0,0 +1,215 @@
+"""Service for reusing company research results across job applications.
+
+This module provides the AsyncCompanyResearchCacheService class and the helpers
+that derive its cache keys. Research results are stored per company and research
+category, so a new application for a company that was researched recently can
+skip the executor loop for every category that is still fresh.
+
+Keys:
+- company key: domain of the official website found by the discovery agent
+  (without "www."), or the lowercased company name with legal suffixes removed
+- category key: lowercased alphanumeric words of the category name
+- cache key: SHA-256 of "<company key>|<category key>"
+
+Entries expire after COMPANY_RESEARCH_CACHE_TTL_HOURS (one week by default).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from datetime import UTC, datetime, timedelta
+from logging import getLogger
+from typing import Any
+from urllib.parse import urlparse
+
+from src.job_applications.model import CompanyResearchCache
+from src.job_applications.repositories.company_research_repository import (
+    AsyncCompanyResearchRepository,
+)
+from src.job_applications.types import DiscoveredCompanyProfile
+
+logger = getLogger(__name__)
+
+COMPANY_RESEARCH_CACHE_TTL_HOURS = float(
+    os.getenv("COMPANY_RESEARCH_CACHE_TTL_HOURS", "168")
+)
+
+# Legal suffixes dropped from company names before they are used as keys
+_COMPANY_SUFFIXES = {
+    "inc",
+    "incorporated",
+    "llc",
+    "ltd",
+    "limited",
+    "corp",
+    "corporation",
+    "co",
+    "gmbh",
+    "sa",
+    "sas",
+    "ag",
+    "plc",
+    "bv",
+}
+
+
+def _words(value: str) -> list[str]:
+    return re.findall(r"[a-z0-9]+", value.lower())
+
+
+def normalize_company_key(
+    company: str, discovery: DiscoveredCompanyProfile | None = None
+) -> str:
+    """Derive the cache key of a company.
+
+    Args:
+        company: Company name as entered in the job application
+        discovery: Discovery results, whose official website is preferred
+
+    Returns:
+        The website domain when known, otherwise the normalized company name
+    """
+    website = discovery.official_website if discovery else None
+    if website:
+        netloc = urlparse(website if "//" in website else f"//{website}").netloc
+        domain = netloc.lower().split(":")[0].removeprefix("www.")
+        if domain:
+            return domain
+
+    words = _words(company)
+    while len(words) > 1 and words[-1] in _COMPANY_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+def normalize_category_key(category_name: str) -> str:
+    """Derive the cache key of a research category name."""
+    return " ".join(_words(category_name))
+
+
+def build_cache_key(company_key: str, category_key: str) -> str:
+    """Build the primary key of a cache entry."""
+    return hashlib.sha256(f"{company_key}|{category_key}".encode()).hexdigest()
+
+
+def hash_results(results: Any) -> str:
+    """Hash research results independently of key order."""
+    payload = json.dumps(results, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class AsyncCompanyResearchCacheService:
+    """Business logic for reading and refreshing cached company research."""
+
+    def __init__(
+        self,
+        company_research_repository: AsyncCompanyResearchRepository,
+        ttl: timedelta | None = None,
+    ):
+        """Initialize the service with a repository and an entry lifetime."""
+        self.company_research_repository = company_research_repository
+        self.ttl = ttl or timedelta(hours=COMPANY_RESEARCH_CACHE_TTL_HOURS)
+
+    async def list_fresh_entries(self, company_key: str) -> list[CompanyResearchCache]:
+        """List the unexpired entries of a company, most recent first."""
+        try:
+            return await self.company_research_repository.list_fresh(
+                company_key, datetime.now(UTC)
+            )
+        except Exception as e:
+            logger.error(
+                f"ERROR: in AsyncCompanyResearchCacheService in list_fresh_entries: {str(e)}"
+            )
+            raise e
+
+    async def get_fresh_results(
+        self, company_key: str, category_names: list[str]
+    ) -> dict[str, Any]:
+        """Retrieve the fresh cached results of the given categories.
+
+        Entries served are counted as hits.
+
+        Args:
+            company_key: Normalized company key
+            category_names: Category names of the research plan
+
+        Returns:
+            Cached results keyed by the category names they were requested with
+        """
+        try:
+            now = datetime.now(UTC)
+            keys = {
+                build_cache_key(company_key, normalize_category_key(name)): name
+                for name in category_names
+            }
+            entries = await self.company_research_repository.get_fresh_by_keys(
+                list(keys), now
+            )
+            await self.company_research_repository.record_hits(
+                [entry.cache_key for entry in entries], now
+            )
+            return {keys[entry.cache_key]: entry.results for entry in entries}
+        except Exception as e:
+            logger.error(
+                f"ERROR: in AsyncCompanyResearchCacheService in get_fresh_results: {str(e)}"
+            )
+            raise e
+
+    async def store_category_results(
+        self,
+        *,
+        company_key: str,
+        company_name: str,
+        category_name: str,
+        results: Any,
+        source_job_application_id: str | None = None,
+    ) -> CompanyResearchCache:
+        """Store or refresh the results of one research category.
+
+        Args:
+            company_key: Normalized company key
+            company_name: Display name of the company
+            category_name: Name of the research category
+            results: Research results produced by the executor
+            source_job_application_id: Application whose research produced the results
+
+        Returns:
+            The stored entry
+        """
+        try:
+            now = datetime.now(UTC)
+            category_key = normalize_category_key(category_name)
+            entry = CompanyResearchCache(
+                cache_key=build_cache_key(company_key, category_key),
+                company_key=company_key,
+                category_key=category_key,
+                company_name=company_name,
+                category_name=category_name,
+                results=results,
+                content_hash=hash_results(results),
+                source_job_application_id=source_job_application_id,
+                refreshed_at=now,
+                expires_at=now + self.ttl,
+            )
+            await self.company_research_repository.upsert(entry)
+            return entry
+        except Exception as e:
+            logger.error(
+                f"ERROR: in AsyncCompanyResearchCacheService in store_category_results: {str(e)}"
+            )
+            raise e
+
+    async def purge_expired(self) -> int:
+        """Delete expired entries and return how many were removed."""
+        try:
+            return await self.company_research_repository.delete_expired(
+                datetime.now(UTC)
+            )
+        except Exception as e:
+            logger.error(
+                f"ERROR: in AsyncCompanyResearchCacheService in purge_expired: {str(e)}"
+            )
+            raise e
@@ -0,0 +1,254 @@
+"""Buffered event sink for the agent pipelines.
+
+This module provides the EventSink class, a drop-in replacement for EventService
+inside the Celery worker. Instead of opening a session, committing one row and
+re-fetching it for every emitted event, the sink queues events in memory and
+writes them in bulk through EventRepository.create_many.
+
+A flush happens when:
+- the buffer reaches EVENT_SINK_MAX_BATCH_SIZE events
+- EVENT_SINK_FLUSH_INTERVAL_SECONDS elapsed since the first buffered event
+- a failure or pipeline-terminal event is emitted (without waiting for the
+  commit, which runs in a worker thread when an event loop is running)
+- a node decorated with flush_events_on_exit returns or raises
+- the job application is written (see JobApplicationService.update_job_application)
+
+Live subscribers are notified once per job application per flush. Flushes
+are serialized, and a batch whose commit fails goes back to the buffer.
+"""
+
+import asyncio
+import functools
+import inspect
+import os
+import threading
+from collections.abc import Callable
+from logging import getLogger
+from typing import Any
+
+from src.configs.database_config import get_session_context
+from src.core.notifications import ChangeNotifier
+from src.job_applications.model import Event
+from src.job_applications.repositories.events_repository import EventRepository
+from src.job_applications.services.events_service import EventService
+from src.job_applications.types import EventName, EventStatus
+
+logger = getLogger(__name__)
+
+EVENT_SINK_MAX_BATCH_SIZE = int(os.getenv("EVENT_SINK_MAX_BATCH_SIZE", "50"))
+EVENT_SINK_FLUSH_INTERVAL_SECONDS = float(
+    os.getenv("EVENT_SINK_FLUSH_INTERVAL_SECONDS", "0.5")
+)
+
+# Events that must be visible as soon as they are emitted
+_IMMEDIATE_EVENT_NAMES = {
+    EventName.PIPELINE_COMPLETED.value,
+    EventName.PIPELINE_FAILED.value,
+}
+
+
+class EventSink(EventService):
+    """Write-only EventService that buffers events and persists them in batches.
+
+    The emit_* methods behave like EventService's, except that the returned
+    event is not yet persisted. Query methods are not available on the sink.
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int = EVENT_SINK_MAX_BATCH_SIZE,
+        flush_interval: float = EVENT_SINK_FLUSH_INTERVAL_SECONDS,
+        change_notifier: ChangeNotifier | None = None,
+    ) -> None:
+        """Initialize an empty sink.
+
+        Args:
+            max_batch_size: Number of buffered events that triggers a flush
+            flush_interval: Maximum time in seconds an event stays buffered
+            change_notifier: Notifier used to announce flushed events
+        """
+        super().__init__(event_repository=None, change_notifier=change_notifier)
+        self.max_batch_size = max(1, max_batch_size)
+        self.flush_interval = flush_interval
+        self._buffer: list[Event] = []
+        self._lock = threading.Lock()
+        # Held from taking the buffer until its commit ends, so batches from
+        # concurrent flushes commit in the order their events were emitted
+        self._flush_lock = threading.Lock()
+        self._flush_timer: asyncio.TimerHandle | None = None
+        self._flush_timer_loop: asyncio.AbstractEventLoop | None = None
+        self._background_flushes: set[asyncio.Task] = set()
+
+    @property
+    def pending(self) -> int:
+        """Number of events waiting to be flushed."""
+        with self._lock:
+            return len(self._buffer)
+
+    def store_event(self, evt: Event) -> Event:
+        """Queue a built event, flushing when a threshold is reached."""
+        with self._lock:
+            self._buffer.append(evt)
+            buffered = len(self._buffer)
+
+        if (
+            evt.status == EventStatus.FAILED.value
+            or evt.event_name in _IMMEDIATE_EVENT_NAMES
+            or buffered >= self.max_batch_size
+        ):
+            self._flush_in_background()
+        else:
+            self._schedule_flush()
+        return evt
+
+    def flush(self) -> int:
+        """Persist every buffered event in a single transaction.
+
+        If the commit fails, the events are put back in the buffer for the
+        next flush and the error is raised.
+
+        Returns:
+            The number of events written
+        """
+        with self._flush_lock:
+            with self._lock:
+                events, self._buffer = self._buffer, []
+            if not events:
+                return 0
+
+            # Collect ids before the commit expires the instances
+            event_ids_by_application: dict[str, list[str]] = {}
+            for evt in events:
+                event_ids_by_application.setdefault(evt.job_application_id, []).append(
+                    evt.id
+                )
+            try:
+                with get_session_context() as session:
+                    EventRepository(session).create_many(events, refresh=False)
+            except Exception as e:
+                logger.error(
+                    f"Error flushing {len(events)} buffered events, keeping them: {e}"
+                )
+                with self._lock:
+                    self._buffer[:0] = events
+                raise
+
+        for job_application_id, event_ids in event_ids_by_application.items():
+            self.notify_events(job_application_id, event_ids)
+        return len(events)
+
+    async def aflush(self) -> int:
+        """Flush the buffer from a worker thread without blocking the event loop."""
+        if not self.pending:
+            return 0
+        return await asyncio.to_thread(self.flush)
+
+    def _schedule_flush(self) -> None:
+        """Arm the flush timer on the running loop, or flush now without one."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._flush_in_background()
+            return
+        with self._lock:
+            # A timer armed on a previous (now closed) loop will never fire
+            if self._flush_timer is not None and self._flush_timer_loop is loop:
+                return
+            self._flush_timer_loop = loop
+            self._flush_timer = loop.call_later(
+                self.flush_interval, self._flush_in_background
+            )
+
+    def _flush_in_background(self) -> None:
+        """Start an asynchronous flush on the running loop, or flush now without one.
+
+        Never raises: emitting an event from an error handler must not replace
+        the error being reported.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Event flush failed: {e}")
+            return
+        with self._lock:
+            self._flush_timer = None
+        task = loop.create_task(self._safe_aflush())
+        self._background_flushes.add(task)
+        task.add_done_callback(self._background_flushes.discard)
+
+    async def _safe_aflush(self) -> None:
+        try:
+            await self.aflush()
+        except Exception as e:
+            logger.error(f"Background event flush failed: {e}")
+
+
+_event_sink: EventSink | None = None
+_event_sink_lock = threading.Lock()
+
+
+def get_event_sink() -> EventSink:
+    """Return the process-wide event sink, creating it on first use."""
+    global _event_sink
+    with _event_sink_lock:
+        if _event_sink is None:
+            _event_sink = EventSink()
+        return _event_sink
+
+
+def flush_event_sink() -> int:
+    """Flush the process-wide event sink if one was created.
+
+    Returns:
+        The number of events written
+    """
+    with _event_sink_lock:
+        sink = _event_sink
+    return sink.flush() if sink is not None else 0
+
+
+async def aflush_event_sink() -> int:
+    """Flush the process-wide event sink, if one was created, off the event loop.
+
+    Returns:
+        The number of events written
+    """
+    with _event_sink_lock:
+        sink = _event_sink
+    return await sink.aflush() if sink is not None else 0
+
+
+def flush_events_on_exit(node: Callable[..., Any]) -> Callable[..., Any]:
+    """Decorate an agent node so its buffered events are flushed when it exits.
+
+    Works with both sync and async node methods. The decorated method's
+    instance must expose an ``event_sink`` attribute.
+    """
+    if not inspect.iscoroutinefunction(node):
+
+        @functools.wraps(node)
+        def sync_wrapper(self, *args, **kwargs):
+            try:
+                return node(self, *args, **kwargs)
+            finally:
+                try:
+                    self.event_sink.flush()
+                except Exception as e:
+                    logger.error(f"Error flushing events after {node.__name__}: {e}")
+
+        return sync_wrapper
+
+    @functools.wraps(node)
+    async def wrapper(self, *args, **kwargs):
+        try:
+            return await node(self, *args, **kwargs)
+        finally:
+            try:
+                await self.event_sink.aflush()
+            except Exception as e:
+                logger.error(f"Error flushing events after {node.__name__}: {e}")
+
+    return wrapper
@@ -3,7 +3,11 @@
 This module provides the EventService class for managing event operations,
 including emitting various types of events (pipeline steps, research categories,
 tool executions, artifacts) and querying events with filtering capabilities.
+AsyncEventService exposes the query side on an async database session; events
+emitted by the pipeline go through the buffered EventSink instead.
 Events are stored as enums converted to strings for database flexibility.
+Succeeded and failed events emitted inside an instrumented node or tool call
+carry that span's measurements under data["metrics"].
 """
 
 from __future__ import annotations
@@ -12,8 +16,17 @@ from logging import getLogger
 from datetime import datetime
 from typing import Any
 
+from src.core.instrumentation import current_span_metrics
+from src.core.notifications import (
+    ChangeNotifier,
+    get_change_notifier,
+    job_application_channel,
+)
 from src.job_applications.model import Event
-from src.job_applications.repositories.events_repository import EventRepository
+from src.job_applications.repositories.events_repository import (
+    AsyncEventRepository,
+    EventRepository,
+)
 from src.job_applications.types import EventName, EventStatus, PipelineStep
 
 logger = getLogger(__name__)
@@ -25,9 +38,60 @@ class EventService:
     Stores enum values as strings in the DB for flexibility.
     """
 
-    def __init__(self, event_repository: EventRepository):
+    def __init__(
+        self,
+        event_repository: EventRepository,
+        change_notifier: ChangeNotifier | None = None,
+    ):
         """Initialize the EventService with an EventRepository instance."""
         self.event_repository = event_repository
+        self.change_notifier = change_notifier or get_change_notifier()
+
+    def notify_events(self, job_application_id: str, event_ids: list[str]) -> None:
+        """Notify live subscribers that new events exist for a job application."""
+        self.change_notifier.publish(
+            job_application_channel(job_application_id),
+            {"type": "events", "event_ids": event_ids},
+        )
+
+    @staticmethod
+    def build_event(
+        *,
+        job_application_id: str,
+        event_name: EventName,
+        status: EventStatus | None = None,
+        step: PipelineStep | str | None = None,
+        category_name: str | None = None,
+        tool_name: str | None = None,
+        iteration: int | None = None,
+        message: str | None = None,
+        data: dict[str, Any] | None = None,
+        error: dict[str, Any] | None = None,
+    ) -> Event:
+        """Build an event for a job application without persisting it."""
+        status_value = status.value if isinstance(status, EventStatus) else status
+        if status_value in (EventStatus.SUCCEEDED.value, EventStatus.FAILED.value):
+            metrics = current_span_metrics()
+            if metrics is not None:
+                data = {**(data or {}), "metrics": metrics}
+        return Event(
+            job_application_id=job_application_id,
+            event_name=event_name.value,
+            status=status_value,
+            step=step.value if isinstance(step, PipelineStep) else step,
+            category_name=category_name,
+            tool_name=tool_name,
+            iteration=iteration,
+            message=message,
+            data=data,
+            error=error,
+        )
+
+    def store_event(self, evt: Event) -> Event:
+        """Persist a built event and notify live subscribers."""
+        created = self.event_repository.create(evt)
+        self.notify_events(evt.job_application_id, [evt.id])
+        return created
 
     # Generic emitter
     def emit_event(
@@ -46,11 +110,11 @@ class EventService:
     ) -> Event:
         """Emit a generic event for a job application."""
         try:
-            evt = Event(
+            evt = self.build_event(
                 job_application_id=job_application_id,
-                event_name=event_name.value,
-                status=status.value if isinstance(status, EventStatus) else status,
-                step=step.value if isinstance(step, PipelineStep) else step,
+                event_name=event_name,
+                status=status,
+                step=step,
                 category_name=category_name,
                 tool_name=tool_name,
                 iteration=iteration,
@@ -58,7 +122,7 @@ class EventService:
                 data=data,
                 error=error,
             )
-            return self.event_repository.create(evt)
+            return self.store_event(evt)
         except Exception as e:
             logger.error(f"Error emitting event {event_name}: {e}")
             raise
@@ -226,6 +290,7 @@ class EventService:
         category_name: str | None = None,
         tool_name: str | None = None,
         since: datetime | None = None,
+        after_id: str | None = None,
         until: datetime | None = None,
         limit: int = 200,
         offset: int = 0,
@@ -233,19 +298,20 @@ class EventService:
     ) -> list[Event]:
         """List events for a job application with optional filtering and pagination."""
         return self.event_repository.list_events(
-            job_application_id=job_application_id,
-            event_name=(
-                event_name.value if isinstance(event_name, EventName) else event_name
-            ),
-            step=step.value if isinstance(step, PipelineStep) else step,
-            status=status.value if isinstance(status, EventStatus) else status,
-            category_name=category_name,
-            tool_name=tool_name,
-            since=since,
-            until=until,
-            limit=limit,
-            offset=offset,
-            ascending=ascending,
+            **_event_filters(
+                job_application_id,
+                event_name=event_name,
+                step=step,
+                status=status,
+                category_name=category_name,
+                tool_name=tool_name,
+                since=since,
+                after_id=after_id,
+                until=until,
+                limit=limit,
+                offset=offset,
+                ascending=ascending,
+            )
         )
 
     def latest_for_step(
@@ -260,3 +326,77 @@ class EventService:
     def clear_events(self, job_application_id: str) -> int:
         """Clear all events for a job application."""
         return self.event_repository.delete_by_job_application(job_application_id)
+
+
+class AsyncEventService:
+    """Async read access to the events linked to job applications."""
+
+    def __init__(self, event_repository: AsyncEventRepository):
+        """Initialize the AsyncEventService with an AsyncEventRepository instance."""
+        self.event_repository = event_repository
+
+    async def list_events(
+        self,
+        job_application_id: str,
+        *,
+        event_name: EventName | str | None = None,
+        step: PipelineStep | str | None = None,
+        status: EventStatus | str | None = None,
+        category_name: str | None = None,
+        tool_name: str | None = None,
+        since: datetime | None = None,
+        after_id: str | None = None,
+        until: datetime | None = None,
+        limit: int = 200,
+        offset: int = 0,
+        ascending: bool = True,
+    ) -> list[Event]:
+        """List events for a job application with optional filtering and pagination."""
+        return await self.event_repository.list_events(
+            **_event_filters(
+                job_application_id,
+                event_name=event_name,
+                step=step,
+                status=status,
+                category_name=category_name,
+                tool_name=tool_name,
+                since=since,
+                after_id=after_id,
+                until=until,
+                limit=limit,
+                offset=offset,
+                ascending=ascending,
+            )
+        )
+
+    async def latest_for_step(
+        self, job_application_id: str, step: PipelineStep
+    ) -> Event | None:
+        """Get the latest event for a specific pipeline step of a job application."""
+        return await self.event_repository.get_latest_by_step(
+            job_application_id=job_application_id,
+            step=step.value,
+        )
+
+    async def clear_events(self, job_application_id: str) -> int:
+        """Clear all events for a job application."""
+        return await self.event_repository.delete_by_job_application(job_application_id)
+
+
+def _event_filters(
+    job_application_id: str,
+    *,
+    event_name: EventName | str | None,
+    step: PipelineStep | str | None,
+    status: EventStatus | str | None,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    return {
+        "job_application_id": job_application_id,
+        "event_name": (
+            event_name.value if isinstance(event_name, EventName) else event_name
+        ),
+        "step": step.value if isinstance(step, PipelineStep) else step,
+        "status": status.value if isinstance(status, EventStatus) else status,
+        **kwargs,
+    }
@@ -3,20 +3,36 @@
 This module provides the JobApplicationService class which handles all business logic
 related to job applications, including creation, retrieval, updates, and status management.
 It serves as an abstraction layer between the API endpoints and the data access layer.
+AsyncJobApplicationService offers the same operations on an async database session.
 """
 
 from datetime import datetime, UTC
 from logging import getLogger
+from typing import Any
 
 from sqlalchemy.orm.attributes import flag_modified
 
+from src.core.notifications import (
+    ChangeNotifier,
+    get_change_notifier,
+    job_application_channel,
+    user_channel,
+)
 from src.core.types import Resume
 from src.job_applications.model import JobApplication
+from src.job_applications.pagination import PageCursor
+from src.job_applications.search import SearchHit
 from src.job_applications.repositories.job_application_repository import (
+    AsyncJobApplicationRepository,
     JobApplicationRepository,
 )
+from src.job_applications.services.event_sink import (
+    aflush_event_sink,
+    flush_event_sink,
+)
 from src.job_applications.types import (
     DiscoveredCompanyProfile,
+    JobApplicationPreview,
     ResearchPlan,
     ResumeGenerationStatus,
     ResumesCreationStats,
@@ -32,9 +48,21 @@ class JobApplicationService:
     Uses JobApplicationRepository for data access and adds business logic layer.
     """
 
-    def __init__(self, job_application_repository: JobApplicationRepository):
+    def __init__(
+        self,
+        job_application_repository: JobApplicationRepository,
+        change_notifier: ChangeNotifier | None = None,
+    ):
         """Initialize the JobApplicationService with a JobApplicationRepository instance."""
         self.job_application_repository = job_application_repository
+        self.change_notifier = change_notifier or get_change_notifier()
+
+    def notify_change(self, job_application_id: str, **payload) -> None:
+        """Notify live subscribers that a job application has changed."""
+        self.change_notifier.publish(
+            job_application_channel(job_application_id),
+            {"type": "application", **payload},
+        )
 
     def create_job_application(
         self, application_data: JobApplication
@@ -92,39 +120,57 @@ class JobApplicationService:
         return self.job_application_repository.get_all()
 
     def list_paginated(
-        self, user_id: str, offset: int = 0, limit: int = 30
-    ) -> tuple[list[JobApplication], int]:
-        """List job applications with pagination.
+        self,
+        user_id: str,
+        offset: int = 0,
+        limit: int = 30,
+        *,
+        cursor: PageCursor | None = None,
+        with_total: bool = True,
+    ) -> tuple[list[JobApplicationPreview], int | None]:
+        """List previews of job applications with pagination.
 
         Args:
             user_id: the id of the authenticated user
             offset (int, optional): The number of job applications to skip. Defaults to 0.
             limit (int, optional): The maximum number of job applications to return. Defaults to 30.
+            cursor: Start after this position instead of skipping offset rows.
+            with_total: Whether to count all of the user's job applications.
 
         Returns:
-            Tuple[List[JobApplication], int]: A tuple containing the list of job applications and the total count
+            Tuple[List[JobApplicationPreview], int | None]: A tuple containing the previews of the job applications and the total count, None unless with_total
         """
         try:
             return self.job_application_repository.list_paginated(
-                user_id, offset, limit
+                user_id, offset, limit, cursor=cursor, with_total=with_total
             )
         except Exception as e:
             logger.error(f"Error listing paginated apps: {e}")
             raise e
 
     def search_job_applications(
-        self, user_id: str, search_term: str, offset: int = 0, limit: int = 100
-    ) -> tuple[list[JobApplication], int]:
-        """List job applications with names or descriptions that match a pattern using LIKE search."""
+        self,
+        user_id: str,
+        search_term: str,
+        offset: int = 0,
+        limit: int = 100,
+        *,
+        cursor: PageCursor | None = None,
+        with_total: bool = True,
+    ) -> tuple[list[SearchHit], int | None]:
+        """Search job applications by title, company and description, best match first."""
         try:
             return self.job_application_repository.search_job_applications(
-                user_id, search_term, offset, limit
+                user_id,
+                search_term,
+                offset,
+                limit,
+                cursor=cursor,
+                with_total=with_total,
             )
         except Exception as e:
-            logger.error(
-                f"Error searching job applications by name or description like '{search_term}': {e}"
-            )
-            return [], 0
+            logger.error(f"Error searching job applications for '{search_term}': {e}")
+            return [], 0 if with_total else None
 
     def delete_job_application(self, application_id: str) -> bool:
         """Delete a job application.
@@ -135,7 +181,10 @@ class JobApplicationService:
         Returns:
             True if the job application was deleted, False otherwise
         """
-        return self.job_application_repository.delete(application_id)
+        deleted = self.job_application_repository.delete(application_id)
+        if deleted:
+            self.notify_change(application_id, deleted=True)
+        return deleted
 
     def update_job_application(self, job_application: JobApplication):
         """Update an existing job application.
@@ -146,7 +195,15 @@ class JobApplicationService:
         Returns:
             The updated job application.
         """
-        return self.job_application_repository.update(job_application)
+        # Persist buffered pipeline events first so readers never observe an
+        # application state ahead of the events that led to it
+        flush_event_sink()
+        updated = self.job_application_repository.update(job_application)
+        self.notify_change(
+            job_application.id,
+            resume_generation_status=job_application.resume_generation_status,
+        )
+        return updated
 
     def update_company_profile_discovery_results(
         self, application_id: str, discovery_results: DiscoveredCompanyProfile
@@ -164,7 +221,7 @@ class JobApplicationService:
                 discovery_results.model_dump(mode="json")
             )
             flag_modified(job_application, "company_profile")
-            return self.job_application_repository.update(job_application)
+            return self.update_job_application(job_application)
         except Exception as e:
             logger.error(
                 f"ERROR: in JobApplicationService in update_company_profile_discovery_results: {str(e)}"
@@ -187,7 +244,7 @@ class JobApplicationService:
                 mode="json"
             )
             flag_modified(job_application, "company_profile")
-            return self.job_application_repository.update(job_application)
+            return self.update_job_application(job_application)
         except Exception as e:
             logger.error(
                 f"ERROR: in JobApplicationService in update_company_profile_research_plan: {str(e)}"
@@ -208,7 +265,7 @@ class JobApplicationService:
 
             job_application.company_profile["research_results"] = research_results
             flag_modified(job_application, "company_profile")
-            return self.job_application_repository.update(job_application)
+            return self.update_job_application(job_application)
         except Exception as e:
             logger.error(
                 f"ERROR: in JobApplicationService in update_company_profile_research_plan: {str(e)}"
@@ -236,7 +293,7 @@ class JobApplicationService:
 
             job_application.company_profile["research_results"][category_name] = results
             flag_modified(job_application, "company_profile")
-            return self.job_application_repository.update(job_application)
+            return self.update_job_application(job_application)
         except Exception as e:
             logger.error(
                 f"ERROR: in JobApplicationService in append_company_profile_category_research_results: {str(e)}"
@@ -319,24 +376,361 @@ class JobApplicationService:
         """Get statistics for resume creation for a user."""
         try:
             all_job_applications = self.job_application_repository.get_all(user_id)
+            return _compute_stats(all_job_applications)
+        except Exception as e:
+            logger.error(f"ERROR: in JobApplicationService in get_stats: {str(e)}")
+            raise e
+
+
+class AsyncJobApplicationService:
+    """Async counterpart of JobApplicationService, backed by AsyncJobApplicationRepository.
+
+    Used by the FastAPI routes and the graph nodes so database I/O does not
+    block the event loop.
+    """
+
+    def __init__(
+        self,
+        job_application_repository: AsyncJobApplicationRepository,
+        change_notifier: ChangeNotifier | None = None,
+    ):
+        """Initialize the AsyncJobApplicationService with an AsyncJobApplicationRepository instance."""
+        self.job_application_repository = job_application_repository
+        self.change_notifier = change_notifier or get_change_notifier()
+
+    def notify_change(self, job_application_id: str, **payload) -> None:
+        """Notify live subscribers that a job application has changed."""
+        self.change_notifier.publish(
+            job_application_channel(job_application_id),
+            {"type": "application", **payload},
+        )
+
+    async def create_job_application(
+        self, application_data: JobApplication
+    ) -> JobApplication:
+        """Create a new job application.
+
+        Args:
+            application_data: Job application data to register
+
+        Returns:
+            The created job application
+        """
+        job_application = await self.job_application_repository.create(application_data)
+        # Lets the user's live stream start following the new application
+        self.change_notifier.publish(
+            user_channel(job_application.user_id),
+            {"type": "application", "application_id": job_application.id},
+        )
+        return job_application
+
+    async def get_job_application(
+        self,
+        application_id: str,
+        *,
+        refresh: bool = False,
+        with_events: bool = False,
+    ) -> JobApplication | None:
+        """Get a job application by ID.
 
-            now = datetime.now(UTC)
-            created_this_month = [
-                app
-                for app in all_job_applications
-                if app.created_at.year == now.year and app.created_at.month == now.month
-            ]
-            completed = [
-                app
-                for app in all_job_applications
-                if app.resume_generation_status
-                == ResumeGenerationStatus.COMPLETED.value
-            ]
-            return ResumesCreationStats(
-                total_created=len(all_job_applications),
-                created_this_month=len(created_this_month),
-                completed=len(completed),
+        Args:
+            application_id: The ID of the job application to retrieve
+            refresh: If True, refresh the object from the database.
+            with_events: If True, eagerly load the related events.
+
+        Returns:
+            The job application if found, None otherwise
+        """
+        return await self.job_application_repository.get_by_id(
+            application_id, refresh=refresh, with_events=with_events
+        )
+
+    async def get_user_job_application(
+        self, application_id: str, user_id: str, *, refresh: bool = False
+    ) -> JobApplication | None:
+        """Get a job application by ID and user id.
+
+        Args:
+            application_id: The ID of the job application to retrieve
+            user_id: The ID of the user to whom the job application belong
+            refresh: If True, refresh the object from the database.
+
+        Returns:
+            The job application if found, None otherwise
+        """
+        return await self.job_application_repository.get_by_id_and_user(
+            application_id, user_id, refresh=refresh
+        )
+
+    async def list_active_job_application_ids(self, user_id: str) -> list[str]:
+        """List the IDs of a user's job applications still being generated.
+
+        Args:
+            user_id: the id of the authenticated user
+
+        Returns:
+            The IDs of the applications that are neither completed nor failed
+        """
+        return await self.job_application_repository.list_active_ids(user_id)
+
+    async def list_paginated(
+        self,
+        user_id: str,
+        offset: int = 0,
+        limit: int = 30,
+        *,
+        cursor: PageCursor | None = None,
+        with_total: bool = True,
+    ) -> tuple[list[JobApplicationPreview], int | None]:
+        """List previews of job applications with pagination.
+
+        Args:
+            user_id: the id of the authenticated user
+            offset (int, optional): The number of job applications to skip. Defaults to 0.
+            limit (int, optional): The maximum number of job applications to return. Defaults to 30.
+            cursor: Start after this position instead of skipping offset rows.
+            with_total: Whether to count all of the user's job applications.
+
+        Returns:
+            Tuple[List[JobApplicationPreview], int | None]: A tuple containing the previews of the job applications and the total count, None unless with_total
+        """
+        try:
+            return await self.job_application_repository.list_paginated(
+                user_id, offset, limit, cursor=cursor, with_total=with_total
             )
         except Exception as e:
-            logger.error(f"ERROR: in JobApplicationService in get_stats: {str(e)}")
+            logger.error(f"Error listing paginated apps: {e}")
             raise e
+
+    async def search_job_applications(
+        self,
+        user_id: str,
+        search_term: str,
+        offset: int = 0,
+        limit: int = 100,
+        *,
+        cursor: PageCursor | None = None,
+        with_total: bool = True,
+    ) -> tuple[list[SearchHit], int | None]:
+        """Search job applications by title, company and description, best match first."""
+        try:
+            return await self.job_application_repository.search_job_applications(
+                user_id,
+                search_term,
+                offset,
+                limit,
+                cursor=cursor,
+                with_total=with_total,
+            )
+        except Exception as e:
+            logger.error(f"Error searching job applications for '{search_term}': {e}")
+            return [], 0 if with_total else None
+
+    async def delete_job_application(self, application_id: str) -> bool:
+        """Delete a job application.
+
+        Args:
+            application_id: The ID of the job application to delete
+
+        Returns:
+            True if the job application was deleted, False otherwise
+        """
+        deleted = await self.job_application_repository.delete(application_id)
+        if deleted:
+            self.notify_change(application_id, deleted=True)
+        return deleted
+
+    async def update_job_application(self, job_application: JobApplication):
+        """Update an existing job application.
+
+        Args:
+            job_application: The job application object with updated data.
+
+        Returns:
+            The updated job application.
+        """
+        # Persist buffered pipeline events first so readers never observe an
+        # application state ahead of the events that led to it
+        await aflush_event_sink()
+        updated = await self.job_application_repository.update(job_application)
+        self.notify_change(
+            job_application.id,
+            resume_generation_status=job_application.resume_generation_status,
+        )
+        return updated
+
+    async def _get_existing(self, job_application_id: str) -> JobApplication:
+        job_application = await self.job_application_repository.get_by_id(
+            job_application_id
+        )
+        if not job_application:
+            raise Exception("No job application found with the given ID")
+        return job_application
+
+    async def _set_company_profile_entry(
+        self, application_id: str, key: str, value: Any, *, merge: bool = False
+    ) -> JobApplication:
+        # Research executors write their categories concurrently; the entry is
+        # set by one UPDATE rather than a read-modify-write of the profile
+        await aflush_event_sink()
+        if not await self.job_application_repository.set_company_profile_entry(
+            application_id, key, value, merge=merge
+        ):
+            raise Exception("No job application found with the given ID")
+        job_application = await self.job_application_repository.get_by_id(
+            application_id, refresh=True
+        )
+        self.notify_change(
+            application_id,
+            resume_generation_status=job_application.resume_generation_status,
+        )
+        return job_application
+
+    async def update_company_profile_discovery_results(
+        self, application_id: str, discovery_results: DiscoveredCompanyProfile
+    ):
+        """Update the company profile discovery results for a job application."""
+        try:
+            return await self._set_company_profile_entry(
+                application_id,
+                "company_discovery_results",
+                discovery_results.model_dump(mode="json"),
+            )
+        except Exception as e:
+            logger.error(
+                f"ERROR: in AsyncJobApplicationService in update_company_profile_discovery_results: {str(e)}"
+            )
+            raise e
+
+    async def update_company_profile_research_plan(
+        self, application_id: str, research_plan: ResearchPlan
+    ):
+        """Update the company profile research plan for a job application."""
+        try:
+            return await self._set_company_profile_entry(
+                application_id, "research_plan", research_plan.model_dump(mode="json")
+            )
+        except Exception as e:
+            logger.error(
+                f"ERROR: in AsyncJobApplicationService in update_company_profile_research_plan: {str(e)}"
+            )
+            raise e
+
+    async def update_company_profile_research_results(
+        self, application_id: str, research_results: dict[str, str]
+    ):
+        """Update the company profile research results for a job application."""
+        try:
+            return await self._set_company_profile_entry(
+                application_id, "research_results", research_results
+            )
+        except Exception as e:
+            logger.error(
+                f"ERROR: in AsyncJobApplicationService in update_company_profile_research_results: {str(e)}"
+            )
+            raise e
+
+    async def append_company_profile_category_research_results(
+        self, application_id: str, category_name: str, results: str
+    ):
+        """Append research results for a specific category in the company profile of a job application."""
+        try:
+            return await self._set_company_profile_entry(
+                application_id,
+                "research_results",
+                {category_name: results},
+                merge=True,
+            )
+        except Exception as e:
+            logger.error(
+                f"ERROR: in AsyncJobApplicationService in append_company_profile_category_research_results: {str(e)}"
+            )
+            raise e
+
+    async def update_job_application_status(
+        self, job_application_id: str, status: ResumeGenerationStatus
+    ):
+        """Update the resume generation status of a job application."""
+        try:
+            job_application = await self._get_existing(job_application_id)
+            job_application.resume_generation_status = status.value
+            return await self.update_job_application(job_application)
+        except Exception as e:
+            logger.error(
+                f"ERROR: in AsyncJobApplicationService in update_job_application_status: {str(e)}"
+            )
+            raise e
+
+    async def save_generated_resume(
+        self, job_application_id: str, generated_resume: Resume
+    ):
+        """Save the generated resume for a job application."""
+        try:
+            job_application = await self._get_existing(job_application_id)
+            job_application.generated_resume = generated_resume.model_dump(mode="json")
+            return await self.update_job_application(job_application)
+        except Exception as e:
+            logger.error(
+                f"ERROR: in AsyncJobApplicationService in save_generated_resume: {str(e)}"
+            )
+            raise e
+
+    async def save_resume_strategy_brief(
+        self, job_application_id: str, strategy_brief: ResumeStrategyBrief
+    ):
+        """Save the resume strategy brief for a job application."""
+        try:
+            job_application = await self._get_existing(job_application_id)
+            job_application.resume_strategy_brief = strategy_brief.model_dump(
+                mode="json"
+            )
+            return await self.update_job_application(job_application)
+        except Exception as e:
+            logger.error(
+                f"ERROR: in AsyncJobApplicationService in save_resume_strategy_brief: {str(e)}"
+            )
+            raise e
+
+    async def save_generated_cover_letter(
+        self, job_application_id: str, generated_cover_letter: str
+    ):
+        """Save the generated cover letter for a job application."""
+        try:
+            job_application = await self._get_existing(job_application_id)
+            job_application.generated_cover_letter = generated_cover_letter
+            return await self.update_job_application(job_application)
+        except Exception as e:
+            logger.error(
+                f"ERROR: in AsyncJobApplicationService in save_generated_cover_letter: {str(e)}"
+            )
+            raise e
+
+    async def get_stats(self, user_id: str) -> ResumesCreationStats:
+        """Get statistics for resume creation for a user."""
+        try:
+            all_job_applications = await self.job_application_repository.get_all(
+                user_id
+            )
+            return _compute_stats(all_job_applications)
+        except Exception as e:
+            logger.error(f"ERROR: in AsyncJobApplicationService in get_stats: {str(e)}")
+            raise e
+
+
+def _compute_stats(job_applications: list[JobApplication]) -> ResumesCreationStats:
+    now = datetime.now(UTC)
+    created_this_month = [
+        app
+        for app in job_applications
+        if app.created_at.year == now.year and app.created_at.month == now.month
+    ]
+    completed = [
+        app
+        for app in job_applications
+        if app.resume_generation_status == ResumeGenerationStatus.COMPLETED.value
+    ]
+    return ResumesCreationStats(
+        total_created=len(job_applications),
+        created_this_month=len(created_this_month),
+        completed=len(completed),
+    )
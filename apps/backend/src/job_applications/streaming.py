@@ -0,0 +1,158 @@
+"""Serialization helpers for streaming job application updates over SSE.
+
+This module provides:
+- serialize_event / serialize_job_application: JSON-ready payloads for SSE frames
+- application_fields: the top-level job application fields carried in delta frames
+- field_fingerprints / changed_fields: cheap change detection between frames
+- EventCursor: the SSE event id used to resume a delta stream after a reconnect
+- format_sse: formatting of a single SSE frame
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from src.job_applications.model import Event, JobApplication
+
+SNAPSHOT_EVENT = "application.snapshot"
+DELTA_EVENT = "application.delta"
+
+
+def serialize_event(ev: Event) -> dict[str, Any]:
+    """Serialize an event row for an SSE payload."""
+    return {
+        "id": ev.id,
+        "job_application_id": ev.job_application_id,
+        "event_name": ev.event_name,
+        "status": ev.status,
+        "step": ev.step,
+        "category_name": ev.category_name,
+        "tool_name": ev.tool_name,
+        "iteration": ev.iteration,
+        "message": ev.message,
+        "data": ev.data,
+        "error": ev.error,
+        "created_at": ev.created_at.isoformat() if ev.created_at else None,
+    }
+
+
+def application_fields(app: JobApplication) -> dict[str, Any]:
+    """Return the top-level fields of a job application, without its events."""
+    return {
+        "id": app.id,
+        "job_title": app.job_title,
+        "company_name": app.company_name,
+        "job_description": app.job_description,
+        "background_task_id": app.background_task_id,
+        "resume_generation_status": (
+            app.resume_generation_status if app.resume_generation_status else None
+        ),
+        "company_profile": app.company_profile,
+        "generated_resume": app.generated_resume,
+        "resume_strategy_brief": app.resume_strategy_brief,
+        "original_resume_snapshot": app.original_resume_snapshot,
+        "generated_cover_letter": app.generated_cover_letter,
+        "created_at": app.created_at.isoformat() if app.created_at else None,
+        "updated_at": app.updated_at.isoformat() if app.updated_at else None,
+    }
+
+
+def serialize_job_application(
+    app: JobApplication, events_limit: int | None = None
+) -> dict[str, Any]:
+    """Serialize a job application and its most recent events for a snapshot frame."""
+    # Events are ordered ascending; keep the most recent ones to bound the payload
+    evs = app.events or []
+    if events_limit and len(evs) > events_limit:
+        evs = evs[-events_limit:]
+    return {
+        **application_fields(app),
+        "events": [serialize_event(e) for e in evs],
+    }
+
+
+def field_fingerprints(fields: dict[str, Any]) -> dict[str, str]:
+    """Hash each field value so later frames can detect which fields changed."""
+    return {
+        name: hashlib.blake2b(
+            json.dumps(value, sort_keys=True, default=str).encode(), digest_size=16
+        ).hexdigest()
+        for name, value in fields.items()
+        if name != "events"
+    }
+
+
+def changed_fields(
+    fields: dict[str, Any], previous_fingerprints: dict[str, str]
+) -> tuple[dict[str, Any], dict[str, str]]:
+    """Return the fields whose value changed and the fingerprints of the new values."""
+    fingerprints = field_fingerprints(fields)
+    changed = {
+        name: fields[name]
+        for name, fingerprint in fingerprints.items()
+        if previous_fingerprints.get(name) != fingerprint
+    }
+    return changed, fingerprints
+
+
+@dataclass
+class EventCursor:
+    """Position of a client in a delta stream.
+
+    Encodes the last delivered event (created_at and id) and the updated_at of
+    the job application at the time of the frame, so a reconnecting client only
+    receives the events it missed and, if the application changed meanwhile,
+    its top-level fields.
+    """
+
+    event_created_at: datetime | None = None
+    event_id: str | None = None
+    application_updated_at: datetime | None = None
+
+    def encode(self) -> str:
+        """Encode the cursor as an SSE event id."""
+        return "|".join(
+            [
+                self.event_created_at.isoformat() if self.event_created_at else "",
+                self.event_id or "",
+                (
+                    self.application_updated_at.isoformat()
+                    if self.application_updated_at
+                    else ""
+                ),
+            ]
+        )
+
+    @classmethod
+    def decode(cls, value: str | None) -> "EventCursor | None":
+        """Decode an SSE event id produced by encode, returning None if invalid."""
+        if not value:
+            return None
+        parts = value.split("|")
+        if len(parts) != 3:
+            return None
+        try:
+            return cls(
+                event_created_at=datetime.fromisoformat(parts[0]) if parts[0] else None,
+                event_id=parts[1] or None,
+                application_updated_at=(
+                    datetime.fromisoformat(parts[2]) if parts[2] else None
+                ),
+            )
+        except ValueError:
+            return None
+
+    def advance(self, events: list[Event]) -> None:
+        """Move the cursor past the given events (ordered by created_at, id)."""
+        if events:
+            self.event_created_at = events[-1].created_at
+            self.event_id = events[-1].id
+
+
+def format_sse(
+    evt_id: str, payload: dict[str, Any], event: str = SNAPSHOT_EVENT
+) -> str:
+    """Format a single SSE frame."""
+    return f"id: {evt_id}\nevent: {event}\ndata: {json.dumps(payload, default=str)}\n\n"
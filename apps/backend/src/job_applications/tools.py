@@ -2,17 +2,29 @@
 
 This module provides tools for:
 - company_discovery_tool: Multi-stage company discovery with web search
-- scraping_tool: Intelligent web scraping and content summarization
+- scraping_tool: Intelligent web scraping and content summarization; pages are
+  reduced to the sections relevant to the requested data points before summarizing
+- tavily_search / scrape_page_markdown: Tavily and Firecrawl calls served from the
+  response cache (see src.core.cache) when the same query or URL was fetched recently
 """
 
+import asyncio
+import functools
+import json
 import logging
 import os
+from typing import Any
 
 from langchain_core.tools import tool
 from langchain_tavily import TavilySearch
 from pydantic import BaseModel
 
+from src.core.cache import get_response_cache, normalize_query, normalize_url
 from src.core.constants import MODEL_NAME
+from src.core.rate_limit_handlers import get_rate_limiter, retry_with_backoff
+from src.core.token_utils import estimate_message_tokens
+from src.integrations.firecrawl import get_firecrawl_client
+from src.job_applications.page_reducer import reduce_page
 from src.job_applications.prompts.company_profiler import (
     smart_scraper_summarizer_system_prompt,
 )
@@ -27,6 +39,73 @@ if tavily_api_key:
 else:
     logger.warning("TAVILY_API_KEY not found. Tavily search tool will be disabled.")
 
+TAVILY_CACHE_TTL_SECONDS = float(os.getenv("TAVILY_CACHE_TTL_SECONDS", "86400"))
+FIRECRAWL_CACHE_TTL_SECONDS = float(os.getenv("FIRECRAWL_CACHE_TTL_SECONDS", "259200"))
+
+
+async def tavily_search(tool_input: str | dict[str, Any]) -> Any:
+    """Run a Tavily search, reusing a cached response for the same query.
+
+    Only cache misses reach Tavily, so only they draw from the Tavily rate limit.
+
+    Args:
+        tool_input: A query string, or the arguments of a tavily_tool call
+
+    Returns:
+        The Tavily response, as returned by tavily_tool.ainvoke
+    """
+    args = {"query": tool_input} if isinstance(tool_input, str) else dict(tool_input)
+    key_args = {**args, "query": normalize_query(str(args.get("query", "")))}
+
+    async def search() -> Any:
+        async with get_rate_limiter("tavily"):
+            return await tavily_tool.ainvoke(tool_input)
+
+    return await get_response_cache().get_or_set(
+        "tavily",
+        json.dumps(key_args, sort_keys=True, default=str),
+        search,
+        TAVILY_CACHE_TTL_SECONDS,
+        should_cache=lambda result: isinstance(result, dict) and "error" not in result,
+    )
+
+
+async def scrape_page_markdown(url: str) -> str:
+    """Scrape a page as markdown with Firecrawl, reusing a cached scrape of the same URL."""
+
+    async def scrape() -> str:
+        async with get_rate_limiter("firecrawl"):
+            return await get_firecrawl_client().scrape_markdown(url)
+
+    return await get_response_cache().get_or_set(
+        "firecrawl",
+        normalize_url(url),
+        scrape,
+        FIRECRAWL_CACHE_TTL_SECONDS,
+        should_cache=bool,
+    )
+
+
+@functools.cache
+def _get_summarizer_model():
+    """Return the model shared by every scraping_tool call in this process."""
+    from langchain_mistralai import ChatMistralAI
+
+    return ChatMistralAI(model=MODEL_NAME)
+
+
+def _finds_official_website(company_name: str, search_results: Any) -> bool:
+    """Whether a search response links to what looks like the company's own domain."""
+    if not isinstance(search_results, dict):
+        return False
+    compact_name = company_name.lower().replace(" ", "")
+    return any(
+        domain in result.get("url", "")
+        for result in search_results.get("results") or []
+        for domain in [".com", ".org", ".io", ".ai"]
+        if compact_name in result.get("url", "")
+    )
+
 
 @tool
 async def company_discovery_tool(company_name: str, additional_context: str = ""):
@@ -47,24 +126,32 @@ async def company_discovery_tool(company_name: str, additional_context: str = ""
         f"{company_name} about us",
     ]
 
-    results = {}
-    for query in search_queries:
+    async def search(query: str) -> tuple[str, Any]:
         try:
-            search_results = await tavily_tool.ainvoke(query)
-            results[query] = search_results
-            # If we find a promising official website, prioritize it
-            if any(
-                domain in result.get("url", "")
-                for result in search_results.get("results")
-                for domain in [".com", ".org", ".io", ".ai"]
-                if company_name.lower().replace(" ", "") in result.get("url", "")
-            ):
-                break
+            return query, await tavily_search(query)
         except Exception as e:
             logger.warning(f"Search failed for query '{query}': {e}")
-            continue
+            return query, None
 
-    return results
+    # Queries run concurrently; the first one that finds the official website
+    # cancels the ones still in flight
+    tasks = [asyncio.create_task(search(query)) for query in search_queries]
+    results = {}
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            query, search_results = await next_done
+            if search_results is None:
+                continue
+            results[query] = search_results
+            if _finds_official_website(company_name, search_results):
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    # Same order as the sequential implementation
+    return {query: results[query] for query in search_queries if query in results}
 
 
 @tool
@@ -80,22 +167,25 @@ async def scraping_tool(url: str, data_to_extract: list[str]):
         str: A concise summary of the web page content, with the requested
              data points highlighted and extracted.
     """
-    from firecrawl import FirecrawlApp
     from langchain_core.messages import HumanMessage, SystemMessage
-    from langchain_mistralai import ChatMistralAI
 
     try:
-        firecrawl_app = FirecrawlApp()
-        scrape_result = firecrawl_app.scrape_url(url, formats=["markdown"])
-        model = ChatMistralAI(model=MODEL_NAME)
-        response = await model.ainvoke(
-            [
-                SystemMessage(content=smart_scraper_summarizer_system_prompt),
-                HumanMessage(
-                    content=f"DATA POINTS: {data_to_extract} \n\n\n PAGE CONTENT: \n {scrape_result.markdown}"
-                ),
-            ]
-        )
+        page_markdown = await scrape_page_markdown(url)
+        # Only the sections relevant to the data points are summarized
+        page_content = reduce_page(page_markdown, data_to_extract)
+        messages = [
+            SystemMessage(content=smart_scraper_summarizer_system_prompt),
+            HumanMessage(
+                content=f"DATA POINTS: {data_to_extract} \n\n\n PAGE CONTENT: \n {page_content}"
+            ),
+        ]
+        # Shares the Mistral budget of the agents calling this tool
+        async with get_rate_limiter("mistral", MODEL_NAME).limit(
+            tokens=estimate_message_tokens(messages)
+        ):
+            response = await retry_with_backoff(
+                lambda: _get_summarizer_model().ainvoke(messages)
+            )
         return response.content
     except Exception as e:
         message = f"ERROR: failed to scrape content from the provided URL {str(e)}"
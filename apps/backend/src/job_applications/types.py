@@ -5,6 +5,7 @@ This module contains:
 - Data models for company profiles, research plans, and company characteristics
 - Request/response models for job application workflows
 - Evaluation models for generated resumes and cover letters
+- Revision models: targeted edits applied to a previous resume or cover letter draft
 """
 
 import ast
@@ -12,7 +13,7 @@ import json
 import re
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -64,6 +65,17 @@ class PipelineStep(Enum):
     COVER_LETTER_EVALUATION = "cover_letter_evaluation"
 
 
+class DraftLoopStopReason(Enum):
+    """Enum representing why a generator/evaluator loop stopped."""
+
+    GRADE_THRESHOLD_REACHED = "grade_threshold_reached"
+    MAX_ROUNDS_REACHED = "max_rounds_reached"
+    NO_CHANGES_REQUESTED = "no_changes_requested"
+    GRADE_PLATEAU = "grade_plateau"
+    TOKEN_BUDGET_EXHAUSTED = "token_budget_exhausted"
+    TIME_BUDGET_EXHAUSTED = "time_budget_exhausted"
+
+
 class ResearchCategory(BaseModel):
     """Model representing a research category within a research plan."""
 
@@ -435,3 +447,64 @@ class ResumeGenerationOutput(BaseModel):
         ...,
         description="The strategy brief summarising top keywords and key narrative changes.",
     )
+
+
+class ResumeEdit(BaseModel):
+    """Model representing one targeted edit to a resume draft."""
+
+    path: str = Field(
+        ...,
+        description=(
+            "Location of the edited value in the PREVIOUS GENERATED VERSION JSON, "
+            "with dots between fields and [index] for list items, e.g. "
+            "'personal_info.summary', 'work_experiences[1].responsibilities', "
+            "'skills' or 'projects[0]'."
+        ),
+    )
+    operation: Literal["set", "append", "remove"] = Field(
+        "set",
+        description=(
+            "'set' replaces the value at path, 'append' adds value to the list at "
+            "path, 'remove' deletes the list item at path."
+        ),
+    )
+    value: str | None = Field(
+        None,
+        description=(
+            "The new value: plain text for text fields, JSON for lists and objects. "
+            "Omitted for 'remove'."
+        ),
+    )
+
+
+class ResumeRevisionOutput(BaseModel):
+    """Model representing a revision of a resume draft as targeted edits."""
+
+    edits: list[ResumeEdit] = Field(
+        ...,
+        description="The edits addressing the requested changes; unchanged parts are not repeated.",
+    )
+    strategy_brief: ResumeStrategyBrief | None = Field(
+        None,
+        description="The updated strategy brief, only when the revision changes it.",
+    )
+
+
+class CoverLetterEdit(BaseModel):
+    """Model representing one targeted edit to a cover letter draft."""
+
+    find: str = Field(
+        ...,
+        description="An exact excerpt of the PREVIOUS GENERATED VERSION to replace, such as a sentence or paragraph.",
+    )
+    replace: str = Field(
+        ..., description="The text replacing the excerpt; empty to delete it."
+    )
+
+
+class CoverLetterRevisionOutput(BaseModel):
+    """Model representing a revision of a cover letter draft as targeted edits."""
+
+    edits: list[CoverLetterEdit] = Field(
+        ..., description="The edits addressing the requested changes."
+    )
@@ -4,6 +4,7 @@ This module sets up the FastAPI application with CORS middleware and includes
 routers for authentication, user management, and job applications.
 """
 
+import contextlib
 import logging
 import os
 
@@ -11,6 +12,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.auth.router import auth_router
+from src.core.instrumentation import API_METRICS_PORT, start_metrics_server
 from src.job_applications.router import job_application_router
 from src.user.router import user_router
 
@@ -22,7 +24,18 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-app = FastAPI(title="Template API", version="0.0.1")
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Serve the Prometheus metrics on an internal port while the app runs.
+
+    The metrics are kept off the public API; the pipeline metrics are served by
+    the Celery worker.
+    """
+    start_metrics_server(API_METRICS_PORT)
+    yield
+
+
+app = FastAPI(title="Template API", version="0.0.1", lifespan=lifespan)
 
 # Add CORS middleware
 app.add_middleware(
@@ -0,0 +1 @@
+"""Benchmarks test package."""
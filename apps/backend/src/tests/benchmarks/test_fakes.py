@@ -0,0 +1,106 @@
+"""Tests for the pipeline benchmark harness.
+
+This module contains unit tests for the fake chat model, the node metrics
+callback and the baseline comparison, none of which need a database.
+"""
+
+import asyncio
+
+from langchain_core.messages import HumanMessage
+from langgraph.graph import END, START, StateGraph
+from pydantic import BaseModel
+
+from src.benchmarks.fakes import BenchmarkScenario, FakeChatModel, ProviderCalls
+from src.benchmarks.metrics import NodeMetricsCallback
+from src.benchmarks.pipeline import compare_with_baseline
+from src.job_applications.types import (
+    GeneratedResumeEvaluation,
+    ResearchPlan,
+    ResumeGenerationOutput,
+)
+
+
+def _model(**scenario) -> FakeChatModel:
+    return FakeChatModel(
+        scenario=BenchmarkScenario(**scenario), provider_calls=ProviderCalls()
+    )
+
+
+def test_structured_output_is_schema_valid_and_follows_the_scenario():
+    """Test that structured output validates and grades follow the scenario."""
+    model = _model(research_categories=3, resume_grades=(70, 95))
+
+    async def run():
+        plan = await model.with_structured_output(ResearchPlan).ainvoke("plan")
+        resume = await model.with_structured_output(ResumeGenerationOutput).ainvoke(
+            "resume"
+        )
+        evaluator = model.with_structured_output(GeneratedResumeEvaluation)
+        grades = [(await evaluator.ainvoke("grade")).grade for _ in range(3)]
+        return plan, resume, grades
+
+    plan, resume, grades = asyncio.run(run())
+
+    assert len(plan.research_categories) == 3
+    assert resume.resume.email == "candidate@example.com"
+    assert grades == [70, 95, 95]
+    assert model.provider_calls.llm == 5
+
+
+def test_node_metrics_attribute_llm_calls_to_nodes():
+    """Test that node runs are timed and LLM calls counted per node."""
+
+    class State(BaseModel):
+        """State of the test graph."""
+
+        text: str = ""
+
+    model = _model()
+
+    async def ask(state: State):
+        response = await model.ainvoke([HumanMessage(content="x" * 400)])
+        return {"text": response.content}
+
+    def done(state: State):
+        return {}
+
+    builder = StateGraph(State)
+    builder.add_node("ask", ask)
+    builder.add_node("done", done)
+    builder.add_edge(START, "ask")
+    builder.add_edge("ask", "done")
+    builder.add_edge("done", END)
+    callback = NodeMetricsCallback()
+
+    asyncio.run(builder.compile().ainvoke(State(), config={"callbacks": [callback]}))
+    metrics = callback.to_dict()
+
+    assert metrics["llm_calls"] == 1
+    assert metrics["nodes"]["ask"]["runs"] == 1
+    assert metrics["nodes"]["ask"]["llm_calls"] == 1
+    assert metrics["nodes"]["ask"]["prompt_tokens"] >= 100
+    assert metrics["nodes"]["done"]["runs"] == 1
+    assert metrics["nodes"]["done"]["llm_calls"] == 0
+
+
+def test_compare_with_baseline_reports_only_regressions():
+    """Test that counters beyond the tolerance are reported as regressions."""
+    baseline = {
+        "llm_calls": 20,
+        "prompt_tokens": 10000,
+        "db_statements": 100,
+        "db_commits": 30,
+        "wall_seconds": {"median": 2.0},
+    }
+    summary = {
+        "llm_calls": 21,
+        "prompt_tokens": 12000,
+        "db_statements": 90,
+        "db_commits": 30,
+        "wall_seconds": {"median": 2.5},
+    }
+
+    regressions = compare_with_baseline(summary, baseline, tolerance=0.1)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("prompt_tokens")
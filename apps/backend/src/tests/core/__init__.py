@@ -0,0 +1 @@
+"""Core test package."""
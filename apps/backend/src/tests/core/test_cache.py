@@ -0,0 +1,103 @@
+"""Tests for the response cache.
+
+This module contains unit tests for the in-memory LRU cache, its hit and miss
+counters and their Prometheus export, the key normalization helpers and the in-memory fallback used when
+Redis cannot be reached.
+"""
+
+import asyncio
+
+from prometheus_client import REGISTRY
+
+from src.core.cache import (
+    InMemoryResponseCache,
+    RedisResponseCache,
+    normalize_query,
+    normalize_url,
+)
+
+
+def _sample(name: str, namespace: str) -> float:
+    return REGISTRY.get_sample_value(name, {"namespace": namespace}) or 0.0
+
+
+def test_get_or_set_counts_hits_and_misses():
+    """Test that the factory only runs on a miss and outcomes are counted."""
+    cache = InMemoryResponseCache()
+    hits_before = _sample("resumind_response_cache_hits_total", "tavily")
+    misses_before = _sample("resumind_response_cache_misses_total", "tavily")
+    calls = []
+
+    async def factory():
+        calls.append(1)
+        return {"results": [1]}
+
+    async def run():
+        first = await cache.get_or_set("tavily", "q", factory, ttl=60)
+        second = await cache.get_or_set("tavily", "q", factory, ttl=60)
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first == second == {"results": [1]}
+    assert len(calls) == 1
+    assert cache.stats() == {"tavily": {"hits": 1, "misses": 1}}
+    assert _sample("resumind_response_cache_hits_total", "tavily") == hits_before + 1
+    assert (
+        _sample("resumind_response_cache_misses_total", "tavily") == misses_before + 1
+    )
+
+
+def test_in_memory_cache_evicts_least_recently_used_and_expired_entries():
+    """Test size based eviction in LRU order and TTL expiry."""
+    cache = InMemoryResponseCache(max_entries=2)
+
+    async def run():
+        await cache.set("firecrawl", "a", "A", ttl=60)
+        await cache.set("firecrawl", "b", "B", ttl=60)
+        await cache.get("firecrawl", "a")
+        await cache.set("firecrawl", "c", "C", ttl=60)
+        await cache.set("firecrawl", "d", "D", ttl=0)
+        return [await cache.get("firecrawl", key) for key in "abcd"]
+
+    assert asyncio.run(run()) == [None, None, "C", None]
+
+
+def test_should_cache_skips_error_responses():
+    """Test that rejected values are returned but not stored."""
+    cache = InMemoryResponseCache()
+
+    async def run():
+        await cache.get_or_set(
+            "tavily",
+            "q",
+            lambda: asyncio.sleep(0, result={"error": "quota"}),
+            ttl=60,
+            should_cache=lambda result: "error" not in result,
+        )
+        return await cache.get("tavily", "q")
+
+    assert asyncio.run(run()) is None
+
+
+def test_normalizers_map_equivalent_requests_to_one_key():
+    """Test that formatting differences do not split cache entries."""
+    assert normalize_query("  Acme   Careers ") == normalize_query("acme careers")
+    assert (
+        normalize_url("HTTPS://Acme.com/about/?b=2&utm_source=x&a=1#team")
+        == normalize_url("acme.com/about?a=1&b=2")
+        == "https://acme.com/about?a=1&b=2"
+    )
+
+
+def test_redis_cache_falls_back_to_memory_when_unreachable():
+    """Test that an unreachable Redis degrades to the in-process cache."""
+    fallback = InMemoryResponseCache()
+    cache = RedisResponseCache("redis://127.0.0.1:1/0", fallback=fallback)
+
+    async def run():
+        await cache.set("tavily", "q", {"results": []}, ttl=60)
+        return await cache.get("tavily", "q")
+
+    assert asyncio.run(run()) == {"results": []}
+    assert "tavily" in fallback._entries
@@ -0,0 +1,135 @@
+"""Tests for the pipeline instrumentation.
+
+This module contains unit tests for node and tool spans, verifying that
+measurements taken in tool calls roll up into their node, reach the data of
+terminal events and are exported as Prometheus metrics.
+"""
+
+import asyncio
+
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+from prometheus_client import REGISTRY
+
+from src.core.instrumentation import (
+    LLMUsageCallback,
+    instrument_node,
+    instrument_tool,
+)
+from src.core.rate_limit_handlers import (
+    InMemoryTokenBucketStore,
+    TokenBucketRateLimiter,
+)
+from src.job_applications.services.events_service import EventService
+from src.job_applications.types import EventName, EventStatus
+
+
+def _llm_result(prompt_tokens: int, completion_tokens: int) -> LLMResult:
+    message = AIMessage(
+        content="ok",
+        usage_metadata={
+            "input_tokens": prompt_tokens,
+            "output_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        },
+    )
+    return LLMResult(generations=[[ChatGeneration(message=message)]])
+
+
+def _sample(name: str, labels: dict[str, str]) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_tool_measurements_roll_up_into_the_node_and_its_events():
+    """Test that gathered tool spans add their LLM usage to the node span."""
+    callback = LLMUsageCallback()
+    events = {}
+    tokens_before = _sample(
+        "resumind_llm_tokens_total", {"node": "test/node", "kind": "prompt"}
+    )
+
+    async def call_tool(name: str, failed: bool):
+        async with instrument_tool(name) as span:
+            callback.on_llm_end(_llm_result(100, 10))
+            if failed:
+                span.status = "error"
+            events[name] = EventService.build_event(
+                job_application_id="application",
+                event_name=EventName.TOOL_EXECUTION,
+                status=EventStatus.FAILED if failed else EventStatus.SUCCEEDED,
+                data={"kept": True},
+            )
+
+    @instrument_node("test/node")
+    async def node():
+        await asyncio.gather(call_tool("search", False), call_tool("scrape", True))
+        return EventService.build_event(
+            job_application_id="application",
+            event_name=EventName.PIPELINE_STEP,
+            status=EventStatus.SUCCEEDED,
+        )
+
+    node_event = asyncio.run(node())
+
+    assert events["search"].data["kept"] is True
+    assert events["search"].data["metrics"]["prompt_tokens"] == 100
+    assert events["scrape"].data["metrics"]["completion_tokens"] == 10
+    assert node_event.data["metrics"]["llm_calls"] == 2
+    assert node_event.data["metrics"]["prompt_tokens"] == 200
+    assert (
+        _sample("resumind_llm_tokens_total", {"node": "test/node", "kind": "prompt"})
+        - tokens_before
+        == 200
+    )
+    assert (
+        _sample(
+            "resumind_pipeline_tool_duration_seconds_count",
+            {"tool": "scrape", "status": "error"},
+        )
+        >= 1
+    )
+
+
+def test_started_events_and_events_outside_spans_carry_no_metrics():
+    """Test that only terminal events emitted inside a span get metrics."""
+
+    @instrument_node("test/started")
+    def node():
+        return EventService.build_event(
+            job_application_id="application",
+            event_name=EventName.PIPELINE_STEP,
+            status=EventStatus.STARTED,
+        )
+
+    outside = EventService.build_event(
+        job_application_id="application",
+        event_name=EventName.PIPELINE_STEP,
+        status=EventStatus.SUCCEEDED,
+    )
+
+    assert node().data is None
+    assert outside.data is None
+
+
+def test_rate_limiter_wait_is_recorded_in_the_node():
+    """Test that time waited on a rate limiter is attributed to the node."""
+    limiter = TokenBucketRateLimiter(
+        "test:instrumentation", 20.0, burst=1, store=InMemoryTokenBucketStore()
+    )
+
+    @instrument_node("test/limited")
+    async def node():
+        async with limiter:
+            pass
+        async with limiter:
+            pass
+        return EventService.build_event(
+            job_application_id="application",
+            event_name=EventName.PIPELINE_STEP,
+            status=EventStatus.SUCCEEDED,
+        )
+
+    metrics = asyncio.run(node()).data["metrics"]
+
+    assert metrics["rate_limit_wait_ms"] > 0
+    assert metrics["duration_ms"] >= metrics["rate_limit_wait_ms"]
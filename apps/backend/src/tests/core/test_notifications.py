@@ -0,0 +1,48 @@
+"""Tests for the change notifier.
+
+This module contains unit tests for the InMemoryChangeNotifier, verifying that
+subscribers are woken by publishes on their channels only.
+"""
+
+import asyncio
+
+from src.core.notifications import (
+    InMemoryChangeNotifier,
+    job_application_channel,
+)
+
+
+def test_in_memory_notifier_delivers_to_subscribed_channel():
+    """Test that a publish wakes subscribers of the same channel only."""
+    notifier = InMemoryChangeNotifier()
+    channel = job_application_channel("app-1")
+
+    async def run():
+        async with notifier.subscribe(channel) as subscription:
+            notifier.publish(job_application_channel("app-2"), {"type": "events"})
+            notifier.publish(channel, {"type": "application"})
+            notification = await subscription.get(timeout=1)
+            missing = await subscription.get(timeout=0.05)
+            return notification, missing
+
+    notification, missing = asyncio.run(run())
+    assert notification.channel == channel
+    assert notification.payload == {"type": "application"}
+    assert missing is None
+
+
+def test_in_memory_notifier_drain_and_unsubscribe():
+    """Test that drain returns pending notifications and exit unsubscribes."""
+    notifier = InMemoryChangeNotifier()
+    channel = job_application_channel("app-1")
+
+    async def run():
+        async with notifier.subscribe(channel) as subscription:
+            for i in range(3):
+                notifier.publish(channel, {"i": i})
+            await asyncio.sleep(0)
+            return await subscription.drain()
+
+    pending = asyncio.run(run())
+    assert [n.payload["i"] for n in pending] == [0, 1, 2]
+    assert notifier._subscribers == {}
@@ -0,0 +1,126 @@
+"""Tests for the token bucket rate limiters.
+
+This module contains unit tests for the in-memory token bucket store, the
+request and token budgets of TokenBucketRateLimiter, the charging of the
+reported token usage and the in-memory fallback used when Redis cannot be
+reached.
+"""
+
+import asyncio
+
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+
+from src.core.rate_limit_handlers import (
+    InMemoryTokenBucketStore,
+    RedisTokenBucketStore,
+    TokenBucketRateLimiter,
+    TokenUsageCallback,
+)
+from src.core.token_utils import estimate_message_tokens
+
+
+def test_in_memory_bucket_reserves_beyond_capacity_with_a_wait():
+    """Test that an empty bucket still grants the reservation but returns a wait."""
+    store = InMemoryTokenBucketStore()
+
+    async def run():
+        first = await store.reserve("mistral", 1, rate=2.0, capacity=1)
+        second = await store.reserve("mistral", 1, rate=2.0, capacity=1)
+        third = await store.reserve("mistral", 1, rate=2.0, capacity=1)
+        return first, second, third
+
+    first, second, third = asyncio.run(run())
+
+    assert first == 0
+    assert 0.45 < second <= 0.5
+    assert 0.95 < third <= 1.0
+
+
+def test_limiter_waits_for_the_token_budget(monkeypatch):
+    """Test that a request within the rate still waits when tokens run out."""
+    slept = []
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    limiter = TokenBucketRateLimiter(
+        "mistral:test",
+        requests_per_second=100,
+        tokens_per_minute=600,
+        store=InMemoryTokenBucketStore(),
+    )
+
+    async def run():
+        async with limiter.limit(tokens=600):
+            pass
+        async with limiter.limit(tokens=60):
+            pass
+
+    asyncio.run(run())
+
+    assert len(slept) == 1
+    assert 5.5 < slept[0] <= 6.0
+
+
+def test_limiter_charges_reported_usage_beyond_the_estimate(monkeypatch):
+    """Test that completion tokens reported by the provider are charged on exit."""
+    slept = []
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    limiter = TokenBucketRateLimiter(
+        "mistral:usage",
+        requests_per_second=100,
+        tokens_per_minute=600,
+        store=InMemoryTokenBucketStore(),
+    )
+    message = AIMessage(
+        content="ok",
+        usage_metadata={
+            "input_tokens": 100,
+            "output_tokens": 500,
+            "total_tokens": 600,
+        },
+    )
+
+    async def run():
+        async with limiter.limit(tokens=100):
+            TokenUsageCallback().on_llm_end(
+                LLMResult(generations=[[ChatGeneration(message=message)]])
+            )
+        async with limiter.limit(tokens=60):
+            pass
+
+    asyncio.run(run())
+
+    # The first call used the whole minute budget, not only its 100 estimated
+    assert len(slept) == 1
+    assert 5.5 < slept[0] <= 6.0
+
+
+def test_redis_store_falls_back_to_memory_when_unreachable():
+    """Test that an unreachable Redis degrades to in-process limits."""
+    fallback = InMemoryTokenBucketStore()
+    store = RedisTokenBucketStore("redis://127.0.0.1:1/0", fallback=fallback)
+
+    async def run():
+        return [
+            await store.reserve("tavily", 1, rate=1.0, capacity=1) for _ in range(2)
+        ]
+
+    waits = asyncio.run(run())
+
+    assert waits[0] == 0
+    assert waits[1] > 0
+    assert "tavily" in fallback._buckets
+
+
+def test_estimate_message_tokens_counts_content_and_overhead():
+    """Test the character based estimate used for token budgets."""
+    messages = [("system", "a" * 40), ("user", "b" * 8)]
+
+    assert estimate_message_tokens(messages) == 10 + 2 + 2 * 4
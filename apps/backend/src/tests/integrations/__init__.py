@@ -0,0 +1 @@
+"""Integrations test package."""
@@ -0,0 +1,57 @@
+"""Tests for the async Firecrawl client.
+
+This module contains unit tests for AsyncFirecrawlClient, verifying that
+concurrent scrapes overlap up to the concurrency cap and that failures surface
+as FirecrawlError.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.integrations.firecrawl import AsyncFirecrawlClient, FirecrawlError
+
+
+def test_concurrent_scrapes_overlap_up_to_the_cap():
+    """Test that scrapes run concurrently but never beyond max_concurrency."""
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return httpx.Response(
+            200, json={"success": True, "data": {"markdown": "# Page"}}
+        )
+
+    client = AsyncFirecrawlClient(
+        "test-key", max_concurrency=3, transport=httpx.MockTransport(handler)
+    )
+
+    async def run():
+        try:
+            return await asyncio.gather(
+                *[client.scrape_markdown(f"https://acme.com/{i}") for i in range(6)]
+            )
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(run()) == ["# Page"] * 6
+    assert peak == 3
+
+
+def test_scrape_errors_include_the_status_code():
+    """Test that API errors raise FirecrawlError with the status for retries."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["Authorization"] == "Bearer test-key"
+        return httpx.Response(429, json={"success": False, "error": "Rate limit"})
+
+    client = AsyncFirecrawlClient("test-key", transport=httpx.MockTransport(handler))
+
+    with pytest.raises(FirecrawlError, match="429"):
+        asyncio.run(client.scrape_markdown("https://acme.com"))
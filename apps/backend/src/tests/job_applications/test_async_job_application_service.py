@@ -0,0 +1,120 @@
+"""Tests for the async job application service.
+
+This module contains unit tests for AsyncJobApplicationService, verifying that
+updates persist buffered pipeline events first and notify live subscribers, and
+that concurrent research result appends do not overwrite each other.
+"""
+
+import asyncio
+import uuid
+
+from src.configs.database_config import get_async_session_context, get_session_context
+from src.core.notifications import InMemoryChangeNotifier, job_application_channel
+from src.core.service_registry import ServiceRegistry
+from src.job_applications.model import JobApplication
+from src.job_applications.services import job_application_service as module
+from src.job_applications.services.job_application_service import (
+    AsyncJobApplicationService,
+)
+from src.job_applications.types import ResumeGenerationStatus
+from src.user.model import User
+
+
+class FakeAsyncRepository:
+    """In-memory stand-in for AsyncJobApplicationRepository."""
+
+    def __init__(self, job_application: JobApplication):
+        """Initialize the fake repository with the single application it holds."""
+        self.job_application = job_application
+        self.calls = []
+
+    async def get_by_id(self, job_application_id, **kwargs):
+        """Return the held application."""
+        self.calls.append("get_by_id")
+        return self.job_application
+
+    async def update(self, job_application):
+        """Record the update and return the application unchanged."""
+        self.calls.append("update")
+        return job_application
+
+
+def test_status_update_flushes_events_before_writing(monkeypatch):
+    """Test that a status update flushes the event sink, updates and notifies."""
+    job_application = JobApplication(
+        id="app-1",
+        job_title="Engineer",
+        job_description="Build things",
+        company_name="Acme",
+        user_id="user-1",
+    )
+    repository = FakeAsyncRepository(job_application)
+
+    async def fake_flush():
+        repository.calls.append("flush")
+        return 0
+
+    monkeypatch.setattr(module, "aflush_event_sink", fake_flush)
+    notifier = InMemoryChangeNotifier()
+    service = AsyncJobApplicationService(repository, change_notifier=notifier)
+
+    async def run():
+        async with notifier.subscribe(job_application_channel("app-1")) as sub:
+            await service.update_job_application_status(
+                "app-1", ResumeGenerationStatus.COMPLETED
+            )
+            return await sub.get(timeout=1)
+
+    notification = asyncio.run(run())
+
+    assert repository.calls == ["get_by_id", "flush", "update"]
+    assert job_application.resume_generation_status == "completed"
+    assert notification.payload["resume_generation_status"] == "completed"
+
+
+def test_concurrent_category_appends_keep_every_category():
+    """Test that research results appended concurrently all survive (needs Postgres)."""
+    with get_session_context() as session:
+        user_id = str(uuid.uuid4())
+        user = User(id=user_id, email=f"{user_id}@example.com", name="Test User")
+        session.add(user)
+        session.commit()
+        job_application = JobApplication(
+            job_description="description",
+            job_title="title",
+            company_name="company",
+            user_id=user_id,
+            company_profile={"research_plan": {"target_role": "title"}},
+        )
+        session.add(job_application)
+        session.commit()
+        application_id = job_application.id
+    categories = [f"category_{i}" for i in range(8)]
+
+    async def append(category):
+        # One session per executor, as in the research fan-out
+        async with get_async_session_context() as session:
+            await ServiceRegistry.get_async_job_application_service(
+                session
+            ).append_company_profile_category_research_results(
+                application_id, category, f"results of {category}"
+            )
+
+    async def run():
+        await asyncio.gather(*(append(category) for category in categories))
+        async with get_async_session_context() as session:
+            return await ServiceRegistry.get_async_job_application_service(
+                session
+            ).get_job_application(application_id)
+
+    try:
+        stored = asyncio.run(run())
+        assert stored.company_profile["research_plan"] == {"target_role": "title"}
+        assert stored.company_profile["research_results"] == {
+            category: f"results of {category}" for category in categories
+        }
+    finally:
+        with get_session_context() as session:
+            session.delete(session.get(JobApplication, application_id))
+            session.delete(session.get(User, user_id))
+            session.commit()
@@ -0,0 +1,182 @@
+"""Tests for the company research cache.
+
+This module contains unit tests for the helpers that normalize company and
+category names into the keys shared by every application for a company, and
+tests of the research planner against Postgres, verifying that cached
+categories are not sent to the research executors.
+"""
+
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+from langgraph.types import Send
+from sqlmodel import delete
+
+from src.configs.database_config import get_async_session_context, get_session_context
+from src.core.notifications import InMemoryChangeNotifier
+from src.core.rate_limit_handlers import (
+    InMemoryTokenBucketStore,
+    TokenBucketRateLimiter,
+)
+from src.core.service_registry import ServiceRegistry
+from src.job_applications.agents.company_profiler_agents.company_profiler import (
+    CompanyProfilerAgent,
+    CompanyProfilerState,
+)
+from src.job_applications.model import CompanyResearchCache, JobApplication
+from src.job_applications.services.company_research_cache_service import (
+    build_cache_key,
+    hash_results,
+    normalize_category_key,
+    normalize_company_key,
+)
+from src.job_applications.services.event_sink import EventSink
+from src.job_applications.types import ResearchCategory, ResearchPlan
+from src.user.model import User
+
+
+def test_company_key_prefers_the_official_website_domain():
+    """Test that the discovered website wins over the entered company name."""
+    discovery = SimpleNamespace(official_website="https://www.Acme.com:443/about")
+
+    assert normalize_company_key("ACME Corp", discovery) == "acme.com"
+    assert normalize_company_key("Acme", SimpleNamespace(official_website="acme.com"))
+
+
+def test_company_key_falls_back_to_the_normalized_name():
+    """Test that name variants of the same company share one key."""
+    keys = {
+        normalize_company_key("Acme, Inc."),
+        normalize_company_key("  acme inc "),
+        normalize_company_key("ACME", SimpleNamespace(official_website=None)),
+    }
+
+    assert keys == {"acme"}
+
+
+def test_cache_key_ignores_category_formatting():
+    """Test that equivalent category names map to the same cache entry."""
+    first = build_cache_key("acme.com", normalize_category_key("Tech Stack"))
+    second = build_cache_key("acme.com", normalize_category_key("tech-stack "))
+
+    assert first == second
+    assert first != build_cache_key("globex.com", normalize_category_key("Tech Stack"))
+
+
+def test_results_hash_is_independent_of_key_order():
+    """Test that the content hash only changes when the results change."""
+    assert hash_results({"a": 1, "b": [2]}) == hash_results({"b": [2], "a": 1})
+    assert hash_results({"a": 1}) != hash_results({"a": 2})
+
+
+class PlanningModel:
+    """Model whose structured output is always the given research plan."""
+
+    def __init__(self, plan: ResearchPlan):
+        """Initialize the model with the plan to return."""
+        self.plan = plan
+
+    def with_structured_output(self, schema):
+        """Return the model itself."""
+        return self
+
+    def with_retry(self, **kwargs):
+        """Return the model itself."""
+        return self
+
+    async def ainvoke(self, messages):
+        """Return the research plan."""
+        return self.plan
+
+
+def _plan_with_cached(category_names: list[str], cached_names: list[str]):
+    company = f"Cached Co {uuid.uuid4().hex[:8]}"
+    user_id = str(uuid.uuid4())
+    with get_session_context() as session:
+        session.add(User(id=user_id, email=f"{user_id}@example.com", name="Test"))
+        session.commit()
+        job_application = JobApplication(
+            job_description="Build APIs",
+            job_title="Backend Engineer",
+            company_name=company,
+            user_id=user_id,
+        )
+        session.add(job_application)
+        session.commit()
+        application_id = job_application.id
+    plan = ResearchPlan(
+        target_role="Backend Engineer",
+        rationale="Test plan",
+        research_categories=[
+            ResearchCategory(
+                category_name=name,
+                description=name,
+                priority=1,
+                data_points=[name],
+            )
+            for name in category_names
+        ],
+    )
+    agent = CompanyProfilerAgent(
+        model=PlanningModel(plan),
+        rate_limiter=TokenBucketRateLimiter(
+            "test", 1_000.0, store=InMemoryTokenBucketStore()
+        ),
+        event_sink=EventSink(change_notifier=InMemoryChangeNotifier()),
+    )
+    state = CompanyProfilerState(
+        job_application_id=application_id,
+        job_role="Backend Engineer",
+        job_description="Build APIs",
+        company=company,
+    )
+
+    async def run():
+        async with get_async_session_context() as session:
+            cache_service = ServiceRegistry.get_async_company_research_cache_service(
+                session
+            )
+            for name in cached_names:
+                await cache_service.store_category_results(
+                    company_key=normalize_company_key(company),
+                    company_name=company,
+                    category_name=name,
+                    results=f"cached {name}",
+                )
+        return await agent.research_planner(state, {})
+
+    try:
+        return asyncio.run(run())
+    finally:
+        with get_session_context() as session:
+            session.exec(
+                delete(CompanyResearchCache).where(
+                    CompanyResearchCache.company_key == normalize_company_key(company)
+                )
+            )
+            session.delete(session.get(JobApplication, application_id))
+            session.delete(session.get(User, user_id))
+            session.commit()
+
+
+def test_planner_only_sends_uncached_categories_to_executors():
+    """Test that cached categories are reused instead of researched (needs Postgres)."""
+    command = _plan_with_cached(["Tech Stack", "Culture"], ["Tech Stack"])
+
+    assert [send.arg["research_category"].category_name for send in command.goto] == [
+        "Culture"
+    ]
+    assert all(isinstance(send, Send) for send in command.goto)
+    assert command.update["research_results"] == {"Tech Stack": "cached Tech Stack"}
+
+
+def test_planner_routes_to_finalize_when_every_category_is_cached():
+    """Test that a fully cached plan skips the executors (needs Postgres)."""
+    command = _plan_with_cached(["Tech Stack", "Culture"], ["Culture", "Tech Stack"])
+
+    assert command.goto == "finalize_research"
+    assert command.update["research_results"] == {
+        "Tech Stack": "cached Tech Stack",
+        "Culture": "cached Culture",
+    }
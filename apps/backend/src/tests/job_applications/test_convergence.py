@@ -0,0 +1,68 @@
+"""Tests for the convergence policy of the drafting loops.
+
+This module contains unit tests for ConvergencePolicy, verifying each stop
+reason and that a loop still making progress within its budgets continues.
+"""
+
+from src.job_applications.agents.drafts_generators.convergence import (
+    ConvergencePolicy,
+    substantive_changes,
+)
+from src.job_applications.types import DraftLoopStopReason
+
+_CHANGES = {"summary": "Lead with the distributed systems experience from Acme"}
+
+
+def _stop_reason(
+    policy: ConvergencePolicy, grades, changes=None, tokens=1000, elapsed=1.0
+):
+    return policy.stop_reason(
+        grades=grades,
+        changes=_CHANGES if changes is None else changes,
+        tokens_used=tokens,
+        elapsed_seconds=elapsed,
+    )
+
+
+def test_loop_continues_while_improving_within_budgets():
+    """Test that a loop improving by more than the delta runs another round."""
+    policy = ConvergencePolicy(min_grade_improvement=3)
+
+    assert _stop_reason(policy, [70]) is None
+    assert _stop_reason(policy, [70, 80]) is None
+
+
+def test_each_stop_reason():
+    """Test the stop reason returned for each convergence criterion."""
+    policy = ConvergencePolicy(
+        grade_threshold=90,
+        max_rounds=3,
+        min_grade_improvement=3,
+        token_budget=10000,
+        time_budget_seconds=60,
+    )
+
+    assert _stop_reason(policy, [70, 92]) == DraftLoopStopReason.GRADE_THRESHOLD_REACHED
+    assert _stop_reason(policy, [60, 70, 80]) == DraftLoopStopReason.MAX_ROUNDS_REACHED
+    assert (
+        _stop_reason(policy, [70], changes={"summary": "None", "skills": "ok"})
+        == DraftLoopStopReason.NO_CHANGES_REQUESTED
+    )
+    assert _stop_reason(policy, [80, 81]) == DraftLoopStopReason.GRADE_PLATEAU
+    assert _stop_reason(policy, [80, 78]) == DraftLoopStopReason.GRADE_PLATEAU
+    # A second round of 6000 tokens would overrun the 10000 token budget
+    assert (
+        _stop_reason(policy, [70], tokens=6000)
+        == DraftLoopStopReason.TOKEN_BUDGET_EXHAUSTED
+    )
+    assert (
+        _stop_reason(policy, [70], elapsed=40)
+        == DraftLoopStopReason.TIME_BUDGET_EXHAUSTED
+    )
+
+
+def test_substantive_changes_ignores_markers_and_short_notes():
+    """Test that empty, "no change" and very short requests are not substantive."""
+    changes = ["No changes.", "", "fix typo", _CHANGES["summary"]]
+
+    assert substantive_changes(changes) == [_CHANGES["summary"]]
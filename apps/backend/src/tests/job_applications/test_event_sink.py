@@ -0,0 +1,117 @@
+"""Tests for the buffered event sink.
+
+This module contains unit tests for EventSink, verifying that events are
+buffered, written in one batch and announced once per job application.
+"""
+
+import asyncio
+import threading
+
+from src.core.notifications import InMemoryChangeNotifier, job_application_channel
+from src.job_applications.repositories.events_repository import EventRepository
+from src.job_applications.services.event_sink import EventSink
+from src.job_applications.types import EventStatus, PipelineStep
+from src.user.model import User  # noqa: F401 - must be imported before JobApplication mapper is configured
+
+
+def test_event_sink_batches_until_failure_event(monkeypatch):
+    """Test that events stay buffered until a failure event forces a flush."""
+    written = []
+    monkeypatch.setattr(
+        EventRepository,
+        "create_many",
+        lambda self, events, refresh=True: written.append(list(events)) or events,
+    )
+    notifier = InMemoryChangeNotifier()
+    sink = EventSink(max_batch_size=10, flush_interval=60, change_notifier=notifier)
+
+    async def run():
+        async with notifier.subscribe(job_application_channel("app-1")) as sub:
+            sink.emit_pipeline_step(
+                job_application_id="app-1",
+                step=PipelineStep.RESEARCH,
+                status=EventStatus.STARTED,
+            )
+            pending_before_failure = sink.pending
+            sink.emit_pipeline_step(
+                job_application_id="app-1",
+                step=PipelineStep.RESEARCH,
+                status=EventStatus.FAILED,
+            )
+            return pending_before_failure, await sub.get(timeout=1)
+
+    pending_before_failure, notification = asyncio.run(run())
+    assert pending_before_failure == 1
+    assert sink.pending == 0
+    assert len(written) == 1 and len(written[0]) == 2
+    assert notification.payload["event_ids"] == [e.id for e in written[0]]
+
+
+def test_failed_flush_keeps_events_and_emit_does_not_raise(monkeypatch):
+    """Test that a failing commit neither escapes emit_* nor loses the batch."""
+    written = []
+
+    def failing_create_many(self, events, refresh=True):
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(EventRepository, "create_many", failing_create_many)
+    sink = EventSink(max_batch_size=10, flush_interval=60)
+
+    sink.emit_pipeline_step(
+        job_application_id="app-1",
+        step=PipelineStep.RESEARCH,
+        status=EventStatus.STARTED,
+    )
+    sink.emit_pipeline_step(
+        job_application_id="app-1",
+        step=PipelineStep.RESEARCH,
+        status=EventStatus.FAILED,
+    )
+    assert sink.pending == 2
+
+    monkeypatch.setattr(
+        EventRepository,
+        "create_many",
+        lambda self, events, refresh=True: written.append(list(events)) or events,
+    )
+    assert sink.flush() == 2
+    assert [e.status for e in written[0]] == ["started", "failed"]
+
+
+def test_concurrent_flushes_commit_in_emission_order(monkeypatch):
+    """Test that a later flush waits for the commit of an earlier one."""
+    first_commit_started = threading.Event()
+    release_first_commit = threading.Event()
+    committed = []
+
+    def slow_create_many(self, events, refresh=True):
+        if not committed:
+            first_commit_started.set()
+            release_first_commit.wait(timeout=2)
+        committed.append([e.step for e in events])
+        return events
+
+    monkeypatch.setattr(EventRepository, "create_many", slow_create_many)
+    sink = EventSink(max_batch_size=10, flush_interval=60)
+
+    sink.emit_pipeline_step(
+        job_application_id="app-1",
+        step=PipelineStep.RESEARCH_PLANNING,
+        status=EventStatus.STARTED,
+    )
+    first = threading.Thread(target=sink.flush)
+    first.start()
+    first_commit_started.wait(timeout=2)
+    sink.emit_pipeline_step(
+        job_application_id="app-1",
+        step=PipelineStep.RESEARCH,
+        status=EventStatus.STARTED,
+    )
+    second = threading.Thread(target=sink.flush)
+    second.start()
+    second.join(timeout=0.2)
+    release_first_commit.set()
+    first.join(timeout=2)
+    second.join(timeout=2)
+
+    assert committed == [["research_planning"], ["research"]]
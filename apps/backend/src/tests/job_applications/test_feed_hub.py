@@ -0,0 +1,224 @@
+"""Tests for the shared application feeds of the SSE endpoint.
+
+This module contains unit tests for ApplicationFeedHub, run against an
+in-memory application store and change notifier, verifying that clients of
+one application share a single watcher, that slow clients are coalesced, and
+that feeds resume from recent frames and end on completion.
+"""
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from src.core.notifications import InMemoryChangeNotifier, job_application_channel
+from src.job_applications.feed_hub import ApplicationFeedHub, FeedKey, FeedSubscriber
+
+START = datetime(2025, 1, 1, 12, 0, 0)
+KEY = FeedKey("app-1", events_limit=50, poll_interval_ms=100)
+
+
+class StubHub(ApplicationFeedHub):
+    """Hub reading an in-memory application instead of the database."""
+
+    def __init__(self, **kwargs):
+        """Initialize the hub with a started application and no events."""
+        super().__init__(notifier=InMemoryChangeNotifier(), **kwargs)
+        self.application_loads = 0
+        self.events = []
+        self.app = dict(
+            id="app-1",
+            job_title="Backend Engineer",
+            company_name="Acme",
+            job_description="Build APIs",
+            background_task_id=None,
+            resume_generation_status="started",
+            company_profile=None,
+            generated_resume=None,
+            resume_strategy_brief=None,
+            original_resume_snapshot=None,
+            generated_cover_letter=None,
+            created_at=START,
+            updated_at=START,
+        )
+
+    def change(self, status=None, **event):
+        """Record an event, optionally a new status, and publish the change."""
+        created_at = START + timedelta(seconds=len(self.events) + 1)
+        self.events.append(
+            SimpleNamespace(
+                id=f"evt-{len(self.events) + 1}",
+                job_application_id="app-1",
+                event_name="pipeline_step",
+                status=None,
+                step=None,
+                category_name=None,
+                tool_name=None,
+                iteration=None,
+                message=event.get("message", ""),
+                data=None,
+                error=None,
+                created_at=created_at,
+            )
+        )
+        if status is not None:
+            self.app.update(resume_generation_status=status, updated_at=created_at)
+        self.notifier.publish(job_application_channel("app-1"), {})
+
+    async def load_application(self, application_id, with_events):
+        """Return a copy of the stored application."""
+        self.application_loads += 1
+        return SimpleNamespace(
+            **self.app, events=list(self.events) if with_events else None
+        )
+
+    async def load_events(self, application_id, cursor, limit):
+        """Return the stored events strictly after the cursor event."""
+        if cursor.event_id is None:
+            return self.events[:limit]
+        position = (cursor.event_created_at, cursor.event_id)
+        return [e for e in self.events if (e.created_at, e.id) > position][:limit]
+
+
+def _parse(frame: str) -> tuple[str, str, dict]:
+    lines = dict(line.split(": ", 1) for line in frame.strip().splitlines())
+    return lines["id"], lines["event"], json.loads(lines["data"])
+
+
+async def _next(frames) -> str:
+    return await asyncio.wait_for(anext(frames), timeout=2)
+
+
+def test_clients_share_one_watcher_and_frame():
+    """Test that every client gets the same frame from a single load per change."""
+
+    async def run():
+        hub = StubHub()
+        async with (
+            hub.subscribe(KEY, mode="delta") as first,
+            hub.subscribe(KEY, mode="delta") as second,
+            hub.subscribe(KEY, mode="snapshot") as third,
+        ):
+            feeds = [sub.frames() for sub in (first, second, third)]
+            joins = [await _next(feed) for feed in feeds]
+            assert hub.watched_applications == 1
+            assert joins[0] is joins[1]
+
+            hub.change(status="processing_company_profile", message="Profiling")
+            deltas = [await _next(feed) for feed in feeds]
+            loads = hub.application_loads
+        return hub, joins, deltas, loads
+
+    hub, joins, deltas, loads = asyncio.run(run())
+
+    assert deltas[0] is deltas[1]
+    _, event, payload = _parse(deltas[0])
+    assert event == "application.delta"
+    assert payload["fields"]["resume_generation_status"] == (
+        "processing_company_profile"
+    )
+    assert [e["message"] for e in payload["events"]] == ["Profiling"]
+    assert payload["status_changed"] is True
+    _, event, snapshot = _parse(deltas[2])
+    assert event == "application.snapshot"
+    assert snapshot["events"] == payload["events"]
+    # One initial load and one per change, whatever the number of clients
+    assert loads == 2
+    assert hub.watched_applications == 0
+
+
+def test_slow_clients_are_coalesced():
+    """Test that a full queue keeps the latest snapshot or resyncs a delta client."""
+
+    async def run():
+        snapshot_client = FeedSubscriber("snapshot", queue_size=2)
+        delta_client = FeedSubscriber("delta", queue_size=2)
+        for frame in ("frame-1", "frame-2", "frame-3"):
+            snapshot_client.offer(frame)
+            delta_client.offer(frame, resync=lambda: "snapshot")
+        snapshot_client.close("end")
+        return [
+            [frame async for frame in snapshot_client.frames()],
+            [
+                delta_client._queue.get_nowait()
+                for _ in range(delta_client._queue.qsize())
+            ],
+        ]
+
+    snapshot_frames, delta_frames = asyncio.run(run())
+
+    assert snapshot_frames == ["frame-3", "end"]
+    assert delta_frames == ["snapshot"]
+
+
+def test_delta_client_resumes_and_feed_ends_on_completion():
+    """Test replay after Last-Event-ID and the completion frame ending the feed."""
+
+    async def run():
+        hub = StubHub()
+        async with hub.subscribe(KEY, mode="delta") as watcher_client:
+            feed = watcher_client.frames()
+            await _next(feed)
+            hub.change(message="First")
+            first_id, _, _ = _parse(await _next(feed))
+            hub.change(message="Second")
+            await _next(feed)
+
+            async with hub.subscribe(
+                KEY, mode="delta", last_event_id=first_id
+            ) as reconnected:
+                resumed = reconnected.frames()
+                replayed = await _next(resumed)
+                hub.change(status="completed", message="Done")
+                rest = [frame async for frame in resumed]
+                return replayed, rest, reconnected.completed
+
+    replayed, rest, completed = asyncio.run(run())
+
+    _, event, payload = _parse(replayed)
+    assert event == "application.delta"
+    assert [e["message"] for e in payload["events"]] == ["Second"]
+    assert [_parse(frame)[2].get("final_status") for frame in rest] == [
+        None,
+        "completed",
+    ]
+    assert completed is True
+
+
+def test_delta_client_resumes_from_the_database_after_the_watcher_stopped():
+    """Test that a reconnect to a new watcher gets the missed events as a delta."""
+
+    async def run():
+        hub = StubHub()
+        async with hub.subscribe(KEY, mode="delta") as first_client:
+            feed = first_client.frames()
+            await _next(feed)
+            hub.change(message="First")
+            first_id, _, _ = _parse(await _next(feed))
+        assert hub.watched_applications == 0
+
+        # Missed while no client watched the application
+        hub.change(message="Second")
+        hub.change(status="processing_company_profile", message="Third")
+
+        async with hub.subscribe(
+            KEY, mode="delta", last_event_id=first_id
+        ) as reconnected:
+            resumed = await _next(reconnected.frames())
+        async with hub.subscribe(
+            KEY, mode="delta", last_event_id="not-a-cursor"
+        ) as undecodable:
+            restarted = await _next(undecodable.frames())
+        return resumed, restarted
+
+    resumed, restarted = asyncio.run(run())
+
+    _, event, payload = _parse(resumed)
+    assert event == "application.delta"
+    assert [e["message"] for e in payload["events"]] == ["Second", "Third"]
+    assert payload["fields"]["resume_generation_status"] == (
+        "processing_company_profile"
+    )
+    _, event, snapshot = _parse(restarted)
+    assert event == "application.snapshot"
+    assert len(snapshot["events"]) == 3
@@ -0,0 +1,165 @@
+"""Tests for the per-user live updates stream.
+
+This module contains unit tests for LiveUpdatesStream, run against feed hubs
+reading in-memory applications, verifying that one stream follows the user's
+active applications, picks up new ones, applies subscription requests and
+forwards resume extraction updates.
+"""
+
+import asyncio
+import json
+from datetime import datetime
+from types import SimpleNamespace
+
+from src.core.notifications import InMemoryChangeNotifier, user_channel
+from src.job_applications.feed_hub import ApplicationFeedHub
+from src.job_applications.live_updates import (
+    LiveUpdatesStream,
+    request_subscription_change,
+)
+
+START = datetime(2025, 1, 1, 12, 0, 0)
+
+
+class StubHub(ApplicationFeedHub):
+    """Hub reading in-memory applications instead of the database."""
+
+    def __init__(self, statuses: dict[str, str]):
+        """Initialize the hub with applications of the given statuses."""
+        super().__init__(notifier=InMemoryChangeNotifier())
+        self.statuses = statuses
+
+    async def load_application(self, application_id, with_events):
+        """Return an application with the stored status and no events."""
+        if application_id not in self.statuses:
+            return None
+        return SimpleNamespace(
+            id=application_id,
+            job_title="Backend Engineer",
+            company_name="Acme",
+            job_description="Build APIs",
+            background_task_id=None,
+            resume_generation_status=self.statuses[application_id],
+            company_profile=None,
+            generated_resume=None,
+            resume_strategy_brief=None,
+            original_resume_snapshot=None,
+            generated_cover_letter=None,
+            created_at=START,
+            updated_at=START,
+            events=[] if with_events else None,
+        )
+
+    async def load_events(self, application_id, cursor, limit):
+        """Return no events."""
+        return []
+
+
+class StubStream(LiveUpdatesStream):
+    """Stream whose active applications and resume are held in memory."""
+
+    async def list_active_applications(self):
+        """Return the applications of the hub still being generated."""
+        return [
+            application_id
+            for application_id, status in self.hub.statuses.items()
+            if status not in ("completed", "failed")
+        ]
+
+    async def load_resume(self):
+        """Return an extracted resume."""
+        return {"personal_info": {"name": "Jane Doe"}}
+
+
+def _parse(frame: str) -> tuple[str, str, dict]:
+    lines = dict(line.split(": ", 1) for line in frame.strip().splitlines())
+    return lines["id"], lines.get("event", ""), json.loads(lines["data"])
+
+
+async def _next(frames) -> tuple[str, str, dict]:
+    return _parse(await asyncio.wait_for(anext(frames), timeout=2))
+
+
+def test_stream_follows_active_and_new_applications():
+    """Test that one stream carries every active application, then new ones."""
+
+    async def run():
+        hub = StubHub({"app-1": "started", "app-2": "processing_cover_letter"})
+        hub.statuses["app-0"] = "completed"
+        stream = StubStream("user-1", hub=hub)
+        frames = stream.frames(heartbeat=5)
+        ready = await _next(frames)
+        opening = sorted([await _next(frames), await _next(frames)])
+
+        hub.statuses["app-3"] = "started"
+        hub.notifier.publish(
+            user_channel("user-1"), {"type": "application", "application_id": "app-3"}
+        )
+        created = await _next(frames)
+        hub.notifier.publish(
+            user_channel("user-1"), {"type": "resume_extraction", "status": "complete"}
+        )
+        resume = await _next(frames)
+        followed = stream.applications
+        watched = hub.watched_applications
+        await frames.aclose()
+        return ready, opening, created, resume, followed, watched, hub
+
+    ready, opening, created, resume, followed, watched, hub = asyncio.run(run())
+
+    _, event, payload = ready
+    assert event == "live.ready"
+    assert sorted(payload["applications"]) == ["app-1", "app-2"]
+    assert [(frame_id.split("/")[0], event) for frame_id, event, _ in opening] == [
+        ("app-1", "application.snapshot"),
+        ("app-2", "application.snapshot"),
+    ]
+    assert created[0].startswith("app-3/")
+    assert created[2]["id"] == "app-3"
+    assert resume[1:] == (
+        "resume.status",
+        {"status": "complete", "resume": {"personal_info": {"name": "Jane Doe"}}},
+    )
+    assert sorted(followed) == ["app-1", "app-2", "app-3"]
+    assert watched == 3
+    # Closing the stream releases every feed
+    assert hub.watched_applications == 0
+
+
+def test_subscription_requests_add_and_remove_applications():
+    """Test subscribe and unsubscribe requests, and the end of a completed feed."""
+
+    async def run():
+        hub = StubHub({"app-1": "completed", "app-2": "started"})
+        stream = StubStream("user-1", hub=hub)
+        frames = stream.frames(heartbeat=5)
+        ready = await _next(frames)
+        opening = await _next(frames)
+        request_subscription_change(
+            hub.notifier, "user-1", stream.stream_id, "subscribe", "app-1"
+        )
+        completed = [await _next(frames) for _ in range(3)]
+        request_subscription_change(
+            hub.notifier, "user-1", stream.stream_id, "unsubscribe", "app-2"
+        )
+        dropped = await _next(frames)
+        followed = stream.applications
+        await frames.aclose()
+        return ready, opening, completed, dropped, followed
+
+    ready, opening, completed, dropped, followed = asyncio.run(run())
+
+    assert ready[2]["applications"] == ["app-2"]
+    assert opening[0].startswith("app-2/")
+    assert [event for _, event, _ in completed] == [
+        "application.snapshot",
+        "application.delta",
+        "application.unsubscribed",
+    ]
+    assert completed[1][2]["final_status"] == "completed"
+    assert completed[2][2] == {"id": "app-1", "reason": "completed"}
+    assert dropped[1:] == (
+        "application.unsubscribed",
+        {"id": "app-2", "reason": "requested"},
+    )
+    assert followed == []
@@ -0,0 +1,70 @@
+"""Tests for the agent message history compaction.
+
+This module contains unit tests for compact_messages and its reducer, verifying
+that older tool outputs are shortened, that old rounds are dropped when over
+budget without splitting tool calls from their results, and that compaction is
+stable when applied repeatedly.
+"""
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+
+from src.job_applications.agents.message_compaction import (
+    add_and_compact_messages,
+    compact_messages,
+)
+
+
+def _round(index: int, output_size: int = 4000) -> list:
+    call_id = f"call_{index}"
+    return [
+        AIMessage(
+            content="",
+            tool_calls=[
+                {"name": "tavily_tool", "args": {"query": f"q{index}"}, "id": call_id}
+            ],
+        ),
+        ToolMessage(content="x" * output_size, tool_call_id=call_id),
+    ]
+
+
+PREAMBLE = [SystemMessage(content="system"), HumanMessage(content="task")]
+
+
+def test_older_tool_outputs_are_compacted_and_the_latest_round_is_kept():
+    """Test that only tool outputs from earlier rounds are shortened."""
+    messages = PREAMBLE + _round(1) + _round(2)
+
+    compacted = compact_messages(messages, token_budget=100_000)
+
+    assert compacted[:2] == PREAMBLE
+    assert compacted[3].content.startswith("[Earlier output of tavily_tool(query='q1')")
+    assert len(compacted[3].content) < 700
+    assert compacted[5].content == "x" * 4000
+    assert messages[3].content == "x" * 4000
+
+
+def test_rounds_over_budget_are_dropped_and_listed_in_the_task():
+    """Test that whole rounds are dropped oldest first when over budget."""
+    messages = PREAMBLE + _round(1) + _round(2) + _round(3)
+
+    compacted = compact_messages(messages, token_budget=1050)
+
+    ai_messages = [m for m in compacted if isinstance(m, AIMessage)]
+    tool_messages = [m for m in compacted if isinstance(m, ToolMessage)]
+    assert [m.tool_calls[0]["id"] for m in ai_messages] == ["call_3"]
+    assert [m.tool_call_id for m in tool_messages] == ["call_3"]
+    assert "tavily_tool(query='q1')" in compacted[1].content
+    assert "tavily_tool(query='q2')" in compacted[1].content
+
+
+def test_compaction_is_stable_across_iterations():
+    """Test that re-compacting keeps a single note and unchanged excerpts."""
+    history = add_and_compact_messages([], PREAMBLE + _round(1))
+    for index in range(2, 6):
+        history = add_and_compact_messages(history, _round(index))
+        history = compact_messages(history, token_budget=1050)
+
+    assert compact_messages(history, token_budget=1050) == history
+    assert history[1].content.count("EARLIER STEPS") == 1
+    assert all(f"q{index}" in history[1].content for index in range(1, 5))
+    assert history[-1].content == "x" * 4000
@@ -0,0 +1,163 @@
+"""Tests for the overlapped drafting mode of the main graph.
+
+This module contains unit tests for MainGraphAgent.overlapped_drafts, run with
+stand-in drafting graphs, verifying that the cover letter starts from the first
+accepted resume draft while the resume loop continues, that it is only
+reconciled when the final resume changed materially, and that a failed cover
+letter run stops the resume loop and marks the job application failed.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.core.types import Resume
+from src.job_applications.agents.main_graph import MainGraphAgent, MainGraphState
+
+BASE_RESUME = {
+    "name": "Jane Doe",
+    "email": "jane@example.com",
+    "personal_info": {
+        "phone_number": "+1 555 0100",
+        "address": "Paris",
+        "summary": "Backend engineer.",
+        "professional_title": "Backend Engineer",
+    },
+    "work_experiences": [
+        {
+            "company_name": "Acme",
+            "position": "Engineer",
+            "start_date": "2020-01-01",
+            "responsibilities": "Built APIs.",
+        }
+    ],
+    "educations": [],
+    "skills": [{"name": "Python", "proficiency_level": "Expert"}],
+}
+
+
+def _resume(summary: str, position: str = "Engineer") -> Resume:
+    data = {**BASE_RESUME, "personal_info": dict(BASE_RESUME["personal_info"])}
+    data["personal_info"]["summary"] = summary
+    data["work_experiences"] = [{**BASE_RESUME["work_experiences"][0]}]
+    data["work_experiences"][0]["position"] = position
+    return Resume.model_validate(data)
+
+
+class FakeResumeGraph:
+    """Resume graph streaming one state per evaluated draft."""
+
+    def __init__(self, drafts: list[tuple[Resume, int]], log: list[str]):
+        """Initialize the graph with (draft, grade) pairs in loop order."""
+        self.drafts = drafts
+        self.log = log
+
+    async def astream(self, input, config, stream_mode):
+        """Yield the state after each evaluation."""
+        grades = []
+        for index, (draft, grade) in enumerate(self.drafts):
+            await asyncio.sleep(0.01)
+            grades.append(grade)
+            self.log.append(f"resume round {index}")
+            yield {**input, "generated_resume": draft, "grade_history": list(grades)}
+
+
+class FakeCoverLetterGraph:
+    """Cover letter graph recording the resume each run was drafted from."""
+
+    def __init__(self, log: list[str]):
+        """Initialize the graph with the shared event log."""
+        self.log = log
+        self.inputs = []
+
+    async def ainvoke(self, input, config):
+        """Return the input state with a cover letter."""
+        self.inputs.append(input)
+        self.log.append("cover letter")
+        return {**input, "generated_cover_letter": f"Letter {len(self.inputs)}"}
+
+
+class FailingCoverLetterGraph(FakeCoverLetterGraph):
+    """Cover letter graph whose run fails."""
+
+    async def ainvoke(self, input, config):
+        """Raise once the run started."""
+        self.log.append("cover letter")
+        raise RuntimeError("cover letter failed")
+
+
+def _agent(drafts: list[tuple[Resume, int]], log: list[str]) -> MainGraphAgent:
+    agent = MainGraphAgent(model=object(), rate_limiter=object())
+    agent.resume_generator_graph = FakeResumeGraph(drafts, log)
+    agent.cover_letter_generator_graph = FakeCoverLetterGraph(log)
+    agent.cover_letter_generator = AsyncMock()
+    return agent
+
+
+def _state(drafts: list[tuple[Resume, int]]) -> MainGraphState:
+    return MainGraphState(
+        job_application_id="job-1",
+        job_role="Backend Engineer",
+        job_description="Build APIs",
+        company="Acme",
+        original_resume_snapshot=drafts[0][0],
+    )
+
+
+def _run(drafts: list[tuple[Resume, int]]):
+    log: list[str] = []
+    agent = _agent(drafts, log)
+    result = asyncio.run(agent.overlapped_drafts(_state(drafts), {}))
+    finalized = agent.cover_letter_generator.finalize_generation.await_args.args[0]
+    return result, agent.cover_letter_generator_graph.inputs, finalized, log
+
+
+def test_cover_letter_starts_from_first_accepted_draft():
+    """Test the handoff during the loop and no reconciliation for small changes."""
+    accepted = _resume("Backend engineer with five years of API work.")
+    polished = _resume("Backend engineer with five years of API work!")
+    drafts = [(_resume("Engineer."), 60), (accepted, 82), (polished, 91)]
+
+    result, inputs, finalized, log = _run(drafts)
+
+    assert log.index("cover letter") < log.index("resume round 2")
+    assert len(inputs) == 1
+    assert inputs[0]["generated_resume"] is accepted
+    assert result == {"generated_resume": polished}
+    assert finalized.generated_cover_letter == "Letter 1"
+
+
+def test_cover_letter_reconciled_when_resume_changed_materially():
+    """Test the reconciliation revision against the final resume."""
+    accepted = _resume("Backend engineer.")
+    final = _resume("Staff engineer leading payments.", position="Staff Engineer")
+    drafts = [(accepted, 85), (final, 93)]
+
+    _, inputs, finalized, _ = _run(drafts)
+
+    assert len(inputs) == 2
+    reconciliation = inputs[1]
+    assert reconciliation["generated_resume"] is final
+    assert reconciliation["generated_cover_letter"] == "Letter 1"
+    assert "personal_info" in reconciliation["evaluation_results"].changes[0]
+    assert "work_experiences" in reconciliation["evaluation_results"].changes[0]
+    assert finalized.generated_cover_letter == "Letter 2"
+
+
+def test_failed_cover_letter_stops_resume_loop_and_marks_failure():
+    """Test that a cover letter failure aborts the node and marks it failed."""
+    drafts = [(_resume(f"Draft {index}."), 85) for index in range(5)]
+    log: list[str] = []
+    agent = _agent(drafts, log)
+    agent.cover_letter_generator_graph = FailingCoverLetterGraph(log)
+    agent._mark_failed = AsyncMock()
+
+    with pytest.raises(RuntimeError, match="cover letter failed"):
+        asyncio.run(agent.overlapped_drafts(_state(drafts), {}))
+
+    assert "resume round 4" not in log
+    agent.cover_letter_generator.finalize_generation.assert_not_awaited()
+    job_application_id, error = agent._mark_failed.await_args.args
+    assert job_application_id == "job-1"
+    assert str(error) == "cover letter failed"
@@ -0,0 +1,92 @@
+"""Tests for the scraped page reducer.
+
+This module contains unit tests for reduce_page, verifying that boilerplate
+and repeated blocks are removed and that only the sections relevant to the
+requested data points are kept within the token budget.
+"""
+
+from src.core.token_utils import estimate_tokens
+from src.job_applications.page_reducer import reduce_page
+
+PAGE = """
+[Home](/) | [About](/about) | [Careers](/careers)
+
+We use cookies to improve your experience. Accept all
+
+# Acme
+
+Acme builds logistics software for retailers.
+
+## Our values
+
+We value ownership, curiosity and shipping small increments every day.
+Our culture is remote first with quarterly offsites.
+
+## Press
+
+{press}
+
+## Engineering
+
+Our tech stack is Python, FastAPI and PostgreSQL running on Kubernetes.
+
+Acme builds logistics software for retailers.
+
+© 2025 Acme Inc. All rights reserved.
+"""
+
+
+def test_small_pages_only_lose_boilerplate_and_duplicates():
+    """Test that a page within budget is kept apart from noise."""
+    reduced = reduce_page(PAGE.format(press="Acme raised a series B."), ["values"])
+
+    assert "cookies" not in reduced
+    assert "[Careers]" not in reduced
+    assert "All rights reserved" not in reduced
+    assert reduced.count("Acme builds logistics software") == 1
+    assert "## Press" in reduced and "## Engineering" in reduced
+
+
+def test_large_pages_keep_relevant_sections_within_budget():
+    """Test that irrelevant sections are dropped first when over budget."""
+    press = "\n\n".join(
+        f"Acme was featured in newspaper number {i} this quarter." for i in range(80)
+    )
+
+    reduced = reduce_page(
+        PAGE.format(press=press),
+        ["Company culture and values", "Tech stack"],
+        token_budget=120,
+    )
+
+    assert estimate_tokens(reduced) <= 120
+    assert "## Our values" in reduced
+    assert "## Engineering" in reduced
+    assert "newspaper" not in reduced
+    assert reduced.index("## Our values") < reduced.index("## Engineering")
+
+
+def test_oversized_single_section_is_truncated():
+    """Test that a page with one huge section still fits the budget."""
+    reduced = reduce_page("# Jobs\n\n" + "open role " * 1000, ["roles"], 50)
+
+    assert reduced.startswith("# Jobs")
+    assert estimate_tokens(reduced) <= 50
+
+
+def test_link_listings_are_kept_as_their_text():
+    """Test that a careers page keeps its job listings but not its link bars."""
+    page = (
+        "[Home](/) · [Jobs](/jobs)\n\n"
+        "![Team photo](/team.png)\n\n"
+        "# Careers\n\n## Open positions\n\n"
+        "- [Senior Backend Engineer - Remote](/jobs/1)\n"
+        "- [Staff Data Scientist](/jobs/2)\n\n"
+        "## Benefits\n\nWe offer health insurance."
+    )
+
+    reduced = reduce_page(page, ["open positions"])
+
+    assert "- Senior Backend Engineer - Remote\n- Staff Data Scientist" in reduced
+    assert "## Benefits" in reduced
+    assert "Home" not in reduced and "Team photo" not in reduced
@@ -0,0 +1,71 @@
+"""Tests for the keyset pagination of job application listings.
+
+This module contains unit tests for PageCursor and the page statement shared by
+the job application repositories, verifying that cursors round-trip, that
+malformed cursors are rejected and that pages select only the preview
+columns and, with a cursor, seek instead of skipping.
+"""
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.job_applications.model import JobApplication
+from src.job_applications.pagination import InvalidCursorError, PageCursor
+from src.job_applications.repositories.job_application_repository import (
+    _page_statement,
+)
+from src.user.model import User  # noqa: F401  (maps JobApplication.user)
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def test_cursor_round_trip():
+    """Test that a cursor decodes to the position it was encoded from."""
+    application = JobApplication(
+        id="0b7c1f4e-2d33-4c55-9a1e-6f0d2b8c9e10",
+        job_title="Backend Engineer",
+        company_name="Acme",
+        job_description="Build APIs",
+        user_id="user-1",
+        created_at=datetime(2025, 3, 4, 5, 6, 7, 891011, tzinfo=UTC),
+    )
+
+    encoded = PageCursor.after(application).encode()
+
+    assert "|" not in encoded and "=" not in encoded
+    assert PageCursor.decode(encoded) == PageCursor(
+        created_at=application.created_at, id=application.id
+    )
+
+
+@pytest.mark.parametrize("value", ["", "not a cursor", "bm8tc2VwYXJhdG9y"])
+def test_malformed_cursor_is_rejected(value):
+    """Test that values not produced by encode raise InvalidCursorError."""
+    with pytest.raises(InvalidCursorError):
+        PageCursor.decode(value)
+
+
+def test_pages_select_previews_and_seek():
+    """Test that pages select preview columns and cursor pages seek, not skip."""
+    condition = JobApplication.user_id == "user-1"
+    cursor = PageCursor(created_at=datetime(2025, 1, 1, tzinfo=UTC), id="app-1")
+
+    first_page = _sql(_page_statement(condition, 20, 10, None))
+    next_page = _sql(_page_statement(condition, 20, 10, cursor))
+
+    assert first_page.startswith(
+        "SELECT app.job_applications.id, app.job_applications.job_title, "
+        "app.job_applications.company_name, app.job_applications.created_at, "
+        "app.job_applications.resume_generation_status \nFROM"
+    )
+    assert "OFFSET" in first_page
+    assert "OFFSET" not in next_page
+    assert "(app.job_applications.created_at, app.job_applications.id) < " in next_page
+    assert (
+        "ORDER BY app.job_applications.created_at DESC, "
+        "app.job_applications.id DESC" in next_page
+    )
@@ -0,0 +1,87 @@
+"""Tests for the per-process pipeline runtime.
+
+This module contains unit tests for PipelineRuntime, verifying that tasks share
+one long-lived event loop that is set up once and torn down on stop, and that
+concurrent pipelines respect the in-flight cap.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.job_applications.pipeline_runtime import PipelineRuntime
+
+
+class StubRuntime(PipelineRuntime):
+    """PipelineRuntime that skips the database and graph setup."""
+
+    def __init__(self, max_in_flight: int = 4):
+        """Initialize the stub with counters for the setup and teardown hooks."""
+        super().__init__("postgresql://unused", max_in_flight=max_in_flight)
+        self.opened = 0
+        self.closed = 0
+
+    async def _open(self) -> None:
+        self.opened += 1
+
+    async def _close(self) -> None:
+        self.closed += 1
+
+
+def test_runtime_reuses_one_loop_across_runs():
+    """Test that coroutines run on the same background loop and setup runs once."""
+    runtime = StubRuntime()
+    runtime.start()
+    runtime.start()
+
+    async def current_loop():
+        return asyncio.get_running_loop(), threading.current_thread().name
+
+    try:
+        first_loop, thread_name = runtime.run(current_loop())
+        second_loop, _ = runtime.run(current_loop())
+    finally:
+        runtime.stop()
+
+    assert first_loop is second_loop
+    assert thread_name == "pipeline-runtime"
+    assert (runtime.opened, runtime.closed) == (1, 1)
+    assert not runtime.running
+
+
+def test_run_requires_a_started_runtime():
+    """Test that submitting work before start raises instead of hanging."""
+    runtime = StubRuntime()
+
+    async def noop():
+        return None
+
+    with pytest.raises(RuntimeError):
+        runtime.run(noop())
+
+
+def test_run_pipeline_caps_concurrent_pipelines():
+    """Test that pipelines submitted from many threads overlap up to the cap."""
+    runtime = StubRuntime(max_in_flight=2)
+    runtime.start()
+    peak = 0
+
+    async def pipeline():
+        nonlocal peak
+        peak = max(peak, runtime.in_flight)
+        await asyncio.sleep(0.05)
+        return runtime.in_flight
+
+    try:
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            results = list(
+                pool.map(lambda _: runtime.run_pipeline(pipeline()), range(6))
+            )
+    finally:
+        runtime.stop()
+
+    assert peak == 2
+    assert all(1 <= in_flight <= 2 for in_flight in results)
+    assert runtime.in_flight == 0
@@ -0,0 +1,125 @@
+"""Tests for the prompt rendering of models and research results.
+
+This module contains unit tests for render_model and render_research_results,
+verifying that empty fields are dropped, that the output is deterministic and
+shorter than the repr it replaces, and that renders are memoized.
+"""
+
+from src.core.types import Resume
+from src.job_applications import prompt_rendering
+from src.job_applications.prompt_rendering import (
+    render_model,
+    render_research_results,
+)
+from src.job_applications.types import ResearchCategory, ResearchPlan
+
+RESUME = {
+    "name": "Jane Doe",
+    "email": "jane@example.com",
+    "personal_info": {
+        "phone_number": "+1 555 0100",
+        "address": "Paris",
+        "summary": "Backend engineer.",
+        "professional_title": "Backend Engineer",
+    },
+    "work_experiences": [
+        {
+            "company_name": "Acme",
+            "position": "Engineer",
+            "start_date": "2020-01-01",
+            "responsibilities": "Built APIs.\nLed the billing migration.",
+        }
+    ],
+    "educations": [],
+    "skills": [{"name": "Python", "proficiency_level": "Expert"}],
+    "projects": [
+        {
+            "title": "Ledger",
+            "description": "Double-entry ledger service.",
+            "technologies": ["Python", "PostgreSQL"],
+        }
+    ],
+}
+
+
+def test_render_model_drops_empty_fields():
+    """Test the compact form of a resume with empty and placeholder fields."""
+    resume = Resume.model_validate(RESUME)
+
+    rendered = render_model(resume)
+
+    assert rendered == (
+        "name: Jane Doe\n"
+        "email: jane@example.com\n"
+        "personal_info:\n"
+        "  phone_number: +1 555 0100\n"
+        "  address: Paris\n"
+        "  summary: Backend engineer.\n"
+        "  professional_title: Backend Engineer\n"
+        "work_experiences:\n"
+        "  - company_name: Acme\n"
+        "    position: Engineer\n"
+        "    start_date: 2020-01-01\n"
+        "    end_date: Present\n"
+        "    responsibilities:\n"
+        "      Built APIs.\n"
+        "      Led the billing migration.\n"
+        "skills:\n"
+        "  - name: Python\n"
+        "    proficiency_level: Expert\n"
+        "projects:\n"
+        "  - title: Ledger\n"
+        "    description: Double-entry ledger service.\n"
+        "    technologies: Python, PostgreSQL"
+    )
+    assert "Not provided" not in rendered
+    assert len(rendered) < len(str(resume))
+    assert render_model(None) == ""
+
+
+def test_render_model_is_memoized_per_object():
+    """Test that a model is rendered once and its entry dropped with it."""
+    plan = ResearchPlan(
+        target_role="Backend Engineer",
+        research_categories=[
+            ResearchCategory(
+                category_name="culture",
+                description="Values and ways of working",
+                priority=1,
+                data_points=["values", "remote policy"],
+            )
+        ],
+        rationale="Culture fit matters for the role.",
+    )
+
+    first = render_model(plan)
+    assert render_model(plan) is first
+    assert "data_points: values, remote policy" in first
+
+    key = id(plan)
+    del plan
+    assert key not in prompt_rendering._model_renders
+
+
+def test_render_research_results_is_deterministic():
+    """Test that category and key order do not change the rendered results."""
+    first = {
+        "tech_stack": {"languages": ["Go", "Python"], "notes": None},
+        "culture": [{"finding": "Remote first", "source": "https://acme.com"}],
+    }
+    second = {
+        "culture": [{"source": "https://acme.com", "finding": "Remote first"}],
+        "tech_stack": {"notes": None, "languages": ["Go", "Python"]},
+    }
+
+    rendered = render_research_results(first)
+
+    assert rendered == render_research_results(second)
+    assert rendered == (
+        "culture:\n"
+        "  - finding: Remote first\n"
+        "    source: https://acme.com\n"
+        "tech_stack:\n"
+        "  languages: Go, Python"
+    )
+    assert render_research_results({}) == ""
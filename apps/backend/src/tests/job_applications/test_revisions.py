@@ -0,0 +1,111 @@
+"""Tests for patch-based revisions of resume and cover letter drafts.
+
+This module contains unit tests for apply_resume_edits and
+apply_cover_letter_edits, verifying how edits are applied, which ones are
+rejected and when a revision fails as a whole.
+"""
+
+import pytest
+
+from src.core.types import Resume
+from src.job_applications.agents.drafts_generators.revisions import (
+    RevisionError,
+    apply_cover_letter_edits,
+    apply_resume_edits,
+)
+from src.job_applications.types import CoverLetterEdit, ResumeEdit
+
+
+def _resume() -> Resume:
+    return Resume.model_validate(
+        {
+            "name": "Jane Doe",
+            "email": "jane@example.com",
+            "personal_info": {
+                "phone_number": "+1 555 0100",
+                "address": "Paris",
+                "summary": "Backend engineer.",
+                "professional_title": "Backend Engineer",
+            },
+            "work_experiences": [
+                {
+                    "company_name": "Acme",
+                    "position": "Engineer",
+                    "start_date": "2020-01-01",
+                    "responsibilities": "Built APIs.",
+                }
+            ],
+            "educations": [],
+            "skills": [
+                {"name": "Python", "proficiency_level": "Expert"},
+                {"name": "COBOL", "proficiency_level": "Beginner"},
+                {"name": "Fortran", "proficiency_level": "Beginner"},
+            ],
+        }
+    )
+
+
+def test_resume_edits_set_append_and_remove():
+    """Test each operation, with removals indexed against the previous draft."""
+    resume, rejected = apply_resume_edits(
+        _resume(),
+        [
+            ResumeEdit(path="skills[2]", operation="remove"),
+            ResumeEdit(
+                path="personal_info.summary", value="Backend engineer, 5 years."
+            ),
+            ResumeEdit(
+                path="skills",
+                operation="append",
+                value='{"name": "Go", "proficiency_level": "Advanced"}',
+            ),
+            ResumeEdit(path="skills[1]", operation="remove"),
+        ],
+    )
+
+    assert rejected == []
+    assert resume.personal_info.summary == "Backend engineer, 5 years."
+    assert [skill.name for skill in resume.skills] == ["Python", "Go"]
+
+
+def test_invalid_resume_edits_are_rejected():
+    """Test that unknown paths and invalid values are skipped and reported."""
+    resume, rejected = apply_resume_edits(
+        _resume(),
+        [
+            ResumeEdit(path="work_experiences[5].position", value="Lead"),
+            ResumeEdit(path="skills", operation="append", value='"Go"'),
+            ResumeEdit(path="work_experiences[0].position", value="Senior Engineer"),
+        ],
+    )
+
+    assert len(rejected) == 2
+    assert resume.work_experiences[0].position == "Senior Engineer"
+    assert len(resume.skills) == 3
+
+    with pytest.raises(RevisionError):
+        apply_resume_edits(_resume(), [ResumeEdit(path="unknown", value="x")])
+
+
+def test_cover_letter_edits_tolerate_whitespace():
+    """Test find/replace edits matching across line breaks and rejected excerpts."""
+    letter = "Dear team,\n\nI am  writing to apply\nfor the role.\n\nBest,\nJane"
+
+    revised, rejected = apply_cover_letter_edits(
+        letter,
+        [
+            CoverLetterEdit(
+                find="I am writing to apply for the role.",
+                replace="I am excited to apply for the Backend Engineer role.",
+            ),
+            CoverLetterEdit(find="Not in the letter", replace="x"),
+        ],
+    )
+
+    assert revised == (
+        "Dear team,\n\nI am excited to apply for the Backend Engineer role."
+        "\n\nBest,\nJane"
+    )
+    assert len(rejected) == 1
+    with pytest.raises(RevisionError):
+        apply_cover_letter_edits(letter, [CoverLetterEdit(find="absent", replace="")])
@@ -0,0 +1,117 @@
+"""Tests for the full-text and trigram search expressions.
+
+This module contains unit tests for the search module, verifying the tsquery
+built from user input and the SQL the search condition and rank compile to, and
+that paging through tied search results skips no row.
+"""
+
+import asyncio
+import uuid
+from datetime import UTC, datetime
+
+from sqlalchemy.dialects import postgresql
+
+from src.configs.database_config import get_async_session_context, get_session_context
+from src.job_applications.model import JobApplication
+from src.job_applications.pagination import PageCursor
+from src.job_applications.repositories.job_application_repository import (
+    AsyncJobApplicationRepository,
+)
+from src.job_applications.search import prefix_tsquery, search_condition, search_rank
+from src.user.model import User
+
+
+def _sql(expression) -> str:
+    # The psycopg2 dialect escapes % as %%
+    return str(expression.compile(dialect=postgresql.dialect())).replace("%%", "%")
+
+
+def test_prefix_tsquery_keeps_only_words():
+    """Test that every word becomes a prefix and tsquery syntax is dropped."""
+    assert prefix_tsquery("Senior Backend-Eng") == "senior:* & backend:* & eng:*"
+    assert prefix_tsquery("c++ & (dev | ops)!") == "c:* & dev:* & ops:*"
+    assert prefix_tsquery("  ++ ") is None
+
+
+def test_search_matches_vector_or_similar_title_and_company():
+    """Test that the condition uses the search vector and the trigram operators."""
+    condition = search_condition("acme eng")
+    sql = _sql(condition)
+    params = condition.compile(dialect=postgresql.dialect()).params
+    rank = _sql(search_rank("acme eng"))
+
+    assert "search_vector @@ to_tsquery(" in sql
+    assert "acme:* & eng:*" in params.values()
+    assert "s <% app.job_applications.job_title" in sql
+    assert "s <% app.job_applications.company_name" in sql
+    assert rank.startswith("CAST(ts_rank_cd(search_vector, to_tsquery(")
+    assert rank.endswith(" AS FLOAT(53))")
+    assert "word_similarity(" in rank and "app.job_applications.company_name)" in rank
+
+
+def test_search_without_words_only_uses_similarity():
+    """Test that a term without words is matched by trigram similarity only."""
+    condition = _sql(search_condition("++"))
+
+    assert "search_vector" not in condition
+    assert "s <% app.job_applications.job_title" in condition
+    assert "ts_rank_cd" not in _sql(search_rank("++"))
+
+
+def test_ranked_cursor_round_trip():
+    """Test that the rank of a search cursor round-trips exactly."""
+    cursor = PageCursor(
+        created_at=datetime(2025, 1, 1, tzinfo=UTC), id="app-1", rank=0.1 + 0.2
+    )
+
+    assert PageCursor.decode(cursor.encode()) == cursor
+
+
+def test_search_pages_keep_rows_tied_on_rank():
+    """Test that paging through equally ranked results skips none (needs Postgres)."""
+    with get_session_context() as session:
+        user_id = str(uuid.uuid4())
+        user = User(id=user_id, email=f"{user_id}@example.com", name="Test User")
+        session.add(user)
+        session.commit()
+        # Identical titles and companies give every application the same rank
+        applications = [
+            JobApplication(
+                job_description="Build payment APIs",
+                job_title="Backend Engineer",
+                company_name="Acme",
+                user_id=user_id,
+            )
+            for _ in range(5)
+        ]
+        session.add_all(applications)
+        session.commit()
+        application_ids = {application.id for application in applications}
+
+    async def page_through():
+        found, ranks, cursor = [], set(), None
+        while True:
+            async with get_async_session_context() as session:
+                hits, _ = await AsyncJobApplicationRepository(
+                    session
+                ).search_job_applications(
+                    user_id, "backend", limit=2, cursor=cursor, with_total=False
+                )
+            found += [hit.preview.id for hit in hits]
+            ranks |= {hit.rank for hit in hits}
+            if len(hits) < 2:
+                return found, ranks
+            cursor = PageCursor.decode(
+                PageCursor.after(hits[-1].preview, hits[-1].rank).encode()
+            )
+
+    try:
+        found, ranks = asyncio.run(page_through())
+        assert len(ranks) == 1
+        assert sorted(found) == sorted(application_ids)
+    finally:
+        with get_session_context() as session:
+            for application_id in application_ids:
+                session.delete(session.get(JobApplication, application_id))
+            session.delete(session.get(User, user_id))
+            session.commit()
@@ -0,0 +1,51 @@
+"""Tests for the SSE streaming helpers.
+
+This module contains unit tests for the delta stream cursor, the event query
+it resumes from, and the field-level change detection used by the delta SSE
+mode.
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+from sqlmodel import select
+
+from src.job_applications.model import Event
+from src.job_applications.repositories.events_repository import _filter_events
+from src.job_applications.streaming import EventCursor, changed_fields
+
+
+def test_event_cursor_round_trip():
+    """Test that a cursor survives encoding and points at its last event."""
+    events = [
+        SimpleNamespace(id="evt-1", created_at=datetime(2025, 1, 1, 12, 0, 0)),
+        SimpleNamespace(id="evt-2", created_at=datetime(2025, 1, 1, 12, 0, 5)),
+    ]
+    cursor = EventCursor(application_updated_at=datetime(2025, 1, 1, 12, 0, 6))
+    cursor.advance(events)
+
+    decoded = EventCursor.decode(cursor.encode())
+    assert decoded == cursor
+    assert (decoded.event_created_at, decoded.event_id) == (
+        events[1].created_at,
+        events[1].id,
+    )
+    assert EventCursor.decode("not-a-cursor") is None
+
+
+def test_events_after_cursor_seek_strictly_past_ties():
+    """Test that resuming from a cursor skips its event but not same-time ones."""
+    stmt = _filter_events(
+        select(Event), since=datetime(2025, 1, 1, 12, 0, 5), after_id="evt-2"
+    )
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "(app.events.created_at, app.events.id) > (" in sql
+    assert ">=" not in sql
+
+
+def test_changed_fields_only_returns_modified_values():
+    """Test that only fields whose value changed are reported."""
+    _, fingerprints = changed_fields({"status": "started", "resume": {"a": 1}}, {})
+    delta, _ = changed_fields({"status": "completed", "resume": {"a": 1}}, fingerprints)
+    assert delta == {"status": "completed"}
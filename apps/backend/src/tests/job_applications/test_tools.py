@@ -1,11 +1,14 @@
 """Tests for job application tools.
 
 This module contains unit tests for the scraping_tool functionality,
-verifying that it correctly extracts and returns data from web pages.
+verifying that it correctly extracts and returns data from web pages, and for
+the concurrent search fan-out of company_discovery_tool.
 """
 
 import asyncio
-from src.job_applications.tools import scraping_tool
+
+from src.job_applications import tools
+from src.job_applications.tools import company_discovery_tool, scraping_tool
 
 
 def test_scraping_tool():
@@ -27,3 +30,36 @@ def test_scraping_tool():
     result = asyncio.run(scraping_tool.ainvoke(input=inputs))
     assert isinstance(result, str)
     assert len(result) > 0
+
+
+def test_company_discovery_tool_cancels_searches_once_the_website_is_found(
+    monkeypatch,
+):
+    """Test that queries run concurrently and stop at the first official website."""
+    started = []
+    cancelled = []
+
+    async def fake_search(query):
+        started.append(query)
+        if "official website" in query:
+            await asyncio.sleep(0.01)
+            return {"results": [{"url": "https://acme.com"}]}
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(query)
+            raise
+        return {"results": []}
+
+    monkeypatch.setattr(tools, "tavily_tool", object())
+    monkeypatch.setattr(tools, "tavily_search", fake_search)
+
+    result = asyncio.run(
+        asyncio.wait_for(
+            company_discovery_tool.ainvoke(input={"company_name": "Acme"}), 1
+        )
+    )
+
+    assert list(result) == ['"Acme" official website']
+    assert len(started) == 5
+    assert len(cancelled) == 4
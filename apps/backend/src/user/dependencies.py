@@ -6,10 +6,11 @@ and UserService instances with proper database session management.
 
 from fastapi import Depends
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.configs.database_config import get_session
+from src.configs.database_config import get_async_session, get_session
 from src.user.repository import UserRepository
-from src.user.service import UserService
+from src.user.service import AsyncUserService, UserService
 
 
 def get_user_repository(session: Session = Depends(get_session)):
@@ -28,3 +29,15 @@ def get_user_service(session: Session = Depends(get_session)) -> UserService:
     from src.core.service_registry import ServiceRegistry
 
     return ServiceRegistry.get_user_service(session)
+
+
+def get_async_user_service(
+    session: AsyncSession = Depends(get_async_session),
+) -> AsyncUserService:
+    """Dependency to get AsyncUserService instance.
+
+    This ensures that the service is created with the current async database session.
+    """
+    from src.core.service_registry import ServiceRegistry
+
+    return ServiceRegistry.get_async_user_service(session)
@@ -1,10 +1,12 @@
 """User repository module for database operations.
 
 This module provides the UserRepository class which handles CRUD operations
-for User objects in the database.
+for User objects in the database, and its async counterpart AsyncUserRepository.
 """
 
+from sqlalchemy.orm import selectinload
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.user.model import User
 
@@ -99,3 +101,104 @@ class UserRepository:
             self.session.commit()
             return True
         return False
+
+
+class AsyncUserRepository:
+    """Async repository for User model database operations.
+
+    Mirrors UserRepository on an AsyncSession.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initialize the AsyncUserRepository with an async database session."""
+        self.session = session
+
+    async def create(self, user: User) -> User:
+        """Create a new user in the database.
+
+        Args:
+            user: The user object to be created
+
+        Returns:
+            The created user with updated fields
+        """
+        self.session.add(user)
+        await self.session.commit()
+        return await self.get_by_id(user.id)
+
+    async def get_by_id(self, user_id: str) -> User | None:
+        """Retrieve a user by their ID.
+
+        Args:
+            user_id: The ID of the user to retrieve
+
+        Returns:
+            The user if found, None otherwise
+        """
+        statement = (
+            select(User)
+            .where(User.id == user_id)
+            .execution_options(populate_existing=True)
+        )
+        results = await self.session.exec(statement)
+        return results.first()
+
+    async def get_by_email(self, email: str) -> User | None:
+        """Retrieve a user by their email address.
+
+        Args:
+            email: The email of the user to retrieve
+
+        Returns:
+            The user if found, None otherwise
+        """
+        results = await self.session.exec(select(User).where(User.email == email))
+        return results.first()
+
+    async def get_all(self) -> list[User]:
+        """Retrieve all users.
+
+        Returns:
+            A list of all users
+        """
+        results = await self.session.exec(select(User))
+        return results.all()
+
+    async def update(self, user: User) -> User:
+        """Update an existing user.
+
+        Args:
+            user: The user object with updated fields
+
+        Returns:
+            The updated user
+        """
+        self.session.add(user)
+        await self.session.commit()
+        return await self.get_by_id(user.id)
+
+    async def delete(self, user_id: str) -> bool:
+        """Delete a user by their ID.
+
+        Args:
+            user_id: The ID of the user to delete
+
+        Returns:
+            True if the user was deleted, False otherwise
+        """
+        # Cascaded relationships must be loaded up front: async sessions cannot lazy-load
+        from src.job_applications.model import JobApplication
+
+        statement = (
+            select(User)
+            .where(User.id == user_id)
+            .options(
+                selectinload(User.job_applications).selectinload(JobApplication.events)
+            )
+        )
+        user = (await self.session.exec(statement)).first()
+        if user:
+            await self.session.delete(user)
+            await self.session.commit()
+            return True
+        return False
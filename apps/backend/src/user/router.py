@@ -4,6 +4,7 @@ This module provides API endpoints for:
 - Uploading user resumes (PDF, DOC, DOCX)
 - Retrieving user data
 - Monitoring resume extraction status via SSE
+- Streaming live updates of all the user's applications on one SSE connection
 - Saving processed resume data
 """
 
@@ -24,12 +25,20 @@ from fastapi import (
 )
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+from typing import Literal
 
 from src.auth.dependencies import get_current_user
+from src.configs.database_config import get_async_session_context
+from src.core.notifications import get_change_notifier, user_channel
+from src.core.service_registry import ServiceRegistry
 from src.core.types import Resume
-from src.user.dependencies import get_user_service
+from src.job_applications.live_updates import (
+    LiveUpdatesStream,
+    request_subscription_change,
+)
+from src.user.dependencies import get_async_user_service
 from src.user.model import User
-from src.user.service import UserService
+from src.user.service import AsyncUserService
 
 logger = getLogger(__name__)
 UPLOAD_DIR = os.path.join(os.path.dirname(__file__), "../../uploads")
@@ -37,6 +46,11 @@ os.makedirs(UPLOAD_DIR, exist_ok=True)
 
 user_router = APIRouter(prefix="/user", tags=["user"])
 
+SSE_HEARTBEAT_SECONDS = float(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))
+RESUME_STATUS_SSE_TIMEOUT_SECONDS = float(
+    os.getenv("RESUME_STATUS_SSE_TIMEOUT_SECONDS", "300")
+)
+
 UPLOAD_DIR = os.path.join(os.path.dirname(__file__), "../../uploads")
 
 
@@ -46,12 +60,27 @@ class SaveResumeRequest(BaseModel):
     resume: Resume
 
 
+class LiveSubscriptionRequest(BaseModel):
+    """Request model for changing the applications followed by a live stream."""
+
+    action: Literal["subscribe", "unsubscribe"]
+    application_id: str
+    mode: Literal["snapshot", "delta"] = "delta"
+    last_event_id: str | None = None
+
+
+async def _extract_resume_in_background(save_path: str, user_id: str) -> None:
+    # Background tasks run after the request's session has been closed
+    async with get_async_session_context() as session:
+        user_service = ServiceRegistry.get_async_user_service(session)
+        await user_service.extract_initial_resume(save_path, user_id)
+
+
 @user_router.post("/resume/upload")
 def upload_resume(
     background_task: BackgroundTasks,
     file: UploadFile = File(...),
     current_user: User = Depends(get_current_user),
-    user_service: UserService = Depends(get_user_service),
 ):
     """Endpoint to upload a resume file for the current user."""
     try:
@@ -67,7 +96,7 @@ def upload_resume(
         with open(save_path, "wb") as buffer:
             shutil.copyfileobj(file.file, buffer)
         background_task.add_task(
-            user_service.extract_initial_resume, save_path, current_user.id
+            _extract_resume_in_background, save_path, current_user.id
         )
         return {
             "status_code": 200,
@@ -82,11 +111,11 @@ def upload_resume(
 @user_router.get("/get")
 async def get_user_data(
     current_user: User = Depends(get_current_user),
-    user_service: UserService = Depends(get_user_service),
+    user_service: AsyncUserService = Depends(get_async_user_service),
 ):
     """Get the current user's data."""
     try:
-        user = user_service.get_user(current_user.id)
+        user = await user_service.get_user(current_user.id)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
         return user
@@ -97,46 +126,170 @@ async def get_user_data(
 
 
 @user_router.get("/resume/status/{token}")
-async def resume_status_sse(
-    token: str, request: Request, user_service: UserService = Depends(get_user_service)
-):
+async def resume_status_sse(token: str, request: Request):
     """SSE endpoint to notify frontend when resume extraction is complete.
 
-    Authenticates user using JWT token from route param.
+    Authenticates user using JWT token from route param. Database sessions are
+    only held for the short reads at the start and once extraction finishes;
+    while waiting, the stream listens for the notification published by
+    UserService.extract_initial_resume and sends a waiting frame every
+    SSE_HEARTBEAT_SECONDS. The stream ends with a timeout status after
+    RESUME_STATUS_SSE_TIMEOUT_SECONDS.
     """
     try:
-        user = await get_current_user(token, user_service)
-        if not user:
-            raise HTTPException(status_code=401, detail="Invalid token")
+        async with get_async_session_context() as session:
+            user = await get_current_user(
+                token, ServiceRegistry.get_async_user_service(session)
+            )
+            if not user:
+                raise HTTPException(status_code=401, detail="Invalid token")
+            user_id = user.id
     except Exception:
         raise HTTPException(status_code=401, detail="Invalid token")
 
-    async def event_generator(user_id: str):
-        while True:
-            user = user_service.get_user(user_id)
+    async def _load_resume() -> tuple[bool, dict | None]:
+        # Short-lived session so no pooled connection is held while waiting
+        async with get_async_session_context() as session:
+            user = await ServiceRegistry.get_async_user_service(session).get_user(
+                user_id
+            )
             if user is None:
-                yield f"data:{json.dumps({'status': 'error', 'detail': 'User not found'})}\n\n"
-                break
+                return False, None
             if isinstance(user.initial_resume, dict) and len(user.initial_resume) > 0:
-                yield f"data: {json.dumps({'status': 'complete', 'resume': user.initial_resume})}\n\n"
-                break
-            yield f"data: {json.dumps({'status': 'waiting'})}\n\n"
-            await asyncio.sleep(2)
+                return True, user.initial_resume
+            return True, None
+
+    async def event_generator():
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + RESUME_STATUS_SSE_TIMEOUT_SECONDS
+
+        # Subscribe before the first read so a completion cannot be missed
+        async with get_change_notifier().subscribe(
+            user_channel(user_id)
+        ) as subscription:
+            check_database = True
+            while True:
+                if check_database:
+                    exists, resume = await _load_resume()
+                    if not exists:
+                        yield f"data:{json.dumps({'status': 'error', 'detail': 'User not found'})}\n\n"
+                        break
+                    if resume is not None:
+                        yield f"data: {json.dumps({'status': 'complete', 'resume': resume})}\n\n"
+                        break
+                    yield f"data: {json.dumps({'status': 'waiting'})}\n\n"
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    yield f"data: {json.dumps({'status': 'timeout', 'detail': 'Resume extraction is taking longer than expected'})}\n\n"
+                    break
+
+                notification = await subscription.get(
+                    timeout=min(SSE_HEARTBEAT_SECONDS, remaining)
+                )
+                if await request.is_disconnected():
+                    break
+                if notification is None:
+                    # Idle heartbeat; re-check in case a notification was lost
+                    check_database = True
+                    continue
+                status = notification.payload.get("status")
+                if status == "failed":
+                    yield f"data: {json.dumps({'status': 'failed', 'detail': notification.payload.get('detail')})}\n\n"
+                    break
+                check_database = status == "complete"
+
+    return StreamingResponse(event_generator(), media_type="text/event-stream")
+
+
+@user_router.get("/live/{token}")
+async def live_updates_sse(
+    token: str,
+    request: Request,
+    mode: Literal["snapshot", "delta"] = "delta",
+):
+    """SSE stream of every live update of the user on a single connection.
+
+    Authenticates user using JWT token from route param. The first frame,
+    live.ready, gives the stream id and the applications followed: all those
+    still being generated, joined by the ones created while the stream is open.
+    Application frames are those of the per-application stream in the given
+    mode, with ids prefixed by "<application_id>/"; an application.unsubscribed
+    frame follows the last frame of an application. Resume extraction updates
+    are sent as resume.status frames.
+
+    Other applications are followed or dropped through
+    POST /user/live/{stream_id}/subscriptions.
+    """
+    try:
+        async with get_async_session_context() as session:
+            user = await get_current_user(
+                token, ServiceRegistry.get_async_user_service(session)
+            )
+            if not user:
+                raise HTTPException(status_code=401, detail="Invalid token")
+            user_id = user.id
+    except Exception:
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    stream = LiveUpdatesStream(user_id, mode=mode)
+
+    async def event_generator():
+        async for frame in stream.frames():
             if await request.is_disconnected():
-                break
+                logger.info(f"Client disconnected from live stream {stream.stream_id}")
+                return
+            yield frame
 
-    return StreamingResponse(event_generator(user.id), media_type="text/event-stream")
+    headers = {
+        "Cache-Control": "no-cache",
+        "Connection": "keep-alive",
+        "X-Accel-Buffering": "no",
+        "Access-Control-Allow-Origin": os.getenv(
+            "FRONTEND_URL", "http://localhost:3000"
+        ),
+        "Access-Control-Allow-Credentials": "true",
+    }
+    return StreamingResponse(
+        event_generator(), media_type="text/event-stream", headers=headers
+    )
+
+
+@user_router.post("/live/{stream_id}/subscriptions")
+async def change_live_subscription(
+    stream_id: str,
+    subscription: LiveSubscriptionRequest,
+    current_user: User = Depends(get_current_user),
+):
+    """Follow or stop following an application on one of the user's live streams."""
+    if subscription.action == "subscribe":
+        async with get_async_session_context() as session:
+            job_application = await ServiceRegistry.get_async_job_application_service(
+                session
+            ).get_user_job_application(subscription.application_id, current_user.id)
+        if job_application is None:
+            raise HTTPException(status_code=404, detail="Job application not found")
+    request_subscription_change(
+        get_change_notifier(),
+        current_user.id,
+        stream_id,
+        subscription.action,
+        subscription.application_id,
+        mode=subscription.mode,
+        last_event_id=subscription.last_event_id,
+    )
+    return {"status_code": 202, "detail": f"{subscription.action} requested"}
 
 
 @user_router.post("/resume/save")
 async def save_resume(
     resume: SaveResumeRequest,
     current_user: User = Depends(get_current_user),
-    user_service: UserService = Depends(get_user_service),
+    user_service: AsyncUserService = Depends(get_async_user_service),
 ):
     """Save the processed resume data for the current user."""
     try:
-        user = user_service.save_resume(current_user.id, resume)
+        user = await user_service.save_resume(current_user.id, resume)
         return {"status_code": 200, "detail": user}
     except HTTPException as e:
         return e
@@ -3,8 +3,10 @@
 This module provides:
 - UserService: Main service class for user operations including registration,
   retrieval, deletion, and resume extraction/processing.
+- AsyncUserService: The same operations on an async database session.
 """
 
+import asyncio
 import os
 from logging import getLogger
 
@@ -14,12 +16,13 @@ from langchain_mistralai import ChatMistralAI
 from langfuse.langchain import CallbackHandler
 
 from src.core.constants import MODEL_NAME
+from src.core.notifications import ChangeNotifier, get_change_notifier, user_channel
 from src.core.types import Resume
 from src.user.model import User
 from src.user.prompts.extract_resume_content_prompt import (
     extract_resume_content_system_prompt,
 )
-from src.user.repository import UserRepository
+from src.user.repository import AsyncUserRepository, UserRepository
 
 logger = getLogger(__name__)
 
@@ -30,9 +33,20 @@ class UserService:
     Uses UserRepository for data access and adds business logic layer.
     """
 
-    def __init__(self, user_repository: UserRepository):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        change_notifier: ChangeNotifier | None = None,
+    ):
         """Initialize the UserService with a UserRepository instance."""
         self.user_repository = user_repository
+        self.change_notifier = change_notifier or get_change_notifier()
+
+    def notify_resume_extraction(
+        self, user_id: str, status: str, detail: str | None = None
+    ) -> None:
+        """Notify live subscribers about the outcome of a resume extraction."""
+        _publish_resume_extraction(self.change_notifier, user_id, status, detail)
 
     def create_user(self, user_data: User) -> User:
         """Register a new user with validation.
@@ -109,65 +123,216 @@ class UserService:
     async def extract_initial_resume(self, save_path: str, user_id: str) -> None:
         """Extract initial resume content for a user."""
         try:
-            loader = PDFPlumberLoader(save_path)
-            docs = loader.load()
-            resume_content = "\n\n".join([doc.page_content for doc in docs])
-            langfuse_handler = CallbackHandler()
-            model = ChatMistralAI(
-                model=MODEL_NAME, callbacks=[langfuse_handler]
-            ).with_structured_output(schema=Resume)
-
-            # Add more specific instruction in the user message
-            user_message = f"""Please extract information from this resume and ensure:
-                            1. Group all responsibilities under each unique job position
-                            2. Do not create duplicate entries for the same job title 
-                            and date range
-                            3. Include complete descriptions without truncation
-                            4. For missing information 
-                            (like grades, end dates for current positions),
-                            use "Not provided" instead of null/None
-                            5. For current positions, use "Present" as the end_date
-
-                            Resume content:
-                            {resume_content}"""
-
-            response = await model.ainvoke(
-                [
-                    ("system", extract_resume_content_system_prompt),
-                    ("user", user_message),
-                ]
-            )
+            validated_resume = await extract_resume_content(save_path)
             logger.info(f"Extracted resume content for user {user_id}")
-            if not response:
-                raise HTTPException(
-                    status_code=500, detail="Failed to extract resume content"
-                )
 
             user = self.get_user(user_id)
             if not user:
                 raise HTTPException(status_code=404, detail="User not found")
 
-            # Validate and clean the response before saving
-            validated_resume = Resume.model_validate(response)
             user.initial_resume = validated_resume.model_dump()
             self.user_repository.update(user)
+            self.notify_resume_extraction(user_id, "complete")
             return user
 
         except HTTPException as http_exc:
             logger.error(
                 f"HTTP error uploading resume for user {user_id}: {http_exc.detail}"
             )
+            self.notify_resume_extraction(user_id, "failed", str(http_exc.detail))
             raise http_exc
         except Exception as e:
             # Store user_id before potential session issues
             logger.error(f"Error uploading resume for user {user_id}: {e}")
+            self.notify_resume_extraction(user_id, "failed", "Error uploading resume")
+            raise HTTPException(status_code=500, detail="Error uploading resume")
+        finally:
+            _remove_uploaded_resume(save_path)
+
+
+class AsyncUserService:
+    """Async counterpart of UserService, backed by AsyncUserRepository.
+
+    Used by the FastAPI routes so database I/O does not block the event loop.
+    """
+
+    def __init__(
+        self,
+        user_repository: AsyncUserRepository,
+        change_notifier: ChangeNotifier | None = None,
+    ):
+        """Initialize the AsyncUserService with an AsyncUserRepository instance."""
+        self.user_repository = user_repository
+        self.change_notifier = change_notifier or get_change_notifier()
+
+    def notify_resume_extraction(
+        self, user_id: str, status: str, detail: str | None = None
+    ) -> None:
+        """Notify live subscribers about the outcome of a resume extraction."""
+        _publish_resume_extraction(self.change_notifier, user_id, status, detail)
+
+    async def create_user(self, user_data: User) -> User:
+        """Register a new user.
+
+        Args:
+            user_data: User data to register
+
+        Returns:
+            The created user
+        """
+        return await self.user_repository.create(user_data)
+
+    async def get_user(self, user_id: str) -> User | None:
+        """Get a user by ID.
+
+        Args:
+            user_id: The ID of the user to retrieve
+
+        Returns:
+            The user if found, None otherwise
+        """
+        return await self.user_repository.get_by_id(user_id)
+
+    async def get_user_by_email(self, email: str) -> User | None:
+        """Get a user by email.
+
+        Args:
+            email: The email of the user to retrieve
+
+        Returns:
+            The user if found, None otherwise
+        """
+        return await self.user_repository.get_by_email(email)
+
+    async def list_users(self) -> list[User]:
+        """List all users.
+
+        Returns:
+            A list of all users
+        """
+        return await self.user_repository.get_all()
+
+    async def delete_user(self, user_id: str) -> bool:
+        """Delete a user account.
+
+        Args:
+            user_id: The ID of the user to delete
+
+        Returns:
+            True if the user was deleted, False otherwise
+        """
+        return await self.user_repository.delete(user_id)
+
+    async def save_resume(self, user_id: str, resume: Resume):
+        """Save the processed resume data for a user."""
+        try:
+            user = await self.get_user(user_id)
+            if not user:
+                raise HTTPException(status_code=404, detail="User not found")
+            if not resume:
+                raise HTTPException(status_code=400, detail="Resume data is required")
+            user.initial_resume = resume.model_dump()
+            return await self.user_repository.update(user)
+        except HTTPException as e:
+            logger.error(f"HTTP error saving resume for user {user_id}: {e.detail}")
+            raise e
+        except Exception:
+            message = f"Error saving resume for user: {user_id}"
+            logger.error(message)
+            raise HTTPException(status_code=500, detail=message)
+
+    async def extract_initial_resume(self, save_path: str, user_id: str) -> None:
+        """Extract initial resume content for a user."""
+        try:
+            validated_resume = await extract_resume_content(save_path)
+            logger.info(f"Extracted resume content for user {user_id}")
+
+            user = await self.get_user(user_id)
+            if not user:
+                raise HTTPException(status_code=404, detail="User not found")
+
+            user.initial_resume = validated_resume.model_dump()
+            await self.user_repository.update(user)
+            self.notify_resume_extraction(user_id, "complete")
+            return user
+
+        except HTTPException as http_exc:
+            logger.error(
+                f"HTTP error uploading resume for user {user_id}: {http_exc.detail}"
+            )
+            self.notify_resume_extraction(user_id, "failed", str(http_exc.detail))
+            raise http_exc
+        except Exception as e:
+            logger.error(f"Error uploading resume for user {user_id}: {e}")
+            self.notify_resume_extraction(user_id, "failed", "Error uploading resume")
             raise HTTPException(status_code=500, detail="Error uploading resume")
         finally:
-            try:
-                if os.path.exists(save_path):
-                    os.remove(save_path)
-                    logger.info(f"Deleted resume file at {save_path}")
-            except Exception as cleanup_error:
-                logger.error(
-                    f"Failed to delete resume file at {save_path}: {cleanup_error}"
-                )
+            _remove_uploaded_resume(save_path)
+
+
+async def extract_resume_content(save_path: str) -> Resume:
+    """Extract structured resume content from an uploaded PDF with the LLM.
+
+    Args:
+        save_path: Path of the uploaded resume file
+
+    Returns:
+        The validated resume
+    """
+    # PDF parsing is CPU/disk bound; keep it off the event loop
+    docs = await asyncio.to_thread(PDFPlumberLoader(save_path).load)
+    resume_content = "\n\n".join([doc.page_content for doc in docs])
+    langfuse_handler = CallbackHandler()
+    model = ChatMistralAI(
+        model=MODEL_NAME, callbacks=[langfuse_handler]
+    ).with_structured_output(schema=Resume)
+
+    # Add more specific instruction in the user message
+    user_message = f"""Please extract information from this resume and ensure:
+                    1. Group all responsibilities under each unique job position
+                    2. Do not create duplicate entries for the same job title 
+                    and date range
+                    3. Include complete descriptions without truncation
+                    4. For missing information 
+                    (like grades, end dates for current positions),
+                    use "Not provided" instead of null/None
+                    5. For current positions, use "Present" as the end_date
+
+                    Resume content:
+                    {resume_content}"""
+
+    response = await model.ainvoke(
+        [
+            ("system", extract_resume_content_system_prompt),
+            ("user", user_message),
+        ]
+    )
+    if not response:
+        raise HTTPException(status_code=500, detail="Failed to extract resume content")
+    # Validate and clean the response before saving
+    return Resume.model_validate(response)
+
+
+def _publish_resume_extraction(
+    change_notifier: ChangeNotifier,
+    user_id: str,
+    status: str,
+    detail: str | None = None,
+) -> None:
+    change_notifier.publish(
+        user_channel(user_id),
+        {
+            "type": "resume_extraction",
+            "status": status,
+            **({"detail": detail} if detail else {}),
+        },
+    )
+
+
+def _remove_uploaded_resume(save_path: str) -> None:
+    try:
+        if os.path.exists(save_path):
+            os.remove(save_path)
+            logger.info(f"Deleted resume file at {save_path}")
+    except Exception as cleanup_error:
+        logger.error(f"Failed to delete resume file at {save_path}: {cleanup_error}")
@@ -24,7 +24,9 @@ export function useJobApplications(
 
     const url = new URL(API_URL!)
     url.pathname = APPLICATION_BACKEND_ROUTES.listJobApplications
-    url.searchParams.set("offset", `${pageIndex * limit}`)
+    if (previousPageData?.next_cursor) {
+      url.searchParams.set("cursor", previousPageData.next_cursor)
+    }
     url.searchParams.set("limit", `${limit}`)
     return url.toString()
   }
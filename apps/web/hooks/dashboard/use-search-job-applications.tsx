@@ -37,7 +37,9 @@ export function useJobApplicationsSearch(
       url.searchParams.set("search_term", searchTerm)
     }
 
-    url.searchParams.set("offset", `${pageIndex * limit}`)
+    if (previousPageData?.next_cursor) {
+      url.searchParams.set("cursor", previousPageData.next_cursor)
+    }
     url.searchParams.set("limit", `${limit}`)
     return url.toString()
   }
@@ -132,6 +132,8 @@ export type JobApplicationPreview = {
 
 export type PaginatedJobApplicationsPreviews = {
   items: JobApplicationPreview[]
-  total: number
+  // Only counted on the first page
+  total: number | null
   has_next: boolean
+  next_cursor?: string | null
 }